@@ -79,11 +79,56 @@ def individual_axes_impl(self, data, axes, method, method_kwargs, baseline_func)
 
     return baseline, params
 
+def matrix_axis_impl(data, axis, method_kwargs, matrix_func):
+    """
+    Fit the baselines of all 1D slices along a single axis at once
+
+    This is the counterpart of individual_axes_impl for methods which have
+    a whole-matrix implementation.
+
+    Parameters
+    ----------
+    data : ndarray
+        The 2D data array to fit the baseline to.
+    axis : int
+        The axis to fit the baseline along.
+    method_kwargs : dict
+        Keyword arguments passed to matrix_func.
+    matrix_func : callable
+        A function called as ``matrix_func(M, **method_kwargs)`` where each
+        row of M is a slice along the axis, which returns the baselines of
+        the rows and a dictionary of arrays of their parameters.
+
+    Returns
+    -------
+    baseline : ndarray
+        The fitted baseline array.
+    params : dict
+        A dictionary containing the parameters of the fitted baseline,
+        in the same structure as from individual_axes_impl.
+    """
+    key = ('rows', 'columns')[axis]
+    M = np.moveaxis(data, axis, -1)
+    partial_baseline, fit_params = matrix_func(M, **method_kwargs)
+    partial_baseline = np.moveaxis(partial_baseline, -1, axis)
+    row_params = {}
+    for name, value in fit_params.items():
+        row_params[name] = list(value) if np.ndim(value) == 1 else [value]*M.shape[0]
+    params = {
+        f'params_{key}': row_params,
+        f'baseline_{key}': partial_baseline,
+    }
+    return partial_baseline, params
+
 def _lpm_individual_axes_impl(self, data, axes, method, method_kwargs, debug=False):
     """
     Adapter for LPM baseline fitting
+
+    Fitting along a single axis is done for all rows at once with
+    compute_lpm_baseline_matrix, which is equivalent to the row-wise
+    compute_lpm_baseline within LPM_MATRIX_RTOL.
     """
-    from molass.Baseline.LpmBaseline import compute_lpm_baseline
+    from molass.Baseline.LpmBaseline import compute_lpm_baseline, compute_lpm_baseline_matrix
     def _lpm_baseline_func(data, **kwargs):
         if debug:
             counter = kwargs.get('counter', None)
@@ -91,7 +136,17 @@ def _lpm_individual_axes_impl(self, data, axes, method, method_kwargs, debug=Fal
                 counter[0] += 1
         x = kwargs.get('jv', None)
         return compute_lpm_baseline(x, data, return_also_params=True, **kwargs)
-    
+
+    def _lpm_matrix_func(M, **kwargs):
+        if debug:
+            counter = kwargs.get('counter', None)
+            if counter is not None:
+                counter[0] += M.shape[0]
+        x = kwargs.get('jv', None)
+        return compute_lpm_baseline_matrix(x, M, return_also_params=True, **kwargs)
+
+    if np.isscalar(axes) and isinstance(method_kwargs, dict) and method_kwargs.get('jv', None) is not None:
+        return matrix_axis_impl(data, axes, method_kwargs, _lpm_matrix_func)
     return individual_axes_impl(self, data, axes, method, method_kwargs, _lpm_baseline_func)
 
 def _uvdiff_individual_axes_impl(self, data, axes, method, method_kwargs, debug=False):
@@ -129,13 +184,26 @@ def _buffit_individual_axes_impl(self, data, axes, method, method_kwargs, debug=
     """
     Adapter for buffer-fit (buffer-frame polyfit) baseline fitting.
     Expects 'buffer_mask' in method_kwargs, pre-computed from the summed elution.
+
+    Since the mask is shared by all q-rows, fitting along a single axis is
+    done for the whole matrix at once with compute_buffit_baseline_matrix.
     """
-    from molass.Baseline.BuffitBaseline import compute_buffit_baseline
+    from molass.Baseline.BuffitBaseline import compute_buffit_baseline, compute_buffit_baseline_matrix
     def _buffit_baseline_func(data, **kwargs):
         x = kwargs.get('jv', None)
         return compute_buffit_baseline(x, data, return_also_params=True, **kwargs)
 
-    return individual_axes_impl(self, data, axes, method, method_kwargs, _buffit_baseline_func)
+    def _buffit_matrix_func(M, **kwargs):
+        x = kwargs.get('jv', None)
+        return compute_buffit_baseline_matrix(x, M, buffer_mask=kwargs.get('buffer_mask', None),
+                                              return_also_params=True)
+
+    kwargs = {} if method_kwargs is None else method_kwargs
+    if (not np.isscalar(axes) or not isinstance(kwargs, dict)
+        or ('threshold' in kwargs and kwargs.get('buffer_mask', None) is None)):
+        # the row-wise path, which also warns about an ignored threshold
+        return individual_axes_impl(self, data, axes, method, method_kwargs, _buffit_baseline_func)
+    return matrix_axis_impl(data, axes, kwargs, _buffit_matrix_func)
 
 CUSTOM_IMPL_DICT = {
     'linear': _lpm_individual_axes_impl,
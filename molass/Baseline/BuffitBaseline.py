@@ -139,3 +139,53 @@ def compute_buffit_baseline(x, y, return_also_params=False, **kwargs):
     if return_also_params:
         return baseline, dict(slope=slope, intercept=intercept, n_buffer=n_buffer_frames)
     return baseline
+
+
+def compute_buffit_baseline_matrix(x, M, buffer_mask=None, return_also_params=False):
+    """Compute the buffit baselines of all q-rows in one least-squares call.
+
+    Since the same buffer mask applies to every q-row, the row-wise linear
+    fits of :func:`compute_buffit_baseline` share one design matrix and can
+    be solved as a single multi-right-hand-side least-squares problem.
+
+    Parameters
+    ----------
+    x : array-like of shape (n_frames,)
+        Frame indices (jv).
+    M : array-like of shape (n_q, n_frames)
+        Intensity matrix, one elution profile per row.
+    buffer_mask : array-like of bool, shape (n_frames,), optional
+        Buffer frames, pre-computed once from the summed elution.
+        If absent or fewer than 2 True entries, falls back to a full-frame
+        linear fit as in :func:`compute_buffit_baseline`.
+    return_also_params : bool, optional
+        If True, return ``(baseline, params_dict)``.
+
+    Returns
+    -------
+    baseline : ndarray of shape (n_q, n_frames)
+        Equal to applying :func:`compute_buffit_baseline` to each row.
+    params : dict  (only if return_also_params is True)
+        Keys: ``slope``, ``intercept`` (arrays of shape (n_q,)), ``n_buffer``.
+    """
+    x = np.asarray(x, dtype=float)
+    M = np.asarray(M)
+    n_buffer_frames = int(np.sum(buffer_mask)) if buffer_mask is not None else 0
+    if n_buffer_frames < 2:
+        # Fallback: use all frames
+        xb, Mb = x, M
+        n_buffer_frames = len(x)
+    else:
+        buffer_mask = np.asarray(buffer_mask, dtype=bool)
+        xb, Mb = x[buffer_mask], M[:, buffer_mask]
+
+    # scale the columns of the design matrix as np.polyfit does
+    A = np.vstack([xb, np.ones(len(xb))]).T
+    col_scale = np.sqrt((A*A).sum(axis=0))
+    coeffs, _, _, _ = np.linalg.lstsq(A/col_scale, Mb.T, rcond=None)
+    slope, intercept = (coeffs.T/col_scale).T
+
+    baseline = slope[:, np.newaxis]*x + intercept[:, np.newaxis]
+    if return_also_params:
+        return baseline, dict(slope=slope, intercept=intercept, n_buffer=n_buffer_frames)
+    return baseline
@@ -114,6 +114,189 @@ def compute_lpm_baseline(x, y, return_also_params=False, **kwargs):
     else:
         return baseline
 
+LPM_MATRIX_RTOL = 1e-8      # documented tolerance of compute_lpm_baseline_matrix
+
+def _linregress_slopes(x, Y, W):
+    """Slopes of the row-wise least-squares lines through the points selected by W."""
+    n = W.sum(axis=1)
+    xm = (W * x).sum(axis=1) / n
+    ym = (W * Y).sum(axis=1) / n
+    dx = x - xm[:, np.newaxis]
+    return (W * dx * (Y - ym[:, np.newaxis])).sum(axis=1) / (W * dx * dx).sum(axis=1)
+
+def _compute_adaptive_p_final_matrix(x, Y, size_sigma):
+    """Row-wise _compute_adaptive_p_final with one shared spline design matrix."""
+    from scipy.interpolate import BSpline
+    from molass_legacy.SerialAnalyzer.BasePercentileOffset import base_percentile_offset
+    n = len(x)
+    knots = np.linspace(x[0], x[-1], max(3, n // 10) + 2)[1:-1]
+    t = np.r_[(x[0],)*4, knots, (x[-1],)*4]
+    try:
+        B = BSpline.design_matrix(x, t, 3).toarray()
+        coeffs, _, _, _ = np.linalg.lstsq(B, Y.T, rcond=None)
+        noisiness = np.std(Y - (B @ coeffs).T, axis=1)
+        signal_scale = np.maximum(np.abs(Y).max(axis=1), 1e-12)
+        noisiness = noisiness / signal_scale  # relative noisiness, matching table calibration
+    except Exception:
+        noisiness = np.std(Y, axis=1)
+    return np.array([base_percentile_offset(nz, size_sigma=size_sigma) for nz in noisiness])
+
+def _solve_lpm_matrix(x, Y, p_final, max_iter_num=10):
+    """Row-wise ScatteringBaseline(y, x=x).solve(p_final) for all rows of Y at once.
+
+    Each row follows its own path through the legacy iteration, i.e., its own
+    convergence and alternating-state detection, while the arithmetic is
+    done for all still-iterating rows together.
+    """
+    from molass_legacy.Baseline.ScatteringBaseline import (
+        PERCENTILE_FIRST, PERCENTILE_SECOND, VERY_SMALL_SLOPE_RATIO,
+        CONVERGENCE_RATIO, ALTERNATING_LIMIT_RATIO)
+    num_rows, n = Y.shape
+    very_small_slope = (Y.max(axis=1) - Y.min(axis=1)) / n * VERY_SMALL_SLOPE_RATIO
+    half_iter_num = max_iter_num//2
+
+    Y_ = Y
+    ppp = np.percentile(Y_, PERCENTILE_FIRST, axis=1)
+    active = np.ones(num_rows, dtype=bool)
+    alternating = np.zeros(num_rows, dtype=bool)
+    average_slope = np.zeros(num_rows)
+    slope = np.zeros(num_rows)
+    last_slope = None
+    init_diff = None
+    slope_list = []
+    for i in range(max_iter_num):
+        if i == half_iter_num:
+            # ScatteringBaseline.is_alternating for the rows still iterating
+            slope_array = np.array(slope_list).T
+            average_slope = np.average(slope_array, axis=1)
+            slope_devs = slope_array - average_slope[:, np.newaxis]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                total_stdev = np.std(slope_array, axis=1)
+                upper_ratio = _masked_std(slope_array, slope_devs > 0) / total_stdev
+                lower_ratio = _masked_std(slope_array, slope_devs < 0) / total_stdev
+            alternating = active & ((upper_ratio + lower_ratio) < ALTERNATING_LIMIT_RATIO)
+
+        new_slope = slope.copy()
+        if i > half_iter_num:
+            average_slope = np.average(np.array(slope_list[-half_iter_num:]), axis=0)
+        new_slope[alternating] = average_slope[alternating]
+        regress = active & ~alternating
+        if regress.any():
+            W = (Y_[regress] <= ppp[regress, np.newaxis]).astype(float)
+            new_slope[regress] = _linregress_slopes(x, Y[regress], W)
+        slope = np.where(active, new_slope, slope)
+
+        Y_ = Y - slope[:, np.newaxis] * x
+        ppp = np.percentile(Y_, PERCENTILE_SECOND, axis=1)
+        slope_list.append(slope.copy())
+
+        if last_slope is not None:
+            diff = np.abs(slope - last_slope)
+            if init_diff is None:
+                init_diff = diff
+            converged = (diff < very_small_slope) | (diff < init_diff * CONVERGENCE_RATIO)
+            active &= ~converged
+            if not active.any():
+                break
+        last_slope = slope.copy()
+
+    # ScatteringBaseline.solve: shift the line to the largest point below the p_final percentile
+    p = _percentile_per_row(Y_, p_final)
+    n_ = np.argmax(np.where(Y_ <= p[:, np.newaxis], Y_, -np.inf), axis=1)
+    rows = np.arange(num_rows)
+    intercept = Y[rows, n_] - slope * x[n_]
+    return slope, intercept
+
+def _masked_std(a, mask):
+    # np.std over the masked elements of each row, nan for empty rows as in np.std([])
+    count = mask.sum(axis=1)
+    mean = (a * mask).sum(axis=1) / count
+    return np.sqrt(((a - mean[:, np.newaxis])**2 * mask).sum(axis=1) / count)
+
+def _percentile_per_row(Y, q):
+    # np.percentile(Y[k], q[k]) with the default 'linear' method for every row k
+    num_rows, n = Y.shape
+    S = np.sort(Y, axis=1)
+    h = (n - 1) * np.broadcast_to(q, (num_rows,)) / 100
+    lo = np.floor(h).astype(int)
+    hi = np.minimum(lo + 1, n - 1)
+    frac = h - lo
+    rows = np.arange(num_rows)
+    a = S[rows, lo]
+    b = S[rows, hi]
+    diff_ = b - a
+    # same two-sided formula as numpy's _lerp for the best agreement
+    return np.where(frac >= 0.5, b - diff_ * (1 - frac), a + diff_ * frac)
+
+def compute_lpm_baseline_matrix(x, M, return_also_params=False, **kwargs):
+    """Compute the LPM baselines of all rows of a matrix at once.
+
+    This is a batched formulation of :func:`compute_lpm_baseline` applied
+    to each row, which runs the percentile-anchored iterations of all rows
+    together in NumPy instead of building a ``ScatteringBaseline`` per row.
+    The results agree with the row-wise baselines to a relative tolerance of
+    ``LPM_MATRIX_RTOL`` (with respect to each row's maximum absolute value),
+    except in the rare rows where a rounding difference flips a discrete
+    decision, e.g., the adaptive ``p_final`` table entry.
+
+    Parameters
+    ----------
+    x : array-like of shape (n,)
+        The x-coordinates shared by the rows.
+    M : array-like of shape (num_rows, n)
+        The y-coordinates, one curve per row.
+    return_also_params : bool, optional
+        If True, also return a dictionary of the row-wise slopes, intercepts
+        and ``p_final`` values.
+    **kwargs : dict, optional
+        ``size_sigma``, ``mask`` and ``endpoint_fraction`` as in
+        :func:`compute_lpm_baseline`.
+
+    Returns
+    -------
+    baseline : ndarray of shape (num_rows, n)
+        The computed baselines.
+    """
+    x = np.asarray(x, dtype=float)
+    M = np.asarray(M, dtype=float)
+    num_rows, n = M.shape
+
+    endpoint_fraction = kwargs.get('endpoint_fraction', None)
+    if endpoint_fraction is not None and endpoint_fraction > 0:
+        k = max(2, int(endpoint_fraction * n))
+        ep_mask = np.zeros(n, dtype=bool)
+        ep_mask[:k] = True
+        ep_mask[-k:] = True
+        xe, Ye = x[ep_mask], M[:, ep_mask]
+        slope = _linregress_slopes(xe, Ye, np.ones(Ye.shape))
+        intercept = Ye.mean(axis=1) - slope * xe.mean()
+        baseline = slope[:, np.newaxis] * x + intercept[:, np.newaxis]
+        if return_also_params:
+            return baseline, dict(slope=slope, intercept=intercept, p_final=None,
+                                  endpoint_fraction=endpoint_fraction)
+        return baseline
+
+    mask = kwargs.get('mask', None)
+    if mask is not None:
+        x_fit = x[mask]
+        Y_fit = M[:, mask]
+    else:
+        x_fit = x
+        Y_fit = M
+
+    size_sigma = kwargs.get('size_sigma', None)
+    if size_sigma is not None:
+        p_final = _compute_adaptive_p_final_matrix(x_fit, Y_fit, size_sigma)
+    else:
+        from molass_legacy.Baseline.ScatteringBaseline import PERCENTILE_FINAL
+        p_final = np.full(num_rows, PERCENTILE_FINAL, dtype=float)
+
+    slope, intercept = _solve_lpm_matrix(x_fit, Y_fit, p_final)
+    baseline = slope[:, np.newaxis] * x + intercept[:, np.newaxis]
+    if return_also_params:
+        return baseline, dict(slope=slope, intercept=intercept,
+                              p_final=None if size_sigma is None else p_final)
+    return baseline
 
 class LpmBaseline(Curve):
     """A class to represent the linear plus minimum baseline of a curve.
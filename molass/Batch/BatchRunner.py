@@ -0,0 +1,228 @@
+"""
+    Batch.BatchRunner.py
+
+    This module contains the functions that are used to run the standard
+    pipeline on many SEC-SAXS datasets in parallel.
+
+        load → trimmed_copy → corrected_copy → get_rg_curve → quick_decomposition
+
+    Each dataset is processed in a worker process, and a failure of one
+    dataset is recorded in the results table without stopping the others.
+"""
+import os
+import csv
+import json
+from time import time
+
+RESULTS_TABLE_NAME = 'batch_results.csv'
+RESULT_FILE_NAME = 'result.json'
+STEP_NAMES = ['load', 'trim', 'correct', 'rg_curve', 'decomposition']
+TABLE_COLUMNS = ['dataset', 'folder', 'status', 'num_frames', 'num_components', 'rgs', 'proportions'] \
+                + ['time_%s' % name for name in STEP_NAMES] + ['time_total', 'error']
+
+def get_dataset_name(root_folder, folder):
+    """
+    Get a dataset name which is unique within the root folder.
+
+    Parameters
+    ----------
+    root_folder : str
+        The root folder of the batch.
+    folder : str
+        The dataset folder under the root folder.
+
+    Returns
+    -------
+    str
+        The relative path of the folder with the path separators replaced by '__'.
+    """
+    relpath = os.path.relpath(folder, root_folder)
+    if relpath == os.curdir:
+        relpath = os.path.basename(os.path.abspath(folder))
+    return relpath.replace(os.sep, '__')
+
+def process_dataset(folder, out_folder=None, name=None, decomposition_kwargs=None, quiet=True):
+    """
+    Run the standard pipeline on a dataset folder.
+
+    Parameters
+    ----------
+    folder : str
+        The dataset folder.
+    out_folder : str, optional
+        If specified, the result is also written to
+        ``out_folder/<name>/result.json``.
+    name : str, optional
+        The dataset name. If None, the base name of the folder is used.
+    decomposition_kwargs : dict, optional
+        Keyword arguments passed to ``quick_decomposition()``.
+    quiet : bool, optional
+        If True, suppress verbose diagnostic output from the pipeline.
+        The global option is restored when the pipeline is done.
+
+    Returns
+    -------
+    record : dict
+        A row of the results table with keys in ``TABLE_COLUMNS``.
+        The ``status`` is 'ok' or 'error', in which case ``error``
+        contains the traceback.
+    """
+    import traceback
+    from molass.Global.Options import get_molass_options, set_molass_options
+    from molass.DataObjects.SecSaxsData import SecSaxsData
+
+    if name is None:
+        name = os.path.basename(os.path.abspath(folder))
+    if decomposition_kwargs is None:
+        decomposition_kwargs = {}
+    previous_quiet = get_molass_options('quiet')
+    set_molass_options(quiet=quiet)
+
+    record = dict(dataset=name, folder=folder, status='error')
+    start_time = time()
+    t0 = start_time
+    step = None
+    try:
+        step = 'load'
+        ssd = SecSaxsData(folder)
+        record['num_frames'] = ssd.xr.M.shape[1]
+        t0 = _record_time(record, step, t0)
+
+        step = 'trim'
+        trimmed = ssd.trimmed_copy()
+        t0 = _record_time(record, step, t0)
+
+        step = 'correct'
+        corrected = trimmed.corrected_copy()
+        t0 = _record_time(record, step, t0)
+
+        step = 'rg_curve'
+        rgcurve = corrected.get_rg_curve()
+        t0 = _record_time(record, step, t0)
+
+        step = 'decomposition'
+        decomp = corrected.quick_decomposition(rgcurve=rgcurve, **decomposition_kwargs)
+        record['num_components'] = decomp.get_num_components()
+        record['rgs'] = [float(rg) for rg in decomp.get_rgs()]
+        record['proportions'] = [float(p) for p in decomp.get_proportions()]
+        t0 = _record_time(record, step, t0)
+        record['status'] = 'ok'
+    except Exception:
+        record['error'] = 'failed at %s: %s' % (step, traceback.format_exc())
+    finally:
+        # with n_jobs=1, this runs in the caller's process
+        set_molass_options(quiet=previous_quiet)
+    record['time_total'] = time() - start_time
+
+    if out_folder is not None:
+        result_folder = os.path.join(out_folder, name)
+        os.makedirs(result_folder, exist_ok=True)
+        with open(os.path.join(result_folder, RESULT_FILE_NAME), 'w') as fh:
+            json.dump(record, fh, indent=2)
+    return record
+
+def _record_time(record, step, t0):
+    t1 = time()
+    record['time_%s' % step] = t1 - t0
+    return t1
+
+def run_batch(root_folder, out_folder, n_jobs=-1, depth=3, decomposition_kwargs=None, quiet=True):
+    """
+    Run the standard pipeline on all datasets found under a root folder.
+
+    The datasets are discovered with
+    :func:`~molass.DataUtils.FolderWalker.walk_folders` and processed in a
+    process pool.  The results table ``out_folder/batch_results.csv`` is
+    written incrementally as datasets complete, so that the finished part
+    survives an interrupted run.
+
+    Parameters
+    ----------
+    root_folder : str
+        The root folder to search for datasets.
+    out_folder : str
+        The folder to write the results table and per-dataset results.
+    n_jobs : int, optional
+        The number of worker processes. -1 (default) uses all CPUs,
+        1 processes the datasets serially in this process.
+    depth : int, optional
+        The maximum depth of the folder search.
+    decomposition_kwargs : dict, optional
+        Keyword arguments passed to ``quick_decomposition()`` for every dataset.
+    quiet : bool, optional
+        If True, suppress verbose diagnostic output from the pipeline.
+
+    Returns
+    -------
+    records : list of dict
+        The rows of the results table in the order of the discovered folders.
+    """
+    from molass.DataUtils.FolderWalker import walk_folders
+    from molass.PackageUtils.ParallelUtils import get_num_workers
+
+    folders = list(walk_folders(root_folder, depth=depth))
+    names = [get_dataset_name(root_folder, folder) for folder in folders]
+    os.makedirs(out_folder, exist_ok=True)
+    table_path = os.path.join(out_folder, RESULTS_TABLE_NAME)
+    records = [None] * len(folders)
+
+    with open(table_path, 'w', newline='') as fh:
+        writer = csv.DictWriter(fh, fieldnames=TABLE_COLUMNS)
+        writer.writeheader()
+
+        def add_record(k, record):
+            records[k] = record
+            writer.writerow(_to_table_row(record))
+            fh.flush()
+
+        num_workers = min(get_num_workers(n_jobs), max(1, len(folders)))
+        if num_workers == 1:
+            for k, (folder, name) in enumerate(zip(folders, names)):
+                add_record(k, process_dataset(folder, out_folder=out_folder, name=name,
+                                              decomposition_kwargs=decomposition_kwargs, quiet=quiet))
+        else:
+            from concurrent.futures import ProcessPoolExecutor, as_completed
+            with ProcessPoolExecutor(max_workers=num_workers) as executor:
+                future_dict = {}
+                for k, (folder, name) in enumerate(zip(folders, names)):
+                    future = executor.submit(process_dataset, folder, out_folder=out_folder, name=name,
+                                             decomposition_kwargs=decomposition_kwargs, quiet=quiet)
+                    future_dict[future] = k
+                for future in as_completed(future_dict):
+                    k = future_dict[future]
+                    try:
+                        record = future.result()
+                    except Exception as e:
+                        # e.g., BrokenProcessPool when a worker has been killed
+                        record = dict(dataset=names[k], folder=folders[k], status='error',
+                                      error='worker failed: %r' % e)
+                    add_record(k, record)
+    return records
+
+def _to_table_row(record):
+    row = {}
+    for key in TABLE_COLUMNS:
+        value = record.get(key)
+        if isinstance(value, list):
+            value = ' '.join('%.4g' % v for v in value)
+        elif isinstance(value, float):
+            value = '%.4g' % value
+        row[key] = '' if value is None else value
+    return row
+
+def load_batch_results(out_folder):
+    """
+    Load the results table written by :func:`run_batch`.
+
+    Parameters
+    ----------
+    out_folder : str
+        The output folder of the batch.
+
+    Returns
+    -------
+    rows : list of dict
+        The rows of the results table as strings.
+    """
+    with open(os.path.join(out_folder, RESULTS_TABLE_NAME), newline='') as fh:
+        return list(csv.DictReader(fh))
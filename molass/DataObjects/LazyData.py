@@ -0,0 +1,89 @@
+"""
+    DataObjects.LazyData.py
+
+    A proxy of an XrData or UvData object which is loaded on first access.
+"""
+
+class LazyData:
+    """
+    A proxy which materializes a data object on first attribute access.
+
+    ``SecSaxsData(folder, lazy=True)`` holds its ``xr`` and ``uv`` as
+    instances of this class, so that creating the object does not read the
+    data files.  Any attribute access, e.g., ``ssd.xr.M`` or
+    ``ssd.xr.get_icurve()``, loads the data and is then forwarded to the
+    loaded object.  Attributes set before the data are loaded are kept and
+    applied to the loaded object.
+
+    Attributes
+    ----------
+    header : dict
+        Lightweight information obtained without loading the data,
+        e.g., from :func:`~molass.DataUtils.XrLoader.scan_xr_header`.
+    """
+    def __init__(self, loader, header=None):
+        """
+        Parameters
+        ----------
+        loader : callable
+            A function without arguments which loads and returns the data object.
+        header : dict or callable, optional
+            The lightweight information, or a function without arguments
+            which returns it when first requested.
+        """
+        object.__setattr__(self, '_loader', loader)
+        object.__setattr__(self, '_target', None)
+        object.__setattr__(self, '_loaded', False)
+        object.__setattr__(self, '_pending', {})
+        object.__setattr__(self, '_header', header)
+
+    def materialize(self):
+        """
+        Load the data object if not yet loaded.
+
+        Returns
+        -------
+        XrData or UvData or None
+            The loaded data object, which is None if the loader found no data.
+        """
+        if not self.is_materialized():
+            target = object.__getattribute__(self, '_loader')()
+            if target is not None:
+                for name, value in object.__getattribute__(self, '_pending').items():
+                    setattr(target, name, value)
+            object.__setattr__(self, '_target', target)
+            object.__setattr__(self, '_loaded', True)
+            object.__setattr__(self, '_loader', None)
+        return object.__getattribute__(self, '_target')
+
+    def is_materialized(self):
+        """
+        Returns whether the data object has been loaded.
+        """
+        return object.__getattribute__(self, '_loaded')
+
+    @property
+    def header(self):
+        header = object.__getattribute__(self, '_header')
+        if callable(header):
+            header = header()
+            object.__setattr__(self, '_header', header)
+        return header
+
+    def __getattr__(self, name):
+        # called only for attributes not defined in this class
+        pending = object.__getattribute__(self, '_pending')
+        if name in pending and not self.is_materialized():
+            return pending[name]
+        return getattr(self.materialize(), name)
+
+    def __setattr__(self, name, value):
+        if self.is_materialized():
+            setattr(object.__getattribute__(self, '_target'), name, value)
+        else:
+            object.__getattribute__(self, '_pending')[name] = value
+
+    def __repr__(self):
+        if self.is_materialized():
+            return "LazyData(%r)" % object.__getattribute__(self, '_target')
+        return "LazyData(not loaded)"
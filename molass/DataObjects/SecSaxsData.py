@@ -105,6 +105,9 @@ class SecSaxsData:
                  uv_pickat=None,
                  uv_monitor=None,
                  xr_pickat=None,
+                 use_cache=None,
+                 load_mode='serial',
+                 lazy=None,
                  debug=False):
         """ssd = SecSacsData(data_folder)
         
@@ -149,6 +152,21 @@ class SecSaxsData:
         xr_pickat : float, optional
             The q-value (Å⁻¹) at which to extract the XR elution profile.
             Defaults to 0.02 when None.
+        use_cache : bool, optional
+            If True, the data are loaded through the binary cache in
+            :mod:`molass.DataUtils.LoadCache`, which makes reopening a folder
+            much faster.  If None, the global option ``load_cache`` is used.
+        load_mode : str, optional
+            How the XR .dat files are read: ``'serial'`` (default),
+            ``'threads'`` or ``'processes'``.  The concurrent modes make
+            loading faster especially on network filesystems.
+            See :func:`~molass.DataUtils.XrLoader.load_xr_parallel`.
+        lazy : bool, optional
+            If True, the XR and UV data are not loaded here but on first
+            access of ``ssd.xr`` or ``ssd.uv`` attributes, which are then
+            :class:`~molass.DataObjects.LazyData.LazyData` proxies.
+            Use :meth:`get_header_info` to get the data shapes and ranges
+            without loading.  If None, the global option ``lazy_load`` is used.
         debug : bool, optional
             If True, enables debug mode for more verbose output.
 
@@ -160,54 +178,37 @@ class SecSaxsData:
         """
         start_time = time()
         self.logger = logging.getLogger(__name__)
-        from molass.Global.Quiet import suppress_if_quiet
+        self._datafiles = datafiles
+        self._beamline_info = beamline_info
         if folder is None:
             assert object_list is not None
             xr_data, uv_data = object_list
-            self.datafiles = datafiles
         else:
             assert object_list is None
-            with suppress_if_quiet(debug=debug):
-                if uv_only:
-                    xrM = None
-                    xrE = None
-                    qv = None
-                else:
-                    if not os.path.isdir(folder):
-                        raise FileNotFoundError(f"Folder {folder} does not exist.")
-                    
-                    from molass.DataUtils.XrLoader import load_xr_with_options
-                    xr_array, datafiles = load_xr_with_options(folder, remove_bubbles=remove_bubbles, logger=self.logger)
-                    xrM = xr_array[:,:,1].T
-                    xrE = xr_array[:,:,2].T
-                    qv = xr_array[0,:,0]
-                    set_setting('in_folder', folder)    # for backward compatibility
-                    self.datafiles = datafiles
-
-                if xr_only:
-                    uvM, wv = None, None
-                else:
-                    from molass.DataUtils.UvLoader import load_uv
-                    from molass.DataUtils.Beamline import get_beamlineinfo_from_settings
-                    uvM, wv, conc_file = load_uv(folder, return_also_conc_file=True)
-                    beamline_info = get_beamlineinfo_from_settings()
-                    set_setting('uv_folder', folder)    # for backward compatibility
-                    set_setting('uv_file', conc_file)   # for backward compatibility
-                uvE = None
- 
-            if xrM is None:
-                xr_data = None
+            from molass.Global.Options import get_molass_options
+            if use_cache is None:
+                use_cache = get_molass_options('load_cache')
+            if lazy is None:
+                lazy = get_molass_options('lazy_load')
+            if not uv_only and not os.path.isdir(folder):
+                raise FileNotFoundError(f"Folder {folder} does not exist.")
+
+            def load_xr_data():
+                return self._load_xr_data(folder, remove_bubbles, use_cache, load_mode, debug)
+
+            def load_uv_data():
+                return self._load_uv_data(folder, use_cache, debug)
+
+            if lazy:
+                from molass.DataObjects.LazyData import LazyData
+                from molass.DataUtils.XrLoader import scan_xr_header
+                xr_data = None if uv_only else LazyData(load_xr_data, header=lambda: scan_xr_header(folder))
+                uv_data = None if xr_only or not self._may_have_uv_data(folder) else LazyData(load_uv_data)
             else:
-                from molass.DataObjects.XrData import XrData
-                xr_data = XrData(xrM, qv, None, xrE)
+                xr_data = None if uv_only else load_xr_data()
+                uv_data = None if xr_only else load_uv_data()
             self.xr_data = xr_data
 
-            if uvM is None:
-                uv_data = None
-            else:
-                from molass.DataObjects.UvData import UvData
-                uv_data = UvData(uvM, wv, None, uvE)
-    
         self.xr = xr_data
         self.uv = uv_data
         effective_uv_pickat = uv_monitor if uv_monitor is not None else uv_pickat
@@ -218,7 +219,6 @@ class SecSaxsData:
         self.trimmed = trimmed
         self.trimming = trimming
         self.mapping = mapping
-        self.beamline_info = beamline_info
         if time_initialized is None:
             self.time_initialized = time() - start_time
         else:
@@ -226,11 +226,157 @@ class SecSaxsData:
         self.time_required = self.time_initialized          # updated later in trimmed_copy() or corrected_copy()
         self.time_required_total = self.time_initialized    # updated later in trimmed_copy() or corrected_copy()
 
+    def _load_xr_data(self, folder, remove_bubbles, use_cache, load_mode, debug):
+        from molass.Global.Quiet import suppress_if_quiet
+        from molass.DataUtils.XrLoader import load_xr_with_options
+        from molass.DataObjects.XrData import XrData
+        with suppress_if_quiet(debug=debug):
+            xr_array, datafiles = load_xr_with_options(folder, remove_bubbles=remove_bubbles, use_cache=use_cache,
+                                                       load_mode=load_mode, logger=self.logger)
+            set_setting('in_folder', folder)    # for backward compatibility
+        self._datafiles = datafiles
+        xrM = xr_array[:,:,1].T
+        xrE = xr_array[:,:,2].T
+        qv = xr_array[0,:,0]
+        return XrData(xrM, qv, None, xrE)
+
+    def _load_uv_data(self, folder, use_cache, debug):
+        from molass.Global.Quiet import suppress_if_quiet
+        from molass.DataUtils.UvLoader import load_uv
+        from molass.DataUtils.Beamline import get_beamlineinfo_from_settings
+        from molass.DataObjects.UvData import UvData
+        with suppress_if_quiet(debug=debug):
+            uvM, wv, conc_file = load_uv(folder, return_also_conc_file=True, use_cache=use_cache)
+            self._beamline_info = get_beamlineinfo_from_settings()
+            set_setting('uv_folder', folder)    # for backward compatibility
+            set_setting('uv_file', conc_file)   # for backward compatibility
+        if uvM is None:
+            return None
+        uvE = None
+        return UvData(uvM, wv, None, uvE)
+
+    @staticmethod
+    def _may_have_uv_data(folder):
+        # the same conditions as load_uv_array, checked without reading the data,
+        # so that an XR-only folder gets uv=None also when loaded lazily
+        from molass_legacy._MOLASS.SerialSettings import get_setting
+        from molass_legacy.SerialAnalyzer.SerialDataUtils import find_conc_files
+        if get_setting('disable_uv_data'):
+            return False
+        return not os.path.isdir(folder) or len(find_conc_files(folder)) > 0
+
+    def _is_pending(self, data):
+        from molass.DataObjects.LazyData import LazyData
+        return isinstance(data, LazyData) and not data.is_materialized()
+
+    @property
+    def uv(self):
+        """The UV data, or None.
+
+        A lazy proxy is replaced by None once it has been loaded and found no data.
+        """
+        from molass.DataObjects.LazyData import LazyData
+        uv = self._uv
+        if isinstance(uv, LazyData) and uv.is_materialized() and uv.materialize() is None:
+            uv = self._uv = None
+        return uv
+
+    @uv.setter
+    def uv(self, value):
+        self._uv = value
+
+    @property
+    def datafiles(self):
+        """The list of XR data files, which are known after the XR data are loaded."""
+        if self._is_pending(self.xr):
+            self.xr.materialize()
+        return self._datafiles
+
+    @datafiles.setter
+    def datafiles(self, value):
+        self._datafiles = value
+
+    @property
+    def beamline_info(self):
+        """The beamline information, which is known after the UV data are loaded."""
+        if self._is_pending(self.uv):
+            self.uv.materialize()
+        return self._beamline_info
+
+    @beamline_info.setter
+    def beamline_info(self, value):
+        self._beamline_info = value
+
+    def is_loaded(self):
+        """ssd.is_loaded()
+
+        Returns whether both XR and UV data have been loaded, which is
+        False only for a lazy object of which some data have not yet been accessed.
+
+        Returns
+        -------
+        bool
+            True if no data are pending.
+        """
+        return not (self._is_pending(self.xr) or self._is_pending(self.uv))
+
+    def get_header_info(self):
+        """ssd.get_header_info()
+
+        Returns the shape and ranges of the data without loading the XR data.
+
+        For a lazy object whose XR data have not been loaded, the XR part
+        comes from a scan of the file names and the first data file.
+        The UV part is read from the UV data, which is a single small file.
+
+        Returns
+        -------
+        info : HeaderInfo (namedtuple)
+            A namedtuple with the following fields:
+
+            - ``n_xr_frames`` (int or None): Number of XR frames
+            - ``n_xr_points`` (int or None): Number of q-values
+            - ``q_range`` (tuple or None): ``(qmin, qmax)`` of the XR data
+            - ``n_uv_frames`` (int or None): Number of UV frames
+            - ``n_uv_points`` (int or None): Number of wavelengths
+            - ``wavelength_range`` (tuple or None): ``(wmin, wmax)`` of the UV data in nm
+
+        Examples
+        --------
+        >>> ssd = SecSaxsData('the_data_folder', lazy=True)
+        >>> print(ssd.get_header_info())
+        """
+        from collections import namedtuple
+        HeaderInfo = namedtuple('HeaderInfo', [
+            'n_xr_frames', 'n_xr_points', 'q_range',
+            'n_uv_frames', 'n_uv_points', 'wavelength_range',
+        ])
+        n_xr_frames = n_xr_points = q_range = None
+        if self._is_pending(self.xr):
+            header = self.xr.header
+            n_xr_frames = header['num_frames']
+            n_xr_points = header['num_points']
+            q_range = header['q_range']
+        elif self.xr is not None:
+            n_xr_points, n_xr_frames = self.xr.M.shape
+            q_range = (float(self.xr.qv[0]), float(self.xr.qv[-1]))
+        n_uv_frames = n_uv_points = wavelength_range = None
+        if self.uv is not None:
+            uv = self.uv.materialize() if self._is_pending(self.uv) else self.uv
+            if uv is not None:
+                n_uv_points, n_uv_frames = uv.M.shape
+                wavelength_range = (float(uv.wv[0]), float(uv.wv[-1]))
+        return HeaderInfo(n_xr_frames, n_xr_points, q_range, n_uv_frames, n_uv_points, wavelength_range)
+
     def __repr__(self):
         parts = []
-        if self.xr is not None:
+        if self._is_pending(self.xr):
+            parts.append("xr=not loaded")
+        elif self.xr is not None:
             parts.append(f"xr={self.xr.M.shape[1]} frames")
-        if self.uv is not None:
+        if self._is_pending(self.uv):
+            parts.append("uv=not loaded")
+        elif self.uv is not None:
             parts.append(f"uv={self.uv.M.shape[1]} frames, pickat={self.uv.pickat}")
         parts.append(f"trimmed={self.trimmed}")
         return f"SecSaxsData({', '.join(parts)})"
@@ -265,6 +411,8 @@ class SecSaxsData:
         has_uv : bool
             True if the UV data is available, False otherwise.
         """
+        if self._is_pending(self.uv):
+            self.uv.materialize()       # replaced by None if no data are found
         return self.uv is not None
 
     def plot_3d(self, **kwargs):
@@ -426,8 +574,8 @@ class SecSaxsData:
             trim = self.make_trimming(**kwargs)
         return plot_trimming_impl(self, trim, baseline=baseline, title=title, **kwargs)
 
-    def copy(self, xr_slices=None, uv_slices=None, trimmed=False, trimming=None, mapping=None, datafiles=None):
-        """ssd.copy(xr_slices=None, uv_slices=None)
+    def copy(self, xr_slices=None, uv_slices=None, trimmed=False, trimming=None, mapping=None, datafiles=None, view=False):
+        """ssd.copy(xr_slices=None, uv_slices=None, view=False)
         
         Returns a deep copy of this object.
 
@@ -445,6 +593,14 @@ class SecSaxsData:
             Otherwise, the returned copy contains the deep copies
             of elements uvM and wv.
 
+        view : bool, optional
+            If True, the matrices of the returned object are read-only views
+            into those of this object, which are copied only when a mutating
+            operation such as baseline subtraction needs them.  The matrices
+            of this object are made read-only as well, so that modifying them
+            later does not change the views.
+            See :meth:`~molass.DataObjects.SsMatrixData.SsMatrixData.copy`.
+
         Returns
         -------
         SecSaxsData
@@ -457,23 +613,56 @@ class SecSaxsData:
         >>> trimmed_ssd = ssd.copy(xr_slices=trimming.xr_slices, uv_slices=trimming.uv_slices)
 
         """
- 
+        return self._copy(xr_slices=xr_slices, uv_slices=uv_slices, trimmed=trimmed, trimming=trimming,
+                          mapping=mapping, datafiles=datafiles, view=view)
+
+    def _copy(self, xr_slices=None, uv_slices=None, trimmed=False, trimming=None, mapping=None, datafiles=None,
+              view=False, lock=True):
+        # lock=False leaves the matrices of this object writable, for a copy whose
+        # views are replaced before it is returned, see corrected_copy()
         if self.xr is None:
             xr_data = None
         else:
-            xr_data = self.xr.copy(slices=xr_slices)
-            
+            xr_data = self.xr.copy(slices=xr_slices, view=view, lock=lock)
+
         if self.uv is None:
             uv_data = None
         else:
-            uv_data = self.uv.copy(slices=uv_slices)
-            
+            uv_data = self.uv.copy(slices=uv_slices, view=view, lock=lock)
+
         return SecSaxsData(object_list=[xr_data, uv_data], trimmed=trimmed, trimming=trimming,
                            beamline_info=self.beamline_info, mapping=mapping, 
                            time_initialized=self.time_initialized, datafiles=datafiles)
 
-    def trimmed_copy(self, trimming=None, jranges=None, mapping=None, nsigmas=None, uv_wavelength=None):
-        """ssd.trimmed_copy(trimming=None, jranges=None, mapping=None, nsigmas=None, uv_wavelength=None)
+    def astype(self, dtype):
+        """ssd.astype(dtype)
+
+        Returns a copy of this object of which the XR and UV matrices are
+        stored in the specified type.
+
+        Parameters
+        ----------
+        dtype : data-type
+            The storage type, e.g., ``np.float32`` to halve the memory of
+            large datasets.  Baseline fitting and SVD are still done in float64.
+
+        Returns
+        -------
+        SecSaxsData
+            A copy of the SSD object with the matrices converted.
+
+        Examples
+        --------
+        >>> ssd32 = ssd.astype(np.float32)
+        """
+        xr_data = None if self.xr is None else self.xr.astype(dtype)
+        uv_data = None if self.uv is None else self.uv.astype(dtype)
+        return SecSaxsData(object_list=[xr_data, uv_data], trimmed=self.trimmed, trimming=self.trimming,
+                           beamline_info=self.beamline_info, mapping=self.mapping,
+                           time_initialized=self.time_initialized, datafiles=self.datafiles)
+
+    def trimmed_copy(self, trimming=None, jranges=None, mapping=None, nsigmas=None, uv_wavelength=None, view=None):
+        """ssd.trimmed_copy(trimming=None, jranges=None, mapping=None, nsigmas=None, uv_wavelength=None, view=None)
 
         Parameters
         ----------
@@ -492,6 +681,10 @@ class SecSaxsData:
             (``None`` on the min side uses the instrument's usable wavelength start,
             typically ~250 nm; ``None`` on the max side uses the full upper end).
             Example: ``uv_wavelength=(None, 550)`` trims UV to ≤ 550 nm.
+        view : bool or None, optional
+            If True, the trimmed matrices are copy-on-write views into those
+            of this object instead of copies.  See :meth:`copy`.
+            If None, the global option ``copy_on_write`` is used.
 
         Returns
         -------
@@ -500,6 +693,9 @@ class SecSaxsData:
         """
         start_time = time()
         from molass.Global.Quiet import suppress_if_quiet
+        if view is None:
+            from molass.Global.Options import get_molass_options
+            view = get_molass_options('copy_on_write')
         with suppress_if_quiet():
             if trimming is None:
                 uv_wr = None
@@ -521,7 +717,8 @@ class SecSaxsData:
         result = self.copy(xr_slices=trimming.xr_slices, uv_slices=trimming.uv_slices,
                            trimmed=True, trimming=trimming,
                            mapping=mapping,
-                           datafiles=self.datafiles)
+                           datafiles=self.datafiles,
+                           view=view)
         result.time_required = time() - start_time
         result.time_required_total = self.time_required_total + result.time_required
         return result
@@ -697,7 +894,7 @@ class SecSaxsData:
                 self.uv.has_anomaly_mask = False
                 self.uv.anomaly_mask = None
 
-    def corrected_copy(self, baseline=None, debug=False, **baseline_kwargs):
+    def corrected_copy(self, baseline=None, debug=False, inplace=False, view=None, **baseline_kwargs):
         """ssd.corrected_copy()
         
         Returns a deep copy of this object which has been corrected
@@ -713,6 +910,19 @@ class SecSaxsData:
             computed internally.
         debug : bool, optional
             If True, enables debug mode for more verbose output.
+        inplace : bool, optional
+            If True, this object itself is corrected and returned instead of
+            a copy, so that the uncorrected matrices are not kept in memory.
+            The matrices are replaced by the corrected ones, written into the
+            baseline buffers, rather than modified in place, since they may be
+            shared with the views of ``trimmed_copy(view=True)`` in either
+            direction; such objects are left intact.
+            Default False.
+        view : bool or None, optional
+            If True, the matrices of the copy which are not changed by the
+            correction, e.g., ``xr.E``, remain copy-on-write views into those
+            of this object.  See :meth:`copy`.  If None, the global option
+            ``copy_on_write`` is used.  Ignored if ``inplace=True``.
         **baseline_kwargs :
             Additional keyword arguments forwarded to :meth:`get_baseline2d`
             for both XR and UV.
@@ -720,7 +930,8 @@ class SecSaxsData:
         Returns
         -------
         SecSaxsData
-            A deep copy of the SSD object with the baseline correction applied.
+            A deep copy of the SSD object with the baseline correction applied,
+            or this object if ``inplace=True``.
 
         Examples
         --------
@@ -728,10 +939,25 @@ class SecSaxsData:
         >>> ssd.set_anomaly_mask()                                    # for negative-peak datasets
         >>> corrected = ssd.corrected_copy()                          # LPM with negative frames masked
         >>> corrected = ssd.corrected_copy(baseline=my_baseline)      # pre-computed XR baseline
+        >>> corrected = ssd.corrected_copy(inplace=True)              # corrects ssd itself
         """
         start_time = time()
         from molass.Global.Quiet import suppress_if_quiet
-        ssd_copy = self.copy(trimmed=self.trimmed, trimming=self.trimming, datafiles=self.datafiles)
+        if inplace:
+            ssd_copy = self
+            if self.uv is not None and getattr(self.xr, 'has_anomaly_mask', False):
+                self.get_mapping()      # estimated from the uncorrected data as in the copy mode
+            for data in (self.xr, self.uv):
+                if data is not None:
+                    data.moment = None  # to be recomputed from the corrected data
+        else:
+            if view is None:
+                from molass.Global.Options import get_molass_options
+                view = get_molass_options('copy_on_write')
+            # views suffice since the subtraction below allocates the corrected matrices;
+            # the others are copied at the end unless views are requested
+            ssd_copy = self._copy(trimmed=self.trimmed, trimming=self.trimming, datafiles=self.datafiles,
+                                  view=True, lock=view)
 
         with suppress_if_quiet(debug=debug):
             if baseline is not None:
@@ -741,10 +967,10 @@ class SecSaxsData:
                     "UV baseline is computed normally.",
                     stacklevel=2,
                 )
-                ssd_copy.xr.M -= baseline
+                ssd_copy.xr.subtract_baseline(baseline, shared=inplace)
             else:
                 baseline = ssd_copy.xr.get_baseline2d(debug=debug, **baseline_kwargs)
-                ssd_copy.xr.M -= baseline
+                ssd_copy.xr.subtract_baseline(baseline, reuse=True, shared=inplace)
 
             # Unified anomaly detection across XR and UV channels.
             # When set_anomaly_mask() was called, both xr and uv have the flag.
@@ -760,10 +986,11 @@ class SecSaxsData:
 
             if ssd_copy.uv is not None:
                 baseline = ssd_copy.uv.get_baseline2d(debug=debug, **baseline_kwargs)
-                ssd_copy.uv.M -= baseline
+                ssd_copy.uv.subtract_baseline(baseline, reuse=True, shared=inplace)
 
         # Interpolate XR for XR-detected anomalies
         if xr_exclude is not None and xr_exclude.any():
+            ssd_copy.xr.ensure_writable()
             self._interpolate_excluded(ssd_copy.xr.M, xr_exclude)
             # Map to UV and interpolate corresponding frames
             if ssd_copy.uv is not None:
@@ -776,12 +1003,19 @@ class SecSaxsData:
                     uv_lo, uv_hi = uv_frames_mapped.min(), uv_frames_mapped.max()
                     uv_exclude = (uv_jv >= uv_lo) & (uv_jv <= uv_hi)
                     if uv_exclude.any():
+                        ssd_copy.uv.ensure_writable()
                         self._interpolate_excluded(ssd_copy.uv.M, uv_exclude)
 
         # Cache the mask for visualization (plot bands)
         if xr_exclude is not None:
             ssd_copy.xr.anomaly_mask = xr_exclude
 
+        if not inplace and not view:
+            for data in (ssd_copy.xr, ssd_copy.uv):
+                if data is not None:
+                    data.ensure_writable()
+                    data.view_slices = None
+
         ssd_copy.time_required = time() - start_time
         ssd_copy.time_required_total = self.time_required_total + ssd_copy.time_required
         ssd_copy.corrected = True  # flag for optimize_rigorously() Pattern A/B warning (#164)
@@ -997,7 +1231,7 @@ class SecSaxsData:
 
         return cls(object_list=[xr_data, uv_data], trimmed=trimmed)
 
-    def get_rg_curve(self, progress_cb=None):
+    def get_rg_curve(self, progress_cb=None, n_jobs=None):
         """Compute the per-frame Rg curve from the corrected XR data, with caching.
 
         Runs a Guinier fit on every elution frame independently and returns
@@ -1021,6 +1255,10 @@ class SecSaxsData:
             The signature is compatible with the legacy ``ProgressCallback``
             so GUI callers can drive a progress bar and live Rg overlay.
             Ignored if the result is already cached.
+        n_jobs : int or None, optional
+            The number of worker processes for the per-frame Guinier fits.
+            None or 1 runs serially; -1 uses all CPUs.  The result is
+            identical to the serial one.  Ignored if the result is already cached.
 
         Returns
         -------
@@ -1037,7 +1275,7 @@ class SecSaxsData:
         Decomposition.get_rg_curve : same pattern on a Decomposition object
         """
         if getattr(self, '_rgcurve', None) is None:
-            self._rgcurve = self.xr.compute_rgcurve(progress_cb=progress_cb)
+            self._rgcurve = self.xr.compute_rgcurve(progress_cb=progress_cb, n_jobs=n_jobs)
         return self._rgcurve
 
     def recommend_decomposition_options(self, egh_overlap_threshold=1.3):
@@ -1171,6 +1409,13 @@ class SecSaxsData:
             such as those arising from buffer composition mismatch.
             Default False.
 
+        solver : str, optional
+            The optimizer of the default algorithm.
+            ``'nelder-mead'`` (default) minimizes the penalty objective with Nelder-Mead.
+            ``'least_squares'`` uses a bounded least-squares solver with analytic
+            EGH Jacobians, which typically needs an order of magnitude fewer
+            function evaluations.
+
         debug : bool, optional
             If True, reload internal modules and show diagnostic plots.
             Default False.
@@ -1191,7 +1436,7 @@ class SecSaxsData:
             'area_weight', 'sec_constraints', 'data_matrix', 'qv',
             'curve_model', 'smoothing', 'decompargs', 'peakpositions',
             'smooth_uv', 'consistent_uv', 'ip_effect_info',
-            'rgcurve',
+            'rgcurve', 'solver',
         }
         unknown = set(kwargs) - _KNOWN_KWARGS
         if unknown:
@@ -39,12 +39,16 @@ class SsMatrixData:
         Explicit mask of frames to exclude from LPM fitting when
         ``has_anomaly_mask=True``.  If None (default), the mask is
         derived automatically from the recognition curve (frames where y < 0).
+    view_slices : tuple of slices or None
+        The slices into the parent object if this object was made by
+        ``copy(view=True)``, otherwise None.
     """
     def __init__(self, M, iv, jv, E=None,
                  moment=None,
                  baseline_method='linear',
                  allow_negative_peaks=False,
-                 negative_peak_mask=None):
+                 negative_peak_mask=None,
+                 dtype=None):
         """Initialize the SsMatrixData object.
 
         Parameters
@@ -58,7 +62,16 @@ class SsMatrixData:
             ``np.arange(M.shape[1])``.
         E : 2D array-like or None, optional
             Error matrix with the same shape as M.  Default None.
+        dtype : data-type or None, optional
+            If given, M and E are stored in this type, e.g., ``np.float32``
+            to halve the memory of large matrices.  Computations which need
+            the precision, such as baseline fitting and SVD, are done in
+            float64 regardless.  Default None, which keeps the given arrays.
         """
+        if dtype is not None:
+            M = np.asarray(M, dtype=dtype)
+            if E is not None:
+                E = np.asarray(E, dtype=dtype)
         self.M = M
         self.iv = iv
         if jv is None:
@@ -69,6 +82,7 @@ class SsMatrixData:
         self.baseline_method = baseline_method
         self.has_anomaly_mask = allow_negative_peaks
         self.anomaly_mask = negative_peak_mask  # None = auto-detect from recognition curve
+        self.view_slices = None     # set by copy(view=True)
 
     @property
     def data(self):
@@ -98,22 +112,45 @@ class SsMatrixData:
             f"{self.__class__.__name__}: M shape (iv={len(self.iv)}, jv={len(self.jv)})"
         )
 
-    def copy(self, slices=None):
+    def copy(self, slices=None, view=False, lock=True):
         """Return a copy of the SsMatrixData object.
 
         Parameters
         ----------
         slices : tuple of slices, optional
             The slices to apply to the iv, jv, and M attributes.
+        view : bool, optional
+            If True, the M and E of the copy are read-only NumPy views into
+            those of this object instead of copies, and the slices are kept
+            as ``view_slices``.  The views are replaced by own copies only
+            when a mutating operation needs them, see :meth:`ensure_writable`
+            and :meth:`subtract_baseline`.
+            Default False.
+        lock : bool, optional
+            If True, with ``view=True``, the M and E of this object are also
+            made read-only, since they are shared with the copy from now on,
+            so that an in-place modification of either side must go through
+            :meth:`ensure_writable` or :meth:`subtract_baseline` and leaves
+            the other side unchanged.  False is for a copy whose views are
+            replaced before any modification can be made.
+            Default True.
         """
         if slices is None:
             islice = slice(None, None)
             jslice = slice(None, None)
         else:
             islice, jslice = slices
-        Ecopy = None if self.E is None else self.E[islice,jslice].copy()
-        return self.__class__(  # __class__ is used to ensure that the correct subclass is instantiated
-                            self.M[islice,jslice].copy(),
+        if view:
+            take = _make_readonly_view
+            if lock:
+                for a in (self.M, self.E):
+                    if a is not None:
+                        a.flags.writeable = False
+        else:
+            take = np.copy
+        Ecopy = None if self.E is None else take(self.E[islice,jslice])
+        result = self.__class__(  # __class__ is used to ensure that the correct subclass is instantiated
+                            take(self.M[islice,jslice]),
                             self.iv[islice].copy(),
                             self.jv[jslice].copy(),
                             Ecopy,
@@ -122,6 +159,89 @@ class SsMatrixData:
                             allow_negative_peaks=self.has_anomaly_mask,
                             negative_peak_mask=self.anomaly_mask,
                             )
+        if view:
+            result.view_slices = (islice, jslice)
+        return result
+
+    def is_view(self):
+        """Return whether M or E is read-only storage shared with another object.
+
+        This is the case for a copy made by ``copy(view=True)`` and, with the
+        default ``lock=True``, for the object it was made from.
+
+        Returns
+        -------
+        bool
+            True if any of M and E has not yet been replaced by its own copy.
+        """
+        return any(a is not None and not a.flags.writeable for a in (self.M, self.E))
+
+    def ensure_writable(self):
+        """Replace the read-only views of M and E by own copies.
+
+        This must be called before modifying M or E in place when the
+        object may have been made by, or may have made, ``copy(view=True)``.
+        It does nothing for the arrays which are already writable.
+        """
+        if not self.M.flags.writeable:
+            self.M = self.M.copy()
+        if self.E is not None and not self.E.flags.writeable:
+            self.E = self.E.copy()
+
+    def subtract_baseline(self, baseline, reuse=False, shared=False):
+        """Subtract a baseline from M.
+
+        For a read-only view, the difference is allocated as a new M,
+        which avoids copying the view before subtracting in place.
+        The result keeps the dtype of M.
+
+        Parameters
+        ----------
+        baseline : 2D array-like
+            The baseline with the same shape as M.
+        reuse : bool, optional
+            If True, the baseline array is no longer needed by the caller
+            and is used as the buffer of the new M when M is a read-only
+            view and the baseline is a C-contiguous array of the same dtype,
+            so that no array is allocated.
+            Default False.
+        shared : bool, optional
+            If True, M is treated as possibly shared with other objects even
+            if it is writable, i.e., it is not modified in place but replaced
+            as a read-only view is.
+            Default False.
+        """
+        if self.M.flags.writeable and not shared:
+            self.M -= baseline
+        elif (reuse and isinstance(baseline, np.ndarray) and baseline.flags.writeable
+              and baseline.flags.c_contiguous
+              and baseline.dtype == self.M.dtype and baseline.shape == self.M.shape):
+            np.subtract(self.M, baseline, out=baseline)
+            self.M = baseline
+        else:
+            out = np.empty(self.M.shape, dtype=self.M.dtype)
+            np.subtract(self.M, baseline, out=out)
+            self.M = out
+
+    def astype(self, dtype):
+        """Return a copy of which M and E are stored in the specified type.
+
+        Parameters
+        ----------
+        dtype : data-type
+            The storage type, e.g., ``np.float32``.
+
+        Returns
+        -------
+        SsMatrixData
+            The copy, which is of the same class as this object.
+        """
+        result = self.copy(view=True, lock=False)
+        result.M = self.M.astype(dtype)
+        if self.E is not None:
+            result.E = self.E.astype(dtype)
+        result.view_slices = None
+        return result
 
     def get_icurve(self, pickat):
         """md.get_icurve(pickat)
@@ -372,7 +492,8 @@ class SsMatrixData:
         Returns
         -------
         baseline : ndarray
-            The 2D baseline array with the same shape as self.M.
+            The 2D baseline array with the same shape and dtype as self.M.
+            It is fitted in float64 even if M is stored in a lower precision.
 
         Examples
         --------
@@ -433,13 +554,14 @@ class SsMatrixData:
             default_kwargs = {}
         method_kwargs = kwargs.get('method_kwargs', default_kwargs)
         baseline_fitter = Baseline2D(self.jv, self.iv)
+        # fitted in float64 even if M is stored in a lower precision
         baseline, params_not_used = baseline_fitter.individual_axes(
-            self.M.T, axes=0, method=method, method_kwargs=method_kwargs
+            np.asarray(self.M.T, dtype=float), axes=0, method=method, method_kwargs=method_kwargs
         )
         if debug:
             if counter is not None:
                 print(f"Baseline fitting completed with {counter} iterations.")  
-        return baseline.T
+        return baseline.T.astype(self.M.dtype, copy=False)
 
     def get_snr_weights(self):
         """Per-q-row signal-to-noise ratio weights.
@@ -567,4 +689,9 @@ class SsMatrixData:
                                         ['positive_ratio', 'ideal', 'delta'])
         pr = self.get_positive_ratio(baseline, weighting=weighting)
         ideal = self.get_bpo_ideal(weighting=weighting)
-        return BaselineEvaluation(pr, ideal, abs(pr - ideal))
\ No newline at end of file
+        return BaselineEvaluation(pr, ideal, abs(pr - ideal))
+
+def _make_readonly_view(a):
+    view = a.view()
+    view.flags.writeable = False
+    return view
@@ -90,8 +90,8 @@ class UvData(SsMatrixData):
             f"  wv range {wl_min:.0f}-{wl_max:.0f} nm"
         )
 
-    def copy(self, slices=None):
-        result = super().copy(slices=slices)
+    def copy(self, slices=None, view=False, lock=True):
+        result = super().copy(slices=slices, view=view, lock=lock)
         result.pickat = self.pickat
         return result
 
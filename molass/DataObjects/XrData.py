@@ -51,8 +51,8 @@ class XrData(SsMatrixData):
     def xr_pickat(self, value):
         self.pickat = value
 
-    def copy(self, slices=None):
-        result = super().copy(slices=slices)
+    def copy(self, slices=None, view=False, lock=True):
+        result = super().copy(slices=slices, view=view, lock=lock)
         result.pickat = self.pickat
         return result
 
@@ -202,7 +202,7 @@ class XrData(SsMatrixData):
         y = compute_baseline_impl(icurve.x, icurve.y, **kwargs)
         return Curve(icurve.x, y, type='i')
 
-    def compute_rgcurve(self, return_info=False, progress_cb=None, debug=False):
+    def compute_rgcurve(self, return_info=False, progress_cb=None, engine='simple', n_jobs=None, debug=False):
         """ssd.compute_rgcurve()
 
         Returns a Rg-curve which is computed using the Molass standard method.
@@ -212,6 +212,15 @@ class XrData(SsMatrixData):
         progress_cb : callable or None, optional
             Optional callback ``(rg_buffer, j)`` called after each frame.
             See :func:`~molass.Guinier.RgCurveUtils.compute_rgcurve_info`.
+        engine : str, optional
+            ``'simple'`` (default) runs SimpleGuinier per frame.
+            ``'batch'`` fits all frames at once with
+            :func:`~molass.Guinier.BatchGuinier.fit_guinier_batch`.
+            With ``return_info=True``, the latter returns a ``BatchGuinierResult``.
+            Any other name raises ``ValueError``.
+        n_jobs : int or None, optional
+            The number of worker processes for the ``'simple'`` engine.
+            None or 1 runs serially; -1 uses all CPUs.
 
         Returns
         -------
@@ -221,8 +230,17 @@ class XrData(SsMatrixData):
             
             import molass.Guinier.RgCurveUtils
             reload(molass.Guinier.RgCurveUtils)
+        if engine == 'batch':
+            from molass.Guinier.BatchGuinier import fit_guinier_batch
+            if return_info:
+                return fit_guinier_batch(self.qv, self.M, self.E)
+            from molass.Guinier.RgCurveUtils import compute_rg_curve_batch
+            return compute_rg_curve_batch(self.M, self.qv, self.E, self.jv, progress_cb=progress_cb)
+        elif engine != 'simple':
+            raise ValueError("Unknown engine: %s" % engine)
+
         from molass.Guinier.RgCurveUtils import compute_rgcurve_info
-        rginfo = compute_rgcurve_info(self, progress_cb=progress_cb)
+        rginfo = compute_rgcurve_info(self, progress_cb=progress_cb, n_jobs=n_jobs)
         if return_info:
             return rginfo
         else:
@@ -0,0 +1,210 @@
+"""
+    DataUtils.LoadCache.py
+
+    Binary cache of XR and UV arrays loaded from data folders.
+
+    The first load of a folder stores the parsed arrays as .npy files in a
+    cache directory, and later loads open them with ``np.load(mmap_mode='c')``
+    instead of parsing the text files again.  Each cache entry is keyed by a
+    signature of the names, sizes and mtimes of the source files, so that an
+    entry is invalidated when any of these files changes.
+"""
+import os
+import json
+import hashlib
+import tempfile
+from glob import glob
+import numpy as np
+
+CACHE_VERSION = 1
+CACHE_DIR_ENV = 'MOLASS_CACHE_DIR'
+
+def get_default_cache_dir():
+    """Return the default cache directory.
+
+    It is taken from the environment variable ``MOLASS_CACHE_DIR`` if set,
+    otherwise ``molass_cache`` in the system temporary directory is used.
+
+    Returns
+    -------
+    str
+        The path of the default cache directory.
+    """
+    cache_dir = os.environ.get(CACHE_DIR_ENV)
+    if cache_dir is None:
+        cache_dir = os.path.join(tempfile.gettempdir(), 'molass_cache')
+    return cache_dir
+
+def compute_files_signature(paths):
+    """Compute a signature of the given files from their names, sizes and mtimes.
+
+    Parameters
+    ----------
+    paths : list of str
+        The file paths.
+
+    Returns
+    -------
+    str
+        A hexadecimal digest which changes when any file is added, removed,
+        resized or modified.
+    """
+    h = hashlib.sha1()
+    h.update(str(CACHE_VERSION).encode())
+    for path in paths:
+        st = os.stat(path)
+        h.update(("%s|%d|%d\n" % (os.path.basename(path), st.st_size, st.st_mtime_ns)).encode())
+    return h.hexdigest()[:20]
+
+def _get_entry_folder(folder_path, cache_dir):
+    if cache_dir is None:
+        cache_dir = get_default_cache_dir()
+    key = hashlib.sha1(os.path.abspath(folder_path).encode()).hexdigest()[:16]
+    return os.path.join(cache_dir, key)
+
+def _remove_stale_entries(entry_folder, prefix, signature):
+    for path in glob(os.path.join(entry_folder, prefix + '-*')):
+        if os.path.basename(path).find(signature) < 0:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+def _save_npy(path, array):
+    # write to a temporary file first so that a concurrent reader never sees a partial file
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as fh:
+        np.save(fh, np.ascontiguousarray(array))
+    os.replace(temp_path, path)
+
+def _save_json(path, info):
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w') as fh:
+        json.dump(info, fh)
+    os.replace(temp_path, path)
+
+def _load_json(path):
+    try:
+        with open(path) as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return None
+
+def load_xr_cached(folder_path, cache_dir=None, load_mode='serial'):
+    """Load XR data from a folder through the binary cache.
+
+    Parameters
+    ----------
+    folder_path : str
+        Path to the folder containing .dat files.
+    cache_dir : str, optional
+        The cache directory. If None, :func:`get_default_cache_dir` is used.
+    load_mode : str, optional
+        The load mode used on a cache miss.
+        See :func:`~molass.DataUtils.XrLoader.load_xr`.
+
+    Returns
+    -------
+    xr_array : np.ndarray
+        3D array containing the X-ray scattering data, same as from
+        :func:`~molass.DataUtils.XrLoader.load_xr`.  On a cache hit, it is
+        a copy-on-write memory map, i.e., writes are allowed but are never
+        flushed to the cache file.
+    datafiles : list of str
+        List of data file paths corresponding to the loaded data.
+    """
+    from molass.DataUtils.XrLoader import load_xr
+    dat_files = sorted(glob(folder_path + "/*.dat"))
+    signature = compute_files_signature(dat_files)
+    entry_folder = _get_entry_folder(folder_path, cache_dir)
+    array_path = os.path.join(entry_folder, 'xr-%s.npy' % signature)
+    info_path = os.path.join(entry_folder, 'xr-%s.json' % signature)
+
+    info = _load_json(info_path)
+    if info is not None and os.path.exists(array_path):
+        return np.load(array_path, mmap_mode='c'), info['datafiles']
+
+    xr_array, datafiles = load_xr(folder_path, load_mode=load_mode)
+    try:
+        os.makedirs(entry_folder, exist_ok=True)
+        _remove_stale_entries(entry_folder, 'xr', signature)
+        _save_npy(array_path, xr_array)
+        _save_json(info_path, dict(folder=os.path.abspath(folder_path), datafiles=datafiles))
+    except OSError as e:
+        # caching is an optimization; a read-only or full cache directory must not break loading
+        print(f"Error writing the load cache for {folder_path}: {e}")
+    return xr_array, datafiles
+
+def load_uv_cached(folder_path, cache_dir=None):
+    """Load UV data from a folder through the binary cache.
+
+    The ``uv_device_no`` setting, which is set as a side effect of parsing
+    the UV file, is stored with the arrays and restored on a cache hit.
+
+    Parameters
+    ----------
+    folder_path : str
+        Path to the folder containing the UV data file.
+    cache_dir : str, optional
+        The cache directory. If None, :func:`get_default_cache_dir` is used.
+
+    Returns
+    -------
+    uvM : np.ndarray
+        UV data matrix, or None when the ``disable_uv_data`` setting is set.
+    wvector : np.ndarray
+        Wavelength vector.
+    conc_file : str
+        The UV data file specification as returned by the legacy loader.
+    """
+    from molass_legacy.SerialAnalyzer.SerialDataUtils import load_uv_array
+    from molass_legacy._MOLASS.SerialSettings import get_setting, set_setting
+    if get_setting('disable_uv_data'):
+        # checked before the lookup, since a cache hit would bypass it
+        return load_uv_array(folder_path)
+    uv_files = sorted(path for path in glob(folder_path + "/*")
+                      if os.path.isfile(path) and path[-4:].lower() != '.dat')
+    signature = compute_files_signature(uv_files)
+    entry_folder = _get_entry_folder(folder_path, cache_dir)
+    uvM_path = os.path.join(entry_folder, 'uv-%s-M.npy' % signature)
+    wv_path = os.path.join(entry_folder, 'uv-%s-wv.npy' % signature)
+    info_path = os.path.join(entry_folder, 'uv-%s.json' % signature)
+
+    info = _load_json(info_path)
+    if info is not None and os.path.exists(uvM_path) and os.path.exists(wv_path):
+        set_setting("uv_device_no", info['uv_device_no'])
+        return np.load(uvM_path, mmap_mode='c'), np.load(wv_path), info['conc_file']
+
+    uvM, wvector, conc_file = load_uv_array(folder_path)
+    if uvM is None:
+        # nothing to cache, e.g., when disable_uv_data is set
+        return uvM, wvector, conc_file
+    try:
+        os.makedirs(entry_folder, exist_ok=True)
+        _remove_stale_entries(entry_folder, 'uv', signature)
+        _save_npy(uvM_path, uvM)
+        _save_npy(wv_path, wvector)
+        _save_json(info_path, dict(folder=os.path.abspath(folder_path), conc_file=conc_file,
+                                   uv_device_no=get_setting("uv_device_no")))
+    except OSError as e:
+        print(f"Error writing the load cache for {folder_path}: {e}")
+    return uvM, wvector, conc_file
+
+def clear_load_cache(folder_path=None, cache_dir=None):
+    """Remove cache entries.
+
+    Parameters
+    ----------
+    folder_path : str, optional
+        If specified, only the entries of this folder are removed.
+        Otherwise, the whole cache directory is removed.
+    cache_dir : str, optional
+        The cache directory. If None, :func:`get_default_cache_dir` is used.
+    """
+    import shutil
+    if folder_path is None:
+        target = get_default_cache_dir() if cache_dir is None else cache_dir
+    else:
+        target = _get_entry_folder(folder_path, cache_dir)
+    if os.path.isdir(target):
+        shutil.rmtree(target)
@@ -5,7 +5,7 @@ import os
 from molass_legacy.SerialAnalyzer.SerialDataUtils import load_uv_array, load_uv_file
 from molass.DataObjects.Curve import create_icurve
 
-def load_uv(path, return_also_conc_file=False):
+def load_uv(path, return_also_conc_file=False, use_cache=False, cache_dir=None):
     """
     Load UV data from a file or directory.
 
@@ -13,7 +13,15 @@ def load_uv(path, return_also_conc_file=False):
     ----------
     path : str
         Path to the UV data file or directory.
-        
+    return_also_conc_file : bool, optional
+        If True, also return the UV data file specification.
+    use_cache : bool, optional
+        If True and path is a directory, load the data through the binary cache.
+        See :mod:`molass.DataUtils.LoadCache`.
+    cache_dir : str, optional
+        The cache directory used when ``use_cache`` is True.
+        If None, the default cache directory is used.
+
     Returns
     -------
     uvM : np.ndarray
@@ -22,7 +30,11 @@ def load_uv(path, return_also_conc_file=False):
         Wavelength vector.
     """
     if os.path.isdir(path):
-        uvM, wvector, conc_file = load_uv_array(path)
+        if use_cache:
+            from molass.DataUtils.LoadCache import load_uv_cached
+            uvM, wvector, conc_file = load_uv_cached(path, cache_dir=cache_dir)
+        else:
+            uvM, wvector, conc_file = load_uv_array(path)
     else:
         data = load_uv_file(path)
         wvector = data[:,0] 
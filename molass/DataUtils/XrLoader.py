@@ -4,7 +4,9 @@
 from glob import glob
 import numpy as np
 
-def load_xr(folder_path):
+LOAD_MODES = ('serial', 'threads', 'processes')
+
+def load_xr(folder_path, load_mode='serial', n_jobs=-1):
     """
     Load X-ray scattering data from a folder containing .dat files.
 
@@ -12,6 +14,12 @@ def load_xr(folder_path):
     ----------
     folder_path : str
         Path to the folder containing .dat files.
+    load_mode : str, optional
+        ``'serial'`` (default) reads the files one after another.
+        ``'threads'`` or ``'processes'`` reads them concurrently with
+        :func:`load_xr_parallel`.
+    n_jobs : int, optional
+        The number of workers for the concurrent modes. -1 (default) uses all CPUs.
 
     Returns
     -------
@@ -26,6 +34,9 @@ def load_xr(folder_path):
     The function assumes that each .dat file contains data in a format compatible with np.loadtxt.
     The first dimension corresponds to the number of files, the second to the number of points, and the third to the data columns.
     """
+    if load_mode != 'serial':
+        return load_xr_parallel(folder_path, load_mode=load_mode, n_jobs=n_jobs)
+
     input_list = []
     datafiles = []
     for path in sorted(glob(folder_path + "/*.dat")):
@@ -34,6 +45,9 @@ def load_xr(folder_path):
             datafiles.append(path)
         except Exception as e:
             print(f"Error loading {path}: {e}")
+    return _convert_to_array(input_list), datafiles
+
+def _convert_to_array(input_list):
     try:
         xr_array = np.array(input_list)
     except ValueError as e:
@@ -43,6 +57,80 @@ def load_xr(folder_path):
         print(f"Converted to least shape array with shape {xr_array.shape}")
     except Exception:
         raise
+    return xr_array
+
+def _load_dat(path):
+    """Load a .dat file returning (data, error message)."""
+    try:
+        return np.loadtxt(path), None
+    except Exception as e:
+        return None, str(e)
+
+def load_xr_parallel(folder_path, load_mode='threads', n_jobs=-1):
+    """
+    Load X-ray scattering data from a folder reading the .dat files concurrently.
+
+    The shape of the first file determines a preallocated array of shape
+    ``(n_files, n_points, n_columns)`` into which the other files are written
+    as soon as they are parsed, so that no intermediate list of arrays has to
+    be stacked afterwards.  Files which fail to load are skipped and files of
+    a different shape are reconciled as in :func:`load_xr`.
+
+    Parameters
+    ----------
+    folder_path : str
+        Path to the folder containing .dat files.
+    load_mode : str, optional
+        ``'threads'`` (default) uses a thread pool, which suits network
+        filesystems where the I/O latency dominates.
+        ``'processes'`` uses a process pool, which suits local disks where
+        the text parsing dominates.
+    n_jobs : int, optional
+        The number of workers. -1 (default) uses all CPUs.
+
+    Returns
+    -------
+    xr_array : np.ndarray
+        3D array containing the X-ray scattering data.
+    datafiles : list of str
+        List of data file paths corresponding to the loaded data.
+    """
+    from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+    from molass.PackageUtils.ParallelUtils import get_num_workers
+    if load_mode == 'threads':
+        executor_class = ThreadPoolExecutor
+    elif load_mode == 'processes':
+        executor_class = ProcessPoolExecutor
+    else:
+        raise ValueError("Unknown load_mode: %s" % load_mode)
+
+    paths = sorted(glob(folder_path + "/*.dat"))
+    num_files = len(paths)
+    xr_array = None
+    loaded = np.zeros(num_files, dtype=bool)
+    misfits = {}        # data of a shape different from the first file
+    num_workers = min(get_num_workers(n_jobs), max(1, num_files))
+    with executor_class(max_workers=num_workers) as executor:
+        for k, (data, error) in enumerate(executor.map(_load_dat, paths)):
+            if data is None:
+                print(f"Error loading {paths[k]}: {error}")
+                continue
+            if xr_array is None:
+                xr_array = np.empty((num_files,) + data.shape)
+            if data.shape == xr_array.shape[1:]:
+                xr_array[k] = data
+            else:
+                misfits[k] = data
+            loaded[k] = True
+
+    datafiles = [path for path, ok in zip(paths, loaded) if ok]
+    if xr_array is None:
+        return _convert_to_array([]), datafiles
+    if len(misfits) > 0:
+        input_list = [misfits[k] if k in misfits else xr_array[k] for k in np.where(loaded)[0]]
+        return _convert_to_array(input_list), datafiles
+    if not loaded.all():
+        xr_array = xr_array[loaded]
     return xr_array, datafiles
 
 def xr_remove_bubbles(xr_array, logger=None, debug=False):
@@ -87,7 +175,34 @@ def xr_remove_bubbles(xr_array, logger=None, debug=False):
         ax2.plot(*icurve_.get_xy())
         plt.show()
 
-def load_xr_with_options(folder_path, remove_bubbles=False, logger=None, debug=False):
+def scan_xr_header(folder_path):
+    """
+    Get the shape and the q-range of the X-ray scattering data in a folder
+    without loading all of it.
+
+    Only the file names are listed and the first .dat file is parsed,
+    which takes milliseconds even for folders of thousands of files.
+
+    Parameters
+    ----------
+    folder_path : str
+        Path to the folder containing .dat files.
+
+    Returns
+    -------
+    info : dict
+        ``num_frames`` (the number of .dat files), ``num_points`` and
+        ``q_range`` (``(qmin, qmax)`` or None if there is no file).
+        The frame count may be larger than the number of frames finally
+        loaded if some of the files cannot be parsed.
+    """
+    paths = sorted(glob(folder_path + "/*.dat"))
+    if len(paths) == 0:
+        return dict(num_frames=0, num_points=0, q_range=None)
+    qv = np.loadtxt(paths[0], usecols=0)
+    return dict(num_frames=len(paths), num_points=len(qv), q_range=(float(qv[0]), float(qv[-1])))
+
+def load_xr_with_options(folder_path, remove_bubbles=False, use_cache=False, cache_dir=None, load_mode='serial', logger=None, debug=False):
     """Load X-ray scattering data from a folder with options to preprocess.
 
     Parameters
@@ -96,6 +211,15 @@ def load_xr_with_options(folder_path, remove_bubbles=False, logger=None, debug=F
         Path to the folder containing .dat files.
     remove_bubbles : bool, optional
         If True, remove bubbles from the data, by default False.
+    use_cache : bool, optional
+        If True, load the data through the binary cache, by default False.
+        See :mod:`molass.DataUtils.LoadCache`.
+    cache_dir : str, optional
+        The cache directory used when ``use_cache`` is True.
+        If None, the default cache directory is used.
+    load_mode : str, optional
+        ``'serial'`` (default), ``'threads'`` or ``'processes'``.
+        See :func:`load_xr_parallel` for the concurrent modes.
     logger : logging.Logger, optional
         Logger for logging messages. If None, print to console.
     debug : bool, optional
@@ -108,7 +232,11 @@ def load_xr_with_options(folder_path, remove_bubbles=False, logger=None, debug=F
     datafiles : list of str
         List of data file paths corresponding to the loaded data.
     """
-    xr_array, datafiles = load_xr(folder_path)
+    if use_cache:
+        from molass.DataUtils.LoadCache import load_xr_cached
+        xr_array, datafiles = load_xr_cached(folder_path, cache_dir=cache_dir, load_mode=load_mode)
+    else:
+        xr_array, datafiles = load_xr(folder_path, load_mode=load_mode)
     if remove_bubbles:
         xr_remove_bubbles(xr_array, logger=logger, debug=debug)
     return xr_array, datafiles
\ No newline at end of file
@@ -0,0 +1,331 @@
+"""
+    DataUtils.XrStream.py
+
+    Incremental ingestion of X-ray scattering frames while a SEC run
+    is still writing them to a folder.
+"""
+import os
+from glob import glob
+from time import sleep, time
+import numpy as np
+
+DEFAULT_CAPACITY = 256      # initial number of frame columns, doubled when exceeded
+
+class XrStream:
+    """
+    A growable XR matrix fed from a folder to which .dat frames are being written.
+
+    Each call of :meth:`poll` appends the newly completed frames and updates
+    the recognition curve, the per-frame Guinier fits and the smoothed curve
+    used for peak detection for those frames only, so that the cost of a
+    poll does not grow with the number of frames already ingested.
+
+    Attributes
+    ----------
+    folder : str
+        The folder being watched.
+    qv : ndarray or None
+        The q-values, taken from the first frame. None until a frame is ingested.
+    datafiles : list of str
+        The paths of the ingested frames in the order of the columns.
+
+    Examples
+    --------
+    >>> stream = XrStream(folder)
+    >>> stream.watch(interval=1.0, idle_timeout=60, callback=lambda s, n: print(s.detect_peaks()))
+    >>> ssd = stream.get_secsaxsdata()
+    """
+    def __init__(self, folder, pickat=None, capacity=DEFAULT_CAPACITY, guinier=True,
+                 window_length=31, polyorder=3):
+        """
+        Parameters
+        ----------
+        folder : str
+            The folder to which the beamline writes the .dat frames.
+        pickat : float or None, optional
+            The q-value of the recognition curve row, as in
+            :meth:`~molass.DataObjects.XrData.XrData.get_icurve`.
+            None uses the XrData default.
+        capacity : int, optional
+            The initial number of frames allocated.
+        guinier : bool, optional
+            If True, each new frame is fitted with
+            :func:`~molass.Guinier.BatchGuinier.fit_guinier_batch`.
+        window_length, polyorder : int, optional
+            The Savitzky-Golay parameters of the smoothing for peak
+            detection, as in :meth:`~molass.DataObjects.XrData.XrData.detect_peaks`.
+        """
+        from molass.DataObjects.XrData import PICKAT
+        self.folder = folder
+        self.pickat = PICKAT if pickat is None else pickat
+        self.guinier = guinier
+        self.window_length = window_length
+        self.polyorder = polyorder
+        self.qv = None
+        self.datafiles = []
+        self._capacity = capacity
+        self._num_frames = 0
+        self._M = None
+        self._E = None
+        self._recog = np.empty(capacity)
+        self._smooth = np.empty(capacity)
+        self._num_final = 0     # leading smoothed values which no more frames can change
+        self._rg = np.empty(capacity)
+        self._score = np.empty(capacity)
+        self._seen = set()
+        self._last_size = None    # (path, size) of the last file at the previous poll
+        self._pick_index = None
+
+    @property
+    def num_frames(self):
+        """The number of ingested frames."""
+        return self._num_frames
+
+    @property
+    def M(self):
+        """The intensity matrix of shape (n_q, num_frames), a view into the growable buffer."""
+        return None if self._M is None else self._M[:, :self._num_frames]
+
+    @property
+    def E(self):
+        """The error matrix of shape (n_q, num_frames), a view into the growable buffer."""
+        return None if self._E is None else self._E[:, :self._num_frames]
+
+    @property
+    def jv(self):
+        """The frame numbers, i.e., the column indices as with a folder loaded at once."""
+        return np.arange(self._num_frames)
+
+    def poll(self):
+        """
+        Ingest the frames completed since the last poll.
+
+        Frames are taken in the sorted order of the file names.  The last
+        file is regarded as still being written until its size is found
+        unchanged by the next poll, and a file which cannot be parsed or has
+        a number of points different from the first frame is retried by the
+        next poll, together with the files following it.
+
+        Returns
+        -------
+        int
+            The number of frames ingested.
+        """
+        new_paths = [path for path in sorted(glob(self.folder + "/*.dat")) if path not in self._seen]
+        frames = []
+        for k, path in enumerate(new_paths):
+            if k == len(new_paths) - 1:
+                size = os.path.getsize(path)
+                if self._last_size != (path, size):
+                    self._last_size = (path, size)
+                    break
+            try:
+                data = np.loadtxt(path)
+            except Exception:
+                break
+            if data.ndim != 2 or data.shape[1] < 3 or self.qv is not None and data.shape[0] != len(self.qv):
+                break
+            if self.qv is None:
+                self.qv = data[:, 0].copy()
+            frames.append(data)
+            self._seen.add(path)
+            self.datafiles.append(path)
+        if len(frames) > 0:
+            self._append(np.array(frames))
+        return len(frames)
+
+    def _append(self, xr_array):
+        from bisect import bisect_right
+        from molass.Global.Options import get_molass_options
+        start = self._num_frames
+        stop = start + len(xr_array)
+        if self._M is None:
+            self._M = np.empty((len(self.qv), self._capacity))
+            self._E = np.empty((len(self.qv), self._capacity))
+            self._pick_index = bisect_right(self.qv, self.pickat)
+        if stop > self._capacity:
+            self._grow(stop)
+        self._M[:, start:stop] = xr_array[:, :, 1].T
+        self._E[:, start:stop] = xr_array[:, :, 2].T
+        self._num_frames = stop
+
+        # the new part of the recognition curve as in XrData.get_recognition_curve
+        if get_molass_options('elution_recognition') == 'icurve':
+            self._recog[start:stop] = self._M[self._pick_index, start:stop]
+        else:
+            self._recog[start:stop] = self._M[:, start:stop].sum(axis=0)
+
+        if self.guinier:
+            from molass.Guinier.BatchGuinier import fit_guinier_batch
+            result = fit_guinier_batch(self.qv, self._M[:, start:stop], self._E[:, start:stop])
+            self._rg[start:stop] = result.rg
+            self._score[start:stop] = result.score
+
+        self._update_smooth()
+
+    def _grow(self, size):
+        capacity = self._capacity
+        while capacity < size:
+            capacity *= 2
+        M = np.empty((self._M.shape[0], capacity))
+        E = np.empty((self._M.shape[0], capacity))
+        M[:, :self._num_frames] = self.M
+        E[:, :self._num_frames] = self.E
+        self._M, self._E = M, E
+        for name in ['_recog', '_smooth', '_rg', '_score']:
+            array = np.empty(capacity)
+            array[:self._num_frames] = getattr(self, name)[:self._num_frames]
+            setattr(self, name, array)
+        self._capacity = capacity
+
+    def _update_smooth(self):
+        # Only the last half window of the smoothed curve depends on the frames
+        # to come, so the filter is applied to the segment from the first value
+        # not yet final, preceded by the half window which it needs.
+        from scipy.signal import savgol_filter
+        n = self._num_frames
+        wl = self.window_length
+        half = wl // 2
+        y = self._recog[:n]
+        if n < wl:
+            # as in XrData.detect_peaks for short curves
+            wl_short = n if n % 2 == 1 else n - 1
+            if wl_short < self.polyorder + 2:
+                self._smooth[:n] = y
+            else:
+                self._smooth[:n] = savgol_filter(y, window_length=wl_short, polyorder=self.polyorder)
+            return
+        start = max(0, self._num_final - half)
+        smooth = savgol_filter(y[start:], window_length=wl, polyorder=self.polyorder)
+        # the leading edge of the segment is valid only at the start of the curve
+        begin = self._num_final if start > 0 else 0
+        self._smooth[begin:n] = smooth[begin - start:]
+        self._num_final = n - half
+
+    def get_recognition_curve(self):
+        """
+        Return the recognition curve of the ingested frames.
+
+        Returns
+        -------
+        Curve
+            The curve as from :meth:`~molass.DataObjects.XrData.XrData.get_recognition_curve`.
+        """
+        from molass.DataObjects.Curve import Curve
+        return Curve(self.jv, self._recog[:self._num_frames].copy())
+
+    def get_rg(self):
+        """
+        Return the per-frame Guinier Rg of the ingested frames.
+
+        Returns
+        -------
+        rg : ndarray
+            The Rg values, NaN where the fit failed.
+        score : ndarray
+            The fit scores in [0, 1], see :func:`~molass.Guinier.BatchGuinier.fit_guinier_batch`.
+        """
+        if not self.guinier:
+            raise ValueError("Guinier fitting is disabled for this stream")
+        n = self._num_frames
+        return self._rg[:n].copy(), self._score[:n].copy()
+
+    def detect_peaks(self, prominence=0.005, distance=20, return_properties=False):
+        """
+        Detect peaks in the recognition curve of the ingested frames.
+
+        The result is the same as that of
+        :meth:`~molass.DataObjects.XrData.XrData.detect_peaks` applied to the
+        data ingested so far.  Only ``find_peaks`` runs over the whole curve,
+        which is maintained smoothed.
+
+        Parameters
+        ----------
+        prominence : float, optional
+            Minimum prominence as a fraction of the smoothed curve maximum.
+        distance : int, optional
+            Minimum number of frames between adjacent peaks.
+        return_properties : bool, optional
+            If True, return ``(peaks, properties)`` as with ``XrData.detect_peaks``.
+
+        Returns
+        -------
+        list of int
+            Frame numbers of the detected peaks.
+        """
+        from scipy.signal import find_peaks
+        smooth = self._smooth[:self._num_frames]
+        if len(smooth) == 0:
+            return ([], {'prominences': np.array([]), 'peak_heights': np.array([])}) if return_properties else []
+        peaks_idx, props = find_peaks(smooth, prominence=smooth.max() * prominence, distance=distance)
+        peak_frames = [int(i) for i in peaks_idx]
+        if return_properties:
+            return peak_frames, {'prominences': props['prominences'], 'peak_heights': smooth[peaks_idx]}
+        return peak_frames
+
+    def watch(self, interval=1.0, timeout=None, idle_timeout=None, callback=None):
+        """
+        Poll the folder repeatedly until a timeout.
+
+        Parameters
+        ----------
+        interval : float, optional
+            The seconds to wait between polls.
+        timeout : float or None, optional
+            The seconds after which to stop in any case. None means no limit.
+        idle_timeout : float or None, optional
+            The seconds without new frames after which to stop, e.g., when
+            the run has finished. None means no limit.
+        callback : callable, optional
+            Called as ``callback(stream, num_new)`` after each poll which
+            ingested frames.  Watching stops if it returns True.
+
+        Returns
+        -------
+        int
+            The total number of frames ingested.
+        """
+        if timeout is None and idle_timeout is None and callback is None:
+            raise ValueError("watch() without timeout, idle_timeout or callback would never return")
+        start_time = last_time = time()
+        while True:
+            num_new = self.poll()
+            now = time()
+            if num_new > 0:
+                last_time = now
+                if callback is not None and callback(self, num_new):
+                    break
+            if timeout is not None and now - start_time >= timeout:
+                break
+            if idle_timeout is not None and now - last_time >= idle_timeout:
+                break
+            sleep(interval)
+        return self._num_frames
+
+    def get_xr_data(self):
+        """
+        Return an XrData object of the frames ingested so far.
+
+        Returns
+        -------
+        XrData
+            The XrData with copies of the matrices, which is not affected by later polls.
+        """
+        from molass.DataObjects.XrData import XrData
+        if self._M is None:
+            raise ValueError("no frame has been ingested from %s" % self.folder)
+        xr = XrData(self.M.copy(), self.qv.copy(), None, self.E.copy())
+        xr.pickat = self.pickat
+        return xr
+
+    def get_secsaxsdata(self):
+        """
+        Return an XR-only SecSaxsData object of the frames ingested so far.
+
+        Returns
+        -------
+        SecSaxsData
+            The data as if loaded from the folder with ``xr_only=True``.
+        """
+        from molass.DataObjects import SecSaxsData
+        return SecSaxsData(object_list=[self.get_xr_data(), None], datafiles=list(self.datafiles))
@@ -4,7 +4,7 @@ Decompose.Proportional.py
 import numpy as np
 from scipy.interpolate import UnivariateSpline
 from molass.Stats.Moment import Moment
-from molass.SEC.Models.Simple import egh
+from molass.SEC.Models.Simple import egh, egh_multi
 from scipy.optimize import minimize
 
 VERY_SMALL_VALUE = 1e-10
@@ -181,14 +181,12 @@ def decompose_proportionally(icurve, proportions, debug=False, allow_negative_pe
     num_components = len(proportions)
     shape = (num_components, 4)
 
+    C_buffer = np.empty((num_components, len(x)))     # reused across objective evaluations
+    params_buffer = initial_params.copy()
+
     def scale_objective(scales, debug_ax=None):
-        cy_list = []
-        for k, h in enumerate(scales):
-            params = initial_params[k].copy()
-            params[0] = h
-            cy = egh(x, *params)
-            cy_list.append(cy)
-        ty = np.sum(cy_list, axis=0)
+        params_buffer[:,0] = scales
+        ty = np.sum(egh_multi(x, params_buffer, out=C_buffer), axis=0)
         if debug_ax is not None:
             debug_ax.plot(x, ty, linestyle=':', color='red')
         return np.sum((ty - y) ** 2)
@@ -213,14 +211,10 @@ def decompose_proportionally(icurve, proportions, debug=False, allow_negative_pe
     result1 = minimize(scale_objective, x0=initial_params[:,0], method=method, bounds=scale_bounds)
 
     def total_objective(params_all, debug_ax=None, return_props=False):
-        cy_list = []
-        areas = []
-        for params in params_all.reshape(shape):
-            cy = egh(x, *params)
-            cy_list.append(cy)
-            areas.append(np.sum(cy))
-        ty = np.sum(cy_list, axis=0)
-        props = np.array(areas)/np.sum(areas)
+        C = egh_multi(x, params_all.reshape(shape), out=C_buffer)
+        areas = np.sum(C, axis=1)
+        ty = np.sum(C, axis=0)
+        props = areas/np.sum(areas)
         if return_props:
             return props
         if debug_ax is not None:
@@ -8,6 +8,11 @@ GLOBAL_OPTIONS = dict(
     developer_mode = False,
     elution_recognition = 'icurve',
     quiet = False,
+    load_cache = False,
+    lazy_load = False,
+    copy_on_write = False,
+    solver_n_jobs = None,
+    eval_cache = False,
 )
 
 def set_molass_options(**kwargs):
@@ -38,6 +43,29 @@ def set_molass_options(**kwargs):
         legacy code during core API calls (``SSD()``, ``trimmed_copy()``,
         ``corrected_copy()``, ``quick_decomposition()``,
         ``optimize_rigorously()``).  Default is False.
+    load_cache : bool, optional
+        If True, ``SecSaxsData(folder)`` loads XR and UV data through the
+        binary cache in :mod:`molass.DataUtils.LoadCache`, so that reopening
+        a dataset does not parse the text files again.  Default is False.
+    lazy_load : bool, optional
+        If True, ``SecSaxsData(folder)`` defers loading XR and UV data until
+        they are first accessed.  See :class:`~molass.DataObjects.LazyData.LazyData`.
+        Default is False.
+    copy_on_write : bool, optional
+        If True, ``trimmed_copy()`` and ``corrected_copy()`` return an
+        object whose matrices are read-only views into those of the original,
+        copied only when a mutating operation needs them.  Default is False.
+    solver_n_jobs : int or None, optional
+        The number of worker processes over which population-based solvers
+        of the rigorous optimization evaluate the candidates of a generation,
+        when not given to the solver itself.  None or 1 evaluates them serially,
+        -1 uses all CPUs (CMA, DE and NSGA2).  See :mod:`molass.Solvers.PopulationPool`.
+        Default is None.
+    eval_cache : bool or int, optional
+        If True or a positive int (the maximum number of entries), in-process
+        rigorous optimizations memoize the objective function and save the
+        cache to ``eval_cache.npz`` in the job folder.
+        See :mod:`molass.Rigorous.EvaluationCache`.  Default is False.
     kwargs : dict
         Other options to set.
     """
@@ -63,6 +91,11 @@ def get_molass_options(*args):
         - 'elution_recognition': Which elution curve to use for recognition
           (``'icurve'`` or ``'sum'``).
         - 'quiet': Whether to suppress verbose diagnostic output.
+        - 'load_cache': Whether to load data folders through the binary cache.
+        - 'lazy_load': Whether to defer loading data folders until first access.
+        - 'copy_on_write': Whether trimmed and corrected copies share the original matrices.
+        - 'solver_n_jobs': The number of worker processes of population-based solvers.
+        - 'eval_cache': Whether to memoize the objective of in-process rigorous optimizations.
     Returns
     -------
     dict
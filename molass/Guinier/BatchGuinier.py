@@ -0,0 +1,124 @@
+"""
+    Guinier.BatchGuinier.py
+
+    This module contains a batched Guinier engine which fits all frames
+    of an XR matrix at once with stacked weighted linear regressions.
+"""
+from collections import namedtuple
+import numpy as np
+
+QRG_LIMIT = 1.3             # upper bound of q*Rg for the Guinier region
+INIT_QMAX = 0.03            # Å⁻¹, initial Guinier window before Rg is known
+MIN_NUM_POINTS = 8          # minimum number of points in a valid Guinier window
+NUM_ITERATIONS = 5
+
+BatchGuinierResult = namedtuple('BatchGuinierResult', ['rg', 'I0', 'score', 'num_points', 'qrg_max'])
+
+def _weighted_linregress(x, Y, W):
+    """Solve ``Y[:,j] ≈ a[j] + b[j]*x`` for all columns by weighted least squares.
+
+    The normal equations of the 2-parameter fits are accumulated with
+    matrix-vector products over the column axis, so that no Python loop
+    over the frames is required.
+    """
+    WY = W * Y
+    S = W.sum(axis=0)
+    Sx = x @ W
+    Sxx = (x**2) @ W
+    Sy = WY.sum(axis=0)
+    Sxy = x @ WY
+    det = S*Sxx - Sx**2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        b = (S*Sxy - Sx*Sy)/det
+        a = (Sxx*Sy - Sx*Sxy)/det
+    return a, b, S, Sy
+
+def fit_guinier_batch(qv, D, E, qrg_limit=QRG_LIMIT, init_qmax=INIT_QMAX,
+                      min_num_points=MIN_NUM_POINTS, num_iterations=NUM_ITERATIONS):
+    """Fit the Guinier law to every column of ``D`` at once.
+
+    Each frame is fitted with ``ln I = ln I0 - Rg²q²/3`` using the
+    inverse variances of ``ln I`` as weights.  Starting from the window
+    ``q <= init_qmax``, the window of each frame is iteratively narrowed
+    (or widened) to ``q*Rg <= qrg_limit`` using the Rg of the previous
+    iteration.
+
+    Parameters
+    ----------
+    qv : ndarray of shape (n_q,)
+        q-values in Å⁻¹.
+    D : ndarray of shape (n_q, n_frames)
+        XR intensity matrix.
+    E : ndarray of shape (n_q, n_frames)
+        Intensity error matrix.
+    qrg_limit : float, optional
+        The upper bound of q*Rg for the Guinier window.
+    init_qmax : float, optional
+        The upper bound of q for the initial window.
+    min_num_points : int, optional
+        Frames whose window has fewer points are regarded as failed.
+    num_iterations : int, optional
+        The number of window refinements.
+
+    Returns
+    -------
+    BatchGuinierResult
+        A named tuple of arrays of shape (n_frames,) with fields
+        ``rg`` (NaN where the fit failed), ``I0``, ``score`` (weighted
+        coefficient of determination in [0, 1], 0 where the fit failed),
+        ``num_points`` and ``qrg_max``.
+    """
+    qv = np.asarray(qv, dtype=float)
+    D = np.asarray(D, dtype=float)
+    E = np.asarray(E, dtype=float)
+    q2 = qv**2
+    positive = np.logical_and(D > 0, E > 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        lnI = np.where(positive, np.log(np.where(positive, D, 1.0)), 0.0)
+        weights = np.where(positive, (D/np.where(positive, E, 1.0))**2, 0.0)
+
+    n_frames = D.shape[1]
+    qmax = np.full(n_frames, init_qmax)
+    rg = np.full(n_frames, np.nan)
+    for _ in range(num_iterations):
+        fitted_qmax = qmax
+        W = weights * (qv[:,np.newaxis] <= fitted_qmax[np.newaxis,:])
+        a, b, S, Sy = _weighted_linregress(q2, lnI, W)
+        with np.errstate(invalid='ignore'):
+            rg = np.sqrt(-3*b)
+        ok = np.isfinite(rg) & (rg > 0)
+        qmax = np.where(ok, qrg_limit/np.where(ok, rg, 1.0), qmax)
+
+    num_points = np.count_nonzero(W, axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        residuals = lnI - (a + b*q2[:,np.newaxis])
+        ss_res = np.sum(W * residuals**2, axis=0)
+        ss_tot = np.sum(W * (lnI - Sy/S)**2, axis=0)
+        score = np.clip(1 - ss_res/ss_tot, 0, 1)
+        I0 = np.exp(a)
+
+    valid = ok & (num_points >= min_num_points) & np.isfinite(score)
+    rg = np.where(valid, rg, np.nan)
+    I0 = np.where(valid, I0, np.nan)
+    score = np.where(valid, score, 0.0)
+    qrg_max = np.where(valid, fitted_qmax*rg, np.nan)
+    return BatchGuinierResult(rg, I0, score, num_points, qrg_max)
+
+def construct_rgcurve_from_batch(jv, result):
+    """Construct an RgCurve from a BatchGuinierResult.
+
+    Parameters
+    ----------
+    jv : ndarray of shape (n_frames,)
+        Original frame numbers.
+    result : BatchGuinierResult
+        The result of :func:`fit_guinier_batch`.
+
+    Returns
+    -------
+    RgCurve
+        An RgCurve with ``results=None``, since the batched fits do not
+        produce per-frame result objects.
+    """
+    from molass.Guinier.RgCurve import RgCurve
+    return RgCurve(np.asarray(jv, dtype=int), np.array(result.rg, dtype=float), np.array(result.score))
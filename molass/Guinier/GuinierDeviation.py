@@ -71,7 +71,9 @@ class GuinierDeviation:
             pass
         else:
             # see also Optimizer.LrfExporter.XrLrfResult
-            X = np.linalg.pinv(M) @ P       # M or M_
+            # the factorization of M is cached across calls with the same M
+            from molass.LowRank.ErrorPropagate import compute_pinv_product
+            X = compute_pinv_product(M, P)  # M or M_
             Ep = np.sqrt((E**2) @ (X**2))
         valid_rgs = self.composite.get_valid_rgs(rg_params)
         if debug:
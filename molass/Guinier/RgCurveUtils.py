@@ -23,7 +23,72 @@ inspect.getfullargspec = _cached_getfullargspec
 
 ADD_ALL_RESULTS = True
 
-def compute_rg_curve_from_arrays(D, qv, E, jv=None, progress_cb=None):
+def _simple_guinier_chunk(qv, M, E):
+    """Run SimpleGuinier on every column of a chunk (process-pool worker)."""
+    from molass_legacy.GuinierAnalyzer.SimpleGuinier import SimpleGuinier
+    return [SimpleGuinier(np.array([qv, M[:,j], E[:,j]]).T) for j in range(M.shape[1])]
+
+def compute_simple_guinier_list(qv, M, E, jv, progress_cb=None, n_jobs=None):
+    """Run SimpleGuinier on every frame, optionally in a process pool.
+
+    The frames are split into contiguous chunks, one per worker, and the
+    results are collected in frame order, so that the returned list is
+    identical to the one obtained serially.
+
+    Parameters
+    ----------
+    qv : ndarray of shape (n_q,)
+        q-values in Å⁻¹.
+    M : ndarray of shape (n_q, n_frames)
+        XR intensity matrix.
+    E : ndarray of shape (n_q, n_frames)
+        Intensity error matrix.
+    jv : ndarray of shape (n_frames,)
+        Original frame numbers.
+    progress_cb : callable or None, optional
+        Same signature as in ``compute_rgcurve_info``.  In the parallel mode,
+        it is called for each frame in order as the chunks are collected.
+    n_jobs : int or None, optional
+        The number of worker processes.  None or 1 runs serially;
+        -1 uses all CPUs.
+
+    Returns
+    -------
+    rginfo_list : list of tuples
+        A list of tuples where each tuple contains (frame number, SimpleGuinier result).
+    """
+    from molass.PackageUtils.ParallelUtils import get_num_workers, split_range
+    n_frames = M.shape[1]
+    rg_buffer = np.zeros(n_frames)  # running buffer for progress_cb
+    num_workers = min(get_num_workers(n_jobs), n_frames)
+    if num_workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        chunks = split_range(n_frames, num_workers)
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            futures = [executor.submit(_simple_guinier_chunk, qv, M[:,chunk], E[:,chunk]) for chunk in chunks]
+            sg_iter = (sg for future in futures for sg in future.result())
+            sg_list = list(_track_progress(sg_iter, rg_buffer, progress_cb, n_frames))
+    else:
+        from molass_legacy.GuinierAnalyzer.SimpleGuinier import SimpleGuinier
+        sg_iter = (SimpleGuinier(np.array([qv, M[:,j], E[:,j]]).T) for j in range(n_frames))
+        sg_list = list(_track_progress(sg_iter, rg_buffer, progress_cb, n_frames))
+
+    rginfo_list = []
+    for j, sg in enumerate(sg_list):
+        if sg.Rg is not None or ADD_ALL_RESULTS:
+            rginfo_list.append((int(jv[j]), sg))
+    return rginfo_list
+
+def _track_progress(sg_iter, rg_buffer, progress_cb, n_frames):
+    for j, sg in enumerate(tqdm(sg_iter, total=n_frames)):
+        rg = sg.Rg
+        if rg is not None and rg > 0:
+            rg_buffer[j] = rg
+        if progress_cb is not None:
+            progress_cb(rg_buffer, j)
+        yield sg
+
+def compute_rg_curve_from_arrays(D, qv, E, jv=None, progress_cb=None, engine='simple', n_jobs=None):
     """Compute a library-quality RgCurve directly from numpy arrays.
 
     This is the array-level entry point that makes rg_curve computation
@@ -47,33 +112,64 @@ def compute_rg_curve_from_arrays(D, qv, E, jv=None, progress_cb=None):
         Original frame numbers.  If None, uses ``np.arange(n_frames)``.
     progress_cb : callable or None
         Same signature as in ``compute_rgcurve_info``.
+    engine : str, optional
+        ``'simple'`` (default) runs SimpleGuinier per frame.
+        ``'batch'`` fits all frames at once with
+        :func:`~molass.Guinier.BatchGuinier.fit_guinier_batch`, which is
+        much faster but does not produce per-frame result objects.
+    n_jobs : int or None, optional
+        The number of worker processes for the ``'simple'`` engine.
+        The result is identical to the serial one.
 
     Returns
     -------
     RgCurve
         Library ``molass.Guinier.RgCurve.RgCurve`` object.
     """
-    from molass_legacy.GuinierAnalyzer.SimpleGuinier import SimpleGuinier
-    from molass.Guinier.RgCurve import construct_rgcurve_from_list
-
     n_frames = D.shape[1]
     if jv is None:
         jv = np.arange(n_frames)
-    rg_buffer = np.zeros(n_frames)
-    rginfo_list = []
-    for j in tqdm(range(n_frames)):
-        sg = SimpleGuinier(np.array([qv, D[:, j], E[:, j]]).T)
-        rg = sg.Rg
-        if rg is not None and rg > 0:
-            rg_buffer[j] = rg
-        if progress_cb is not None:
-            progress_cb(rg_buffer, j)
-        if sg.Rg is not None or ADD_ALL_RESULTS:
-            rginfo_list.append((int(jv[j]), sg))
+    if engine == 'batch':
+        return compute_rg_curve_batch(D, qv, E, jv, progress_cb=progress_cb)
+    elif engine != 'simple':
+        raise ValueError("Unknown engine: %s" % engine)
+
+    from molass.Guinier.RgCurve import construct_rgcurve_from_list
+    rginfo_list = compute_simple_guinier_list(qv, D, E, jv, progress_cb=progress_cb, n_jobs=n_jobs)
     return construct_rgcurve_from_list(rginfo_list)
 
+def compute_rg_curve_batch(D, qv, E, jv, progress_cb=None):
+    """Compute an RgCurve with the batched Guinier engine.
+
+    Parameters
+    ----------
+    D : ndarray of shape (n_q, n_frames)
+        XR intensity matrix.
+    qv : ndarray of shape (n_q,)
+        q-values in Å⁻¹.
+    E : ndarray of shape (n_q, n_frames)
+        Intensity error matrix.
+    jv : ndarray of shape (n_frames,)
+        Original frame numbers.
+    progress_cb : callable or None
+        Same signature as in ``compute_rgcurve_info``.  Since all frames
+        are fitted at once, it is called for each frame after the fit.
 
-def compute_rgcurve_info(xrdata, progress_cb=None):
+    Returns
+    -------
+    RgCurve
+        An RgCurve with ``results=None``.
+    """
+    from molass.Guinier.BatchGuinier import fit_guinier_batch, construct_rgcurve_from_batch
+    result = fit_guinier_batch(qv, D, E)
+    if progress_cb is not None:
+        rg_buffer = np.nan_to_num(result.rg, nan=0.0)
+        for j in range(len(rg_buffer)):
+            progress_cb(rg_buffer, j)
+    return construct_rgcurve_from_batch(jv, result)
+
+
+def compute_rgcurve_info(xrdata, progress_cb=None, n_jobs=None):
     """
     Computes Rg curve information from XR data.
     It uses the SimpleGuinier class to compute Rg values for each j-curve in the XR data.
@@ -89,31 +185,18 @@ def compute_rgcurve_info(xrdata, progress_cb=None):
         the 0-based column index of the current frame.  The signature matches
         the legacy ``ProgressCallback`` so GUI callers can drive a progress bar
         and live Rg overlay with no additional adaptation.
+    n_jobs : int or None, optional
+        The number of worker processes.  None or 1 runs serially;
+        -1 uses all CPUs.  The result is identical to the serial one.
 
     Returns
     -------
     rginfo_list : list of tuples
         A list of tuples where each tuple contains (index, SimpleGuinier result).
     """
-    from molass_legacy.GuinierAnalyzer.SimpleGuinier import SimpleGuinier
-    qv = xrdata.qv
-    xrM = xrdata.M
-    xrE = xrdata.E
-    jv = xrdata.jv  # original frame numbers (may differ from 0..N after trimming)
-    n_frames = xrM.shape[1]
-    rg_buffer = np.zeros(n_frames)  # running buffer for progress_cb
-    rginfo_list = []
-    for j in tqdm(range(n_frames)):
-        sg = SimpleGuinier(np.array([qv, xrM[:,j], xrE[:,j]]).T)
-        rg = sg.Rg
-        if rg is not None and rg > 0:
-            rg_buffer[j] = rg
-        if progress_cb is not None:
-            progress_cb(rg_buffer, j)
-        if sg.Rg is not None or ADD_ALL_RESULTS:
-            # rginfo_list.append((j, sg.Rg, sg.score))
-            rginfo_list.append((int(jv[j]), sg))
-    return rginfo_list
+    # xrdata.jv holds original frame numbers (may differ from 0..N after trimming)
+    return compute_simple_guinier_list(xrdata.qv, xrdata.M, xrdata.E, xrdata.jv,
+                                       progress_cb=progress_cb, n_jobs=n_jobs)
 
 # ---------------------------------------------------------------------------
 # Segment-analysis utilities
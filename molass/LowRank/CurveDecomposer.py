@@ -11,7 +11,7 @@ from scipy.optimize import minimize
 # Fits EGH peaks one at a time (argmax → fit → subtract), with area-ratio
 # significance stopping when num_components is None (auto-detect).
 from molass.Peaks.EghPeeler import egh_peel
-from molass.SEC.Models.Simple import egh
+from molass.SEC.Models.Simple import egh, egh_multi
 
 TAU_PENALTY_SCALE = 100
 NPLATES_PENALTY_SCALE = 1e-4
@@ -19,6 +19,7 @@ MEAN_ORDER_PENALTY_SCALE = 1e5
 SIGMA_ORDER_PENALTY_SCALE = 1e5
 GUINIER_PENALTY_SCALE = 1e5
 VERY_SMALL_VALUE = 1e-10
+SOLVERS = ('nelder-mead', 'least_squares')
 
 def safe_log10(x):
     """
@@ -51,11 +52,7 @@ def compute_areas(x, peak_list):
     areas : array-like
         The areas under each peak.
     """
-    areas = []
-    for params in peak_list:
-        y = egh(x, *params)
-        areas.append(np.sum(y))
-    return np.array(areas)
+    return np.sum(egh_multi(x, peak_list), axis=1)
 
 class CurveDecomposer:
     """ A class for decomposing curves into component curves.
@@ -104,6 +101,12 @@ def decompose_icurve_impl(icurve, num_components, **kwargs):
                 Random seed for parameter randomization. Default is None.
             - global_opt: bool
                 If True, use global optimization (basinhopping) for fitting. Default is False.
+            - solver: str
+                'nelder-mead' (default) minimizes the log-sum penalty objective with Nelder-Mead.
+                'least_squares' solves the bounded least-squares reformulation with analytic
+                Jacobians (see molass.LowRank.LeastSquaresDecomposer), which requires far fewer
+                function evaluations. It does not support sec_constraints or global_opt, in which
+                case Nelder-Mead is used with a warning.
     Returns
     -------
     ret_curves : list of ComponentCurve
@@ -199,10 +202,9 @@ def decompose_icurve_impl(icurve, num_components, **kwargs):
                     ax.legend()
                     plt.show()
 
+            C_buffer = np.empty((m, len(x)))     # reused across objective evaluations
+
             def fit_objective(p):
-                cy_list = []
-                areas = []
-                tau_penalty = 0
                 ndev_penalty = 0
                 shaped_params = p.reshape(shape)
                 if num_components > 1:
@@ -211,20 +213,21 @@ def decompose_icurve_impl(icurve, num_components, **kwargs):
                 else:
                     mean_order_penalty = 0
                     sigma_order_penalty = 0
-                for h, tr, sigma, tau in shaped_params:
-                    cy = egh(x, h, tr, sigma, tau)
-                    tau_penalty += max(0, abs(tau) - sigma*tau_limit)
-                    cy_list.append(cy)
-                    areas.append(np.sum(cy))
-                    if num_plates is not None:
-                        ndev_penalty = ((tr - tI)**2 / (sigma**2 + tau**2) - N**2)**2
-                ty = np.sum(cy_list, axis=0)
-                area_proportions = np.array(areas)/np.sum(areas)
+                C = egh_multi(x, shaped_params, out=C_buffer)
+                sigmas = shaped_params[:, 2]
+                taus = shaped_params[:, 3]
+                tau_penalty = np.sum(np.maximum(0, np.abs(taus) - sigmas*tau_limit))
+                areas = np.sum(C, axis=1)
+                if num_plates is not None:
+                    # as before vectorization, only the last component is evaluated
+                    tr, sigma, tau = shaped_params[-1, 1:4]
+                    ndev_penalty = ((tr - tI)**2 / (sigma**2 + tau**2) - N**2)**2
+                ty = np.sum(C, axis=0)
+                area_proportions = areas/np.sum(areas)
                 if M_ is None:
                     guinier_penalty = 0
                 else:
                     try:
-                        C = np.array(cy_list)
                         Cinv = np.linalg.pinv(C)
                         P = M_ @ Cinv
                         slope_proxy = P[0,:] - P[jqv,:]
@@ -275,7 +278,25 @@ def decompose_icurve_impl(icurve, num_components, **kwargs):
             init_params = check_egh_bounds(x, y, init_params, bounds, modify=True, debug=debug)
 
             global_opt = kwargs.get('global_opt', False)
-            if global_opt:
+            solver = kwargs.get('solver', 'nelder-mead')
+            if solver not in SOLVERS:
+                raise ValueError("Unknown solver: %s, expected one of %s" % (solver, SOLVERS))
+            if solver == 'least_squares' and (M_ is not None or global_opt):
+                import warnings
+                warnings.warn("solver='least_squares' does not support sec_constraints or global_opt; "
+                              "using Nelder-Mead instead.", stacklevel=2)
+                solver = 'nelder-mead'
+
+            if solver == 'least_squares':
+                if debug:
+                    import molass.LowRank.LeastSquaresDecomposer
+                    reload(molass.LowRank.LeastSquaresDecomposer)
+                from molass.LowRank.LeastSquaresDecomposer import fit_egh_least_squares
+                plates_info = None if num_plates is None else (N, tI)
+                res = fit_egh_least_squares(x, sy, init_params, bounds, target_proportions,
+                                            tau_limit=tau_limit, area_weight=area_weight, max_y=max_y,
+                                            plates_info=plates_info)
+            elif global_opt:
                 from scipy.optimize import basinhopping
                 minimizer_kwargs = dict(method="Nelder-Mead", bounds=bounds)
                 res = basinhopping(fit_objective, init_params, minimizer_kwargs=minimizer_kwargs)
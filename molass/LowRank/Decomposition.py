@@ -787,7 +787,7 @@ class Decomposition:
         scd_colors = ['green' if rank == 1 else 'red' for rank in ranks]
         return peak_top_xes, scd_colors
     
-    def upgrade(self, model, *, rgcurve=None, model_params=None, debug=False, **kwargs):
+    def upgrade(self, model, *, rgcurve=None, model_params=None, n_jobs=None, debug=False, **kwargs):
         """
         Upgrade the decomposition to a physics-aware column model (SDM or EDM).
 
@@ -820,6 +820,13 @@ class Decomposition:
             ``'lognormal'`` uses a lognormal pore distribution (G1300).
             Takes precedence over ``model_params['pore_dist']`` when both are given.
 
+        n_jobs : int, optional
+            For SDM (mono) and CEDM: the number of worker processes in which the
+            starting points of the column-parameter optimization are run.
+            None (default) or 1 runs them serially, -1 uses all CPUs.
+            Combine with ``n_starts`` to add randomized starting points
+            (and ``seed`` to make them reproducible); the best result is kept.
+
         debug : bool, optional
             If True, enable debug mode.
 
@@ -839,11 +846,13 @@ class Decomposition:
             reload(molass.SEC.ModelFactory)
         from molass.SEC.ModelFactory import create_model
         sec_model = create_model(model, debug=debug)
+        if n_jobs is not None:
+            kwargs['n_jobs'] = n_jobs
         return sec_model.optimize_decomposition(self, rgcurve=rgcurve,
                                                 model_params=model_params,
                                                 debug=debug, **kwargs)
 
-    def optimize_with_model(self, model_name, rgcurve=None, model_params=None, debug=False, **kwargs):
+    def optimize_with_model(self, model_name, rgcurve=None, model_params=None, n_jobs=None, debug=False, **kwargs):
         """Deprecated. Use :meth:`upgrade` instead."""
         import warnings
         warnings.warn(
@@ -852,7 +861,7 @@ class Decomposition:
             stacklevel=2,
         )
         return self.upgrade(model_name, rgcurve=rgcurve, model_params=model_params,
-                            debug=debug, **kwargs)
+                            n_jobs=n_jobs, debug=debug, **kwargs)
 
     def recommend_num_components(self, k_max=3, model="SDM", rgcurve=None,
                                  rt_dist="gamma",
@@ -997,6 +1006,7 @@ class Decomposition:
                             ns_narrow_bounds=True,
                             ns_adaptive_nsteps=False,
                             ns_nsteps=None,
+                            seed=None, num_chains=1, kill_dominated=False,
                             **kwargs):
         """
         Perform a rigorous decomposition.
@@ -1111,6 +1121,22 @@ class Decomposition:
             behaviour for unattended in-process runs.
         debug : bool, optional
             If True, enable debug mode.
+        seed : int or None, optional
+            Random seed of the optimizer.  None (default) uses 1234, so that
+            repeated runs are reproducible.
+        num_chains : int, optional
+            Number of independent chains.  Default 1.  If greater than 1,
+            chain ``k`` runs with seed ``seed + k`` in its own subprocess and
+            job folder (``optimized/jobs/NNN``) under ``analysis_folder``, and
+            a :class:`~molass.Rigorous.MultiChain.MultiChainRunInfo` is
+            returned, whose ``load_best()`` picks the best result over all
+            chains via :meth:`load_best_rigorous_result`.  Mainly useful for
+            ``method='BH'``, which can get stuck in a poor basin.
+            ``in_process``, ``async_`` and ``monitor`` are ignored.
+        kill_dominated : bool, optional
+            Only with ``num_chains > 1``.  If True, terminate the chains whose
+            best SV stays well below that of the best chain, so that the CPUs
+            go to the promising ones.  Default False.
 
         Returns
         -------
@@ -1213,7 +1239,7 @@ class Decomposition:
         if rgcurve is None:
             rgcurve = self.ssd.xr.compute_rgcurve()
 
-        return make_rigorous_decomposition_impl(self, rgcurve, analysis_folder=analysis_folder, method=method, niter=niter, frozen_components=frozen_components, frozen_param_groups=frozen_param_groups, trimmed_ssd=trimmed_ssd, clear_jobs=clear_jobs, function_code=function_code, in_process=in_process, monitor=monitor, async_=async_, progress=progress, max_trials=max_trials, debug=debug, _dry_run=_dry_run, ns_narrow_bounds=ns_narrow_bounds, ns_adaptive_nsteps=ns_adaptive_nsteps, ns_nsteps=ns_nsteps, solver_kwargs=solver_kwargs)
+        return make_rigorous_decomposition_impl(self, rgcurve, analysis_folder=analysis_folder, method=method, niter=niter, frozen_components=frozen_components, frozen_param_groups=frozen_param_groups, trimmed_ssd=trimmed_ssd, clear_jobs=clear_jobs, function_code=function_code, in_process=in_process, monitor=monitor, async_=async_, progress=progress, max_trials=max_trials, debug=debug, _dry_run=_dry_run, ns_narrow_bounds=ns_narrow_bounds, ns_adaptive_nsteps=ns_adaptive_nsteps, ns_nsteps=ns_nsteps, solver_kwargs=solver_kwargs, seed=seed, num_chains=num_chains, kill_dominated=kill_dominated)
 
     def score_initial(self, trimmed_ssd=None, analysis_folder=None,
                       function_code=None, debug=False):
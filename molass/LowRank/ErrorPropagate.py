@@ -5,12 +5,50 @@
 """
 import numpy as np
 
-def compute_propagated_error(M, P, E):
+PINV_RCOND = 1e-15      # the relative cutoff of small singular values, same as np.linalg.pinv
+
+def compute_pinv_product(M, P, svd=None):
+    """
+    Compute W = pinv(M) @ P from the thin SVD factors of M.
+
+    With the factors ``M = U @ diag(s) @ VT``, ``W = VT.T @ diag(1/s) @ (U.T @ P)``,
+    which costs O(rank) matrix-vector products instead of forming the
+    ``(n_frames, n_q)`` pseudo-inverse.  Singular values below
+    ``PINV_RCOND`` times the largest are discarded as in ``np.linalg.pinv``.
+
+    Parameters
+    ----------
+    M : 2D array-like
+        The matrix to be pseudo-inverted.
+    P : 2D array-like
+        The matrix to be multiplied.
+    svd : tuple or None, optional
+        The thin SVD factors (U, s, VT) of M, possibly truncated to its
+        rank, e.g., those used to compute a low rank M.  If None, the
+        economy SVD of M is taken from the per-matrix cache of
+        :func:`~molass.LowRank.SvdBackend.get_svd`, so that repeated calls
+        with the same M share one factorization.
+
+    Returns
+    -------
+    W : 2D array-like
+        Equal to ``np.linalg.pinv(M) @ P`` within floating-point rounding.
+    """
+    if svd is None:
+        from molass.LowRank.SvdBackend import get_svd
+        svd = get_svd(np.asanyarray(M), method='economy')
+    U, s, VT = svd
+    large = s > PINV_RCOND * np.max(s)
+    return VT[large].T @ ((U[:, large].T @ P) / s[large, np.newaxis])
+
+def compute_propagated_error(M, P, E, svd=None):
     """
     Compute the propagated error of the low rank approximation.
     The propagated error Pe is computed using the formula:
         Pe = sqrt( (E^2) * (W^2) )
 
+    where W = pinv(M) @ P is computed with :func:`compute_pinv_product`.
+
     Parameters
     ----------
     M : 2D array-like
@@ -19,13 +57,14 @@ def compute_propagated_error(M, P, E):
         The projected matrix.
     E : 2D array-like
         The error matrix corresponding to M.
-        
+    svd : tuple or None, optional
+        The thin SVD factors of M, see :func:`compute_pinv_product`.
+
     Returns
     -------
     Pe : 2D array-like
         The propagated error matrix corresponding to P.
     """
-    M_pinv = np.linalg.pinv(M)
-    W = np.dot(M_pinv, P)
+    W = compute_pinv_product(M, P, svd=svd)
     Pe = np.sqrt(np.dot(E**2, W**2))
-    return Pe
\ No newline at end of file
+    return Pe
@@ -0,0 +1,160 @@
+"""
+LowRank.LeastSquaresDecomposer.py
+
+This module contains the analytic-gradient fitting path of the EGH
+decomposition, selected with ``solver='least_squares'``.
+
+The penalties of the Nelder-Mead objective in
+:mod:`molass.LowRank.CurveDecomposer` are reformulated as residual terms,
+so that the whole problem is a bounded nonlinear least-squares problem
+which is solved with ``scipy.optimize.least_squares`` using the analytic
+Jacobian from :func:`~molass.SEC.Models.Simple.egh_multi_jacobian`.
+
+    residuals = [ ty - sy                                   (data)
+                  sqrt(area_weight*max_y) * (p - p_target)  (area proportions)
+                  w * max(0, |tau| - sigma*tau_limit)       (tau)
+                  w * min(0, diff(tR))                      (mean order)
+                  w * min(0, diff(sigma))                   (sigma order)
+                  w * ((tR - tI)²/(sigma² + tau²) - N²)     (num_plates, optional) ]
+
+where the penalty weights ``w`` are proportional to ``max_y`` so that
+they are independent of the intensity scale.
+"""
+import numpy as np
+from scipy.optimize import least_squares
+from molass.SEC.Models.Simple import egh_multi_jacobian
+
+TAU_RESIDUAL_SCALE = 10
+MEAN_ORDER_RESIDUAL_SCALE = 10
+SIGMA_ORDER_RESIDUAL_SCALE = 10
+NPLATES_RESIDUAL_SCALE = 1e-2
+
+def fit_egh_least_squares(x, y, init_params, bounds, target_proportions,
+                          tau_limit=0.5, area_weight=0.1, max_y=None,
+                          plates_info=None, max_nfev=None):
+    """
+    Fit a sum of EGH functions by bounded least squares with analytic Jacobians.
+
+    Parameters
+    ----------
+    x : array-like of shape (n,)
+        The x values of the curve.
+    y : array-like of shape (n,)
+        The y values of the curve.
+    init_params : array-like of shape (m, 4) or (4*m,)
+        The initial parameters (H, tR, sigma, tau) of the m components.
+    bounds : list of tuple
+        The ``(min, max)`` bounds of the flattened parameters as used with
+        ``scipy.optimize.minimize``, where None means unbounded.
+    target_proportions : array-like of shape (m,)
+        The target area proportions of the components.
+    tau_limit : float, optional
+        The limit of ``|tau|/sigma`` beyond which the tau residual is active.
+    area_weight : float, optional
+        The weight of the area proportion residuals.
+    max_y : float, optional
+        The maximum of y. If None, it is computed from y.
+    plates_info : tuple of (float, float), optional
+        ``(N, tI)`` where N is the square root of the number of plates and
+        tI the estimated interstitial time.  If given, the plate count
+        residual is applied to the last component as in the Nelder-Mead
+        objective.
+    max_nfev : int, optional
+        The maximum number of residual evaluations passed to ``least_squares``.
+
+    Returns
+    -------
+    OptimizeResult
+        The result of ``scipy.optimize.least_squares``, where ``x`` holds
+        the optimized parameters flattened.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    init_params = np.asarray(init_params, dtype=float).flatten()
+    num_params = len(init_params)
+    m = num_params//4
+    target_proportions = np.asarray(target_proportions, dtype=float)
+    if max_y is None:
+        max_y = np.max(y)
+    area_scale = np.sqrt(area_weight * max_y)
+    tau_scale = TAU_RESIDUAL_SCALE * max_y
+    mean_order_scale = MEAN_ORDER_RESIDUAL_SCALE * max_y
+    sigma_order_scale = SIGMA_ORDER_RESIDUAL_SCALE * max_y
+    nplates_scale = NPLATES_RESIDUAL_SCALE * max_y
+
+    n = len(x)
+    i_area = n
+    i_tau = i_area + m
+    i_mean = i_tau + m
+    i_sigma = i_mean + m - 1
+    i_plates = i_sigma + m - 1
+    num_residuals = i_plates + (0 if plates_info is None else 1)
+    rows = np.arange(m)
+    rows_ = np.arange(m - 1)
+
+    cache = {}
+    def evaluate(p):
+        # residuals and jacobian share the EGH evaluation at the same point
+        key = p.tobytes()
+        if cache.get('key') != key:
+            cache['key'] = key
+            cache['values'] = egh_multi_jacobian(x, p.reshape((m, 4)))
+        return cache['values']
+
+    def residuals(p):
+        shaped_params = p.reshape((m, 4))
+        C, _ = evaluate(p)
+        sigmas = shaped_params[:, 2]
+        taus = shaped_params[:, 3]
+        areas = np.sum(C, axis=1)
+        r = np.empty(num_residuals)
+        r[:n] = np.sum(C, axis=0) - y
+        r[i_area:i_tau] = area_scale * (areas/np.sum(areas) - target_proportions)
+        r[i_tau:i_mean] = tau_scale * np.maximum(0, np.abs(taus) - sigmas*tau_limit)
+        r[i_mean:i_sigma] = mean_order_scale * np.minimum(0, np.diff(shaped_params[:, 1]))
+        r[i_sigma:i_plates] = sigma_order_scale * np.minimum(0, np.diff(sigmas))
+        if plates_info is not None:
+            N, tI = plates_info
+            tr, sigma, tau = shaped_params[-1, 1:4]
+            r[i_plates] = nplates_scale * ((tr - tI)**2/(sigma**2 + tau**2) - N**2)
+        return r
+
+    def jacobian(p):
+        shaped_params = p.reshape((m, 4))
+        C, dC = evaluate(p)
+        sigmas = shaped_params[:, 2]
+        taus = shaped_params[:, 3]
+        J = np.zeros((num_residuals, num_params))
+        J[:n] = dC.transpose(2, 0, 1).reshape(n, num_params)
+
+        areas = np.sum(C, axis=1)
+        total = np.sum(areas)
+        dareas = np.sum(dC, axis=2)                                     # (m, 4)
+        dprop = (np.eye(m)*total - areas[:, np.newaxis])/total**2       # dp_k/dA_l
+        J[i_area:i_tau] = area_scale * (dprop[:, :, np.newaxis] * dareas[np.newaxis, :, :]).reshape(m, num_params)
+
+        active = np.abs(taus) - sigmas*tau_limit > 0
+        J[i_tau + rows, 4*rows + 2] = -tau_scale * tau_limit * active
+        J[i_tau + rows, 4*rows + 3] = tau_scale * np.sign(taus) * active
+
+        for i_start, j, scale in [(i_mean, 1, mean_order_scale), (i_sigma, 2, sigma_order_scale)]:
+            active = np.diff(shaped_params[:, j]) < 0
+            J[i_start + rows_, 4*rows_ + j] = -scale * active
+            J[i_start + rows_, 4*(rows_ + 1) + j] = scale * active
+
+        if plates_info is not None:
+            N, tI = plates_info
+            tr, sigma, tau = shaped_params[-1, 1:4]
+            v = sigma**2 + tau**2
+            d2 = (tr - tI)**2
+            k = num_params - 4
+            J[i_plates, k + 1] = nplates_scale * 2*(tr - tI)/v
+            J[i_plates, k + 2] = -nplates_scale * 2*sigma*d2/v**2
+            J[i_plates, k + 3] = -nplates_scale * 2*tau*d2/v**2
+        return J
+
+    lower = np.array([-np.inf if b[0] is None else b[0] for b in bounds], dtype=float)
+    upper = np.array([np.inf if b[1] is None else b[1] for b in bounds], dtype=float)
+    init_params = np.clip(init_params, lower, upper)
+    return least_squares(residuals, init_params, jac=jacobian, bounds=(lower, upper),
+                         method='trf', x_scale='jac', max_nfev=max_nfev)
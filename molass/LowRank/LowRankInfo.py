@@ -9,7 +9,7 @@ from importlib import reload
 import numpy as np
 import matplotlib.pyplot as plt
 
-def get_denoised_data( D, rank=3, svd=None ):
+def get_denoised_data( D, rank=3, svd=None, svd_method='auto' ):
     """
     Get the denoised data by low rank approximation using SVD.
 
@@ -21,6 +21,10 @@ def get_denoised_data( D, rank=3, svd=None ):
         The rank for the low rank approximation, by default 3.
     svd : tuple or None, optional
         Precomputed SVD (U, s, VT) to use instead of computing it again
+    svd_method : str, optional
+        The SVD backend used when svd is None, one of
+        :data:`~molass.LowRank.SvdBackend.SVD_METHODS`.  The factorization
+        is cached per matrix, see :func:`~molass.LowRank.SvdBackend.get_svd`.
 
     Returns
     -------
@@ -29,11 +33,16 @@ def get_denoised_data( D, rank=3, svd=None ):
     """
     # print( 'get_denoised_data: rank=', rank )
     if svd is None:
-        U, s, VT = np.linalg.svd( D )
+        D = np.asanyarray(D)
+        truncated = min(D.shape) > rank
+        if truncated:
+            from molass.LowRank.SvdBackend import get_svd
+            U, s, VT = get_svd( D, rank=rank, method=svd_method )
     else:
         U, s, VT = svd
-    if s.shape[0] > rank:
-        Us_ = np.dot( U[:,0:rank], np.diag( s[0:rank] ) )
+        truncated = s.shape[0] > rank
+    if truncated:
+        Us_ = U[:,0:rank] * s[0:rank]
         D_  = np.dot( Us_, VT[0:rank,:] )
     else:
         # just make a copy
@@ -41,6 +50,16 @@ def get_denoised_data( D, rank=3, svd=None ):
         D_  = np.array(D)
     return D_
 
+def _get_denoised_svd(D, rank, svd_method):
+    # the thin SVD factors of get_denoised_data(D, rank, svd_method=svd_method)
+    from molass.LowRank.SvdBackend import get_svd
+    D = np.asanyarray(D)
+    if min(D.shape) > rank:
+        U, s, VT = get_svd(D, rank=rank, method=svd_method)
+        return U[:,0:rank], s[0:rank], VT[0:rank,:]
+    else:
+        return get_svd(D, method='economy')
+
 def compute_lowrank_matrices(M, ccurves, E, ranks, **kwargs):
     """
     Compute the matrices for the low rank approximation.
@@ -63,6 +82,8 @@ def compute_lowrank_matrices(M, ccurves, E, ranks, **kwargs):
         Possible keys include:
             - svd_rank: int or None
                 The rank for the SVD used in the low rank approximation. If None, it will be set to the sum of ranks.
+            - svd_method: str
+                The SVD backend, see :func:`get_denoised_data`. Default is 'auto'.
     Returns
     -------
     M_ : 2D array-like
@@ -85,7 +106,7 @@ def compute_lowrank_matrices(M, ccurves, E, ranks, **kwargs):
         from molass.Except.ExceptionTypes import InadequateUseError
         raise InadequateUseError("svd_rank(%d) must not be less than number of components(%d)" % (svd_rank, rank))
     
-    M_ = get_denoised_data(M, rank=svd_rank)
+    M_ = get_denoised_data(M, rank=svd_rank, svd_method=kwargs.get('svd_method', 'auto'))
     cy_list = [c.get_xy()[1] for c in ccurves]
     for k, r in enumerate(ranks):
         if r > 1:
@@ -100,7 +121,9 @@ def compute_lowrank_matrices(M, ccurves, E, ranks, **kwargs):
         Pe = None
     else:
         # propagate the error
+        # M_ consists of the top svd_rank triplets of M, which are reused from the svd cache
         from molass.LowRank.ErrorPropagate import compute_propagated_error
-        Pe = compute_propagated_error(M_, P_, E)
+        svd = _get_denoised_svd(M, svd_rank, kwargs.get('svd_method', 'auto'))
+        Pe = compute_propagated_error(M_, P_, E, svd=svd)
         
     return M_, C_, P_, Pe
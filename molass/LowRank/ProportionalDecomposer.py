@@ -8,7 +8,7 @@ import numpy as np
 from bisect import bisect_right
 from scipy.optimize import minimize, basinhopping
 from molass_legacy.KekLib.SciPyCookbook import smooth
-from molass.SEC.Models.Simple import egh, e0
+from molass.SEC.Models.Simple import egh, egh_multi, e0
 from molass.Stats.Moment import compute_meanstd
 
 SQRT_PI_8 = np.sqrt(np.pi/8)
@@ -119,19 +119,14 @@ def decompose_icurve_proportionally(x, y, decompargs, **kwargs):
     shape = init_params.shape
     dev_weights = decompargs.get('dev_weights', (1,5))
 
+    C_buffer = np.empty((shape[0], len(x)))     # reused across objective evaluations
+
     def fit_func(p, ax=None):
-        area_list = []
         params = p.reshape(shape)
-        cy_list = []
-        tau_penalty = 0
-        for h, m, s, t in params:
-            cy = egh(x, h, m, s, t)
-            cy_list.append(cy)
-            area = compute_egh_area_fast(h, s, t)
-            area_list.append(area)
-            tau_penalty += max(0, t/s - tau_limit)**2
+        area_list = compute_egh_area_fast(params[:,0], params[:,2], params[:,3])
+        tau_penalty = np.sum(np.maximum(0, params[:,3]/params[:,2] - tau_limit)**2)
         tau_penalty *= 1000
-        ty = np.sum(cy_list, axis=0)
+        ty = np.sum(egh_multi(x, params, out=C_buffer), axis=0)
         order_penalty = min(0, np.min(np.diff(params[:,1])))*1000
         area_list = np.asarray(area_list)
         total = np.sum(area_list)
@@ -0,0 +1,216 @@
+"""
+    LowRank.SvdBackend.py
+
+    This module contains the SVD backends used for low rank denoising.
+
+    Only the top few singular triplets are used by the low rank
+    approximation, so a full SVD is mostly wasted work on large matrices.
+    The backends are
+
+        'full'        np.linalg.svd with full matrices (the legacy behavior)
+        'economy'     np.linalg.svd with full_matrices=False
+        'randomized'  randomized range finder with oversampling and power
+                      iterations (Halko, Martinsson and Tropp, 2011)
+        'arpack'      scipy.sparse.linalg.svds
+
+    and 'auto' chooses one of them by the matrix shape and requested rank.
+    :func:`get_svd` also caches the factorizations per matrix identity, so
+    that, e.g., ``get_xr_matrices`` and the constrained decomposition of the
+    same data matrix share one SVD.
+"""
+import weakref
+import hashlib
+from collections import OrderedDict, namedtuple
+import numpy as np
+
+SVD_METHODS = ('auto', 'full', 'economy', 'randomized', 'arpack')
+ARPACK_MIN_SIZE = 500           # min(shape) above which 'auto' may use the arpack backend
+ARPACK_MAX_RANK_RATIO = 0.1     # rank/min(shape) below which 'auto' may use the arpack backend
+DEFAULT_OVERSAMPLING = 10
+DEFAULT_POWER_ITERATIONS = 4
+SVD_CACHE_SIZE = 4
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+def choose_svd_method(shape, rank=None):
+    """
+    Choose an SVD backend for a matrix shape and requested rank.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        The shape of the matrix.
+    rank : int or None, optional
+        The number of singular triplets needed. None means all.
+
+    Returns
+    -------
+    str
+        'arpack' for large matrices of which only a small rank is needed,
+        otherwise 'economy'.  'randomized' is not chosen automatically
+        since its accuracy depends on the gap between the requested and the
+        remaining singular values, which is small when the last requested
+        component is close to the noise level.
+    """
+    min_size = min(shape)
+    if rank is not None and min_size > ARPACK_MIN_SIZE and rank <= min_size * ARPACK_MAX_RANK_RATIO:
+        return 'arpack'
+    return 'economy'
+
+def randomized_svd(D, rank, oversampling=DEFAULT_OVERSAMPLING, n_iter=DEFAULT_POWER_ITERATIONS, seed=0):
+    """
+    Compute a truncated SVD with the randomized range finder.
+
+    Parameters
+    ----------
+    D : 2D array-like
+        The matrix to be factorized.
+    rank : int
+        The number of singular triplets to compute.
+    oversampling : int, optional
+        The number of additional random vectors which improve the accuracy.
+    n_iter : int, optional
+        The number of power iterations, each re-orthonormalized with QR,
+        which improve the accuracy for slowly decaying spectra.
+    seed : int or None, optional
+        The random seed. The default makes the result deterministic.
+
+    Returns
+    -------
+    U : ndarray of shape (m, rank)
+    s : ndarray of shape (rank,)
+    VT : ndarray of shape (rank, n)
+    """
+    m, n = D.shape
+    size = min(rank + oversampling, m, n)
+    rng = np.random.default_rng(seed)
+    Q, _ = np.linalg.qr(D @ rng.standard_normal((n, size)))
+    for _ in range(n_iter):
+        Z, _ = np.linalg.qr(D.T @ Q)
+        Q, _ = np.linalg.qr(D @ Z)
+    Ub, s, VT = np.linalg.svd(Q.T @ D, full_matrices=False)
+    return (Q @ Ub)[:, :rank], s[:rank], VT[:rank]
+
+def compute_svd(D, rank=None, method='auto', **kwargs):
+    """
+    Compute the SVD of a matrix with the specified backend.
+
+    Parameters
+    ----------
+    D : 2D array-like
+        The matrix to be factorized.
+    rank : int or None, optional
+        The number of singular triplets needed. None means all, which
+        is only possible with 'full' or 'economy'.
+    method : str, optional
+        One of ``SVD_METHODS``.
+    kwargs : dict, optional
+        ``oversampling``, ``n_iter`` and ``seed`` for 'randomized'.
+
+    Returns
+    -------
+    U, s, VT : ndarray
+        The factorization, in descending order of the singular values.
+        The truncating backends return exactly ``rank`` triplets, the others
+        return all of them.
+    """
+    if method not in SVD_METHODS:
+        raise ValueError("unknown svd method: %r, must be one of %s" % (method, SVD_METHODS))
+    # factorized in float64 even if D is stored in a lower precision such as float32
+    D = np.asarray(D, dtype=float)
+    if method == 'auto':
+        method = choose_svd_method(D.shape, rank)
+    if method in ('randomized', 'arpack'):
+        if rank is None:
+            raise ValueError("rank must be specified for the %r svd method" % method)
+        if rank >= min(D.shape):
+            method = 'economy'
+
+    if method == 'full':
+        return np.linalg.svd(D)
+    elif method == 'economy':
+        return np.linalg.svd(D, full_matrices=False)
+    elif method == 'randomized':
+        return randomized_svd(D, rank, **kwargs)
+    else:
+        from scipy.sparse.linalg import svds
+        U, s, VT = svds(D, k=rank, random_state=kwargs.get('seed', 0))
+        order = np.argsort(s)[::-1]
+        return U[:, order], s[order], VT[order]
+
+_svd_cache = OrderedDict()
+_cache_stats = [0, 0]   # hits, misses
+
+def _get_fingerprint(D):
+    # a hash of all the values detects any in-place modification, e.g., by
+    # corrected_copy(inplace=True), at a small fraction of the SVD cost
+    return hashlib.blake2b(np.ascontiguousarray(D), digest_size=16).digest()
+
+def get_svd(D, rank=None, method='auto', **kwargs):
+    """
+    Get the SVD of a matrix, reusing a cached factorization of the same matrix.
+
+    A factorization is cached per matrix identity and backend, and is
+    reused for any request of the same or a smaller rank as long as the
+    matrix object is alive and its values are unchanged.
+
+    Parameters
+    ----------
+    D : ndarray
+        The matrix to be factorized.
+    rank : int or None, optional
+        The number of singular triplets needed. None means all.
+    method : str, optional
+        One of ``SVD_METHODS``.
+    kwargs : dict, optional
+        Passed to :func:`compute_svd`.
+
+    Returns
+    -------
+    U, s, VT : ndarray
+        The factorization as from :func:`compute_svd`.
+    """
+    if method == 'auto':
+        method = choose_svd_method(D.shape, rank)
+    key = (id(D), method)
+    entry = _svd_cache.get(key)
+    fingerprint = _get_fingerprint(D)
+    if entry is not None:
+        ref, shape, entry_fingerprint, svd = entry
+        if (ref() is D and shape == D.shape and entry_fingerprint == fingerprint
+            and (rank is None and len(svd[1]) == min(D.shape) or rank is not None and len(svd[1]) >= rank)):
+            _cache_stats[0] += 1
+            _svd_cache.move_to_end(key)
+            return svd
+    _cache_stats[1] += 1
+    svd = compute_svd(D, rank=rank, method=method, **kwargs)
+    try:
+        ref = weakref.ref(D)
+    except TypeError:
+        # an array-like without weakref support; do not cache
+        return svd
+    _svd_cache[key] = (ref, D.shape, fingerprint, svd)
+    _svd_cache.move_to_end(key)
+    while len(_svd_cache) > SVD_CACHE_SIZE:
+        _svd_cache.popitem(last=False)
+    return svd
+
+def svd_cache_info():
+    """
+    Return the statistics of the SVD cache.
+
+    Returns
+    -------
+    CacheInfo
+        A named tuple ``(hits, misses, maxsize, currsize)`` in the
+        manner of ``functools.lru_cache``.
+    """
+    return CacheInfo(_cache_stats[0], _cache_stats[1], SVD_CACHE_SIZE, len(_svd_cache))
+
+def clear_svd_cache():
+    """
+    Clear the SVD cache and its statistics.
+    """
+    _svd_cache.clear()
+    _cache_stats[0] = 0
+    _cache_stats[1] = 0
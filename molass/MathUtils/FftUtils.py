@@ -1,8 +1,18 @@
 """
     MathUtils/FftUtils.py
 """
+from collections import OrderedDict, namedtuple
+import hashlib
 import numpy as np
-from scipy.interpolate import UnivariateSpline
+
+INTERP_CACHE_SIZE = 8
+INTERP_WEIGHT_TOLERANCE = 1e-16
+INVERSE_EDGE_SIZE = 64
+SEEN_GRIDS_FACTOR = 4       # grids seen once remembered, relative to the cache size
+
+_inverse_collocation_cache = {}
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
 
 def compute_standard_wCD(N):
     # extracted from molass_legacy/CharFunc/cf2DistFFT.py
@@ -22,6 +32,97 @@ def compute_standard_wCD(N):
     D = (-1)**(-2*(A/(B-A))*k)     # k must be complex, see https://stackoverflow.com/questions/45384602/numpy-runtimewarning-invalid-value-encountered-in-power
     return w, C, D
 
+def _collocation_knots(N):
+    x = np.arange(N, dtype=float)
+    return np.r_[(x[0],)*4, x[2:-2], (x[-1],)*4]     # not-a-knot as in FITPACK with s=0
+
+def compute_inverse_collocation(N, tol=INTERP_WEIGHT_TOLERANCE):
+    """
+    Compute the truncated inverse of the cubic spline collocation matrix.
+
+    The columns of ``inv(A)``, where ``A @ c = y`` is the not-a-knot
+    collocation system on ``np.arange(N)``, decay geometrically (by a factor
+    of about 0.27 per grid point) away from the diagonal, so that they are
+    truncated at ``tol`` relative to their largest entry.  Away from the
+    boundaries, the columns are shifts of one another, so that only the
+    columns near the ends need to be solved for.  The result depends only on
+    ``N`` and is cached.
+
+    Parameters
+    ----------
+    N : int
+        The size of the integer grid.
+    tol : float, optional
+        The relative tolerance below which entries are dropped.
+
+    Returns
+    -------
+    scipy.sparse.csr_matrix of shape (N, N)
+        The truncated inverse, about 55 nonzeros per row.
+    """
+    key = (N, tol)
+    Ainv = _inverse_collocation_cache.get(key)
+    if Ainv is not None:
+        return Ainv
+
+    from scipy.interpolate import BSpline
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.linalg import splu
+    A = BSpline.design_matrix(np.arange(N, dtype=float), _collocation_knots(N), 3)
+    lu = splu(A.tocsc())
+    if N <= 4*INVERSE_EDGE_SIZE:
+        solved = np.arange(N)
+    else:
+        solved = np.r_[0:INVERSE_EDGE_SIZE + 1, N - INVERSE_EDGE_SIZE:N]
+    E = np.zeros((N, len(solved)))
+    E[solved, np.arange(len(solved))] = 1
+    X = lu.solve(E)
+    X[np.abs(X) < tol*np.abs(X).max(axis=0, keepdims=True)] = 0
+    rows, cols = np.nonzero(X)
+    vals = X[rows, cols]
+    cols = solved[cols]
+    if len(solved) < N:
+        # interior columns: shifts of the column at INVERSE_EDGE_SIZE,
+        # whose boundary effects are below 0.27**INVERSE_EDGE_SIZE
+        stencil = X[:, INVERSE_EDGE_SIZE]
+        offsets = np.flatnonzero(stencil) - INVERSE_EDGE_SIZE
+        interior = np.arange(INVERSE_EDGE_SIZE + 1, N - INVERSE_EDGE_SIZE)
+        rows = np.r_[rows, (interior[:, np.newaxis] + offsets).ravel()]
+        cols = np.r_[cols, np.repeat(interior, len(offsets))]
+        vals = np.r_[vals, np.tile(stencil[offsets + INVERSE_EDGE_SIZE], len(interior))]
+    Ainv = coo_matrix((vals, (rows, cols)), shape=(N, N)).tocsr()
+    _inverse_collocation_cache[key] = Ainv
+    return Ainv
+
+def compute_interp_matrix(N, t, tol=INTERP_WEIGHT_TOLERANCE):
+    """
+    Compute the sparse matrix of cubic spline interpolation weights.
+
+    The not-a-knot cubic spline through ``(np.arange(N), y)``, i.e., the
+    spline of ``UnivariateSpline(np.arange(N), y, s=0)``, depends linearly
+    on ``y``, so that its values at ``t`` are ``W @ y`` for a fixed matrix
+    ``W = B @ inv(A)``, where ``B`` is the B-spline design matrix at ``t``
+    and ``inv(A)`` is given by :func:`compute_inverse_collocation`.  Both
+    factors are banded, which leaves about 57 nonzeros per row.
+
+    Parameters
+    ----------
+    N : int
+        The size of the integer grid.
+    t : ndarray of shape (n,)
+        The query points.
+    tol : float, optional
+        The relative tolerance below which weights are dropped.
+
+    Returns
+    -------
+    scipy.sparse.csr_matrix of shape (n, N)
+        The interpolation matrix.
+    """
+    from scipy.interpolate import BSpline
+    B = BSpline.design_matrix(t, _collocation_knots(N), 3, extrapolate=True)
+    return (B @ compute_inverse_collocation(N, tol)).tocsr()
+
 class FftInvPdf:
     """
     Numerically invert a characteristic function (CF) to obtain a PDF via FFT.
@@ -45,7 +146,7 @@ class FftInvPdf:
     inverse-amplitude scaling (``ts * result``) so that the returned values form
     a proper PDF integrating to 1 over the original (unscaled) time axis.
     """
-    def __init__(self, cf):
+    def __init__(self, cf, cache_size=INTERP_CACHE_SIZE):
         self.cf = cf
         self.default_N = 1024
         self.w, self.C, self.D = compute_standard_wCD(self.default_N)
@@ -54,6 +155,16 @@ class FftInvPdf:
         # computed only once regardless of how many PDF evaluations are made.
         self._large_N = None
         self._large_w = self._large_C = self._large_D = None
+        # LRU cache of interpolation matrices keyed on (N, t-grid hash).
+        # A grid seen once is interpolated by a spline fit, since the query
+        # grids of the model wrappers, e.g. ts*(x - tI), mostly change on
+        # every call; a matrix is built only for a grid seen again, and then
+        # reduces the interpolation to a sparse matrix-vector product.
+        self.cache_size = cache_size
+        self._interp_cache = OrderedDict()
+        self._seen_grids = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     def __call__(self, t, *params):
         """
@@ -78,23 +189,140 @@ class FftInvPdf:
             to obtain the PDF on the original time axis — or let the wrapper
             handle this via ``ts * __call__(ts * x, ...)``.
         """
+        t = np.ascontiguousarray(t, dtype=float)
+        N, w, C, D = self._get_grid(t[-1])
+        cft = self.cf(w[N//2:], *params)
+        cft = np.concatenate([cft[::-1].conj(), cft])
+        pdfFFT = np.max([np.zeros(N), (C*np.fft.fft(D*cft)).real], axis=0)
+        W = self._get_interp_matrix(N, t)
+        if W is None:
+            from scipy.interpolate import UnivariateSpline
+            return UnivariateSpline(np.arange(N), pdfFFT, s=0)(t)
+        return W @ pdfFFT
+
+    def _get_interp_matrix(self, N, t):
+        """
+        Return the cached interpolation matrix for ``t``, or None.
+
+        None is returned for a grid seen for the first time, which the caller
+        interpolates by a spline fit; the matrix is built when the grid is
+        seen again.
+        """
+        if self.cache_size <= 0:
+            self.cache_misses += 1
+            return None
+        key = (N, len(t), hashlib.sha1(t.tobytes()).digest())
+        W = self._interp_cache.get(key)
+        if W is not None:
+            self.cache_hits += 1
+            self._interp_cache.move_to_end(key)
+            return W
+        self.cache_misses += 1
+        if self._seen_grids.pop(key, None) is None:
+            self._seen_grids[key] = True
+            if len(self._seen_grids) > SEEN_GRIDS_FACTOR*self.cache_size:
+                self._seen_grids.popitem(last=False)
+            return None
+        W = self._interp_cache[key] = compute_interp_matrix(N, t)
+        if len(self._interp_cache) > self.cache_size:
+            self._interp_cache.popitem(last=False)
+        return W
+
+    def cache_info(self):
+        """
+        Return the statistics of the interpolation matrix cache.
+
+        Returns
+        -------
+        CacheInfo
+            A named tuple ``(hits, misses, maxsize, currsize)`` in the
+            manner of ``functools.lru_cache``.
+        """
+        return CacheInfo(self.cache_hits, self.cache_misses, self.cache_size, len(self._interp_cache))
+
+    def cache_clear(self):
+        """
+        Clear the interpolation matrix cache and its statistics.
+        """
+        self._interp_cache.clear()
+        self._seen_grids.clear()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def _get_grid(self, t_max):
+        # t_max is the last value of a sorted, pre-scaled time array
         N = self.default_N
-        t_max = t[-1]  # t is a sorted, pre-scaled time array
         if t_max >= N:
             # Auto-resize to the next power of 2 that covers the query range.
-            # Without this, UnivariateSpline would extrapolate outside [0, N-1],
+            # Without this, the spline would extrapolate outside [0, N-1],
             # producing garbage PDF values (e.g. for unscaled lognormal models
             # with raw frame values ~[455, 1393]).  See issue #181.
             N = int(2 ** np.ceil(np.log2(t_max + 2)))
             if N != self._large_N:
                 self._large_w, self._large_C, self._large_D = compute_standard_wCD(N)
                 self._large_N = N
-            w, C, D = self._large_w, self._large_C, self._large_D
+            return N, self._large_w, self._large_C, self._large_D
         else:
-            w, C, D = self.w, self.C, self.D
+            return N, self.w, self.C, self.D
 
-        cft = self.cf(w[N//2:], *params)
-        cft = np.concatenate([cft[::-1].conj(), cft])
-        pdfFFT = np.max([np.zeros(N), (C*np.fft.fft(D*cft)).real], axis=0)
-        spline = UnivariateSpline(np.arange(N), pdfFFT, s=0)
-        return spline(t)
\ No newline at end of file
+    def batch(self, t, *params):
+        """
+        Evaluate K PDFs at once, one for each parameter set.
+
+        The K characteristic functions are evaluated as a ``(K, N)`` array,
+        inverted with a single multi-row FFT and interpolated with one cubic
+        spline over all rows, or the cached interpolation matrix when ``t``
+        has been seen before, which is much cheaper than K calls of
+        ``__call__`` when the same ``t`` is shared.
+
+        Parameters
+        ----------
+        t : array-like of shape (n,) or (K, n)
+            Sorted, non-negative, **pre-scaled** time values, either shared by
+            all parameter sets or given per parameter set.  The FFT grid is
+            sized for the largest value over all rows.
+        *params
+            Parameters forwarded to ``cf(w, *params)`` where each one is a
+            scalar shared by all parameter sets or an array of shape (K,).
+            The characteristic function must broadcast over them, i.e., be
+            written with element-wise numpy operations.
+
+        Returns
+        -------
+        ndarray of shape (K, n)
+            PDF values where row k equals ``__call__(t, *params_k)`` within
+            floating-point rounding.
+        """
+        from scipy.interpolate import BSpline, make_interp_spline
+        t = np.ascontiguousarray(t, dtype=float)
+        params = [np.asarray(p) for p in params]
+        shape = np.broadcast(*params).shape if len(params) > 0 else ()
+        if len(shape) > 0:
+            K = shape[0]
+        else:
+            K = t.shape[0] if t.ndim == 2 else 1
+        N, w, C, D = self._get_grid(np.max(t[..., -1]))
+
+        cols = [p.reshape(-1, 1) if p.ndim > 0 else p for p in params]
+        cft = np.empty((K, N), dtype=complex)
+        cft[:, N//2:] = self.cf(w[np.newaxis, N//2:], *cols)
+        cft[:, :N//2] = cft[:, N//2:][:, ::-1].conj()
+        pdfFFT = np.maximum(0, (C*np.fft.fft(D*cft, axis=1)).real)
+        if t.ndim == 1:
+            W = self._get_interp_matrix(N, t)
+            if W is not None:
+                return (W @ pdfFFT.T).T
+            return make_interp_spline(np.arange(N), pdfFFT.T, k=3)(t).T
+        else:
+            # same not-a-knot cubic interpolation as UnivariateSpline(..., s=0)
+            spline = None
+            rows = []
+            for k, tk in enumerate(t):
+                W = self._get_interp_matrix(N, tk)
+                if W is not None:
+                    rows.append(W @ pdfFFT[k])
+                    continue
+                if spline is None:
+                    spline = make_interp_spline(np.arange(N), pdfFFT.T, k=3)
+                rows.append(BSpline(spline.t, spline.c[:, k], 3)(tk))
+            return np.array(rows)
\ No newline at end of file
@@ -23,6 +23,7 @@ def get_ready_for_numba():
 
     if os.path.exists(numba_cache):
         import shutil
-        shutil.rmtree(numba_cache)
-    os.makedirs(numba_cache)
+        # worker processes starting together may race on the removal
+        shutil.rmtree(numba_cache, ignore_errors=True)
+    os.makedirs(numba_cache, exist_ok=True)
     IS_READY_FOR_NUMBA = True
\ No newline at end of file
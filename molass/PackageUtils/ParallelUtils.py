@@ -0,0 +1,49 @@
+"""
+    PackageUtils.ParallelUtils.py
+"""
+import os
+import numpy as np
+
+def get_num_workers(n_jobs):
+    """
+    Resolve an ``n_jobs`` option into a number of workers.
+
+    Parameters
+    ----------
+    n_jobs : int or None
+        None or 1 means serial execution.
+        Negative values count back from the number of CPUs as in joblib,
+        i.e., -1 means all CPUs, -2 all but one, and so on.
+
+    Returns
+    -------
+    int
+        The number of workers, always at least 1.
+    """
+    if n_jobs is None:
+        return 1
+    n_jobs = int(n_jobs)
+    if n_jobs < 0:
+        num_cpus = os.cpu_count() or 1
+        return max(1, num_cpus + 1 + n_jobs)
+    return max(1, n_jobs)
+
+def split_range(n, num_chunks):
+    """
+    Split ``range(n)`` into contiguous slices of nearly equal sizes.
+
+    Parameters
+    ----------
+    n : int
+        The length of the range to split.
+    num_chunks : int
+        The maximum number of chunks.
+
+    Returns
+    -------
+    list of slice
+        Non-empty slices which cover ``range(n)`` in order.
+    """
+    num_chunks = max(1, min(num_chunks, n))
+    bounds = np.linspace(0, n, num_chunks + 1).astype(int)
+    return [slice(start, stop) for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
@@ -40,7 +40,7 @@ with symmetric Gaussian initialization) from molass-legacy.
 import numpy as np
 from scipy.optimize import minimize as sp_minimize
 from scipy.signal import savgol_filter
-from molass.SEC.Models.Simple import egh, gaussian
+from molass.SEC.Models.Simple import egh, egh_multi, gaussian
 
 DEFAULT_MIN_AREA_FRAC = 0.02
 DEFAULT_MIN_HEIGHT_FRAC = 0.05
@@ -163,6 +163,7 @@ def egh_peel(x, y, num_components=None, min_area_frac=DEFAULT_MIN_AREA_FRAC,
     max_steps = num_components if num_components is not None else MAX_STEPS
     peak_list = []
     sigma_dominant = None
+    model_buffer = np.empty((1, len(x)))    # reused across objective evaluations
 
     for step in range(max_steps):
         # Smooth residual to avoid fitting noise spikes
@@ -206,7 +207,7 @@ def egh_peel(x, y, num_components=None, min_area_frac=DEFAULT_MIN_AREA_FRAC,
 
         def objective(p):
             H, mu, sigma, tau = p
-            model_y = egh(x, H, mu, sigma, tau)
+            model_y = egh_multi(x, p, out=model_buffer)[0]
             data_fit = np.sum((model_y - y_for_fit) ** 2)
             penalty = 1e3 * max(0, tau - sigma * TAU_BOUND_RATIO) ** 2
             return data_fit + penalty
@@ -279,7 +279,9 @@ def list_rigorous_jobs(analysis_folder):
     """List completed rigorous optimization jobs on disk.
 
     Scans the ``analysis_folder/optimized/jobs/`` directory and returns
-    metadata for each job that has a ``callback.txt`` file.
+    metadata for each job that has a ``callback.txt`` file.  The files are
+    read incrementally through :mod:`molass.Rigorous.ProgressLog`, so that
+    polling a running optimization only reads the new records.
 
     Parameters
     ----------
@@ -300,28 +302,10 @@ def list_rigorous_jobs(analysis_folder):
         for job in jobs:
             print(f"Job {job.id}: {job.iterations} iters, best fv={job.best_fv:.4f}")
     """
-    import numpy as np
-    from molass_legacy.Optimizer.StateSequence import read_callback_txt_impl
-
-    analysis_folder = os.path.abspath(analysis_folder)
-    jobs_folder = os.path.join(analysis_folder, "optimized", "jobs")
-
-    if not os.path.exists(jobs_folder):
-        return []
+    from molass.Rigorous.ProgressLog import read_job_logs, record_time
 
     result = []
-    for d in sorted(os.listdir(jobs_folder)):
-        job_dir = os.path.join(jobs_folder, d)
-        if not os.path.isdir(job_dir):
-            continue
-        cb_file = os.path.join(job_dir, "callback.txt")
-        if not os.path.exists(cb_file):
-            continue
-
-        fv_list, _ = read_callback_txt_impl(cb_file)
-        if not fv_list:
-            continue
-
+    for d, records in read_job_logs(analysis_folder):
         # Guard against premature reads.  The very first callback.txt entry is
         # always the init-params evaluation written before any search begins:
         #   BH:  c=0, a=False  (init); subsequent entries have a=True when BH
@@ -330,8 +314,8 @@ def list_rigorous_jobs(analysis_folder):
         #        the counter rises with each NS iteration callback.
         # Skip the job if only the single init entry exists (i.e. the search
         # has not yet made its first move in either method). (issue #188)
-        if len(fv_list) <= 1:
-            continue  # only init entry — BH/NS has not started yet
+        if len(records) <= 1:
+            continue  # no entry, or only init entry — BH/NS has not started yet
 
         # Use all entries for best_fv regardless of a=True/False.
         # For BH: the true best may be in a rejected basin (a=False).
@@ -339,11 +323,10 @@ def list_rigorous_jobs(analysis_folder):
         #   beats the init params — init gets a=False and is often the best.
         # For NS: all entries are a=False by design.
         # get_params() (Scripting.py) also uses argmin over all entries.
-        fv_arr = np.array(fv_list, dtype=object)
-        iterations = len(fv_arr)
-        best_fv = float(min(row[1] for row in fv_list))
-        # Last iteration's timestamp (column 3)
-        timestamp = fv_list[-1][3]
+        iterations = len(records)
+        best_fv = float(np.nanmin(records["fv"]))
+        # Last iteration's timestamp
+        timestamp = record_time(records["time"][-1])
 
         result.append(JobInfo(id=d, iterations=iterations,
                               best_fv=best_fv, timestamp=timestamp))
@@ -438,7 +421,9 @@ def parse_sv_history(analysis_folder):
     """Parse all ``callback.txt`` files and return the SV best-so-far trajectory.
 
     This is the pure data-extraction layer shared by :func:`check_progress`
-    and :attr:`RunInfo.sv_history`.  No printing, no file writes.
+    and :attr:`RunInfo.sv_history`.  No printing.  The files are read
+    incrementally through :mod:`molass.Rigorous.ProgressLog`, whose sidecar
+    files in the job folders are the only writes.
 
     Parameters
     ----------
@@ -451,23 +436,12 @@ def parse_sv_history(analysis_folder):
         ``sv_best_so_far``: one SV value per accepted evaluation, accumulated
         as the running minimum.  Empty list if no evaluations are recorded yet.
     """
-    import os, re
-    import numpy as np
-
-    jobs_folder = os.path.join(os.path.abspath(analysis_folder), "optimized", "jobs")
-    if not os.path.isdir(jobs_folder):
-        return []
-
-    all_fvals = []
-    for jobid in sorted(os.listdir(jobs_folder)):
-        cb = os.path.join(jobs_folder, jobid, "callback.txt")
-        if not os.path.exists(cb):
-            continue
-        content = open(cb, encoding="utf-8", errors="replace").read()
-        fvals = [float(m) for m in re.findall(r"^f=([\-\d.eE+]+)", content, re.MULTILINE)]
-        all_fvals.extend(fvals)
+    from molass.Rigorous.ProgressLog import read_job_logs
 
-    if not all_fvals:
+    fvals = [records["fv"] for _, records in read_job_logs(analysis_folder)]
+    all_fvals = np.concatenate(fvals) if fvals else np.zeros(0)
+    all_fvals = all_fvals[~np.isnan(all_fvals)]
+    if len(all_fvals) == 0:
         return []
 
     best_so_far = np.minimum.accumulate(all_fvals)
@@ -503,32 +477,20 @@ def parse_sv_history_per_job(analysis_folder):
         for job_id, svs in per_job.items():
             print(f"job {job_id}: {len(svs)} evals, best SV = {svs[-1]:.1f}")
     """
-    import os, re
-    import numpy as np
-
-    jobs_folder = os.path.join(os.path.abspath(analysis_folder), "optimized", "jobs")
-    if not os.path.isdir(jobs_folder):
-        return {}
+    from molass.Rigorous.ProgressLog import read_job_logs
 
     result = {}
-    global_best_fv = None
+    global_best_fv = np.inf
 
-    for jobid in sorted(os.listdir(jobs_folder)):
-        cb = os.path.join(jobs_folder, jobid, "callback.txt")
-        if not os.path.exists(cb):
-            continue
-        content = open(cb, encoding="utf-8", errors="replace").read()
-        fvals = [float(m) for m in re.findall(r"^f=([\-\d.eE+]+)", content, re.MULTILINE)]
-        if not fvals:
+    for jobid, records in read_job_logs(analysis_folder):
+        fvals = records["fv"][~np.isnan(records["fv"])]
+        if len(fvals) == 0:
             continue
 
-        job_svs = []
-        for fv in fvals:
-            if global_best_fv is None or fv < global_best_fv:
-                global_best_fv = fv
-            sv = -200 / (1 + np.exp(-1.5 * global_best_fv)) + 100
-            job_svs.append(float(sv))
-        result[jobid] = job_svs
+        best_so_far = np.minimum.accumulate(np.concatenate([[global_best_fv], fvals]))[1:]
+        global_best_fv = best_so_far[-1]
+        sv_so_far = -200 / (1 + np.exp(-1.5 * best_so_far)) + 100
+        result[jobid] = [float(v) for v in sv_so_far]
 
     return result
 
@@ -663,8 +625,7 @@ def read_convergence_data(analysis_folder):
         print(f"Best fv: {info.best_fv:.4f}, spread: {info.spread:.6f}")
         print(f"Trend: {info.trend}")
     """
-    import numpy as np
-    from molass_legacy.Optimizer.StateSequence import read_callback_txt_impl
+    from molass.Rigorous.ProgressLog import read_job_logs, record_time
 
     analysis_folder = os.path.abspath(analysis_folder)
     jobs_folder = os.path.join(analysis_folder, "optimized", "jobs")
@@ -673,22 +634,14 @@ def read_convergence_data(analysis_folder):
         raise FileNotFoundError(f"No jobs folder found at {jobs_folder}")
 
     job_convergences = []
-    for d in sorted(os.listdir(jobs_folder)):
-        job_dir = os.path.join(jobs_folder, d)
-        if not os.path.isdir(job_dir):
-            continue
-        cb_file = os.path.join(job_dir, "callback.txt")
-        if not os.path.exists(cb_file):
-            continue
-
-        fv_list, _ = read_callback_txt_impl(cb_file)
-        if not fv_list:
+    for d, records in read_job_logs(analysis_folder):
+        if len(records) == 0:
             continue
 
-        evals = [row[0] for row in fv_list]
-        fvs = [row[1] for row in fv_list]
-        timestamps = [row[3] for row in fv_list]
-        best_fv = min(fvs)
+        evals = [int(c) for c in records["counter"]]
+        fvs = [float(f) for f in records["fv"]]
+        timestamps = [record_time(t) for t in records["time"]]
+        best_fv = float(np.nanmin(records["fv"]))
 
         job_convergences.append(JobConvergence(
             id=d, evals=evals, fvs=fvs, best_fv=best_fv,
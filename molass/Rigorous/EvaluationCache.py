@@ -0,0 +1,414 @@
+"""
+Rigorous.EvaluationCache.py
+
+Memoization of the rigorous objective function.
+
+Basin-Hopping and CMA-ES often evaluate the objective at parameter vectors
+which have been evaluated before, e.g., the init params of a resumed job
+(the best params of the previous one, see ``_load_best_init_params``) or
+the minima replayed on accept/reject, and parameters of frozen components
+never change at all.  The cache maps a hash of the quantized parameter
+vector to the objective value and, when known, the score breakdown, in LRU
+order, and can be saved to and loaded from ``eval_cache.npz`` in a job
+folder.  The saved entries are tagged with a fingerprint of the objective,
+see :func:`make_objective_fingerprint`, so that those of a job run with
+another model, data or set of free parameters are not loaded.
+
+Copyright (c) 2026, SAXS Team, KEK-PF
+"""
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+import numpy as np
+
+DEFAULT_MAXSIZE = 10000
+QUANTIZE_BITS = 40          # mantissa bits kept, i.e., relative resolution ~1e-12
+CACHE_FILE = "eval_cache.npz"
+DATA_ATTRS = ("xrD", "xrE", "uvD")
+
+
+def quantize(params, bits=QUANTIZE_BITS):
+    """Quantize a parameter vector to ``bits`` mantissa bits.
+
+    Parameters
+    ----------
+    params : array-like
+        The parameter vector.
+    bits : int, optional
+        The number of mantissa bits kept.
+
+    Returns
+    -------
+    mantissas : ndarray of int64
+    exponents : ndarray of int32
+    """
+    m, e = np.frexp(np.asarray(params, dtype=float))
+    return np.round(np.ldexp(m, bits)).astype(np.int64), e.astype(np.int32)
+
+
+def make_objective_fingerprint(optimizer):
+    """Return a fingerprint of what the objective values of an optimizer depend on.
+
+    The quantized parameters identify an evaluation only for the same
+    objective, which is determined by the optimizer class and function code,
+    the data matrices (e.g., trimmed differently in another session), the
+    number of parameters and which of them are free (frozen components or
+    parameter groups).  The values of the frozen parameters are part of
+    the parameter vector itself.
+
+    Parameters
+    ----------
+    optimizer : BasicOptimizer
+        The legacy optimizer.
+
+    Returns
+    -------
+    str
+        A hex digest.
+
+    Notes
+    -----
+    The hash of the data matrices is kept on the optimizer and recomputed
+    only when one of them is replaced by another array or reshaped, so that
+    a repeated call costs little.  Modifying them in place is not detected.
+    """
+    h = hashlib.blake2b(digest_size=16)
+
+    def update(*items):
+        h.update(repr(items).encode())
+
+    cls = type(optimizer)
+    get_function_code = getattr(optimizer, "get_function_code", None)
+    update(cls.__module__, cls.__qualname__, get_function_code() if get_function_code else None)
+    h.update(_get_data_digest(optimizer))
+    init_params = getattr(optimizer, "init_params", None)
+    free_indices = getattr(optimizer, "xr_params_indeces", None)
+    update(None if init_params is None else len(init_params),
+           None if free_indices is None else np.asarray(free_indices).tolist())
+    return h.hexdigest()
+
+
+def _hash_data(arrays):
+    h = hashlib.blake2b(digest_size=16)
+    for name, array in zip(DATA_ATTRS, arrays):
+        if array is None:
+            h.update(repr((name, None)).encode())
+        else:
+            array = np.ascontiguousarray(array)
+            h.update(repr((name, array.shape, array.dtype.str)).encode())
+            h.update(array)
+    return h.digest()
+
+
+def _get_data_digest(optimizer):
+    arrays = tuple(getattr(optimizer, name, None) for name in DATA_ATTRS)
+    shapes = tuple(np.shape(a) for a in arrays)
+    memo = getattr(optimizer, "_data_digest", None)
+    # compared by identity, whose objects the memo keeps alive so that the ids are not reused
+    if memo is not None and all(a is b for a, b in zip(memo[0], arrays)) and memo[1] == shapes:
+        return memo[2]
+    digest = _hash_data(arrays)
+    optimizer._data_digest = (arrays, shapes, digest)
+    return digest
+
+
+class EvaluationCache:
+    """LRU cache of objective values and score breakdowns.
+
+    Thread-safe, since the objective is also evaluated by the monitor while
+    the solver runs.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        The maximum number of entries.
+    bits : int, optional
+        The mantissa bits of the parameter quantization, see :func:`quantize`.
+    fingerprint : str, optional
+        The fingerprint of the objective, see :func:`make_objective_fingerprint`.
+        Only saved entries of the same fingerprint are loaded.
+
+    Examples
+    --------
+    >>> cache = EvaluationCache()
+    >>> cache.put(params, fv, scores)
+    >>> fv, scores = cache.get(params, need_scores=True)
+    >>> cache.stats()
+    """
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE, bits=QUANTIZE_BITS, fingerprint=None):
+        self.maxsize = maxsize
+        self.bits = bits
+        self.fingerprint = fingerprint
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._loaded = set()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def key(self, params):
+        """Return the hash of the quantized ``params``."""
+        m, e = quantize(params, self.bits)
+        return hashlib.blake2b(m.tobytes() + e.tobytes(), digest_size=16).digest()
+
+    def get(self, params, need_scores=False):
+        """Look up ``params``.
+
+        Parameters
+        ----------
+        params : array-like
+            The (real) parameter vector.
+        need_scores : bool, optional
+            If True, an entry without the score breakdown counts as a miss.
+
+        Returns
+        -------
+        tuple or None
+            ``(fv, scores)``, where ``scores`` is an ndarray or None, or None
+            on a miss.
+        """
+        key = self.key(params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or (need_scores and entry[1] is None):
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, params, fv, scores=None):
+        """Store the value, and the score breakdown if given, at ``params``.
+
+        A breakdown already stored is kept when ``scores`` is None.
+        """
+        key = self.key(params)
+        if scores is not None:
+            scores = np.array(scores, dtype=float)
+        with self._lock:
+            old = self._entries.get(key)
+            if scores is None and old is not None:
+                scores = old[1]
+            self._entries[key] = (float(fv), scores)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self, fingerprint=None):
+        """Remove all entries and reset the statistics.
+
+        Parameters
+        ----------
+        fingerprint : str, optional
+            If given, the new fingerprint of the objective, whose saved
+            entries may then be loaded again.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            if fingerprint is not None:
+                self.fingerprint = fingerprint
+                self._loaded.clear()
+
+    def stats(self):
+        """Return the hit-rate statistics.
+
+        Returns
+        -------
+        dict
+            ``hits``, ``misses``, ``hit_rate`` (0 when nothing has been looked
+            up), ``size`` and ``maxsize``.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return dict(hits=self.hits, misses=self.misses,
+                        hit_rate=self.hits/lookups if lookups else 0.0,
+                        size=len(self._entries), maxsize=self.maxsize)
+
+    def save(self, folder):
+        """Save the entries to ``eval_cache.npz`` in ``folder``.
+
+        Returns
+        -------
+        str or None
+            The path of the file, or None if it could not be written.
+        """
+        with self._lock:
+            entries = list(self._entries.items())
+        width = max([len(s) for _, (_, s) in entries if s is not None], default=0)
+        scores = np.full((len(entries), width), np.nan)
+        lengths = np.full(len(entries), -1, dtype=np.int32)   # -1: no breakdown
+        for i, (_, (_, s)) in enumerate(entries):
+            if s is not None:
+                scores[i, :len(s)] = s
+                lengths[i] = len(s)
+        path = os.path.join(folder, CACHE_FILE)
+        try:
+            np.savez(path,
+                     keys=np.array([k for k, _ in entries], dtype="S16"),
+                     fvs=np.array([fv for _, (fv, _) in entries], dtype=float),
+                     scores=scores, lengths=lengths, bits=self.bits,
+                     fingerprint="" if self.fingerprint is None else self.fingerprint)
+        except OSError:
+            return None
+        return path
+
+    def load(self, folder):
+        """Merge the entries saved in ``folder``, once per folder.
+
+        Entries saved with a different quantization or for another objective,
+        i.e., with a different fingerprint, are ignored.
+
+        Returns
+        -------
+        int
+            The number of entries loaded.
+        """
+        path = os.path.abspath(os.path.join(folder, CACHE_FILE))
+        if path in self._loaded or not os.path.exists(path):
+            return 0
+        self._loaded.add(path)
+        try:
+            with np.load(path) as data:
+                fingerprint = str(data["fingerprint"]) if "fingerprint" in data.files else None
+                if int(data["bits"]) != self.bits or (fingerprint or None) != self.fingerprint:
+                    return 0
+                keys, fvs, scores, lengths = data["keys"], data["fvs"], data["scores"], data["lengths"]
+        except (OSError, ValueError, KeyError):
+            return 0
+        with self._lock:
+            for key, fv, s, n in zip(keys, fvs, scores, lengths):
+                key = bytes(key).ljust(16, b"\0")   # "S16" strips trailing zero bytes
+                if key not in self._entries:
+                    self._entries[key] = (float(fv), None if n < 0 else s[:n].copy())
+                    self._entries.move_to_end(key, last=False)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return len(keys)
+
+
+class CachedObjective:
+    """Memoizing replacement of an optimizer's ``objective_func``.
+
+    Calls returning only the value are answered from the cache.  Calls with
+    ``return_full=True`` are always evaluated, since they also return the
+    LRF matrices, and store the score breakdown.  Calls with other options,
+    e.g., ``plot=True``, bypass the cache.
+
+    The legacy objective functions count their calls in the optimizer's
+    ``eval_counter``, which is recorded as ``c=`` in callback.txt; a hit
+    advances it as the evaluation would have.
+
+    Parameters
+    ----------
+    func : callable
+        The original ``objective_func`` bound method.
+    cache : EvaluationCache
+        The cache.
+    """
+
+    def __init__(self, func, cache):
+        self.func = func
+        self.cache = cache
+        self.owner = getattr(func, "__self__", None)
+        self._counter_step = 0
+
+    def __call__(self, p, return_full=False, **kwargs):
+        if any(kwargs.values()):
+            return self.func(p, return_full=return_full, **kwargs)
+        if not return_full:
+            entry = self.cache.get(p)
+            if entry is not None:
+                if self._counter_step:
+                    self.owner.eval_counter += self._counter_step
+                return entry[0]
+        counter = getattr(self.owner, "eval_counter", None)
+        result = self.func(p, return_full=return_full)
+        if counter is not None:
+            self._counter_step = self.owner.eval_counter - counter
+        if isinstance(result, tuple):
+            self.cache.put(p, result[0], result[1] if len(result) > 1 else None)
+        else:
+            self.cache.put(p, result)
+        return result
+
+
+def get_evaluation_cache(optimizer):
+    """Return the :class:`EvaluationCache` of an optimizer, or None."""
+    return getattr(optimizer, "_evaluation_cache", None)
+
+
+def _get_current_cache(optimizer, maxsize=DEFAULT_MAXSIZE):
+    # the cache of the optimizer, created or cleared to match its current objective
+    fingerprint = make_objective_fingerprint(optimizer)
+    cache = get_evaluation_cache(optimizer)
+    if cache is None:
+        cache = optimizer._evaluation_cache = EvaluationCache(maxsize=maxsize, fingerprint=fingerprint)
+    elif cache.fingerprint != fingerprint:
+        cache.clear(fingerprint=fingerprint)
+    return cache
+
+
+def install_evaluation_cache(optimizer, maxsize=DEFAULT_MAXSIZE):
+    """Memoize the objective function of an optimizer.
+
+    Replaces ``optimizer.objective_func`` by a :class:`CachedObjective`, so
+    that the evaluations by the solvers through ``objective_func_wrapper``
+    go through the cache.  Does nothing more if already installed, except
+    that the entries are cleared if the objective has changed since, e.g.,
+    by freezing other parameters (see :func:`make_objective_fingerprint`).
+
+    Parameters
+    ----------
+    optimizer : BasicOptimizer
+        The legacy optimizer.
+    maxsize : int, optional
+        The maximum number of entries of a new cache.
+
+    Returns
+    -------
+    EvaluationCache
+    """
+    cache = _get_current_cache(optimizer, maxsize=maxsize)
+    if not isinstance(optimizer.objective_func, CachedObjective):
+        optimizer.objective_func = CachedObjective(optimizer.objective_func, cache)
+    return cache
+
+
+def evaluate_breakdown(optimizer, params, folder=None):
+    """Return the objective value and score breakdown at ``params``.
+
+    Looks them up in the cache of the optimizer first, which is created
+    without memoizing the objective if there is none yet, so that a repeated
+    request costs nothing.
+
+    Parameters
+    ----------
+    optimizer : BasicOptimizer
+        The legacy optimizer.
+    params : ndarray
+        The real parameter vector.
+    folder : str, optional
+        A job folder whose saved cache is to be merged first, if saved for
+        the same objective.
+
+    Returns
+    -------
+    fv : float
+    scores : ndarray
+        In the order of ``optimizer.get_score_names()``.
+    """
+    cache = _get_current_cache(optimizer)
+    if folder is not None:
+        cache.load(folder)
+    entry = cache.get(params, need_scores=True)
+    if entry is None:
+        result = optimizer.objective_func(params, return_full=True)
+        cache.put(params, result[0], result[1])
+        entry = cache.get(params, need_scores=True)
+    return entry
@@ -89,6 +89,9 @@ class GuiScenario:
     def get_score_breakdown(self, params=None):
         """Return score breakdown at init_params (or any given params).
 
+        Repeated requests are answered from the evaluation cache
+        (see :mod:`molass.Rigorous.EvaluationCache`).
+
         Returns
         -------
         dict  {'fv': float, 'scores': {name: value}}
@@ -96,9 +99,8 @@ class GuiScenario:
         """
         if params is None:
             params = self.init_params
-        result = self.optimizer.objective_func(params, return_full=True)
-        fv = float(result[0])
-        score_array = result[1]
+        from molass.Rigorous.EvaluationCache import evaluate_breakdown
+        fv, score_array = evaluate_breakdown(self.optimizer, params, folder=self.work_folder)
         names = self.optimizer.get_score_names()
         scores = {name: float(val) for name, val in zip(names, score_array)}
         return {'fv': fv, 'scores': scores}
@@ -0,0 +1,379 @@
+"""
+Rigorous.MultiChain.py
+
+Multi-chain rigorous optimization: N independent Basin-Hopping chains with
+different seeds, each in its own subprocess and job folder
+(``<analysis_folder>/optimized/jobs/NNN``) under the same analysis_folder.
+
+A single BH chain can get stuck in a poor basin; running a few differently
+seeded chains side by side and keeping the best is the cheapest remedy.
+Chains which stay clearly behind the best one can be terminated early so
+that the CPUs go to the promising ones.
+
+Copyright (c) 2026, SAXS Team, KEK-PF
+"""
+import os
+import time
+import threading
+from molass.Rigorous.RunInfo import RunInfo
+
+DEFAULT_SEED = 1234         # the default seed of BackRunner.run / run_optimizer_in_process
+DOMINANCE_MARGIN = 5.0      # SV points behind the best chain
+DOMINANCE_PATIENCE = 3      # consecutive checks before a dominated chain is killed
+WATCH_INTERVAL = 30         # seconds between dominance checks
+
+
+def launch_chains(decomposition, rgcurve, optimizer, dsets, init_params, x_shifts,
+                  analysis_folder, num_chains, seed=None, niter=20, method='BH',
+                  clear_jobs=True, kill_dominated=False, debug=False):
+    """Launch the chains as subprocesses and return a handle to them.
+
+    Chain ``k`` runs with seed ``seed + k`` in the next free job folder.
+
+    Parameters
+    ----------
+    decomposition : Decomposition
+        The initial decomposition.
+    rgcurve : RgComponentCurve
+        The Rg component curve.
+    optimizer : BasicOptimizer
+        The prepared legacy optimizer.
+    dsets, init_params, x_shifts
+        As prepared in :func:`~molass.Rigorous.RigorousImplement.make_rigorous_decomposition_impl`.
+    analysis_folder : str
+        The absolute analysis folder.
+    num_chains : int
+        The number of chains.
+    seed : int or None, optional
+        The seed of the first chain.  None → ``DEFAULT_SEED``.
+    niter : int, optional
+        Iteration budget of each chain.
+    method : str, optional
+        Optimization method of the chains.
+    clear_jobs : bool, optional
+        If True, remove the existing job folders first.
+    kill_dominated : bool, optional
+        If True, start :meth:`MultiChainRunInfo.watch` with the default
+        margin and patience.
+    debug : bool, optional
+        If True, enable debug output of the runners.
+
+    Returns
+    -------
+    MultiChainRunInfo
+    """
+    from molass_legacy.Optimizer.BackRunner import BackRunner
+    from molass.Rigorous.RunRegistry import write_run_manifest, update_run_manifest
+
+    if seed is None:
+        seed = DEFAULT_SEED
+
+    if clear_jobs:
+        import shutil
+        jobs_dir = os.path.join(analysis_folder, "optimized", "jobs")
+        if os.path.isdir(jobs_dir):
+            shutil.rmtree(jobs_dir)
+
+    chains = []
+    seeds = []
+    for k in range(num_chains):
+        chain_seed = seed + k
+        # runners are started one after another so that each picks its own
+        # empty job folder (BackRunner.get_work_folder)
+        runner = BackRunner(xr_only=optimizer.get_xr_only(), shared_memory=False)
+        runner.run(optimizer, init_params, niter=niter, seed=chain_seed, x_shifts=x_shifts,
+                   debug=debug)
+        sub_pid = getattr(runner.process, "pid", None)
+        write_run_manifest(
+            runner.working_folder,
+            role="work",
+            method=method, niter=niter,
+            in_process=False, monitor=False,
+            analysis_folder=analysis_folder,
+            subprocess_pid=sub_pid,
+            chain=k, seed=chain_seed,
+            status="running",
+        )
+        chain = RunInfo(
+            ssd=decomposition.ssd, optimizer=optimizer, dsets=dsets,
+            init_params=init_params, monitor=None,
+            analysis_folder=analysis_folder, decomposition=decomposition,
+            rgcurve=rgcurve,
+        )
+        chain.work_folder = runner.working_folder
+        chain._subprocess_process = runner.process
+        chains.append(chain)
+        seeds.append(chain_seed)
+
+    update_run_manifest(
+        analysis_folder,
+        work_folder=chains[0].work_folder,
+        subprocess_pid=getattr(chains[0]._subprocess_process, "pid", None),
+        num_chains=num_chains,
+        chains=[dict(chain=k, seed=s, work_folder=c.work_folder,
+                     subprocess_pid=getattr(c._subprocess_process, "pid", None))
+                for k, (c, s) in enumerate(zip(chains, seeds))],
+        status="running",
+    )
+
+    run_info = MultiChainRunInfo(
+        chains, seeds,
+        ssd=decomposition.ssd, optimizer=optimizer, dsets=dsets,
+        init_params=init_params, monitor=None,
+        analysis_folder=analysis_folder, decomposition=decomposition,
+        rgcurve=rgcurve,
+    )
+    if kill_dominated:
+        run_info.watch()
+    return run_info
+
+
+class MultiChainRunInfo(RunInfo):
+    """Handle of a multi-chain run returned by ``optimize_rigorously(num_chains=N)``.
+
+    Disk-based operations inherited from :class:`~molass.Rigorous.RunInfo.RunInfo`
+    (``sv_history``, ``live_status``, ...) cover all the chains, since they
+    share the analysis_folder.
+
+    Attributes
+    ----------
+    chains : list of RunInfo
+        One per chain, each tracking its own subprocess and ``work_folder``.
+    seeds : list of int
+        The seeds of the chains.
+    killed : set of int
+        The indices of the chains terminated as dominated.
+    """
+
+    def __init__(self, chains, seeds, **kwargs):
+        super().__init__(**kwargs)
+        self.chains = chains
+        self.seeds = seeds
+        self.killed = set()
+        self._dominated_counts = [0] * len(chains)
+        self._watch_thread = None
+        self._finished = False
+
+    @property
+    def is_alive(self):
+        """``True`` while any of the chains is still running."""
+        return any(chain.is_alive for chain in self.chains)
+
+    def request_stop(self):
+        """Terminate all the chains which are still running."""
+        self._stop_event.set()
+        for chain in self.chains:
+            if chain.is_alive:
+                chain._subprocess_process.terminate()
+
+    def __repr__(self):
+        n_alive = sum(chain.is_alive for chain in self.chains)
+        parts = [f"chains={len(self.chains)}", f"alive={n_alive}", f"killed={len(self.killed)}"]
+        try:
+            svs = [s["best_sv"] for s in self.chain_status() if s["best_sv"] is not None]
+            if svs:
+                parts.append(f"best_sv={max(svs):.1f}")
+        except Exception:
+            pass
+        return f"MultiChainRunInfo({', '.join(parts)})"
+
+    def chain_status(self):
+        """Return the progress of each chain read from its callback.txt.
+
+        Returns
+        -------
+        list of dict
+            One per chain with keys ``chain``, ``seed``, ``work_folder``,
+            ``alive``, ``killed``, ``iterations``, ``best_fv`` and ``best_sv``.
+            The scores are None until the chain has made its first move.
+        """
+        from molass.Rigorous.CurrentStateUtils import list_rigorous_jobs, fv_to_sv
+        jobs = {job.id: job for job in list_rigorous_jobs(self.analysis_folder)}
+        status = []
+        for k, (chain, seed) in enumerate(zip(self.chains, self.seeds)):
+            job = jobs.get(os.path.basename(chain.work_folder))
+            best_fv = None if job is None else job.best_fv
+            status.append(dict(
+                chain=k, seed=seed, work_folder=chain.work_folder,
+                alive=chain.is_alive, killed=k in self.killed,
+                iterations=0 if job is None else job.iterations,
+                best_fv=best_fv,
+                best_sv=None if best_fv is None else float(fv_to_sv(best_fv)),
+            ))
+        return status
+
+    def live_status(self):
+        """Same as :meth:`RunInfo.live_status` with ``chains`` from :meth:`chain_status`."""
+        status = super().live_status()
+        try:
+            status["chains"] = self.chain_status()
+        except Exception:
+            status["chains"] = None
+        return status
+
+    def kill_dominated(self, margin=DOMINANCE_MARGIN, patience=DOMINANCE_PATIENCE):
+        """Check the chains once and kill those which stay dominated.
+
+        A running chain is dominated when its best SV is more than ``margin``
+        below the best SV over all chains.  It is killed when it has been
+        dominated in ``patience`` consecutive checks.  The best chain is
+        never dominated, so at least one chain survives.
+
+        Parameters
+        ----------
+        margin : float, optional
+            Dominance margin in SV points.
+        patience : int, optional
+            The number of consecutive dominated checks before killing.
+
+        Returns
+        -------
+        list of int
+            The indices of the chains killed by this check.
+        """
+        status = self.chain_status()
+        svs = [s["best_sv"] for s in status if s["best_sv"] is not None]
+        if len(svs) < 2:
+            return []
+        top = max(svs)
+        killed = []
+        for s in status:
+            k = s["chain"]
+            if not s["alive"] or s["best_sv"] is None:
+                continue
+            if s["best_sv"] < top - margin:
+                self._dominated_counts[k] += 1
+            else:
+                self._dominated_counts[k] = 0
+            if self._dominated_counts[k] >= patience:
+                self._kill_chain(k, best_sv=s["best_sv"], top_sv=top)
+                killed.append(k)
+        return killed
+
+    def _kill_chain(self, k, best_sv=None, top_sv=None):
+        chain = self.chains[k]
+        chain._subprocess_process.terminate()
+        self.killed.add(k)
+        try:
+            from molass.Rigorous.RunRegistry import update_run_manifest
+            update_run_manifest(chain.work_folder, status="killed_dominated",
+                                best_sv=best_sv, top_sv=top_sv)
+        except Exception:
+            pass
+
+    def watch(self, margin=DOMINANCE_MARGIN, patience=DOMINANCE_PATIENCE, interval=WATCH_INTERVAL):
+        """Start a daemon thread which calls :meth:`kill_dominated` periodically.
+
+        The thread ends when all the chains have finished or
+        :meth:`request_stop` is called.
+
+        Parameters
+        ----------
+        margin, patience
+            See :meth:`kill_dominated`.
+        interval : float, optional
+            Seconds between checks.
+
+        Returns
+        -------
+        threading.Thread
+        """
+        def _watch():
+            while self.is_alive and not self._stop_event.wait(interval):
+                try:
+                    self.kill_dominated(margin=margin, patience=patience)
+                except Exception:
+                    pass
+
+        self._watch_thread = threading.Thread(target=_watch, daemon=True)
+        self._watch_thread.start()
+        return self._watch_thread
+
+    def wait(self, timeout=600, poll_interval=5):
+        """Wait for all the chains to finish.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum seconds to wait (default 600).  Use ``0`` for no limit.
+        poll_interval : float, optional
+            Seconds between checks (default 5).
+
+        Returns
+        -------
+        bool
+            ``True`` if all the chains have finished, ``False`` if timed out.
+        """
+        deadline = time.time() + timeout if timeout else None
+        while self.is_alive:
+            if deadline is not None:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return False
+                time.sleep(min(poll_interval, remaining))
+            else:
+                time.sleep(poll_interval)
+        self._record_completion()
+        return True
+
+    def _record_completion(self):
+        if self._finished:
+            return
+        self._finished = True
+        try:
+            from molass.Rigorous.RunRegistry import update_run_manifest
+            for k, chain in enumerate(self.chains):
+                if k in self.killed:
+                    continue
+                update_run_manifest(chain.work_folder, status="completed",
+                                    subprocess_returncode=chain._subprocess_process.returncode)
+            update_run_manifest(self.analysis_folder, status="completed",
+                                killed_chains=sorted(self.killed))
+        except Exception:
+            pass
+
+    def load_best(self, timeout=0, poll_interval=5, debug=False):
+        """Load the best result over all the chains, waiting until one is available.
+
+        Uses :meth:`Decomposition.load_best_rigorous_result`, which picks the
+        job folder, i.e., the chain, with the lowest objective function value.
+        Parameters and exceptions are as in :meth:`RunInfo.load_best`.
+
+        Returns
+        -------
+        Decomposition
+            With ``result.fv``, ``result.sv`` and ``result.chain`` (the
+            index of the chain it came from, None for a job of an earlier
+            run kept with ``clear_jobs=False``) attached.
+        """
+        if self.analysis_folder is None:
+            raise ValueError(
+                "No analysis_folder stored in this RunInfo. "
+                "Pass analysis_folder= to optimize_rigorously()."
+            )
+        if self.decomposition is None:
+            raise ValueError(
+                "No decomposition stored in this RunInfo. "
+                "Cannot reconstruct result without the initial decomposition."
+            )
+        from molass.Rigorous.CurrentStateUtils import (
+            wait_for_rigorous_results, list_rigorous_jobs, fv_to_sv,
+        )
+        ready = wait_for_rigorous_results(
+            self.analysis_folder,
+            timeout=timeout,
+            poll_interval=poll_interval,
+        )
+        if not ready:
+            raise TimeoutError(
+                f"No rigorous results appeared within {timeout}s "
+                f"in {self.analysis_folder}"
+            )
+        result = self.decomposition.load_best_rigorous_result(
+            self.analysis_folder, rgcurve=self.rgcurve, debug=debug)
+        best = min(list_rigorous_jobs(self.analysis_folder), key=lambda j: j.best_fv)
+        result.fv = best.best_fv
+        result.sv = float(fv_to_sv(best.best_fv))
+        job_ids = [os.path.basename(chain.work_folder) for chain in self.chains]
+        result.chain = job_ids.index(best.id) if best.id in job_ids else None
+        return result
@@ -0,0 +1,284 @@
+"""
+Rigorous.ProgressLog.py
+
+Indexed binary log of the evaluations recorded in the ``callback.txt`` of
+an optimizer job.
+
+``callback.txt`` is written by the legacy optimizer as multi-line text
+records (``t=``, ``x=``, ``[...]``, ``f=``, ``a=``, ``c=``).  Parsing the
+whole file on every progress query makes polling a long run cost more and
+more.  A :class:`ProgressLog` instead tails ``callback.txt`` from the byte
+offset it has consumed so far and appends the new records, as fixed-width
+binary rows of :data:`RECORD_DTYPE`, to two sidecar files in the job folder:
+
+    progress.bin    append-only records, ``RECORD_DTYPE.itemsize`` bytes each
+    progress.idx    JSON index: consumed offset in callback.txt, number of
+                    records, and the head of callback.txt to detect a rewrite
+
+so that each query costs O(new records), also across processes and
+sessions.  The sidecar files are best-effort: when the job folder is not
+writable the log is kept in memory only.
+
+Copyright (c) 2026, SAXS Team, KEK-PF
+"""
+import os
+import re
+import json
+import threading
+from datetime import datetime
+import numpy as np
+
+CALLBACK_TXT = "callback.txt"
+LOG_BIN = "progress.bin"
+LOG_IDX = "progress.idx"
+SCHEMA = "molass.progress_log/v1"
+
+RECORD_DTYPE = np.dtype([
+    ("counter", "<i8"),     # c= : number of evaluations when recorded
+    ("fv", "<f8"),          # f= : objective function value
+    ("accept", "?"),        # a= : accepted by the solver
+    ("time", "<f8"),        # t= : POSIX timestamp, NaN when not recorded
+])
+
+HEAD_SIZE = 64              # bytes of callback.txt kept to detect a rewrite
+
+_time_re = re.compile(rb't=(\d{4})-(\d{2})-(\d{2}) (\d{2}):(\d{2}):(\d{2})')
+
+_logs = {}                  # ProgressLog cache by job folder, see get_progress_log
+_logs_lock = threading.Lock()
+
+
+def _parse_records(data):
+    """Parse the complete records in ``data`` (bytes of callback.txt).
+
+    Returns the records and the number of bytes consumed, i.e., up to the end
+    of the last ``c=`` line; an incomplete trailing record is left for later.
+    """
+    records = []
+    consumed = 0
+    pos = 0
+    time = np.nan
+    fv = np.nan
+    accept = False
+    for line in data.splitlines(keepends=True):
+        pos += len(line)
+        if not line.endswith(b"\n"):
+            break
+        head = line[0:2]
+        if head == b"t=":
+            m = _time_re.match(line)
+            time = datetime(*map(int, m.groups())).timestamp() if m else np.nan
+        elif head == b"f=":
+            try:
+                fv = float(line[2:])
+            except ValueError:
+                fv = np.nan
+        elif head == b"a=":
+            accept = line[2:].strip() == b"True"
+        elif head == b"c=":
+            try:
+                counter = int(line[2:])
+            except ValueError:
+                counter = -1
+            records.append((counter, fv, accept, time))
+            consumed = pos
+            time = np.nan
+            fv = np.nan
+            accept = False
+    return np.array(records, dtype=RECORD_DTYPE), consumed
+
+
+class ProgressLog:
+    """Evaluations of one job, read incrementally from its ``callback.txt``.
+
+    Thread-safe, since a log from :func:`get_progress_log` is shared, e.g.,
+    by the watch thread of a multi-chain run and the main thread polling it.
+
+    Parameters
+    ----------
+    job_folder : str
+        The job folder, e.g., ``<analysis_folder>/optimized/jobs/000``.
+    persist : bool, optional
+        If True (default), load and save the sidecar files in the job folder.
+
+    Examples
+    --------
+    ::
+
+        log = ProgressLog(work_folder)
+        n = 0
+        while run_info.is_alive:
+            log.update()
+            new = log.read(n)       # only the records since the last poll
+            n += len(new)
+    """
+
+    def __init__(self, job_folder, persist=True):
+        self.job_folder = os.path.abspath(job_folder)
+        self.persist = persist
+        self._lock = threading.Lock()
+        self._reset()
+        if persist:
+            self._load()
+
+    def _reset(self):
+        self.offset = 0
+        self.head = b""
+        self._buffer = np.zeros(0, dtype=RECORD_DTYPE)
+        self._size = 0
+
+    @property
+    def callback_txt(self):
+        return os.path.join(self.job_folder, CALLBACK_TXT)
+
+    @property
+    def records(self):
+        """Structured array of :data:`RECORD_DTYPE`, one row per record so far."""
+        return self.read()
+
+    def __len__(self):
+        return self._size
+
+    def read(self, start=0):
+        """Return the records from index ``start`` on, without updating."""
+        with self._lock:
+            return self._buffer[start:self._size]
+
+    def update(self):
+        """Read the records appended to ``callback.txt`` since the last update.
+
+        Returns
+        -------
+        int
+            The number of new records.  If ``callback.txt`` has been rewritten
+            (a job folder reused after its jobs were cleared), the log is
+            rebuilt and this is the number of all its records.
+        """
+        with self._lock:
+            return self._update()
+
+    def _update(self):
+        try:
+            fh = open(self.callback_txt, "rb")
+        except OSError:
+            if self.offset > 0:
+                self._reset()
+                self._save(0)
+            return 0
+        with fh:
+            head = fh.read(HEAD_SIZE)
+            size = os.fstat(fh.fileno()).st_size
+            rebuilt = size < self.offset or head[:len(self.head)] != self.head
+            if rebuilt:
+                self._reset()
+            self.head = head
+            start = self._size
+            fh.seek(self.offset)
+            data = fh.read(size - self.offset)
+        new, consumed = _parse_records(data)
+        if consumed > 0:
+            self._append(new)
+            self.offset += consumed
+        if consumed > 0 or rebuilt:
+            self._save(start)
+        return len(new)
+
+    def _append(self, new):
+        need = self._size + len(new)
+        if need > len(self._buffer):
+            buffer = np.zeros(max(need, 2 * len(self._buffer), 64), dtype=RECORD_DTYPE)
+            buffer[:self._size] = self._buffer[:self._size]
+            self._buffer = buffer
+        self._buffer[self._size:need] = new
+        self._size = need
+
+    def _load(self):
+        try:
+            with open(os.path.join(self.job_folder, LOG_IDX), encoding="utf-8") as fh:
+                index = json.load(fh)
+            if index.get("schema") != SCHEMA:
+                return
+            count = int(index["count"])
+            records = np.fromfile(os.path.join(self.job_folder, LOG_BIN), dtype=RECORD_DTYPE, count=count)
+        except (OSError, ValueError, KeyError):
+            return
+        if len(records) < count:
+            return
+        self._append(records)
+        self.offset = int(index["offset"])
+        self.head = bytes.fromhex(index["head"])
+
+    def _save(self, start):
+        """Write the records from ``start`` on, then the index."""
+        if not self.persist:
+            return
+        try:
+            bin_path = os.path.join(self.job_folder, LOG_BIN)
+            # seek-and-write rather than append, so that concurrent updaters
+            # write the same bytes at the same place
+            with open(bin_path, "r+b" if os.path.exists(bin_path) else "wb") as fh:
+                fh.seek(start * RECORD_DTYPE.itemsize)
+                fh.write(self._buffer[start:self._size].tobytes())
+                fh.truncate()
+            idx_path = os.path.join(self.job_folder, LOG_IDX)
+            tmp_path = "%s.%d.tmp" % (idx_path, os.getpid())
+            with open(tmp_path, "w", encoding="utf-8") as fh:
+                json.dump(dict(schema=SCHEMA, offset=self.offset, count=self._size,
+                               head=self.head.hex()), fh)
+            os.replace(tmp_path, idx_path)
+        except OSError:
+            pass
+
+
+def get_progress_log(job_folder):
+    """Return the updated :class:`ProgressLog` of a job folder.
+
+    The logs are cached in this process, so that repeated queries only read
+    what has been appended since the previous one.
+
+    Parameters
+    ----------
+    job_folder : str
+        The job folder.
+
+    Returns
+    -------
+    ProgressLog
+    """
+    key = os.path.abspath(job_folder)
+    with _logs_lock:
+        log = _logs.get(key)
+        if log is None:
+            log = _logs[key] = ProgressLog(key)
+    log.update()
+    return log
+
+
+def read_job_logs(analysis_folder):
+    """Return the records of all jobs with a ``callback.txt``, updated.
+
+    Parameters
+    ----------
+    analysis_folder : str
+        Root folder for optimizer output (contains ``optimized/jobs/``).
+
+    Returns
+    -------
+    list of (str, ndarray)
+        ``(job id, records)`` sorted by job id.
+    """
+    jobs_folder = os.path.join(os.path.abspath(analysis_folder), "optimized", "jobs")
+    if not os.path.isdir(jobs_folder):
+        return []
+    result = []
+    for jobid in sorted(os.listdir(jobs_folder)):
+        job_dir = os.path.join(jobs_folder, jobid)
+        if not os.path.exists(os.path.join(job_dir, CALLBACK_TXT)):
+            continue
+        result.append((jobid, get_progress_log(job_dir).records))
+    return result
+
+
+def record_time(value):
+    """Convert a ``time`` field to a naive ``datetime`` as in ``read_callback_txt_impl``, or None."""
+    return None if np.isnan(value) else datetime.fromtimestamp(float(value))
@@ -162,7 +162,7 @@ def _load_best_init_params(analysis_folder, init_params):
     return None
 
 
-def make_rigorous_decomposition_impl(decomposition, rgcurve, analysis_folder=None, niter=20, method="BH", frozen_components=None, frozen_param_groups=None, trimmed_ssd=None, clear_jobs=True, function_code=None, in_process=True, monitor=True, async_=True, progress='dashboard', max_trials=0, debug=False, _dry_run=False, ns_narrow_bounds=True, ns_adaptive_nsteps=False, ns_nsteps=None, solver_kwargs=None):
+def make_rigorous_decomposition_impl(decomposition, rgcurve, analysis_folder=None, niter=20, method="BH", frozen_components=None, frozen_param_groups=None, trimmed_ssd=None, clear_jobs=True, function_code=None, in_process=True, monitor=True, async_=True, progress='dashboard', max_trials=0, debug=False, _dry_run=False, ns_narrow_bounds=True, ns_adaptive_nsteps=False, ns_nsteps=None, solver_kwargs=None, seed=None, num_chains=1, kill_dominated=False):
     """
     Make a rigorous decomposition using a given RG curve.
 
@@ -216,12 +216,31 @@ def make_rigorous_decomposition_impl(decomposition, rgcurve, analysis_folder=Non
         Kept in the signature only for backward compatibility.
     debug : bool, optional
         If True, enable debug mode with additional output.
+    seed : int or None, optional
+        Random seed of the optimizer.  None → 1234, the legacy default.
+    num_chains : int, optional
+        If greater than 1, run that many independent chains with seeds
+        ``seed + k``, each in its own subprocess and job folder, and return
+        a :class:`~molass.Rigorous.MultiChain.MultiChainRunInfo`.
+        ``in_process``, ``async_`` and ``monitor`` are then ignored.
+        Default 1.
+    kill_dominated : bool, optional
+        Only with ``num_chains > 1``.  If True, terminate the chains whose
+        best SV stays well below that of the best chain.
+        See :meth:`~molass.Rigorous.MultiChain.MultiChainRunInfo.kill_dominated`.
 
     Returns
     -------
     Decomposition
         The refined decomposition object.
     """
+    if num_chains < 1:
+        raise ValueError(f"num_chains must be >= 1, got {num_chains!r}")
+    if num_chains > 1:
+        # chains are separate processes, see molass.Rigorous.MultiChain
+        in_process = False
+        monitor = False
+
     # NS (UltraNest) segfaults in-process (molass-library#138).
     # Auto-route to the subprocess path which has a working MplMonitor dashboard.
     _NS_METHODS = {'NS'}
@@ -441,6 +460,18 @@ def make_rigorous_decomposition_impl(decomposition, rgcurve, analysis_folder=Non
     # run optimization (outside _quiet — subprocess launch message is useful)
     from molass_legacy.Optimizer.Scripting import run_optimizer
     x_shifts = dsets.get_x_shifts()
+    if seed is None:
+        from molass.Rigorous.MultiChain import DEFAULT_SEED
+        seed = DEFAULT_SEED
+
+    if num_chains > 1:
+        if debug:
+            import molass.Rigorous.MultiChain
+            reload(molass.Rigorous.MultiChain)
+        from molass.Rigorous.MultiChain import launch_chains
+        return launch_chains(decomposition, rgcurve, optimizer, dsets, init_params, x_shifts,
+                             analysis_folder, num_chains, seed=seed, niter=niter, method=method,
+                             clear_jobs=clear_jobs, kill_dominated=kill_dominated, debug=debug)
 
     if in_process:
         # In-process path: skip subprocess + MplMonitor entirely.  The
@@ -464,6 +495,21 @@ def make_rigorous_decomposition_impl(decomposition, rgcurve, analysis_folder=Non
             rgcurve=rgcurve,
         )
 
+        # Memoize the objective (see molass.Rigorous.EvaluationCache).  When
+        # resuming, the saved caches of the previous jobs already hold e.g.
+        # the evaluation at the new init_params, their best params.
+        from molass.Global.Options import get_molass_options
+        _eval_cache = get_molass_options('eval_cache')
+        _cache = None
+        if _eval_cache:
+            from molass.Rigorous.EvaluationCache import install_evaluation_cache, DEFAULT_MAXSIZE
+            _cache = install_evaluation_cache(
+                optimizer, maxsize=DEFAULT_MAXSIZE if _eval_cache is True else int(_eval_cache))
+            _jobs_dir = os.path.join(analysis_folder, "optimized", "jobs")
+            if not clear_jobs and os.path.isdir(_jobs_dir):
+                for _entry in sorted(os.listdir(_jobs_dir)):
+                    _cache.load(os.path.join(_jobs_dir, _entry))
+
         def _run_in_process():
             # Pass a callback so run_info.work_folder is set as soon as the
             # job folder is allocated — before solve() starts.  This lets the
@@ -473,7 +519,7 @@ def make_rigorous_decomposition_impl(decomposition, rgcurve, analysis_folder=Non
                 run_info.work_folder = wf
 
             _result, _work_folder = run_optimizer_in_process(
-                optimizer, init_params, niter=niter, method=method,
+                optimizer, init_params, niter=niter, method=method, seed=seed,
                 x_shifts=x_shifts, clear_jobs=clear_jobs, debug=debug,
                 work_folder_callback=_on_folder_ready,
                 stop_event=run_info._stop_event,
@@ -502,6 +548,9 @@ def make_rigorous_decomposition_impl(decomposition, rgcurve, analysis_folder=Non
             except Exception:
                 pass
 
+            if _cache is not None:
+                _cache.save(_work_folder)
+
             run_info.in_process_result = _result
             run_info.work_folder = _work_folder
             run_info._async_error = None
@@ -580,7 +629,7 @@ def make_rigorous_decomposition_impl(decomposition, rgcurve, analysis_folder=Non
         runner = BackRunner(xr_only=optimizer.get_xr_only(), shared_memory=False)
         # Mirror MplMonitor.run_impl: ensure optimizer is prepared before launch.
         # (already done above in `optimizer.prepare_for_optimization(init_params)`)
-        runner.run(optimizer, init_params, niter=niter, x_shifts=x_shifts,
+        runner.run(optimizer, init_params, niter=niter, seed=seed, x_shifts=x_shifts,
                    debug=debug)
         # Breadcrumb: now that the runner has a working_folder + subprocess
         # PID, expose them so external observers can find the live run.
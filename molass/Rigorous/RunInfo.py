@@ -421,7 +421,10 @@ class RunInfo:
 
         Loads the best (or specified) optimized parameters from disk, runs them
         through the optimizer's objective function, and returns a dict mapping
-        each score name to its value.
+        each score name to its value.  Parameters already evaluated with their
+        breakdown, in this session or in a job whose ``eval_cache.npz`` has
+        been saved, are answered from the evaluation cache without running
+        the objective function (see :meth:`evaluation_cache_stats`).
 
         Score architecture
         ------------------
@@ -500,9 +503,10 @@ class RunInfo:
         job_folder = os.path.join(jobs_folder, jobid)
         params = get_params(job_folder, debug=debug)
 
-        result = self.optimizer.objective_func(params, return_full=True)
-        fv = result[0]
-        score_array = result[1]
+        # from the evaluation cache when these params have been evaluated
+        # (see molass.Rigorous.EvaluationCache)
+        from molass.Rigorous.EvaluationCache import evaluate_breakdown
+        fv, score_array = evaluate_breakdown(self.optimizer, params, folder=job_folder)
         names = self.optimizer.get_score_names()
 
         scores = {}
@@ -511,6 +515,23 @@ class RunInfo:
 
         return {'fv': float(fv), 'scores': scores}
 
+    def evaluation_cache_stats(self):
+        """Return the hit-rate statistics of the optimizer's evaluation cache.
+
+        The cache memoizes the objective function during in-process runs
+        with the ``eval_cache`` global option, and the breakdowns returned by
+        :meth:`get_score_breakdown` in any case.
+
+        Returns
+        -------
+        dict or None
+            See :meth:`molass.Rigorous.EvaluationCache.EvaluationCache.stats`.
+            None if the optimizer has no cache.
+        """
+        from molass.Rigorous.EvaluationCache import get_evaluation_cache
+        cache = get_evaluation_cache(self.optimizer)
+        return None if cache is None else cache.stats()
+
     def get_current_curves(self):
         """Return the data and model curves currently shown on the monitor.
 
@@ -1430,7 +1451,6 @@ class RunInfo:
         Used by the idempotency guard.  Tries psutil first, falls back to
         os.kill(pid, 0) on POSIX.
         """
-        import os
         manifest = None
         if self.analysis_folder:
             from molass.Rigorous.RunRegistry import read_manifest
@@ -1444,14 +1464,21 @@ class RunInfo:
         # Fast path: manifest already records completion
         if status in ("completed", "failed"):
             return False
+        # Multi-chain runs record one subprocess per chain
+        pids = [sub_pid] + [c.get("subprocess_pid") for c in manifest.get("chains", [])]
+        return any(self._pid_exists(pid) for pid in pids if pid is not None)
+
+    @staticmethod
+    def _pid_exists(pid):
+        import os
         try:
             import psutil
-            return psutil.pid_exists(int(sub_pid))
+            return psutil.pid_exists(int(pid))
         except ImportError:
             pass
         # POSIX fallback
         try:
-            os.kill(int(sub_pid), 0)
+            os.kill(int(pid), 0)
             return True
         except (OSError, ProcessLookupError):
             return False
\ No newline at end of file
@@ -22,4 +22,7 @@ from .RunRegistry import (
     read_manifest,
     write_run_manifest,
     update_run_manifest,
-)
\ No newline at end of file
+)
+from .MultiChain import (
+    MultiChainRunInfo,
+)
@@ -0,0 +1,469 @@
+"""
+    SEC.ColumnEngine.py
+
+    Headless engine of the SEC column particle simulation.
+
+    This module implements the same physics as :func:`~molass.SEC.ColumnSimulation.get_animation`,
+    i.e., the moves by ``touchable_indeces`` and ``compute_next_positions`` with
+    ``Particle.enters_stationary`` and ``get_next_position_impl``, without matplotlib.
+    The particle state is kept in flat NumPy arrays and all particles are
+    advanced by one Numba-compiled kernel per frame, which makes it possible
+    to collect residence-time statistics of 10^5 particles.
+
+    Copyright (c) 2024-2025, Molass Community
+"""
+import numpy as np
+
+RS = 0.0381                         # grain radius, as in ColumnSimulation
+PSIZES = np.array([5, 2.5, 2])      # particle sizes of the species, as in ColumnSimulation
+PARTICLE_SCALE = 1/1000
+COLUMN_EXTENT = (0.35, 0.65, 0, 1)  # xmin, xmax, ymin, ymax
+TANGENT_TOL = 1e-9                  # as in circle_line_segment_intersection
+REFLECT_LIMIT_DIST = 1e-5           # as in StationaryMove
+REFLECT_NUM_TRIALS = 5              # as in StationaryMove
+
+_step_kernel = None
+
+def _get_step_kernel():
+    """Compile the kernel on the first call, which takes several seconds."""
+    global _step_kernel
+    if _step_kernel is not None:
+        return _step_kernel
+
+    from molass.PackageUtils.NumbaUtils import get_ready_for_numba
+    get_ready_for_numba()
+    from numba import njit
+
+    # error_model='numpy' lets degenerate divisions give inf or nan as in the python implementation
+    @njit(cache=False, error_model='numpy')
+    def circle_segment_intersections(cx, cy, R, p1x, p1y, p2x, p2y, out):
+        # circle_line_segment_intersection with full_line=False, returning the number of points
+        x1 = p1x - cx
+        y1 = p1y - cy
+        x2 = p2x - cx
+        y2 = p2y - cy
+        dx = x2 - x1
+        dy = y2 - y1
+        dr2 = dx**2 + dy**2
+        big_d = x1*y2 - x2*y1
+        discriminant = R**2*dr2 - big_d**2
+        if discriminant < 0:
+            return 0
+        sq = np.sqrt(discriminant)
+        sign_dy = -1.0 if dy < 0 else 1.0
+        first_sign = 1.0 if dy < 0 else -1.0
+        n = 0
+        for sign in (first_sign, -first_sign):
+            xi = cx + (big_d*dy + sign*sign_dy*dx*sq)/dr2
+            yi = cy + (-big_d*dx + sign*abs(dy)*sq)/dr2
+            if abs(dx) > abs(dy):
+                frac = (xi - p1x)/dx
+            else:
+                frac = (yi - p1y)/dy
+            if 0 <= frac <= 1:
+                out[n, 0] = xi
+                out[n, 1] = yi
+                n += 1
+        if n == 2 and abs(discriminant) <= TANGENT_TOL:
+            n = 1
+        return n
+
+    @njit(cache=False, error_model='numpy')
+    def includes_entry(x, y, r, cx, cy, R, entries):
+        # Particle.enters_stationary without the last position
+        d = np.sqrt((cx - x)**2 + (cy - y)**2)
+        if d > r + R or d < abs(r - R) or (d == 0 and r == R):
+            return False
+        a = (r**2 - R**2 + d**2)/(2*d)
+        h = np.sqrt(r**2 - a**2)
+        x2 = x + a*(cx - x)/d
+        y2 = y + a*(cy - y)/d
+        a0 = np.arctan2(y2 - h*(cx - x)/d - cy, x2 + h*(cy - y)/d - cx)
+        a1 = np.arctan2(y2 + h*(cx - x)/d - cy, x2 - h*(cy - y)/d - cx)
+        if a0 > a1:
+            a0, a1 = a1, a0
+        for i in range(entries.shape[0]):
+            if entries[i, 0] < a0 and a1 < entries[i, 1]:
+                return True
+        return False
+
+    @njit(cache=False, error_model='numpy')
+    def enters_stationary(x, y, r, lx, ly, cx, cy, R, poreradius, entries, work):
+        # Particle.enters_stationary with the last position
+        if r >= poreradius:
+            return False
+        d = np.sqrt((cx - x)**2 + (cy - y)**2)
+        if d > r + R or d < abs(r - R) or (d == 0 and r == R):
+            n = circle_segment_intersections(cx, cy, R, x, y, lx, ly, work)
+            for m in range(n):
+                if includes_entry(work[m, 0], work[m, 1], r, cx, cy, R, entries):
+                    return True
+            return False
+        return includes_entry(x, y, r, cx, cy, R, entries)
+
+    @njit(cache=False, error_model='numpy')
+    def mirror_image(a, b, c, x1, y1):
+        temp = -2 * (a * x1 + b * y1 + c) / (a * a + b * b)
+        return temp * a + x1, temp * b + y1
+
+    @njit(cache=False, error_model='numpy')
+    def reflected_point(walls, nb, wx, wy, nx, ny):
+        # compute_reflected_point, where walls[0] is the common vertex
+        c0x = walls[0, 0]
+        c0y = walls[0, 1]
+        found = False
+        mx = 0.0
+        my = 0.0
+        rx = nx - wx
+        ry = ny - wy
+        for m in range(1, nb):
+            sx = walls[m, 0] - c0x
+            sy = walls[m, 1] - c0y
+            denom = rx*sy - ry*sx
+            if denom == 0:
+                continue
+            qx = c0x - wx
+            qy = c0y - wy
+            t = (qx*sy - qy*sx)/denom
+            u = (qx*ry - qy*rx)/denom
+            if 0 <= t <= 1 and 0 <= u <= 1:
+                px = wx + t*rx
+                py = wy + t*ry
+                slope = (py - c0y)/(px - c0x)
+                x_, y_ = mirror_image(slope, -1.0, c0y - slope*c0x, nx, ny)
+                if np.sqrt((x_ - nx)**2 + (y_ - ny)**2) > REFLECT_LIMIT_DIST:
+                    found = True
+                    mx = x_
+                    my = y_
+        return found, mx, my
+
+    @njit(cache=False, error_model='numpy')
+    def triangle_contains(walls, x, y):
+        c1 = (walls[1, 0] - walls[0, 0])*(y - walls[0, 1]) - (walls[1, 1] - walls[0, 1])*(x - walls[0, 0])
+        c2 = (walls[2, 0] - walls[1, 0])*(y - walls[1, 1]) - (walls[2, 1] - walls[1, 1])*(x - walls[1, 0])
+        c3 = (walls[0, 0] - walls[2, 0])*(y - walls[2, 1]) - (walls[0, 1] - walls[2, 1])*(x - walls[2, 0])
+        return (c1 > 0 and c2 > 0 and c3 > 0) or (c1 < 0 and c2 < 0 and c3 < 0)
+
+    @njit(cache=False, error_model='numpy')
+    def next_position(walls_table, nwalls, entries_flat, r, cx, cy, R, lx, ly, px, py, work):
+        # get_next_position_impl, returning (nx, ny, mobile)
+        angle = np.arctan2(py - cy, px - cx)
+        k = np.argmin((entries_flat - angle)**2)
+        i = k // 2
+        walls = walls_table[i]
+        nb = nwalls[i]
+        wx, wy = lx, ly
+        nx, ny = px, py
+        reflected = False
+        for _ in range(REFLECT_NUM_TRIALS):
+            found, mx, my = reflected_point(walls, nb, wx, wy, nx, ny)
+            if not found:
+                break
+            wx, wy = nx, ny
+            nx, ny = mx, my
+            reflected = True
+
+        mobile = False
+        if not reflected and not triangle_contains(walls, nx, ny):
+            n = circle_segment_intersections(cx, cy, R, wx, wy, nx, ny, work)
+            if n == 0:
+                if np.sqrt((nx - cx)**2 + (ny - cy)**2) < R + r:
+                    mobile = True
+            else:
+                tx = work[0, 0]
+                ty = work[0, 1]
+                a = cx - tx
+                b = cy - ty
+                nx, ny = mirror_image(a, b, -a*tx - b*ty, nx, ny)
+                mobile = True
+        return nx, ny, mobile
+
+    @njit(cache=False, error_model='numpy')
+    def step_kernel(x, y, mobile, grain_ref, ptype, dxv, dyv, gx, gy, R, rvs, radii, poreradius,
+                    entries, entries_flat, walls, nwalls, xmin, xmax, du):
+        work = np.empty((2, 2))
+        for k in range(x.shape[0]):
+            t = ptype[k]
+            r = radii[t]
+            lx = x[k]
+            ly = y[k]
+            dx = dxv[k]
+            nx = lx + dx
+            if nx < xmin:
+                nx = 2*xmin - nx
+            elif nx > xmax:
+                nx = 2*xmax - nx
+            ny = ly + dyv[k]
+            if mobile[k]:
+                ny -= du
+
+            # touchable_indeces
+            j = -1
+            overlap = 0.0
+            for g in range(gx.shape[0]):
+                distv = rvs[t] - np.sqrt((gx[g] - nx)**2 + (gy[g] - ny)**2)
+                if distv > 0:
+                    j = g
+                    overlap = distv
+                    break
+            if j < 0:
+                mobile[k] = True
+                grain_ref[k] = -1
+            elif mobile[k]:
+                if enters_stationary(nx, ny, r, lx, ly, gx[j], gy[j], R, poreradius, entries, work):
+                    mobile[k] = False
+                    grain_ref[k] = j
+                else:
+                    bx = nx - gx[j]
+                    by = ny - gy[j]
+                    scale = overlap/np.sqrt(bx**2 + by**2)*2
+                    nx += bx*scale
+                    ny += by*scale
+                    grain_ref[k] = -1
+
+            # stationary move
+            if not mobile[k]:
+                g = grain_ref[k]
+                nx, ny, state = next_position(walls[g, t], nwalls[g, t], entries_flat, r,
+                                              gx[g], gy[g], R, lx, ly, nx, ny, work)
+                mobile[k] = state
+
+            if nx < xmin or nx > xmax:
+                nx += -2*dx
+            x[k] = nx
+            y[k] = ny
+
+    _step_kernel = step_kernel
+    return _step_kernel
+
+def compute_walls_table(grains, radii):
+    """
+    Compute the boundary walls of every pore sector for every particle size.
+
+    The walls depend only on the grain, the sector and the particle radius,
+    so they are computed once with
+    :func:`~molass.SEC.StationaryMove.compute_boundary_walls` instead of
+    in every move.
+
+    Parameters
+    ----------
+    grains : list of NewGrain
+        The grains of the column.
+    radii : array-like
+        The particle radii.
+
+    Returns
+    -------
+    walls : ndarray of shape (n_grains, n_radii, n_pores, 3, 2)
+        The boundary points, of which the first is the common vertex.
+    nwalls : ndarray of shape (n_grains, n_radii, n_pores)
+        The numbers of valid boundary points.
+    """
+    from molass.SEC.StationaryMove import compute_boundary_walls
+    num_pores = len(grains[0].entries)
+    walls = np.zeros((len(grains), len(radii), num_pores, 3, 2))
+    nwalls = np.zeros((len(grains), len(radii), num_pores), dtype=np.int64)
+    for g, grain in enumerate(grains):
+        cx, cy = grain.center
+        for t, r in enumerate(radii):
+            for i in range(num_pores):
+                entry_points = [grain.get_point_from_angle(angle) for angle in grain.entries[i,:]]
+                bpoints = compute_boundary_walls(cx, cy, grain.radius, r, entry_points)
+                nwalls[g, t, i] = len(bpoints)
+                walls[g, t, i, :len(bpoints)] = bpoints
+    return walls, nwalls
+
+class ColumnEngine:
+    """
+    A headless SEC column simulation of many particles.
+
+    Attributes
+    ----------
+    x, y : ndarray of shape (num_particles,)
+        The particle positions.
+    mobile : ndarray of bool
+        True for particles in the mobile phase, False for those in a pore,
+        which is ``inmobile_states`` of ``get_animation``.
+    grain_ref : ndarray of int
+        The grain index of the particles in a pore, -1 otherwise.
+    ptype : ndarray of int
+        The species index of the particles.
+    delta : float
+        The time (and standard deviation of the random moves) per frame.
+    """
+    def __init__(self, num_species_particles=500, psizes=PSIZES, num_pores=16, num_frames=400,
+                 rs=RS, extent=COLUMN_EXTENT, seed=None):
+        """
+        Parameters
+        ----------
+        num_species_particles : int, optional
+            The number of particles of each species.
+        psizes : array-like, optional
+            The particle sizes of the species, scaled by ``PARTICLE_SCALE`` into radii.
+        num_pores : int, optional
+            The number of pores per grain.
+        num_frames : int, optional
+            The number of frames for which the particles cross the column
+            length at the unit speed, which defines the time step.
+        rs : float, optional
+            The grain radius.
+        extent : tuple of float, optional
+            The ``(xmin, xmax, ymin, ymax)`` of the column.
+        seed : int or None, optional
+            The random seed.
+        """
+        from molass.SEC.ColumnElements import NewGrain
+        from molass.SEC.ColumnStructure import get_grain_positions
+        self.xmin, self.xmax, self.ymin, self.ymax = extent
+        self.num_pores = num_pores
+        self.num_frames = num_frames
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        self.delta = self.ymax/num_frames
+        self.du = self.delta*5
+
+        self.grains = [NewGrain(id_, center, rs, num_pores)
+                       for id_, center in get_grain_positions(self.xmin, self.xmax, self.ymin, self.ymax, rs)]
+        self.radii = np.asarray(psizes, dtype=float)*PARTICLE_SCALE
+        self.rvs = self.radii + rs
+        self.walls, self.nwalls = compute_walls_table(self.grains, self.radii)
+        grain = self.grains[0]
+        self.entries = np.ascontiguousarray(grain.entries, dtype=float)
+        self.entries_flat = self.entries.flatten()
+        self.poreradius = grain.poreradius
+        self.grain_radius = rs
+        self.gx = np.array([g.center[0] for g in self.grains])
+        self.gy = np.array([g.center[1] for g in self.grains])
+
+        ptype = np.array(list(np.arange(len(self.radii)))*num_species_particles)
+        self.rng.shuffle(ptype)
+        self.ptype = ptype
+        num_particles = len(ptype)
+        self.x = np.linspace(self.xmin+0.02, self.xmax-0.02, num_particles)
+        self.y = np.ones(num_particles)*self.ymax
+        self.mobile = np.ones(num_particles, dtype=bool)
+        self.grain_ref = -np.ones(num_particles, dtype=np.int64)
+
+    @property
+    def num_particles(self):
+        return len(self.ptype)
+
+    def step(self, dxv=None, dyv=None):
+        """
+        Advance all particles by one frame.
+
+        Parameters
+        ----------
+        dxv, dyv : ndarray or None, optional
+            The random moves of the particles. If None, they are drawn from
+            ``N(0, delta)``.
+        """
+        if dxv is None or dyv is None:
+            dxv, dyv = self.rng.normal(0, self.delta, (2, self.num_particles))
+        kernel = _get_step_kernel()
+        kernel(self.x, self.y, self.mobile, self.grain_ref, self.ptype,
+               np.ascontiguousarray(dxv, dtype=float), np.ascontiguousarray(dyv, dtype=float),
+               self.gx, self.gy, self.grain_radius, self.rvs, self.radii, self.poreradius,
+               self.entries, self.entries_flat, self.walls, self.nwalls,
+               self.xmin, self.xmax, self.du)
+
+    def run(self, num_frames=None, use_tqdm=False):
+        """
+        Run the simulation collecting the residence-time statistics.
+
+        Parameters
+        ----------
+        num_frames : int or None, optional
+            The number of frames to run. None means ``self.num_frames``.
+        use_tqdm : bool, optional
+            If True, show a progress bar.
+
+        Returns
+        -------
+        stats : dict
+            ``adsorption_durations`` and ``adsorption_particle_ids`` (flat
+            arrays of all pore residence times and the particles they belong
+            to), ``adsorption_counts``, ``total_adsorbed_time`` and
+            ``exit_frames`` (the first frame at which each particle reached
+            the column bottom, -1 if not yet) per particle, and the metadata
+            keys of the ``get_animation`` statistics.
+        """
+        if num_frames is None:
+            num_frames = self.num_frames
+        n = self.num_particles
+        start_frames = -np.ones(n, dtype=int)
+        adsorption_counts = np.zeros(n, dtype=int)
+        total_adsorbed_time = np.zeros(n)
+        exit_frames = -np.ones(n, dtype=int)
+        durations = []
+        particle_ids = []
+
+        frames = range(num_frames)
+        if use_tqdm:
+            from tqdm.auto import tqdm
+            frames = tqdm(frames)
+        for i in frames:
+            prev_mobile = self.mobile.copy()
+            self.step()
+            # the same events as counted by get_animation(track_statistics=True)
+            started = prev_mobile & ~self.mobile
+            start_frames[started] = i
+            adsorption_counts[started] += 1
+            ended = np.where(~prev_mobile & self.mobile & (start_frames >= 0))[0]
+            if len(ended) > 0:
+                duration = (i - start_frames[ended])*self.delta
+                durations.append(duration)
+                particle_ids.append(ended)
+                total_adsorbed_time[ended] += duration
+                start_frames[ended] = -1
+            exited = (exit_frames < 0) & (self.y <= self.ymin)
+            exit_frames[exited] = i
+
+        return dict(
+            adsorption_durations=np.concatenate(durations) if durations else np.zeros(0),
+            adsorption_particle_ids=np.concatenate(particle_ids) if particle_ids else np.zeros(0, dtype=int),
+            adsorption_counts=adsorption_counts,
+            total_adsorbed_time=total_adsorbed_time,
+            exit_frames=exit_frames,
+            ptype_indeces=self.ptype,
+            large_indeces=np.where(self.ptype == 0)[0],
+            middle_indeces=np.where(self.ptype == 1)[0],
+            small_indeces=np.where(self.ptype == 2)[0],
+            delta=self.delta,
+            num_frames=num_frames,
+            seed=self.seed,
+            num_pores=self.num_pores,
+            unit_angle_deg=360.0/self.num_pores,
+            pore_sector_angle_deg=180.0/self.num_pores,
+        )
+
+def simulate_column(num_species_particles=500, num_frames=400, num_pores=16, seed=None, **kwargs):
+    """
+    Run a headless column simulation and return its statistics.
+
+    Parameters
+    ----------
+    num_species_particles : int, optional
+        The number of particles of each species.
+    num_frames : int, optional
+        The number of frames.
+    num_pores : int, optional
+        The number of pores per grain.
+    seed : int or None, optional
+        The random seed.
+    kwargs : dict, optional
+        Other arguments of :class:`ColumnEngine`.
+
+    Returns
+    -------
+    stats : dict
+        The statistics as from :meth:`ColumnEngine.run`.
+
+    Examples
+    --------
+    >>> stats = simulate_column(num_species_particles=100_000//3, seed=0)
+    >>> durations = stats['adsorption_durations']
+    """
+    engine = ColumnEngine(num_species_particles=num_species_particles, num_frames=num_frames,
+                          num_pores=num_pores, seed=seed, **kwargs)
+    return engine.run()
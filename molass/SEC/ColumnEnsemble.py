@@ -0,0 +1,192 @@
+"""
+    SEC.ColumnEnsemble.py
+
+    Ensembles of independent column simulations run in a process pool,
+    aggregated into residence-time distributions to be compared with the SDM.
+    No matplotlib figure is created, so that it can be used on headless nodes.
+
+    Copyright (c) 2024-2025, Molass Community
+"""
+import numpy as np
+
+def _run_engine(config, seed):
+    from molass.SEC.ColumnEngine import ColumnEngine
+    engine = ColumnEngine(seed=seed, **config)
+    return engine.run()
+
+def run_column_ensemble(configs=None, num_runs=4, seed=0, n_jobs=None, callback_done=None):
+    """
+    Run independent seeded column simulations for each configuration.
+
+    Parameters
+    ----------
+    configs : list of dict or None, optional
+        The keyword arguments of :class:`~molass.SEC.ColumnEngine.ColumnEngine`
+        for each configuration, e.g., ``[dict(num_pores=8), dict(num_pores=16, psizes=[5, 3, 1])]``,
+        where ``rs`` and ``extent`` vary the grain geometry.
+        None means one configuration of the defaults.
+    num_runs : int, optional
+        The number of runs per configuration.
+    seed : int or None, optional
+        The seed from which the seeds of all the runs are derived, so that
+        the results do not depend on ``n_jobs``.
+    n_jobs : int or None, optional
+        The number of worker processes. None or 1 runs serially in this
+        process, -1 uses all CPUs.  Note that each worker compiles the
+        simulation kernel once, which takes several seconds.
+    callback_done : callable, optional
+        Called as ``callback_done(c, r, stats)`` when the r-th run of the
+        c-th configuration has finished.
+
+    Returns
+    -------
+    results : list of list of dict
+        ``results[c][r]`` is the statistics from
+        :meth:`~molass.SEC.ColumnEngine.ColumnEngine.run` of the r-th run of
+        the c-th configuration.  Pass ``results[c]`` to :func:`aggregate_column_stats`.
+    """
+    from molass.PackageUtils.ParallelUtils import get_num_workers
+    if configs is None:
+        configs = [{}]
+    tasks = [(c, r) for c in range(len(configs)) for r in range(num_runs)]
+    seeds = np.random.SeedSequence(seed).generate_state(len(tasks))
+    results = [[None]*num_runs for _ in configs]
+    num_workers = min(get_num_workers(n_jobs), max(1, len(tasks)))
+    if num_workers == 1:
+        for (c, r), task_seed in zip(tasks, seeds):
+            results[c][r] = _run_engine(configs[c], int(task_seed))
+            if callback_done is not None:
+                callback_done(c, r, results[c][r])
+    else:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            future_dict = {executor.submit(_run_engine, configs[c], int(task_seed)): (c, r)
+                           for (c, r), task_seed in zip(tasks, seeds)}
+            for future in as_completed(future_dict):
+                c, r = future_dict[future]
+                results[c][r] = future.result()
+                if callback_done is not None:
+                    callback_done(c, r, results[c][r])
+    return results
+
+def aggregate_column_stats(stats_list, num_bins=50):
+    """
+    Aggregate the statistics of runs of the same configuration per species.
+
+    Parameters
+    ----------
+    stats_list : list of dict
+        The statistics of the runs, e.g., ``results[c]`` from :func:`run_column_ensemble`.
+    num_bins : int, optional
+        The number of bins of the residence-time and exit-time histograms.
+
+    Returns
+    -------
+    species : list of dict
+        One dict per species with
+        ``residence_times`` (all completed pore visits), ``entry_counts``
+        (pore entries per particle) and ``exit_times`` (times at which the
+        particles reached the column bottom), their histograms
+        ``residence_hist``, ``entry_count_hist`` and ``exit_time_hist`` as
+        ``(values, bin_edges)`` with densities for the times and counts for
+        the entries, and the moment estimates ``npi``, ``k``, ``theta``,
+        ``t0`` and ``N0`` of the parameters of
+        :func:`~molass.SEC.Models.SdmMonoPore.sdm_monopore_gamma_pdf`.
+    """
+    num_species = int(max(np.max(stats['ptype_indeces']) for stats in stats_list)) + 1
+    species = []
+    for t in range(num_species):
+        residence_times = []
+        entry_counts = []
+        exit_times = []
+        mobile_times = []
+        for stats in stats_list:
+            ptype = stats['ptype_indeces']
+            delta = stats['delta']
+            residence_times.append(stats['adsorption_durations'][ptype[stats['adsorption_particle_ids']] == t])
+            entry_counts.append(stats['adsorption_counts'][ptype == t])
+            exited = (ptype == t) & (stats['exit_frames'] >= 0)
+            exit_time = stats['exit_frames'][exited]*delta
+            exit_times.append(exit_time)
+            mobile_times.append(exit_time - stats['total_adsorbed_time'][exited])
+        residence_times = np.concatenate(residence_times)
+        entry_counts = np.concatenate(entry_counts)
+        exit_times = np.concatenate(exit_times)
+        mobile_times = np.concatenate(mobile_times)
+        species.append(dict(
+            residence_times=residence_times,
+            entry_counts=entry_counts,
+            exit_times=exit_times,
+            residence_hist=_density_hist(residence_times, num_bins),
+            entry_count_hist=(np.bincount(entry_counts), np.arange(entry_counts.max() + 2) if len(entry_counts) > 0 else np.zeros(1)),
+            exit_time_hist=_density_hist(exit_times, num_bins),
+            **estimate_sdm_params(residence_times, entry_counts, mobile_times),
+        ))
+    return species
+
+def _density_hist(values, num_bins):
+    if len(values) == 0:
+        return np.zeros(num_bins), np.linspace(0, 1, num_bins + 1)
+    return np.histogram(values, bins=num_bins, density=True)
+
+def estimate_sdm_params(residence_times, entry_counts, mobile_times):
+    """
+    Estimate the SDM parameters from the simulated events by the method of moments.
+
+    Parameters
+    ----------
+    residence_times : ndarray
+        The durations of the pore visits.
+    entry_counts : ndarray
+        The numbers of pore entries per particle.
+    mobile_times : ndarray
+        The times spent in the mobile phase per particle.
+
+    Returns
+    -------
+    dict
+        ``npi`` (mean number of entries), ``k`` and ``theta`` (gamma shape and
+        scale of the residence times, NaN with fewer than two visits),
+        ``t0`` (mean mobile time) and ``N0`` (``(t0/σ0)²`` of the mobile times).
+    """
+    npi = np.mean(entry_counts) if len(entry_counts) > 0 else np.nan
+    if len(residence_times) > 1 and np.var(residence_times) > 0:
+        mean = np.mean(residence_times)
+        var = np.var(residence_times)
+        k = mean**2/var
+        theta = var/mean
+    else:
+        k = theta = np.nan
+    t0 = np.mean(mobile_times) if len(mobile_times) > 0 else np.nan
+    sigma0 = np.std(mobile_times) if len(mobile_times) > 1 else np.nan
+    N0 = (t0/sigma0)**2 if sigma0 > 0 else np.nan
+    return dict(npi=npi, k=k, theta=theta, t0=t0, N0=N0)
+
+def compute_sdm_exit_pdf(species_stats, x, timescale=None):
+    """
+    Evaluate the SDM elution PDF with the parameters estimated from a species.
+
+    Parameters
+    ----------
+    species_stats : dict
+        A species of :func:`aggregate_column_stats`.
+    x : array-like
+        The times at which to evaluate, e.g., the bin centers of ``exit_time_hist``.
+    timescale : float or None, optional
+        The timescale of :func:`~molass.SEC.Models.SdmMonoPore.sdm_monopore_gamma_pdf`.
+        None means ``80/t_R`` for the mean exit time ``t_R``, following its rule of thumb.
+
+    Returns
+    -------
+    ndarray
+        The PDF to be compared with the density of the simulated exit times.
+        Species which never enter the pores give the pure mobile-phase peak.
+    """
+    from molass.SEC.Models.SdmMonoPore import sdm_monopore_gamma_pdf
+    x = np.asarray(x, dtype=float)
+    if timescale is None:
+        timescale = 80/np.mean(species_stats['exit_times'])
+    npi, k, theta = species_stats['npi'], species_stats['k'], species_stats['theta']
+    if not npi > 0 or not np.isfinite(k):
+        npi, k, theta = 0.0, 1.0, 0.0
+    return sdm_monopore_gamma_pdf(x, npi, k, theta, species_stats['N0'], species_stats['t0'], timescale=timescale)
@@ -7,6 +7,37 @@ import numpy as np
 from matplotlib.patches import Rectangle, Circle
 from .ColumnElements import NewGrain, solvant_color
 
+def get_grain_positions(xmin, xmax, ymin, ymax, rs):
+    """ Get the staggered grain positions of the column structure.
+
+    Parameters
+    ----------
+    xmin, xmax, ymin, ymax : float
+        The extent of the column.
+    rs : float
+        The radius of each grain.
+
+    Returns
+    -------
+    positions : list of tuple
+        The ``((i, j), (x, y))`` pairs of the grain ids and centers
+        in the order of the grains made by :func:`plot_column_structure`.
+    """
+    ym = 0.03
+    circle_cxv = np.linspace(xmin, xmax, 7)
+    circle_cyv = np.flip(np.linspace(ymin+ym+rs, ymax-ym-rs, 12))
+    positions = []
+    for i, y in enumerate(circle_cyv):
+        for j, x in enumerate(circle_cxv):
+            if i%2 == 0:
+                if j%2 == 0:
+                    continue
+            else:
+                if j%2 == 1:
+                    continue
+            positions.append(((i, j), (x, y)))
+    return positions
+
 def plot_column_structure(ax, xmin, xmax, ymin, ymax, num_pores, rs):
     """ Plot the column structure with grains on the given axes.
 
@@ -33,11 +64,7 @@ def plot_column_structure(ax, xmin, xmax, ymin, ymax, num_pores, rs):
         The list of grains created in the column structure.
     """
 
-    xm = 0.01
-    ym = 0.03
-
-    circle_cxv = np.linspace(xmin, xmax, 7)
-    circle_cyv = np.flip(np.linspace(ymin+ym+rs, ymax-ym-rs, 12))
+    positions = get_grain_positions(xmin, xmax, ymin, ymax, rs)
 
     ax.set_axis_off()
 
@@ -54,29 +81,21 @@ def plot_column_structure(ax, xmin, xmax, ymin, ymax, num_pores, rs):
         if create_grains:
             grains = []
         
-        for i, y in enumerate(circle_cyv):
-            for j, x in enumerate(circle_cxv):
-                if i%2 == 0:
-                    if j%2 == 0:
-                        continue
-                else:
-                    if j%2 == 1:
-                        continue
+        for (i, j), (x, y) in positions:
+            if create_grains:
+                grain = NewGrain((i, j), (x, y), radius, num_pores)
 
+            if draw_rectangle:
+                p = Rectangle((x-radius, y-radius*4.5), radius*2, radius*9, color=color, alpha=alpha)
+            else:
+                p = Circle((x, y), radius, color=color, alpha=alpha)
                 if create_grains:
                     grain = NewGrain((i, j), (x, y), radius, num_pores)
-
-                if draw_rectangle:
-                    p = Rectangle((x-radius, y-radius*4.5), radius*2, radius*9, color=color, alpha=alpha)
-                else:
-                    p = Circle((x, y), radius, color=color, alpha=alpha)
-                    if create_grains:
-                        grain = NewGrain((i, j), (x, y), radius, num_pores)
-                        if debug:
-                            print("create_grains: ", (i, j), (x, y))
-                            grain.draw_entries(ax)
-                        grains.append(grain)
-                ax.add_patch(p)
+                    if debug:
+                        print("create_grains: ", (i, j), (x, y))
+                        grain.draw_entries(ax)
+                    grains.append(grain)
+            ax.add_patch(p)
 
         if create_grains:
             return grains
@@ -133,3 +133,33 @@ def edm_pdf(x, Pe, t0, R, timescale=None):
     """
     ts = 80.0 / (t0 * R) if timescale is None else timescale
     return ts * _edm_pdf_impl(ts * x, Pe, ts * t0, R)
+
+
+def edm_pdf_batch(x, Pe, t0, R, timescale=None):
+    """
+    Batched variant of :func:`edm_pdf` evaluating K components at once.
+
+    Parameters
+    ----------
+    x : array_like of shape (n,)
+        Time array (physical time units) shared by all components.
+    Pe, t0, R : float or array_like of shape (K,)
+        The parameters of :func:`edm_pdf`, each either shared or per component.
+    timescale : float, array_like of shape (K,) or None, optional
+        Time rescaling factor(s).  If ``None`` (default), chosen per component
+        as ``80 / (t0 * R)`` as in :func:`edm_pdf`.
+
+    Returns
+    -------
+    ndarray of shape (K, n)
+        Normalised PDFs, one row per component.
+    """
+    x = np.asarray(x, dtype=float)
+    t0 = np.asarray(t0, dtype=float)
+    ts = 80.0 / (t0 * np.asarray(R, dtype=float)) if timescale is None else np.asarray(timescale, dtype=float)
+    ts, t0 = np.broadcast_arrays(ts, t0)
+    if ts.ndim == 0:
+        return ts * _edm_pdf_impl.batch(ts * x, Pe, ts * t0, R)
+    # per-component timescales give per-component pre-scaled time arrays
+    ts_ = ts[:, np.newaxis]
+    return ts_ * _edm_pdf_impl.batch(ts_ * x, Pe, ts * t0, R)
@@ -32,6 +32,70 @@ def _check_positive_b(b_values, suppress, stacklevel=4):
             stacklevel=stacklevel,
         )
 
+class CedmObjective:
+    """
+    The objective function of the constrained-EDM (``shared_column=True``) mode
+    of :func:`optimize_edm_xr_decomposition`.
+
+    It is a module-level class rather than a closure so that it can be
+    pickled into worker processes for the multi-start mode.
+
+    The parameter vector is ``[t0_sh, u_sh, e_sh, Dz_sh, a_0, b_0, cinj_0, a_1, b_1, cinj_1, ...]``.
+    """
+    N_SHARED = 4  # t0, u, e, Dz
+    N_PER_COMP = 3  # a, b, cinj
+
+    def __init__(self, x, y, n_comp, egh_peak_frames, position_anchor_scale, a_order_penalty_scale):
+        self.x = x
+        self.y = y
+        self.n_comp = n_comp
+        self.egh_peak_frames = egh_peak_frames
+        self.position_anchor_scale = position_anchor_scale
+        self.a_order_penalty_scale = a_order_penalty_scale
+
+    def __call__(self, p_flat, return_cy_list=False):
+        x = self.x
+        t0_v, u_v, e_v, Dz_v = p_flat[:self.N_SHARED]
+        per_comp = p_flat[self.N_SHARED:].reshape(self.n_comp, self.N_PER_COMP)
+        cy_list = []
+        a_values = []
+        for a_v, b_v, cinj_v in per_comp:
+            a_values.append(a_v)
+            full = np.array([t0_v, u_v, a_v, b_v, e_v, Dz_v, cinj_v])
+            # Replace NaN/Inf (from overflow in pathological regions) with 0
+            # so the position penalty is still applied to out-of-range curves.
+            cy = np.nan_to_num(edm_impl(x, *full), nan=0.0, posinf=0.0, neginf=0.0)
+            cy_list.append(cy)
+        if return_cy_list:
+            return cy_list
+        ty = np.sum(cy_list, axis=0)
+        data_error = np.sum((ty - self.y) ** 2)
+
+        position_penalty = 0.0
+        for cy, egh_peak in zip(cy_list, self.egh_peak_frames):
+            cy_abs_sum = np.sum(np.abs(cy))
+            if cy_abs_sum > 0:
+                centroid = np.sum(cy * x) / cy_abs_sum
+                position_penalty += (centroid - egh_peak) ** 2
+            else:
+                # Curve is zero everywhere — apply a strong penalty so the
+                # optimizer does not "hide" a component outside the data range.
+                position_penalty += (x[-1] - egh_peak) ** 2
+
+        # Order penalty: penalize when a[i] > a[i+1] (wrong order)
+        # Components are ordered by EGH peak position (early → late elution).
+        # SEC principle: early elution → larger Rg → smaller K_SEC (a).
+        # So a[0] ≤ a[1] ≤ ... ≤ a[n-1] is the expected ordering.
+        order_penalty = 0.0
+        for i in range(self.n_comp - 1):
+            if a_values[i] > a_values[i+1]:
+                # Wrong order: penalize the squared violation
+                order_penalty += (a_values[i] - a_values[i+1]) ** 2
+
+        return (data_error +
+                position_penalty * self.position_anchor_scale +
+                order_penalty * self.a_order_penalty_scale)
+
 def optimize_edm_xr_decomposition(decomposition, init_params, **kwargs):
     """ Optimize the EDM decomposition.
 
@@ -91,6 +155,17 @@ def optimize_edm_xr_decomposition(decomposition, init_params, **kwargs):
             Default True.  Pass ``False`` to use unconstrained (free) EDM,
             which is deprecated and will be removed in a future release.
 
+        n_starts : int, optional
+            For ``shared_column=True`` only: the number of randomized starting
+            points added to the analytical one.  Default 0.
+
+        n_jobs : int, optional
+            The number of worker processes to run the starting points in.
+            None (default) or 1 runs them serially, -1 uses all CPUs.
+
+        seed : int, optional
+            The random seed for the randomized starting points.
+
         suppress_positive_b_warning : bool, optional
             If True, suppress the UserWarning that is issued when any fitted
             ``b`` parameter is positive.  In SEC, b > 0 (Langmuir adsorption)
@@ -293,58 +368,25 @@ def optimize_edm_xr_decomposition(decomposition, init_params, **kwargs):
         # kwargs can override via 'a_order_penalty_scale' (default 1e-3).
         a_order_penalty_scale = kwargs.get('a_order_penalty_scale', 1e-3)
 
-        def objective_sc(p_flat, return_cy_list=False):
-            t0_v, u_v, e_v, Dz_v = p_flat[:N_SHARED]
-            per_comp = p_flat[N_SHARED:].reshape(n_comp, N_PER_COMP)
-            cy_list = []
-            a_values = []
-            for a_v, b_v, cinj_v in per_comp:
-                a_values.append(a_v)
-                full = np.array([t0_v, u_v, a_v, b_v, e_v, Dz_v, cinj_v])
-                # Replace NaN/Inf (from overflow in pathological regions) with 0
-                # so the position penalty is still applied to out-of-range curves.
-                cy = np.nan_to_num(edm_impl(x, *full), nan=0.0, posinf=0.0, neginf=0.0)
-                cy_list.append(cy)
-            if return_cy_list:
-                return cy_list
-            ty = np.sum(cy_list, axis=0)
-            data_error = np.sum((ty - y) ** 2)
-            
-            position_penalty = 0.0
-            for cy, egh_peak in zip(cy_list, egh_peak_frames):
-                cy_abs_sum = np.sum(np.abs(cy))
-                if cy_abs_sum > 0:
-                    centroid = np.sum(cy * x) / cy_abs_sum
-                    position_penalty += (centroid - egh_peak) ** 2
-                else:
-                    # Curve is zero everywhere — apply a strong penalty so the
-                    # optimizer does not "hide" a component outside the data range.
-                    position_penalty += (x[-1] - egh_peak) ** 2
-            
-            # Order penalty: penalize when a[i] > a[i+1] (wrong order)
-            # Components are ordered by EGH peak position (early → late elution).
-            # SEC principle: early elution → larger Rg → smaller K_SEC (a).
-            # So a[0] ≤ a[1] ≤ ... ≤ a[n-1] is the expected ordering.
-            order_penalty = 0.0
-            for i in range(n_comp - 1):
-                if a_values[i] > a_values[i+1]:
-                    # Wrong order: penalize the squared violation
-                    order_penalty += (a_values[i] - a_values[i+1]) ** 2
-            
-            return (data_error + 
-                    position_penalty * position_anchor_scale +
-                    order_penalty * a_order_penalty_scale)
+        objective_sc = CedmObjective(x, y, n_comp, egh_peak_frames,
+                                     position_anchor_scale, a_order_penalty_scale)
 
         # Single optimization from the analytical starting point.
-        # No two-phase, no multi-start — L-BFGS-B from (e=0.5, b=0) follows
+        # No two-phase, no multi-start by default — L-BFGS-B from (e=0.5, b=0) follows
         # the gradient into the physically meaningful basin.  Unconstrained t0
         # and b allow the EDM curves to take flexible shapes that better fit the
         # data while still preserving the a-value ordering (K_SEC identifiability).
         per_comp_init = np.column_stack([a_init, np.zeros(n_comp), cinj_init]).flatten()
         p0_sc = np.concatenate([np.array([t0_sh, u_sh, e_sh_init, Dz_sh]), per_comp_init])
 
-        result_sc = minimize(objective_sc, p0_sc, bounds=sc_bounds, method='L-BFGS-B',
-                             options={'maxiter': 20000, 'ftol': 1e-14, 'gtol': 1e-9})
+        # Optional randomized starts, which can be run in a process pool with n_jobs.
+        from molass.ScipyUtils.MultiStart import make_random_starts, minimize_multistart, select_best
+        starts = [p0_sc] + make_random_starts(p0_sc, sc_bounds, kwargs.get('n_starts', 0),
+                                              seed=kwargs.get('seed', None))
+        results = minimize_multistart(objective_sc, starts, n_jobs=kwargs.get('n_jobs', None),
+                                      bounds=sc_bounds, method='L-BFGS-B',
+                                      options={'maxiter': 20000, 'ftol': 1e-14, 'gtol': 1e-9})
+        result_sc = select_best(results)
 
         t0_fit, u_fit, e_fit, Dz_fit = result_sc.x[:N_SHARED]
         per_comp_fit = result_sc.x[N_SHARED:].reshape(n_comp, N_PER_COMP)
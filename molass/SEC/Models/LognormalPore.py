@@ -337,39 +337,96 @@ def sdm_lognormal_pore_gamma_pdf(x, scale, N, T, k, me, mp, mu, sigma, Rg, N0, t
 # vectorized numpy operations.  Typical speedup: 50-100x per PDF call.
 # ============================================================================
 
+class LognormalQuadraturePlan:
+    """
+    Precomputed Gauss-Legendre quadrature over pore sizes.
+
+    The Legendre nodes and weights for ``n_quad`` are computed once, and
+    :meth:`get_nodes` maps them to the integration intervals ``[Rg, max_rg]``
+    of several components at once.  Use :func:`get_quadrature_plan` to
+    share the plans across calls.
+    """
+    def __init__(self, n_quad=64):
+        self.n_quad = n_quad
+        if n_quad == 64:
+            self.nodes, self.weights = _GL64_NODES, _GL64_WEIGHTS
+        else:
+            self.nodes, self.weights = np.polynomial.legendre.leggauss(n_quad)
+
+    def get_nodes(self, lower, upper):
+        """
+        Map the nodes and weights to the intervals ``[lower, upper]``.
+
+        Parameters
+        ----------
+        lower, upper : array-like of shape (K,)
+            The interval bounds.
+
+        Returns
+        -------
+        r : ndarray of shape (K, n_quad)
+            The nodes.
+        wt : ndarray of shape (K, n_quad)
+            The weights.
+        """
+        half = 0.5 * (np.asarray(upper) - np.asarray(lower))[:, None]
+        mid = 0.5 * (np.asarray(upper) + np.asarray(lower))[:, None]
+        return half * self.nodes + mid, half * self.weights
+
+_quadrature_plans = {}
+
+def get_quadrature_plan(n_quad=64):
+    """
+    Return the shared :class:`LognormalQuadraturePlan` for ``n_quad``.
+    """
+    plan = _quadrature_plans.get(n_quad)
+    if plan is None:
+        plan = LognormalQuadraturePlan(n_quad)
+        _quadrature_plans[n_quad] = plan
+    return plan
+
 def sdm_lognormal_pore_gamma_cf_fast(w, N, T, k, me, mp, mu, sigma, Rg, N0, t0, n_quad=64):
-    """Vectorized Gauss-Legendre version of sdm_lognormal_pore_gamma_cf."""
+    """Vectorized Gauss-Legendre version of sdm_lognormal_pore_gamma_cf.
+
+    ``Rg`` may be an array of shape (K,) or (K, 1) to evaluate K components
+    at once, in which case the result has shape (K, n_w), as required by
+    :meth:`~molass.MathUtils.FftUtils.FftInvPdf.batch`.
+    """
+    batched = np.ndim(Rg) > 0
+    # the FftInvPdf grid is real-valued but of complex dtype; real arithmetic is much cheaper
+    w = np.real(w).reshape(-1)                    # (n_w,)
+    Rg = np.asarray(Rg, dtype=float).reshape(-1)  # (K,)
     mode = compute_mode(mu, sigma)
     stdev = compute_stdev(mu, sigma)
     max_rg = min(PORESIZE_INTEG_LIMIT, mode + 5*stdev)
 
-    if max_rg <= Rg:
-        Z = 1j * w * t0
-        return np.exp(Z + Z**2 / (2 * N0))
-
-    # Gauss-Legendre nodes/weights mapped to [Rg, max_rg]
-    nodes, weights = np.polynomial.legendre.leggauss(n_quad)
-    half = 0.5 * (max_rg - Rg)
-    mid  = 0.5 * (max_rg + Rg)
-    r  = half * nodes + mid       # (n_quad,)
-    wt = half * weights           # (n_quad,)
+    # Gauss-Legendre nodes/weights mapped to [Rg, max_rg], one row per component;
+    # components with max_rg <= Rg have no pore contribution
+    active = max_rg > Rg
+    r, wt = get_quadrature_plan(n_quad).get_nodes(np.where(active, Rg, 0), np.where(active, max_rg, 1))
+    wt = wt * active[:, None]                     # (K, n_quad)
 
     # Integrand components at all quadrature nodes
-    g = lognorm.pdf(r, sigma, scale=np.exp(mu))   # (n_quad,)
-    ratio = np.minimum(1.0, Rg / r)               # (n_quad,)
-    n_pore = N * (1 - ratio)**me                   # (n_quad,)
-    theta  = T * (1 - ratio)**mp                   # (n_quad,)
-
-    # Gamma CF: (1 - iw*theta)^(-k) - 1
-    # Broadcast: w (n_w,1) × theta (1,n_quad) → (n_w, n_quad)
-    gamma_term = (1 - 1j * w[:, None] * theta[None, :])**(-k) - 1
+    g = _lognorm_pdf_fast(r, mu, sigma)           # (K, n_quad)
+    ratio = np.minimum(1.0, Rg[:, None] / r)      # (K, n_quad)
+    n_pore = N * (1 - ratio)**me                  # (K, n_quad)
+    theta  = T * (1 - ratio)**mp                  # (K, n_quad)
+
+    # Gamma CF: (1 - iw*theta)^(-k) - 1 = (1 + a^2)^(-k/2) * exp(ik*arctan(a)) - 1, a = w*theta
+    # evaluated in real arithmetic, which is cheaper than the complex power
+    # Broadcast: w (1, n_w, 1) × theta (K, 1, n_quad) → (K, n_w, n_quad)
+    a = w[None, :, None] * theta[:, None, :]
+    magnitude = np.exp(-0.5 * k * np.log1p(a * a))
+    phase = k * np.arctan(a)
+    gamma_term = magnitude * np.cos(phase) - 1 + 1j * (magnitude * np.sin(phase))
 
     # Weighted sum over quadrature nodes
-    coeffs = g * n_pore * wt                       # (n_quad,)
-    integrated = gamma_term @ coeffs               # (n_w,)
+    coeffs = g * n_pore * wt                      # (K, n_quad)
+    integrated = np.einsum('kwq,kq->kw', gamma_term, coeffs)   # (K, n_w)
 
     Z = integrated + 1j * w * t0
-    return np.exp(Z + Z**2 / (2 * N0))
+    cf = np.exp(Z + Z**2 / (2 * N0))
+    return cf if batched else cf[0]
 
 _sdm_lognormal_pore_gamma_pdf_fast_impl = FftInvPdf(sdm_lognormal_pore_gamma_cf_fast)
 
@@ -394,6 +451,22 @@ def sdm_lognormal_pore_gamma_pdf_fast(x, scale, N, T, k, me, mp, mu, sigma, Rg,
         ts * (x - t0), N, ts * T, k, me, mp, mu, sigma, Rg, N0, 0
     )
 
+def sdm_lognormal_pore_gamma_pdf_fast_batch(x, scales, N, T, k, me, mp, mu, sigma, Rgs, N0, t0):
+    """Batched version of sdm_lognormal_pore_gamma_pdf_fast for components sharing
+    the column parameters, returning an array of shape (K, len(x)).
+
+    The CFs of all components are evaluated in one broadcast over
+    ``(K, n_w, n_quad)`` and inverted with one multi-row FFT.
+    """
+    from molass.SEC.Models.SdmMonoPore import DEFAULT_TIMESCALE
+    x_shifted_max = np.max(x) - t0
+    ts_safe = (1024 - 1) / x_shifted_max if x_shifted_max > 0 else DEFAULT_TIMESCALE
+    ts = min(DEFAULT_TIMESCALE, ts_safe)
+    Y = _sdm_lognormal_pore_gamma_pdf_fast_impl.batch(
+        ts * (np.asarray(x) - t0), N, ts * T, k, me, mp, mu, sigma, np.asarray(Rgs, dtype=float), N0, 0
+    )
+    return np.asarray(scales, dtype=float)[:, None] * ts * Y
+
 
 # --------------------------------------------------------------------------
 # Analytical moments of SDM lognormal-pore gamma distribution
@@ -7,6 +7,8 @@ from collections import namedtuple
 from molass.SEC.Models.SdmMonoPore import (
     sdm_monopore_pdf,
     sdm_monopore_gamma_pdf,
+    sdm_monopore_pdf_batch,
+    sdm_monopore_gamma_pdf_batch,
     DEFAULT_TIMESCALE,
 )
 from molass.LowRank.ComponentCurve import ComponentCurve
@@ -190,4 +192,50 @@ class SdmComponentCurve(ComponentCurve):
         float
             The scale parameter.
         """
-        return self.scale
\ No newline at end of file
+        return self.scale
+
+def compute_sdm_curves_batch(x, column, rgs, scales):
+    """
+    Computes the y values of several SDM components sharing a column.
+
+    For ``pore_dist='mono'``, and for ``pore_dist='lognormal'`` with the gamma
+    residence time distribution, all components are evaluated with one batched
+    FFT inversion, which is equivalent to but much faster than evaluating
+    ``SdmComponentCurve(x, column, rg, scale).get_y()`` for each component.
+
+    Parameters
+    ----------
+    x : array-like
+        The x values.
+    column : SdmColumn
+        The SDM column shared by the components.
+    rgs : array-like of shape (K,)
+        The radii of gyration of the components.
+    scales : array-like of shape (K,)
+        The scaling factors of the components.
+
+    Returns
+    -------
+    ndarray of shape (K, len(x))
+        The y values of the components.
+    """
+    scales = np.asarray(scales, dtype=float)
+    if column.pore_dist == 'lognormal' and column.rt_dist != 'exponential':
+        from molass.SEC.Models.LognormalPore import sdm_lognormal_pore_gamma_pdf_fast_batch
+        N, T, me, mp, x0, tI, N0, mu, sigma, k = column.get_params()
+        return sdm_lognormal_pore_gamma_pdf_fast_batch(np.asarray(x) - tI, scales, N, T, k, me, mp,
+                                                       mu, sigma, rgs, N0, x0 - tI)
+    if column.pore_dist != 'mono':
+        return np.array([SdmComponentCurve(x, column, rg, scale).get_y() for rg, scale in zip(rgs, scales)])
+
+    N, T, me, mp, x0, tI, N0, poresize, timescale, k = column.get_params()
+    rhov = np.minimum(np.asarray(rgs, dtype=float)/poresize, 1.0)
+    niv = N*(1 - rhov)**me
+    tiv = T*(1 - rhov)**mp
+    x_ = np.asarray(x) - tI
+    t0 = x0 - tI
+    if column.rt_dist == 'exponential':
+        Y = sdm_monopore_pdf_batch(x_, niv, tiv, N0, t0, timescale=timescale)
+    else:
+        Y = sdm_monopore_gamma_pdf_batch(x_, niv, k, tiv / k, N0, t0, timescale=timescale)
+    return scales[:, np.newaxis] * Y
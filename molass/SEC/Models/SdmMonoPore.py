@@ -61,6 +61,27 @@ def sdm_monopore_pdf(x, npi, tpi, N0, t0, timescale=DEFAULT_TIMESCALE):
     """
     return timescale*sdm_monopore_pdf_impl(timescale*x, npi, timescale*tpi, N0, timescale*t0)
 
+def sdm_monopore_pdf_batch(x, npi, tpi, N0, t0, timescale=DEFAULT_TIMESCALE):
+    """
+    Batched variant of :func:`sdm_monopore_pdf` evaluating K components at once.
+
+    Parameters
+    ----------
+    x : array_like of shape (n,)
+        Time array (physical time units) shared by all components.
+    npi, tpi, N0, t0 : float or array_like of shape (K,)
+        The parameters of :func:`sdm_monopore_pdf`, each either shared or per component.
+    timescale : float, optional
+        Time rescaling factor shared by all components.
+
+    Returns
+    -------
+    ndarray of shape (K, n)
+        Normalised PDFs, one row per component.
+    """
+    ts = timescale
+    return ts*sdm_monopore_pdf_impl.batch(ts*np.asarray(x), npi, ts*np.asarray(tpi), N0, ts*np.asarray(t0))
+
 def sdm_monopore_gamma_cf(w, npi, k, theta, N0, t0):
     """
     Gamma-distributed residence times with mobile phase dispersion.
@@ -103,4 +124,12 @@ def sdm_monopore_gamma_pdf(x, npi, k, theta, N0, t0, timescale=DEFAULT_TIMESCALE
     """Wrapper with timescale normalization"""
     return timescale*sdm_monopore_gamma_pdf_impl(
         timescale*x, npi, k, timescale*theta, N0, timescale*t0
-    )
\ No newline at end of file
+    )
+
+def sdm_monopore_gamma_pdf_batch(x, npi, k, theta, N0, t0, timescale=DEFAULT_TIMESCALE):
+    """Batched variant of :func:`sdm_monopore_gamma_pdf` returning an array of shape (K, n),
+    where each parameter is either shared or an array of shape (K,)."""
+    ts = timescale
+    return ts*sdm_monopore_gamma_pdf_impl.batch(
+        ts*np.asarray(x), npi, k, ts*np.asarray(theta), N0, ts*np.asarray(t0)
+    )
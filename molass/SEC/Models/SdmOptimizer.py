@@ -4,8 +4,8 @@ SEC.Models.SdmOptimizer.py
 import numpy as np
 from scipy.optimize import minimize
 from molass.SEC.Models.SdmMonoPore import (
-    sdm_monopore_pdf,
-    sdm_monopore_gamma_pdf,
+    sdm_monopore_pdf_batch,
+    sdm_monopore_gamma_pdf_batch,
     DEFAULT_TIMESCALE,
 )
 
@@ -23,6 +23,95 @@ def _proxy_rgs_from_peak_frames(decomposition, poresize_ref=100.0,
         rho = rho_min + norm * (rho_max - rho_min)
     return np.asarray(rho * poresize_ref, dtype=float)
 
+class SdmXrObjective:
+    """
+    The objective function of :func:`optimize_sdm_xr_decomposition`.
+
+    It is a module-level class rather than a closure so that it can be
+    pickled into worker processes for the multi-start mode.
+
+    The parameter vector is ``[N, T, x0, tI, N0, k, rg_1..rg_n, scale_1..scale_n, poresize]``.
+    """
+    def __init__(self, x, y, num_components, me, mp, rt_dist, timescale,
+                 rgv, rg_qualities, rg_anchor_scale, egh_peak_frames, position_anchor_scale):
+        self.x = x
+        self.y = y
+        self.num_components = num_components
+        self.me = me
+        self.mp = mp
+        self.rt_dist = rt_dist
+        self.timescale = timescale
+        self.rgv = rgv
+        self.rg_qualities = rg_qualities
+        self.rg_anchor_scale = rg_anchor_scale
+        self.egh_peak_frames = egh_peak_frames
+        self.position_anchor_scale = position_anchor_scale
+        self._pdf_batch_func = sdm_monopore_pdf_batch if rt_dist == 'exponential' else sdm_monopore_gamma_pdf_batch
+        self.eval_count = 0
+
+    def __call__(self, params, return_cy_list=False, plot=False):
+        N_, T_, x0_, tI_, N0_, k_ = params[0:6]
+        rgv_ = params[6:6+self.num_components]
+        rg_diff = np.diff(rgv_)
+        non_ordered = np.where(rg_diff > 0)[0]
+        order_penalty = np.sum(rg_diff[non_ordered]**2) * 1e3  # penalty for non-ordered rgv
+
+        # Minimum Rg separation penalty: prevent components from collapsing to identical Rgs
+        # when they're geometrically distinguished (e.g., separate SEC peaks with different Rgs).
+        # This prevents NNLS rank deficiency from driving minority components toward zero.
+        # Target: maintain at least 1 Å separation between adjacent components.
+        min_rg_sep_target = 1.0  # Å (strong pressure to separate)
+        rg_sep_deficit = np.maximum(0, min_rg_sep_target - np.abs(rg_diff))
+        rg_sep_penalty = np.sum(rg_sep_deficit**2) * 1e2  # Scale: 100 per Å²
+        order_penalty += rg_sep_penalty
+
+        # poresize is now an optimization variable (last in params vector)
+        poresize_ = params[6+2*self.num_components]
+        rhov = rgv_/poresize_
+        rhov[rhov > 1] = 1.0  # limit rhov to 1.0
+        scales_ = params[6+self.num_components:6+2*self.num_components]
+        x_ = self.x - tI_
+        t0 = x0_ - tI_
+        niv = N_*(1 - rhov)**self.me
+        tiv = T_*(1 - rhov)**self.mp
+        # all components in one batched FFT inversion
+        if self.rt_dist == 'exponential':
+            cy_array = self._pdf_batch_func(x_, niv, tiv, N0_, t0, timescale=self.timescale)
+        else:
+            thetav = tiv / k_  # Gamma scale: mean = k*theta = ti
+            cy_array = self._pdf_batch_func(x_, niv, k_, thetav, N0_, t0, timescale=self.timescale)
+        cy_list = list(scales_[:, np.newaxis] * cy_array)
+        if return_cy_list:
+            return cy_list
+        ty = np.sum(cy_list, axis=0)
+        if plot:
+            import matplotlib.pyplot as plt
+            plt.figure()
+            plt.plot(self.x, self.y, label='Data')
+            plt.plot(self.x, ty, label='Model')
+            for i, cy in enumerate(cy_list):
+                plt.plot(self.x, cy, label='Component %d' % (i+1))
+            plt.legend()
+            plt.show()
+        # Quality-weighted soft Rg anchoring: pulls each component's Rg toward
+        # its EGH-estimated value in proportion to the Guinier fit quality.
+        # quality ≈ 1 → strong pull (stays near EGH Rg); quality ≈ 0 → unconstrained.
+        rgv_safe = np.maximum(self.rgv, 1e-12)
+        rg_anchor_penalty = np.sum(self.rg_qualities * ((rgv_ / rgv_safe - 1) ** 2)) * self.rg_anchor_scale
+        # Position constraint: use theoretical centroid (mean of gamma, = x0 + N*T*(1-rho)^6)
+        # which is amplitude-independent — prevents collapse to degenerate solution even
+        # when one component's scale → 0. Peak position is the priority per user guidance.
+        peak_positions = np.array([x0_ + N_ * (1-rho)**self.me * T_ * (1-rho)**self.mp for rho in rhov])
+        position_penalty = np.sum((peak_positions - self.egh_peak_frames) ** 2) * self.position_anchor_scale
+        # Scale penalty: weak quadratic penalty to discourage near-zero scales. Weight is tiny
+        # (1e-4) so it barely affects the fit but provides a nudge away from collapse.
+        # At s=0.001: penalty ≈ 1e-10; at s=0.01: ≈ 1e-8; at s=0.1: ≈ 1e-6.
+        # This is ~0.01% of typical data fit errors, so won't distort the solution.
+        scale_penalty = np.sum((1.0 / np.maximum(scales_, 1e-8)) ** 2) * 1e-4
+        error = np.sum((self.y - ty)**2) + order_penalty + rg_anchor_penalty + position_penalty + scale_penalty
+        self.eval_count += 1
+        return error
+
 def optimize_sdm_xr_decomposition(decomposition, env_params, model_params=None, **kwargs):
     """ Optimize the SDM decomposition.
 
@@ -37,6 +126,15 @@ def optimize_sdm_xr_decomposition(decomposition, env_params, model_params=None,
     kwargs : dict
         Additional parameters for the optimization process.
 
+        n_starts : int, optional
+            The number of randomized starting points added to the estimator-based
+            and physics-based ones. Default 0.
+        n_jobs : int, optional
+            The number of worker processes to run the starting points in.
+            None (default) or 1 runs them serially, -1 uses all CPUs.
+        seed : int, optional
+            The random seed for the randomized starting points.
+
     Returns
     -------
     new_xr_ccurves : list of SdmComponentCurve
@@ -101,9 +199,9 @@ def optimize_sdm_xr_decomposition(decomposition, env_params, model_params=None,
 
     if rt_dist == 'exponential':
         k_init = 1.0   # not optimized for exponential
-        _pdf_func = sdm_monopore_pdf
+        _pdf_batch_func = sdm_monopore_pdf_batch
     else:
-        _pdf_func = sdm_monopore_gamma_pdf
+        _pdf_batch_func = sdm_monopore_gamma_pdf_batch
 
     def estimate_initial_scales():
         scales = []
@@ -123,71 +221,9 @@ def optimize_sdm_xr_decomposition(decomposition, env_params, model_params=None,
     egh_peak_frames = np.array([c.x[c.y.argmax()] for c in decomposition.xr_ccurves], dtype=float)
     position_anchor_scale = model_params.get('position_anchor_scale', 1e-5) if model_params else 1e-5
 
-    def objective_function(params, return_cy_list=False, plot=False):
-        N_, T_, x0_, tI_, N0_, k_ = params[0:6]
-        rgv_ = params[6:6+num_components]
-        rg_diff = np.diff(rgv_)
-        non_ordered = np.where(rg_diff > 0)[0]
-        order_penalty = np.sum(rg_diff[non_ordered]**2) * 1e3  # penalty for non-ordered rgv
-        
-        # Minimum Rg separation penalty: prevent components from collapsing to identical Rgs
-        # when they're geometrically distinguished (e.g., separate SEC peaks with different Rgs).
-        # This prevents NNLS rank deficiency from driving minority components toward zero.
-        # Target: maintain at least 1 Å separation between adjacent components.
-        min_rg_sep_target = 1.0  # Å (strong pressure to separate)
-        rg_sep_deficit = np.maximum(0, min_rg_sep_target - np.abs(rg_diff))
-        rg_sep_penalty = np.sum(rg_sep_deficit**2) * 1e2  # Scale: 100 per Å²
-        order_penalty += rg_sep_penalty
-        
-        # poresize is now an optimization variable (last in params vector)
-        poresize_ = params[6+2*num_components]
-        rhov = rgv_/poresize_
-        rhov[rhov > 1] = 1.0  # limit rhov to 1.0
-        scales_ = params[6+num_components:6+2*num_components]
-        cy_list = []
-        x_ = x - tI_
-        t0 = x0_ - tI_
-        for rho, scale in zip(rhov, scales_):
-            ni = N_*(1 - rho)**me
-            ti = T_*(1 - rho)**mp
-            if rt_dist == 'exponential':
-                cy = scale * _pdf_func(x_, ni, ti, N0_, t0, timescale=timescale)
-            else:
-                theta = ti / k_  # Gamma scale: mean = k*theta = ti
-                cy = scale * _pdf_func(x_, ni, k_, theta, N0_, t0, timescale=timescale)
-            cy_list.append(cy)
-        if return_cy_list:
-            return cy_list
-        ty = np.sum(cy_list, axis=0)
-        if plot:
-            import matplotlib.pyplot as plt
-            plt.figure()
-            plt.plot(x, y, label='Data')
-            plt.plot(x, ty, label='Model')
-            for i, cy in enumerate(cy_list):
-                plt.plot(x, cy, label='Component %d' % (i+1))
-            plt.legend()
-            plt.show()
-        # Quality-weighted soft Rg anchoring: pulls each component's Rg toward
-        # its EGH-estimated value in proportion to the Guinier fit quality.
-        # quality ≈ 1 → strong pull (stays near EGH Rg); quality ≈ 0 → unconstrained.
-        rgv_safe = np.maximum(rgv, 1e-12)
-        rg_anchor_penalty = np.sum(rg_qualities * ((rgv_ / rgv_safe - 1) ** 2)) * rg_anchor_scale
-        # Position constraint: use theoretical centroid (mean of gamma, = x0 + N*T*(1-rho)^6)
-        # which is amplitude-independent — prevents collapse to degenerate solution even
-        # when one component's scale → 0. Peak position is the priority per user guidance.
-        peak_positions = np.array([x0_ + N_ * (1-rho)**me * T_ * (1-rho)**mp for rho in rhov])
-        position_penalty = np.sum((peak_positions - egh_peak_frames) ** 2) * position_anchor_scale
-        # Scale penalty: weak quadratic penalty to discourage near-zero scales. Weight is tiny
-        # (1e-4) so it barely affects the fit but provides a nudge away from collapse.
-        # At s=0.001: penalty ≈ 1e-10; at s=0.01: ≈ 1e-8; at s=0.1: ≈ 1e-6.
-        # This is ~0.01% of typical data fit errors, so won't distort the solution.
-        scale_penalty = np.sum((1.0 / np.maximum(scales_, 1e-8)) ** 2) * 1e-4
-        error = np.sum((y - ty)**2) + order_penalty + rg_anchor_penalty + position_penalty + scale_penalty
-        _eval_count[0] += 1
-        return error
-
-    _eval_count = [0]
+    objective_function = SdmXrObjective(x, y, num_components, me, mp, rt_dist, timescale,
+                                        rgv, rg_qualities, rg_anchor_scale,
+                                        egh_peak_frames, position_anchor_scale)
 
     # Void volume must precede every component peak — compute once, used for
     # both the physics-based starting point and the x0 upper bound.
@@ -345,7 +381,7 @@ def optimize_sdm_xr_decomposition(decomposition, env_params, model_params=None,
     def _nm_callback(xk):
         if _pbar is not None:
             _pbar.update(1)
-            _pbar.set_postfix(evals=_eval_count[0], refresh=False)
+            _pbar.set_postfix(evals=objective_function.eval_count, refresh=False)
 
     if progress:
         from tqdm.auto import tqdm as _tqdm
@@ -353,22 +389,37 @@ def optimize_sdm_xr_decomposition(decomposition, env_params, model_params=None,
     else:
         _pbar = None
 
-    result = None
+    # Optional randomized starts around both deterministic starts, which
+    # can be run in a process pool with n_jobs.
+    from molass.PackageUtils.ParallelUtils import get_num_workers
+    from molass.ScipyUtils.MultiStart import make_random_starts, minimize_multistart, select_best
+    n_starts = kwargs.get('n_starts', 0)
+    n_jobs = kwargs.get('n_jobs', None)
     start_names = ['estimator', 'physics']
-    # DEBUG: Show initial guess and bounds before optimization
-    init_scales_est = np.array(initial_guess[6+num_components:6+2*num_components])
-    init_scales_phys = np.array(physics_guess[6+num_components:6+2*num_components])
-    for i, (name, start) in enumerate(zip(start_names, [initial_guess, physics_guess])):
-        if _pbar is not None:
-            _pbar.set_description(f'SDM(mono) {name}')
-        r = minimize(objective_function, start, bounds=bounds, method=method,
-                     callback=_nm_callback if _pbar is not None else None)
+    starts = [initial_guess, physics_guess]
+    seed = kwargs.get('seed', None)
+    for i, start in enumerate(make_random_starts(np.array(starts[0]), bounds, (n_starts + 1)//2, seed=seed)):
+        start_names.append('estimator-random-%d' % i)
+        starts.append(start)
+    for i, start in enumerate(make_random_starts(np.array(starts[1]), bounds, n_starts//2,
+                                                 seed=None if seed is None else seed + 1)):
+        start_names.append('physics-random-%d' % i)
+        starts.append(start)
+
+    def _report_start(i, r):
+        if _pbar is not None and parallel:
+            _pbar.update(1)
         if debug:
             scales_i = r.x[6+num_components:6+2*num_components]
             poresize_i = r.x[6+2*num_components]
-            print(f"  Start [{name}]: obj={r.fun:.6f}, scales={np.array2string(scales_i, precision=4)}, poresize={poresize_i:.1f}")
-        if result is None or r.fun < result.fun:
-            result = r
+            print(f"  Start [{start_names[i]}]: obj={r.fun:.6f}, scales={np.array2string(scales_i, precision=4)}, poresize={poresize_i:.1f}")
+
+    parallel = get_num_workers(n_jobs) > 1 and len(starts) > 1
+    # the per-iteration callback cannot be sent to worker processes
+    callback = _nm_callback if _pbar is not None and not parallel else None
+    results = minimize_multistart(objective_function, starts, n_jobs=n_jobs, callback_done=_report_start,
+                                  bounds=bounds, method=method, callback=callback)
+    result = select_best(results)
     if _pbar is not None:
         _pbar.close()
 
@@ -397,17 +448,12 @@ def optimize_sdm_xr_decomposition(decomposition, env_params, model_params=None,
     _rhov_ = np.clip(rgv_ / poresize_, 0.0, 1.0)
     _x_tI = x - tI_
     _t0_post = x0_ - tI_
-    _A_cols = []
-    for _rho in _rhov_:
-        _ni = N_ * (1 - _rho) ** me
-        _ti = T_ * (1 - _rho) ** mp
-        if rt_dist == 'exponential':
-            _cy = _pdf_func(_x_tI, _ni, _ti, N0_, _t0_post, timescale=timescale)
-        else:
-            _theta = _ti / k_
-            _cy = _pdf_func(_x_tI, _ni, k_, _theta, N0_, _t0_post, timescale=timescale)
-        _A_cols.append(_cy)
-    _A_mat = np.array(_A_cols).T
+    _niv = N_ * (1 - _rhov_) ** me
+    _tiv = T_ * (1 - _rhov_) ** mp
+    if rt_dist == 'exponential':
+        _A_mat = _pdf_batch_func(_x_tI, _niv, _tiv, N0_, _t0_post, timescale=timescale).T
+    else:
+        _A_mat = _pdf_batch_func(_x_tI, _niv, k_, _tiv / k_, N0_, _t0_post, timescale=timescale).T
     _scales_nnls, _ = _nnls(_A_mat, y)
     scales_ = np.array([max(s, 1e-3) for s in _scales_nnls])
 
@@ -449,7 +495,7 @@ def refine_sdm_per_component(sdm_ccurves, x, y, **kwargs):
         return sdm_ccurves
 
     from scipy.optimize import minimize as _minimize
-    from .SdmComponentCurve import SdmColumn, SdmComponentCurve
+    from .SdmComponentCurve import SdmColumn, SdmComponentCurve, compute_sdm_curves_batch
 
     col0 = sdm_ccurves[0].column
     pore_dist = col0.pore_dist
@@ -478,10 +524,7 @@ def refine_sdm_per_component(sdm_ccurves, x, y, **kwargs):
     def objective(params):
         rgs = params[:nc]
         scales = params[nc:]
-        y_model = np.zeros_like(y, dtype=float)
-        for rg_i, scale_i in zip(rgs, scales):
-            cc_i = SdmComponentCurve(x, fixed_col, float(np.clip(rg_i, 1.0, rg_hard_upper)), float(scale_i))
-            y_model += cc_i.get_y()
+        y_model = np.sum(compute_sdm_curves_batch(x, fixed_col, np.clip(rgs, 1.0, rg_hard_upper), scales), axis=0)
         residual = y - y_model
         return float(np.dot(residual, residual))
 
@@ -595,7 +638,7 @@ def optimize_sdm_lognormal_xr_decomposition(decomposition, env_params, model_par
         import molass.SEC.Models.SdmComponentCurve
         reload(molass.SEC.Models.SdmComponentCurve)
     from .SdmComponentCurve import SdmColumn, SdmComponentCurve
-    from molass.SEC.Models.LognormalPore import sdm_lognormal_pore_gamma_pdf_fast
+    from molass.SEC.Models.LognormalPore import sdm_lognormal_pore_gamma_pdf_fast_batch
     progress = kwargs.get('progress', False)
 
     num_components = decomposition.num_components
@@ -687,13 +730,10 @@ def optimize_sdm_lognormal_xr_decomposition(decomposition, env_params, model_par
 
         x_ = x - tI_
         t0_ = x0_ - tI_
-        cy_list = []
-        for rg_, scale_ in zip(rgv_, scales_):
-            cy = scale_ * sdm_lognormal_pore_gamma_pdf_fast(
-                x_, 1.0, N_, T_, k_, me, mp, mu_, sigma_, rg_, N0_, t0_
-            )
-            cy_list.append(cy)
-        ty = np.sum(cy_list, axis=0)
+        cy_array = sdm_lognormal_pore_gamma_pdf_fast_batch(
+            x_, scales_, N_, T_, k_, me, mp, mu_, sigma_, rgv_, N0_, t0_
+        )
+        ty = np.sum(cy_array, axis=0)
         # Penalize Rg deviation from Guinier values (prevents Rg drift in lognormal model)
         rg_penalty = rg_penalty_scale * np.sum(((rgv_ - rgv) / rgv) ** 2)
         error = np.sum((y - ty) ** 2) + order_penalty + rg_penalty + gap_penalty
@@ -783,12 +823,8 @@ def optimize_sdm_lognormal_xr_decomposition(decomposition, env_params, model_par
     # NNLS finds the exact 1D-fit optimum at the converged shape.
     _x_tI = x - tI_
     _t0_post = x0_ - tI_
-    _A_cols = []
-    for _rg in rgv_:
-        _cy = sdm_lognormal_pore_gamma_pdf_fast(
-            _x_tI, 1.0, N_, T_, k_, me, mp, mu_, sigma_, _rg, N0_, _t0_post)
-        _A_cols.append(_cy)
-    _A_mat = np.array(_A_cols).T
+    _A_mat = sdm_lognormal_pore_gamma_pdf_fast_batch(
+        _x_tI, np.ones(num_components), N_, T_, k_, me, mp, mu_, sigma_, rgv_, N0_, _t0_post).T
     _scales_nnls, _ = _nnls(_A_mat, y)
     scales_ = np.array([max(s, 1e-3) for s in _scales_nnls])
 
@@ -27,20 +27,146 @@ def gaussian(x, A, mu, sigma):
 
 def _egh_impl(x, H, tR, sigma, tau):
     x_  = x - tR
-    s2  = 2 * sigma**2
-    z   = s2 + tau*x_
-    z_neg   = z <= 0
+    z   = 2 * sigma**2 + tau*x_
     z_pos   = z > 0
+    return np.where(z_pos, H * np.exp(-x_**2/np.where(z_pos, z, 1.0)), 0.0)
 
-    zero_part = np.zeros( len(x) )[z_neg]
-    posi_part = H * np.exp( -x_[z_pos]**2/( s2 + tau*x_[z_pos] ) )
+def egh_multi(x, params, out=None):
+    """
+    Evaluates multiple EGH functions in one vectorized pass.
 
-    if tau > 0:
-        parts = [ zero_part, posi_part ]
-    else:
-        parts = [ posi_part, zero_part ]
+    Parameters
+    ----------
+    x : array-like of shape (n,)
+        The input values.
+    params : array-like of shape (m, 4)
+        The parameters (H, tR, sigma, tau) of the m EGH functions.
+    out : ndarray of shape (m, n), optional
+        A preallocated output array, which is useful to avoid allocations
+        in objective functions evaluated many times.
+
+    Returns
+    -------
+    ndarray of shape (m, n)
+        The computed EGH values, where the k-th row equals ``egh(x, *params[k])``.
+    """
+    x = np.asarray(x, dtype=float)
+    params = np.asarray(params, dtype=float).reshape(-1, 4)
+    H = params[:,0,np.newaxis]
+    tR = params[:,1,np.newaxis]
+    sigma = params[:,2,np.newaxis]
+    tau = params[:,3,np.newaxis]
+    if out is None:
+        out = np.empty((len(params), len(x)))
+    x_ = x - tR
+    z = 2 * sigma**2 + tau*x_
+    z_neg = z <= 0
+    z[z_neg] = 1.0
+    np.square(x_, out=out)
+    np.negative(out, out=out)
+    np.divide(out, z, out=out)
+    np.exp(out, out=out)
+    np.multiply(H, out, out=out)
+    out[z_neg] = 0.0
+    return out
+
+def egh_multi_jacobian(x, params):
+    """
+    Evaluates multiple EGH functions and their analytic partial derivatives.
+
+    With ``x_ = x - tR`` and ``z = 2*sigma**2 + tau*x_``, the EGH is
+    ``f = H*exp(g)`` where ``g = -x_**2/z``, so that
+
+    - ``df/dH     = exp(g)``
+    - ``df/dtR    = f*(2*x_/z - tau*x_**2/z**2)``
+    - ``df/dsigma = f*4*sigma*x_**2/z**2``
+    - ``df/dtau   = f*x_**3/z**2``
+
+    which are all zero where ``z <= 0``.
+
+    Parameters
+    ----------
+    x : array-like of shape (n,)
+        The input values.
+    params : array-like of shape (m, 4)
+        The parameters (H, tR, sigma, tau) of the m EGH functions.
+
+    Returns
+    -------
+    values : ndarray of shape (m, n)
+        The computed EGH values, same as from :func:`egh_multi`.
+    jacobian : ndarray of shape (m, 4, n)
+        The partial derivatives, where ``jacobian[k, j]`` is the derivative
+        of the k-th EGH function with respect to its j-th parameter.
+    """
+    x = np.asarray(x, dtype=float)
+    params = np.asarray(params, dtype=float).reshape(-1, 4)
+    H = params[:,0,np.newaxis]
+    tR = params[:,1,np.newaxis]
+    sigma = params[:,2,np.newaxis]
+    tau = params[:,3,np.newaxis]
+    x_ = x - tR
+    z = 2 * sigma**2 + tau*x_
+    z_pos = z > 0
+    z = np.where(z_pos, z, 1.0)
+    x2_z = x_**2/z
+    e = np.where(z_pos, np.exp(-x2_z), 0.0)
+    f = H * e
+    f_z = f/z
+    jacobian = np.empty((len(params), 4, len(x)))
+    jacobian[:,0,:] = e
+    jacobian[:,1,:] = f_z*(2*x_ - tau*x2_z)
+    jacobian[:,2,:] = f_z*4*sigma*x2_z
+    jacobian[:,3,:] = f_z*x_*x2_z
+    return f, jacobian
+
+_egh_multi_numba_impl = None
+
+def egh_multi_numba(x, params, out=None):
+    """
+    A Numba-compiled variant of :func:`egh_multi`.
+
+    It is compiled on the first call, which takes a few seconds,
+    and is worth using only for objective functions evaluated many times.
+
+    Parameters
+    ----------
+    x : array-like of shape (n,)
+        The input values.
+    params : array-like of shape (m, 4)
+        The parameters (H, tR, sigma, tau) of the m EGH functions.
+    out : ndarray of shape (m, n), optional
+        A preallocated output array.
+
+    Returns
+    -------
+    ndarray of shape (m, n)
+        The computed EGH values.
+    """
+    global _egh_multi_numba_impl
+    if _egh_multi_numba_impl is None:
+        from molass.PackageUtils.NumbaUtils import get_ready_for_numba
+        get_ready_for_numba()
+        from numba import njit
+
+        @njit(cache=False)
+        def impl(x, params, out):
+            for k in range(params.shape[0]):
+                H, tR, sigma, tau = params[k,0], params[k,1], params[k,2], params[k,3]
+                s2 = 2 * sigma**2
+                for i in range(x.shape[0]):
+                    x_ = x[i] - tR
+                    z = s2 + tau*x_
+                    out[k,i] = H * np.exp(-x_**2/z) if z > 0 else 0.0
+            return out
+
+        _egh_multi_numba_impl = impl
 
-    return np.hstack( parts )
+    x = np.ascontiguousarray(x, dtype=float)
+    params = np.ascontiguousarray(params, dtype=float).reshape(-1, 4)
+    if out is None:
+        out = np.empty((len(params), len(x)))
+    return _egh_multi_numba_impl(x, params, out)
 
 def egh(x, H, tR, sigma, tau):
     """
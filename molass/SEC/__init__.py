@@ -3,4 +3,6 @@
 """
 
 from .ColumnSimulation import get_animation
-from .PoreEntryAnimation import get_pore_entry_animation, run_simulation as run_pore_simulation
\ No newline at end of file
+from .PoreEntryAnimation import get_pore_entry_animation, run_simulation as run_pore_simulation
+from .ColumnEngine import ColumnEngine, simulate_column
+from .ColumnEnsemble import run_column_ensemble, aggregate_column_stats, compute_sdm_exit_pdf
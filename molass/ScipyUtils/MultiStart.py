@@ -0,0 +1,120 @@
+"""
+ScipyUtils.MultiStart.py
+
+Multi-start local optimization, optionally running the starts in a
+process pool.  The objective must be picklable for the parallel mode,
+i.e., a module-level function or an instance of a module-level class.
+"""
+import numpy as np
+
+def make_random_starts(x0, bounds, num_starts, scale=0.1, seed=None):
+    """
+    Make randomized starting points around a given point.
+
+    Each parameter is perturbed by a normal deviate of relative size
+    ``scale`` (absolute size for parameters equal to zero) and clipped
+    into the finite parts of its bounds.
+
+    Parameters
+    ----------
+    x0 : array-like
+        The point around which the starts are made.
+    bounds : list of tuple or None
+        The ``(min, max)`` bounds as used with ``scipy.optimize.minimize``,
+        where None means unbounded.
+    num_starts : int
+        The number of starts to make.
+    scale : float, optional
+        The relative standard deviation of the perturbations.
+    seed : int or None, optional
+        The random seed.
+
+    Returns
+    -------
+    list of ndarray
+        The starting points.
+    """
+    x0 = np.asarray(x0, dtype=float)
+    rng = np.random.default_rng(seed)
+    if bounds is None:
+        lower = np.full(len(x0), -np.inf)
+        upper = np.full(len(x0), np.inf)
+    else:
+        lower = np.array([-np.inf if b[0] is None else b[0] for b in bounds], dtype=float)
+        upper = np.array([np.inf if b[1] is None else b[1] for b in bounds], dtype=float)
+    sizes = np.where(x0 != 0, np.abs(x0), 1.0) * scale
+    starts = []
+    for _ in range(num_starts):
+        start = x0 + rng.normal(0, 1, len(x0)) * sizes
+        starts.append(np.clip(start, lower, upper))
+    return starts
+
+def _minimize_worker(objective, start, minimize_kwargs):
+    from scipy.optimize import minimize
+    return minimize(objective, start, **minimize_kwargs)
+
+def minimize_multistart(objective, starts, n_jobs=None, callback_done=None, **minimize_kwargs):
+    """
+    Run ``scipy.optimize.minimize`` from each of the starts.
+
+    Parameters
+    ----------
+    objective : callable
+        The objective function, which must be picklable when ``n_jobs``
+        implies more than one worker.
+    starts : list of array-like
+        The starting points.
+    n_jobs : int or None, optional
+        The number of worker processes. None or 1 runs the starts serially
+        in this process, -1 uses all CPUs.
+    callback_done : callable, optional
+        Called as ``callback_done(k, result)`` when the k-th start has finished.
+    minimize_kwargs : dict
+        Keyword arguments passed to ``scipy.optimize.minimize``.
+
+    Returns
+    -------
+    results : list of OptimizeResult
+        The results in the order of the starts.  Since each start is a
+        deterministic local optimization, they are identical whether run
+        serially or in parallel.
+    """
+    from molass.PackageUtils.ParallelUtils import get_num_workers
+    num_workers = min(get_num_workers(n_jobs), max(1, len(starts)))
+    results = [None] * len(starts)
+    if num_workers == 1:
+        for k, start in enumerate(starts):
+            results[k] = _minimize_worker(objective, start, minimize_kwargs)
+            if callback_done is not None:
+                callback_done(k, results[k])
+    else:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            future_dict = {executor.submit(_minimize_worker, objective, start, minimize_kwargs): k
+                           for k, start in enumerate(starts)}
+            for future in as_completed(future_dict):
+                k = future_dict[future]
+                results[k] = future.result()
+                if callback_done is not None:
+                    callback_done(k, results[k])
+    return results
+
+def select_best(results):
+    """
+    Select the result with the lowest objective value.
+
+    Parameters
+    ----------
+    results : list of OptimizeResult
+        The results of :func:`minimize_multistart`.
+
+    Returns
+    -------
+    OptimizeResult
+        The first result among those with the lowest ``fun``.
+    """
+    best = None
+    for result in results:
+        if best is None or result.fun < best.fun:
+            best = result
+    return best
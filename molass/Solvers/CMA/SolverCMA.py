@@ -41,11 +41,25 @@ class SolverCMA:
         `accept_test`.
     sigma0 : float, optional
         Initial step size in normalized [0,10] space.  Default 2.0.
+    n_jobs : int or None, optional
+        Number of worker processes over which the candidates of each
+        generation are evaluated, each worker holding its own replica of
+        the optimizer (see :mod:`molass.Solvers.PopulationPool`).
+        None → the ``solver_n_jobs`` global option; None or 1 evaluates
+        serially, -1 uses all CPUs.
+    popsize : int or None, optional
+        Population size.  None → the pycma default 4 + 3*ln(n), i.e. 15 for
+        50 params.  A multiple of n_jobs keeps all workers busy.
     """
 
-    def __init__(self, optimizer, sigma0=DEFAULT_SIGMA0):
+    def __init__(self, optimizer, sigma0=DEFAULT_SIGMA0, n_jobs=None, popsize=None):
         self.optimizer = optimizer
         self.sigma0 = sigma0
+        if n_jobs is None:
+            from molass.Global.Options import get_molass_options
+            n_jobs = get_molass_options('solver_n_jobs')
+        self.n_jobs = n_jobs
+        self.popsize = popsize
 
     def minimize(self, objective, init_params, niter=100, seed=1234,
                  bounds=None, narrow_bounds=False, show_history=False):
@@ -103,6 +117,8 @@ class SolverCMA:
         opts['maxfevals'] = max_fevals
         opts['seed'] = seed
         opts['verbose'] = -9      # silent — logging handled by optimizer
+        if self.popsize is not None:
+            opts['popsize'] = self.popsize
 
         es = cma.CMAEvolutionStrategy(init_params.tolist(), self.sigma0, opts)
 
@@ -111,30 +127,34 @@ class SolverCMA:
         best_fv = np.inf
         best_x = init_params.copy()
 
-        while not es.stop():
-            solutions = es.ask()
-            fitnesses = [objective(np.array(x)) for x in solutions]
-            es.tell(solutions, fitnesses)
-
-            gen_best_idx = int(np.argmin(fitnesses))
-            gen_best_fv = fitnesses[gen_best_idx]
-            gen_best_x = np.array(solutions[gen_best_idx])
-
-            if gen_best_fv < best_fv:
-                best_fv = gen_best_fv
-                best_x = gen_best_x.copy()
-                minima_callback(best_x, best_fv, True)
-
-            # Cooperative stop: check the stop signal every generation, not just
-            # on improvement.  Without this, a converged CMA run (no new best)
-            # never calls minima_callback, so request_stop() / Terminate button
-            # has no effect until the ctypes KI injection fires — which can fail
-            # if pycma is inside a C extension holding the GIL.  This makes the
-            # dashboard hang at "Status: Terminating..." indefinitely.
-            # (molass-library#170)
-            if (getattr(self.optimizer, '_stop_event', None) is not None
-                    and self.optimizer._stop_event.is_set()):
-                break
+        # The candidates of a generation are independent, so that they can be
+        # evaluated in parallel; the ask/tell loop itself stays here.
+        from molass.Solvers.PopulationPool import PopulationPool
+        with PopulationPool(objective, n_jobs=self.n_jobs, optimizer=self.optimizer) as pool:
+            while not es.stop():
+                solutions = es.ask()
+                fitnesses = pool.evaluate(solutions)
+                es.tell(solutions, fitnesses)
+
+                gen_best_idx = int(np.argmin(fitnesses))
+                gen_best_fv = fitnesses[gen_best_idx]
+                gen_best_x = np.array(solutions[gen_best_idx])
+
+                if gen_best_fv < best_fv:
+                    best_fv = gen_best_fv
+                    best_x = gen_best_x.copy()
+                    minima_callback(best_x, best_fv, True)
+
+                # Cooperative stop: check the stop signal every generation, not just
+                # on improvement.  Without this, a converged CMA run (no new best)
+                # never calls minima_callback, so request_stop() / Terminate button
+                # has no effect until the ctypes KI injection fires — which can fail
+                # if pycma is inside a C extension holding the GIL.  This makes the
+                # dashboard hang at "Status: Terminating..." indefinitely.
+                # (molass-library#170)
+                if (getattr(self.optimizer, '_stop_event', None) is not None
+                        and self.optimizer._stop_event.is_set()):
+                    break
 
         r = es.result
         return OptimizeResult(
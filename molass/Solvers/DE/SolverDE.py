@@ -13,7 +13,9 @@
     Notes
     -----
     DE is a population-based method: every generation evaluates `pop_size`
-    candidate solutions in sequence.  The evaluation budget is:
+    candidate solutions, in sequence by default, or over a process pool of
+    optimizer replicas with ``n_jobs`` (see :mod:`molass.Solvers.PopulationPool`),
+    or in one call of a vectorized objective.  The evaluation budget is:
         max_fevals = niter * FEVALS_PER_NITER
         max_gen    = max_fevals // pop_size   (≥ 1)
 
@@ -51,16 +53,29 @@ class SolverDE:
     F : float or tuple
         Differential weight (mutation factor).  A tuple ``(F_min, F_max)``
         enables dithering.
+    n_jobs : int or None
+        Number of worker processes over which each generation is evaluated.
+        None → the ``solver_n_jobs`` global option; None or 1 evaluates
+        serially, -1 uses all CPUs.
+    vectorized : bool
+        If True, the objective is called once per generation with the
+        population matrix of shape (pop_size, n_var) and returns the
+        pop_size values.  ``n_jobs`` is then ignored.
     """
 
     def __init__(self, optimizer, pop_size=None, variant="DE/rand/1/bin",
-                 CR=0.5, F=0.5, warm_sigma=1.0):
+                 CR=0.5, F=0.5, warm_sigma=1.0, n_jobs=None, vectorized=False):
         self.optimizer = optimizer
         self._pop_size = pop_size
         self.variant = variant
         self.CR = CR
         self.F = F
         self.warm_sigma = warm_sigma
+        if n_jobs is None:
+            from molass.Global.Options import get_molass_options
+            n_jobs = get_molass_options('solver_n_jobs')
+        self.n_jobs = n_jobs
+        self.vectorized = vectorized
 
     def minimize(self, objective, init_params, niter=100, seed=1234,
                  bounds=None, narrow_bounds=False, show_history=False):
@@ -92,11 +107,14 @@ class SolverDE:
             ``.fun`` — objective value at best x
             ``.nit`` — number of DE generations completed
             ``.nfev``— total function evaluations
+            ``.timings`` — per-generation evaluation and overhead wall times,
+            see :meth:`~molass.Solvers.PopulationPool.GenerationTimer.as_dict`
         """
         from pymoo.algorithms.soo.nonconvex.de import DE
         from pymoo.core.problem import Problem
         from pymoo.core.termination import NoTermination
         from pymoo.problems.static import StaticProblem
+        from molass.Solvers.PopulationPool import PopulationPool, GenerationTimer
 
         n = len(init_params)
 
@@ -140,31 +158,37 @@ class SolverDE:
         n_gen = 0
         n_fev = 0
 
-        while algorithm.has_next() and n_gen < max_gen:
-            infills = algorithm.ask()
-            X = infills.get("X")
-
-            # evaluate each candidate sequentially (objective is not vectorised)
-            F_vals = np.array([float(objective(x)) for x in X], dtype=float)
-            n_fev += len(F_vals)
-
-            algorithm.evaluator.eval(
-                StaticProblem(problem, F=F_vals[:, None]), infills
-            )
-            algorithm.tell(infills=infills)
-            n_gen += 1
-
-            # track best
-            gen_best_idx = int(np.argmin(F_vals))
-            gen_best_fv = float(F_vals[gen_best_idx])
-            if gen_best_fv < best_fv:
-                best_fv = gen_best_fv
-                best_x = X[gen_best_idx].copy()
-                minima_callback(best_x, best_fv, True)
-
-            # cooperative stop (Terminate button)
-            if stop_event is not None and stop_event.is_set():
-                break
+        timer = GenerationTimer()
+        with PopulationPool(objective, n_jobs=self.n_jobs, optimizer=self.optimizer,
+                            vectorized=self.vectorized) as pool:
+            while algorithm.has_next() and n_gen < max_gen:
+                timer.start()
+                infills = algorithm.ask()
+                X = infills.get("X")
+
+                # evaluate the whole population in one step (see PopulationPool)
+                with timer.evaluating():
+                    F_vals = np.array(pool.evaluate(X), dtype=float)
+                n_fev += len(F_vals)
+
+                algorithm.evaluator.eval(
+                    StaticProblem(problem, F=F_vals[:, None]), infills
+                )
+                algorithm.tell(infills=infills)
+                n_gen += 1
+
+                # track best
+                gen_best_idx = int(np.argmin(F_vals))
+                gen_best_fv = float(F_vals[gen_best_idx])
+                if gen_best_fv < best_fv:
+                    best_fv = gen_best_fv
+                    best_x = X[gen_best_idx].copy()
+                    minima_callback(best_x, best_fv, True)
+                timer.stop()
+
+                # cooperative stop (Terminate button)
+                if stop_event is not None and stop_event.is_set():
+                    break
 
         # pymoo's algorithm.opt holds the current best population member
         opt = algorithm.opt[0]
@@ -183,6 +207,7 @@ class SolverDE:
             nfev=n_fev,
             message="DE finished after %d generations, %d fevals" % (n_gen, n_fev),
             success=True,
+            timings=timer.as_dict(),
         )
 
 
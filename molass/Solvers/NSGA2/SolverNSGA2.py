@@ -47,6 +47,47 @@ _NEG_PENALTY_IDX = 8   # index 8 in score_list_with_penalties
 FEVALS_PER_NITER = 200
 
 
+def evaluate_scores(optimizer, x):
+    """Evaluate the NSGA-II objectives and constraint of one individual.
+
+    A module-level function so that it can be run by optimizer replicas in
+    worker processes (see :mod:`molass.Solvers.PopulationPool`).
+
+    Parameters
+    ----------
+    optimizer : BasicOptimizer
+        The optimizer or its replica.
+    x : ndarray
+        Parameter vector in normalized [0, 10] space.
+
+    Returns
+    -------
+    F : ndarray of shape (N_OBJ,)
+        The 7 major scores, NaN replaced by 1e6.
+    G : ndarray of shape (1,)
+        negative_penalty as the inequality constraint G ≤ 0.
+    """
+    # objective_func(real_params, return_full=True) returns
+    # (fv, score_list_with_penalties, *matrices)
+    # score_list_with_penalties[0:N_OBJ] are the 7 raw scores.
+    real_params = optimizer.to_real_params(x)
+    with optimizer._objective_lock:
+        result = optimizer.objective_func(real_params, return_full=True)
+    if isinstance(result, tuple) and len(result) >= 2:
+        score_list = np.array(result[1], dtype=float)
+        # 7 major scores as objectives
+        F = score_list[:N_OBJ].copy()
+        F = np.where(np.isnan(F), 1e6, F)
+        # negative_penalty as inequality constraint G ≤ 0
+        neg_penalty = score_list[_NEG_PENALTY_IDX] if len(score_list) > _NEG_PENALTY_IDX else 0.0
+        G = np.array([float(neg_penalty)])
+    else:
+        fv = float(result) if not isinstance(result, tuple) else float(result[0])
+        F = np.full(N_OBJ, fv)
+        G = np.array([0.0])
+    return F, G
+
+
 class SolverNSGA2:
     """NSGA-II solver using pymoo.
 
@@ -61,11 +102,19 @@ class SolverNSGA2:
         Fully constructed optimizer with `objective_func` and `minima_callback`.
     pop_size : int
         NSGA-II population size.  Default 100.
+    n_jobs : int or None
+        Number of worker processes over which each generation is evaluated,
+        each holding a replica of the optimizer.  None → the ``solver_n_jobs``
+        global option; None or 1 evaluates serially, -1 uses all CPUs.
     """
 
-    def __init__(self, optimizer, pop_size=100):
+    def __init__(self, optimizer, pop_size=100, n_jobs=None):
         self.optimizer = optimizer
         self.pop_size = pop_size
+        if n_jobs is None:
+            from molass.Global.Options import get_molass_options
+            n_jobs = get_molass_options('solver_n_jobs')
+        self.n_jobs = n_jobs
 
     def minimize(self, objective, init_params, niter=100, seed=1234,
                  bounds=None, narrow_bounds=False, show_history=False):
@@ -92,12 +141,15 @@ class SolverNSGA2:
             `.fun` — synthesized fv at that point
             `.nit` — NSGA-II generations completed
             `.nfev`— total function evaluations
+            `.timings` — per-generation evaluation and overhead wall times,
+            see :meth:`~molass.Solvers.PopulationPool.GenerationTimer.as_dict`
         """
         from pymoo.algorithms.moo.nsga2 import NSGA2
-        from pymoo.core.problem import ElementwiseProblem
+        from pymoo.core.problem import Problem
         from pymoo.core.termination import NoTermination
         from pymoo.optimize import minimize as pymoo_minimize
         from molass_legacy.Optimizer.FvSynthesizer import synthesize
+        from molass.Solvers.PopulationPool import PopulationPool, OptimizerReplica, GenerationTimer
 
         n = len(init_params)
 
@@ -114,15 +166,10 @@ class SolverNSGA2:
             xl = np.zeros(n)
             xu = np.full(n, 10.0)
 
-        # ── multi-objective wrapper ──────────────────────────────────────────
-        # objective_func(real_params, return_full=True) returns
-        # (fv, score_list_with_penalties, *matrices)
-        # score_list_with_penalties[0:N_OBJ] are the 7 raw scores.
-        _objective_func = self.optimizer.objective_func
-        _to_real = self.optimizer.to_real_params
-        _lock = self.optimizer._objective_lock
-
-        class _MultiObjProblem(ElementwiseProblem):
+        # ── multi-objective problem ──────────────────────────────────────────
+        # The whole population is evaluated in one step by evaluate_scores on
+        # the optimizer, or on its replicas in worker processes (pool below).
+        class _MultiObjProblem(Problem):
             def __init__(self_inner):
                 # n_ieq_constr=1: negative_penalty ≤ 0 (satisfied when = 0)
                 # This prevents NSGA-II from exploring solutions with negative
@@ -130,23 +177,10 @@ class SolverNSGA2:
                 # adds negative_penalty directly to fv).
                 super().__init__(n_var=n, n_obj=N_OBJ, n_ieq_constr=1, xl=xl, xu=xu)
 
-            def _evaluate(self_inner, x, out, *args, **kwargs):
-                real_params = _to_real(x)
-                with _lock:
-                    result = _objective_func(real_params, return_full=True)
-                if isinstance(result, tuple) and len(result) >= 2:
-                    score_list = np.array(result[1], dtype=float)
-                    # 7 major scores as objectives
-                    F = score_list[:N_OBJ].copy()
-                    F = np.where(np.isnan(F), 1e6, F)
-                    out["F"] = F
-                    # negative_penalty as inequality constraint G ≤ 0
-                    neg_penalty = score_list[_NEG_PENALTY_IDX] if len(score_list) > _NEG_PENALTY_IDX else 0.0
-                    out["G"] = np.array([float(neg_penalty)])
-                else:
-                    fv = float(result) if not isinstance(result, tuple) else float(result[0])
-                    out["F"] = np.full(N_OBJ, fv)
-                    out["G"] = np.array([0.0])
+            def _evaluate(self_inner, X, out, *args, **kwargs):
+                results = pool.evaluate(X)
+                out["F"] = np.array([F for F, _ in results])
+                out["G"] = np.array([G for _, G in results])
 
         problem = _MultiObjProblem()
 
@@ -183,64 +217,69 @@ class SolverNSGA2:
         algorithm = algorithm.setup(problem, termination=NoTermination(),
                                     seed=seed, verbose=False)
 
-        while algorithm.has_next() and n_gen < max_gen:
-            # ask → evaluate → tell
-            pop = algorithm.ask()
-            # Evaluate each individual (ElementwiseProblem evaluates one at a time)
-            algorithm.evaluator.eval(problem, pop)
-            algorithm.tell(infills=pop)
-            n_gen += 1
-            n_fev += len(pop)
-
-            # Find best synthesized fv on current Pareto front (feasible solutions only)
-            pareto_F = algorithm.result().F if n_gen == max_gen else None
-            pareto_G = algorithm.result().G if n_gen == max_gen else None
-            if pareto_F is None:
-                # Mid-run: use current population's non-dominated front
-                try:
-                    from pymoo.util.nds.non_dominated_sorting import NonDominatedSorting
-                    nds = NonDominatedSorting()
-                    all_F = pop.get("F")
-                    all_G = pop.get("G")
-                    # Consider only feasible individuals (G ≤ 0) for Pareto ranking
-                    feasible = np.all(all_G <= 0, axis=1)
-                    if np.any(feasible):
-                        fronts = nds.do(all_F[feasible])
-                        fidx = np.where(feasible)[0][fronts[0]]
-                    else:
-                        # No feasible solution yet — fall back to full population
-                        fronts = nds.do(all_F)
-                        fidx = fronts[0]
-                    front0_F = all_F[fidx]
-                    front0_G = all_G[fidx]
-                    front0_X = pop.get("X")[fidx]
-                except Exception:
-                    front0_F = pop.get("F")
-                    front0_G = pop.get("G")
-                    front0_X = pop.get("X")
-            else:
-                front0_F = pareto_F
-                front0_G = pareto_G if pareto_G is not None else np.zeros((len(pareto_F), 1))
-                front0_X = algorithm.result().X
-
-            # synthesize() on the 7 scores + add negative_penalty (G[:,0]) so
-            # the callback fv is on the same scale as BH's objective.
-            sv_arr = np.array([
-                synthesize(f, positive_elevate=3) + max(0.0, float(g[0]))
-                for f, g in zip(front0_F, front0_G)
-            ])
-            best_idx = int(np.argmin(sv_arr))
-            gen_best_fv = float(sv_arr[best_idx])
-            gen_best_x = front0_X[best_idx]
-
-            if gen_best_fv < best_fv:
-                best_fv = gen_best_fv
-                best_x = gen_best_x.copy()
-                minima_callback(best_x, best_fv, True)
-
-            # Cooperative stop
-            if stop_event is not None and stop_event.is_set():
-                break
+        timer = GenerationTimer()
+        with PopulationPool(OptimizerReplica(self.optimizer, evaluate_scores), n_jobs=self.n_jobs) as pool:
+            while algorithm.has_next() and n_gen < max_gen:
+                timer.start()
+                # ask → evaluate → tell
+                pop = algorithm.ask()
+                # Evaluate the whole population in one step (see _MultiObjProblem)
+                with timer.evaluating():
+                    algorithm.evaluator.eval(problem, pop)
+                algorithm.tell(infills=pop)
+                n_gen += 1
+                n_fev += len(pop)
+
+                # Find best synthesized fv on current Pareto front (feasible solutions only)
+                pareto_F = algorithm.result().F if n_gen == max_gen else None
+                pareto_G = algorithm.result().G if n_gen == max_gen else None
+                if pareto_F is None:
+                    # Mid-run: use current population's non-dominated front
+                    try:
+                        from pymoo.util.nds.non_dominated_sorting import NonDominatedSorting
+                        nds = NonDominatedSorting()
+                        all_F = pop.get("F")
+                        all_G = pop.get("G")
+                        # Consider only feasible individuals (G ≤ 0) for Pareto ranking
+                        feasible = np.all(all_G <= 0, axis=1)
+                        if np.any(feasible):
+                            fronts = nds.do(all_F[feasible])
+                            fidx = np.where(feasible)[0][fronts[0]]
+                        else:
+                            # No feasible solution yet — fall back to full population
+                            fronts = nds.do(all_F)
+                            fidx = fronts[0]
+                        front0_F = all_F[fidx]
+                        front0_G = all_G[fidx]
+                        front0_X = pop.get("X")[fidx]
+                    except Exception:
+                        front0_F = pop.get("F")
+                        front0_G = pop.get("G")
+                        front0_X = pop.get("X")
+                else:
+                    front0_F = pareto_F
+                    front0_G = pareto_G if pareto_G is not None else np.zeros((len(pareto_F), 1))
+                    front0_X = algorithm.result().X
+
+                # synthesize() on the 7 scores + add negative_penalty (G[:,0]) so
+                # the callback fv is on the same scale as BH's objective.
+                sv_arr = np.array([
+                    synthesize(f, positive_elevate=3) + max(0.0, float(g[0]))
+                    for f, g in zip(front0_F, front0_G)
+                ])
+                best_idx = int(np.argmin(sv_arr))
+                gen_best_fv = float(sv_arr[best_idx])
+                gen_best_x = front0_X[best_idx]
+
+                if gen_best_fv < best_fv:
+                    best_fv = gen_best_fv
+                    best_x = gen_best_x.copy()
+                    minima_callback(best_x, best_fv, True)
+                timer.stop()
+
+                # Cooperative stop
+                if stop_event is not None and stop_event.is_set():
+                    break
 
         return OptimizeResult(
             x=best_x,
@@ -249,4 +288,5 @@ class SolverNSGA2:
             nfev=n_fev,
             message="NSGA-II finished: %d gen, %d fevals" % (n_gen, n_fev),
             success=True,
+            timings=timer.as_dict(),
         )
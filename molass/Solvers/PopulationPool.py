@@ -0,0 +1,255 @@
+"""
+    molass.Solvers.PopulationPool
+
+    Parallel evaluation of the candidates of a generation for the
+    population-based solvers (CMA, DE, NSGA2).
+
+    The candidates are spread over a process pool in which each worker holds
+    its own replica of the objective, i.e., its own copy of the optimizer
+    state, made once when the worker starts.  Each candidate then costs only
+    the transfer of its parameter vector and of the resulting value.
+    Alternatively, a vectorized objective is called once with the whole
+    population matrix.
+
+    Copyright (c) 2026, SAXS Team, KEK-PF
+"""
+import pickle
+import threading
+from time import perf_counter
+import numpy as np
+
+_replica = None     # the objective replica of a worker process
+
+
+def _init_replica(replica):
+    global _replica
+    _replica = replica
+
+
+def _evaluate_replica(x):
+    return _replica(x)
+
+
+class OptimizerReplica:
+    """Picklable copy of the objective method of an optimizer.
+
+    ``BasicOptimizer.objective_func_wrapper`` is a bound method of an
+    optimizer which also holds a lock, the callback file handle and the
+    shared memory of the dashboard, none of which can be pickled.  This
+    pickles the rest of the optimizer state, which is what the objective
+    depends on, and gives the replica new locks.  The other unpicklable
+    attributes are set to None in the replica, except those overriding a
+    class attribute, which fall back to it.
+
+    Parameters
+    ----------
+    optimizer : object
+        The optimizer to be replicated.
+    method : str or callable
+        The name of the objective method, e.g., ``'objective_func_wrapper'``,
+        or a module-level function called as ``method(optimizer, x)``.
+    """
+
+    def __init__(self, optimizer, method):
+        self.optimizer = optimizer
+        self.method = method
+
+    def __getstate__(self):
+        state = {}
+        locks = {}
+        skipped = []
+        for name, value in vars(self.optimizer).items():
+            if isinstance(value, (type(threading.Lock()), type(threading.RLock()))):
+                locks[name] = isinstance(value, type(threading.RLock()))
+                continue
+            try:
+                pickle.dumps(value)
+            except Exception:
+                skipped.append(name)
+                continue
+            state[name] = value
+        return dict(cls=type(self.optimizer), state=state, locks=locks, skipped=skipped,
+                    method=self.method)
+
+    def __setstate__(self, d):
+        optimizer = d['cls'].__new__(d['cls'])
+        optimizer.__dict__.update(d['state'])
+        for name, reentrant in d['locks'].items():
+            setattr(optimizer, name, threading.RLock() if reentrant else threading.Lock())
+        for name in d['skipped']:
+            # e.g. a CachedObjective replacing objective_func falls back to the method
+            if not hasattr(d['cls'], name):
+                setattr(optimizer, name, None)
+        self.optimizer = optimizer
+        self.method = d['method']
+
+    def __call__(self, x):
+        if isinstance(self.method, str):
+            return getattr(self.optimizer, self.method)(x)
+        return self.method(self.optimizer, x)
+
+
+def make_objective_replica(objective):
+    """Return a picklable object which evaluates the objective.
+
+    Parameters
+    ----------
+    objective : callable
+        A picklable callable, e.g., a module-level function, or a method of
+        an optimizer, e.g., ``optimizer.objective_func_wrapper``.
+
+    Returns
+    -------
+    callable
+        The objective itself if it can be pickled, otherwise an
+        :class:`OptimizerReplica` of its optimizer.
+    """
+    try:
+        pickle.dumps(objective)
+        return objective
+    except Exception:
+        pass
+    owner = getattr(objective, '__self__', None)
+    if owner is None or not hasattr(owner, '__dict__'):
+        raise ValueError("parallel evaluation requires a picklable objective or a method of an optimizer, got %r" % objective)
+    return OptimizerReplica(owner, objective.__name__)
+
+
+class PopulationPool:
+    """Evaluator of the candidates of a generation, serial or over replicas.
+
+    Parameters
+    ----------
+    objective : callable
+        Objective function f(x) → scalar.
+    n_jobs : int or None, optional
+        The number of worker processes.  None or 1 evaluates the candidates
+        serially in this process, -1 uses all CPUs.
+    optimizer : object, optional
+        The optimizer whose ``eval_counter`` is to be advanced for the
+        evaluations done by the replicas, which count only their own, or
+        by the vectorized objective.
+    vectorized : bool, optional
+        If True, the objective is called once per generation with the
+        population matrix of shape (n, n_var) and must return the n values,
+        and ``n_jobs`` is ignored.
+
+    Examples
+    --------
+    >>> with PopulationPool(objective, n_jobs=-1, optimizer=optimizer) as pool:
+    ...     fitnesses = pool.evaluate(solutions)
+    """
+
+    def __init__(self, objective, n_jobs=None, optimizer=None, vectorized=False):
+        from molass.PackageUtils.ParallelUtils import get_num_workers
+        self.objective = objective
+        self.optimizer = optimizer
+        self.vectorized = vectorized
+        self.num_workers = 1 if vectorized else get_num_workers(n_jobs)
+        self.executor = None
+        if self.num_workers > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            replica = make_objective_replica(objective)
+            self.executor = ProcessPoolExecutor(max_workers=self.num_workers,
+                                                initializer=_init_replica, initargs=(replica,))
+
+    def evaluate(self, solutions):
+        """Evaluate the candidates.
+
+        Parameters
+        ----------
+        solutions : sequence of array-like
+            The candidate parameter vectors.
+
+        Returns
+        -------
+        list of float
+            The objective values in the order of the candidates, which are
+            the same whether evaluated serially or in parallel.
+        """
+        if self.vectorized:
+            fitnesses = list(self.objective(np.array(solutions)))
+        else:
+            X = [np.array(x) for x in solutions]
+            if self.executor is None:
+                return [self.objective(x) for x in X]
+            fitnesses = list(self.executor.map(_evaluate_replica, X))
+        # unlike objective_func_wrapper in this process, these do not count
+        if self.optimizer is not None and hasattr(self.optimizer, 'eval_counter'):
+            self.optimizer.eval_counter += len(fitnesses)
+        return fitnesses
+
+    def close(self):
+        """Shut down the worker processes, if any."""
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class GenerationTimer:
+    """Per-generation wall time split into evaluation and algorithm overhead.
+
+    Examples
+    --------
+    >>> timer = GenerationTimer()
+    >>> while ...:
+    ...     timer.start()
+    ...     X = algorithm.ask()
+    ...     with timer.evaluating():
+    ...         F = pool.evaluate(X)
+    ...     algorithm.tell(F)
+    ...     timer.stop()
+    >>> timer.as_dict()
+    """
+
+    def __init__(self):
+        self.eval_times = []
+        self.total_times = []
+        self._t0 = None
+        self._eval = 0.0
+
+    def start(self):
+        """Mark the start of a generation."""
+        self._t0 = perf_counter()
+        self._eval = 0.0
+
+    def evaluating(self):
+        """Return a context manager measuring an evaluation of this generation."""
+        from contextlib import contextmanager
+
+        @contextmanager
+        def _measure():
+            t = perf_counter()
+            try:
+                yield
+            finally:
+                self._eval += perf_counter() - t
+
+        return _measure()
+
+    def stop(self):
+        """Mark the end of a generation."""
+        self.total_times.append(perf_counter() - self._t0)
+        self.eval_times.append(self._eval)
+
+    def as_dict(self):
+        """Return the timings.
+
+        Returns
+        -------
+        dict
+            ``eval`` and ``overhead`` (the rest of the generation, i.e.,
+            ask, tell, Pareto ranking and callbacks), arrays in seconds with
+            one value per generation, and their totals ``eval_total`` and
+            ``overhead_total``.
+        """
+        eval_times = np.array(self.eval_times)
+        overhead = np.array(self.total_times) - eval_times
+        return dict(eval=eval_times, overhead=overhead,
+                    eval_total=float(eval_times.sum()), overhead_total=float(overhead.sum()))
@@ -0,0 +1,77 @@
+"""Tests for DataUtils.LoadCache — binary cache of XR folder loads."""
+import os
+import numpy as np
+import pytest
+from molass.DataUtils.LoadCache import load_xr_cached, load_uv_cached, clear_load_cache
+
+
+def _write_frames(folder, num_frames=5, n_q=50, scale=1.0):
+    qv = np.linspace(0.01, 0.3, n_q)
+    for j in range(num_frames):
+        data = np.array([qv, scale*(j + 1)*np.exp(-qv*10), np.full(n_q, 0.01)]).T
+        np.savetxt(os.path.join(folder, "frame_%05d.dat" % j), data)
+
+
+@pytest.fixture
+def folders(tmp_path):
+    data_folder = tmp_path / "data"
+    cache_dir = tmp_path / "cache"
+    data_folder.mkdir()
+    _write_frames(str(data_folder))
+    return str(data_folder), str(cache_dir)
+
+
+def test_second_load_is_memory_mapped(folders):
+    data_folder, cache_dir = folders
+    xr_array1, datafiles1 = load_xr_cached(data_folder, cache_dir=cache_dir)
+    assert not isinstance(xr_array1, np.memmap)
+    xr_array2, datafiles2 = load_xr_cached(data_folder, cache_dir=cache_dir)
+    assert isinstance(xr_array2, np.memmap)
+    assert datafiles2 == datafiles1
+    assert np.array_equal(xr_array1, xr_array2)
+
+
+def test_cached_array_is_copy_on_write(folders):
+    data_folder, cache_dir = folders
+    load_xr_cached(data_folder, cache_dir=cache_dir)
+    xr_array, _ = load_xr_cached(data_folder, cache_dir=cache_dir)
+    xr_array[:,:,1] = 0     # e.g., remove_bubbles modifies the array in place
+    xr_array_, _ = load_xr_cached(data_folder, cache_dir=cache_dir)
+    assert xr_array_[:,:,1].max() > 0
+
+
+def test_invalidated_when_files_change(folders):
+    data_folder, cache_dir = folders
+    xr_array1, _ = load_xr_cached(data_folder, cache_dir=cache_dir)
+    _write_frames(data_folder, num_frames=6, scale=2.0)
+    xr_array2, datafiles2 = load_xr_cached(data_folder, cache_dir=cache_dir)
+    assert not isinstance(xr_array2, np.memmap)
+    assert len(datafiles2) == 6
+    assert np.allclose(xr_array2[0,:,1], 2*xr_array1[0,:,1])
+
+
+def test_clear_load_cache(folders):
+    data_folder, cache_dir = folders
+    load_xr_cached(data_folder, cache_dir=cache_dir)
+    clear_load_cache(data_folder, cache_dir=cache_dir)
+    xr_array, _ = load_xr_cached(data_folder, cache_dir=cache_dir)
+    assert not isinstance(xr_array, np.memmap)
+
+
+def test_uv_cache_respects_disable_uv_data(folders):
+    from molass_legacy._MOLASS.SerialSettings import get_setting, set_setting
+    data_folder, cache_dir = folders
+    wv = np.arange(200, 450, dtype=float)
+    np.savetxt(os.path.join(data_folder, "sample_UV.txt"),
+               np.array([wv] + [np.exp(-(wv - 280)**2/200)*j for j in range(1, 6)]).T)
+    load_uv_cached(data_folder, cache_dir=cache_dir)
+    uvM, wvector, _ = load_uv_cached(data_folder, cache_dir=cache_dir)
+    assert isinstance(uvM, np.memmap)
+    assert uvM.shape == (len(wv), 5)
+    saved = get_setting('disable_uv_data')
+    set_setting('disable_uv_data', True)
+    try:
+        uvM, wvector, conc_file = load_uv_cached(data_folder, cache_dir=cache_dir)
+    finally:
+        set_setting('disable_uv_data', saved)
+    assert uvM is None and conc_file is None
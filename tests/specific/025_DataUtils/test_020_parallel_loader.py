@@ -0,0 +1,37 @@
+"""Tests for DataUtils.XrLoader.load_xr_parallel — concurrent .dat reading."""
+import os
+import numpy as np
+import pytest
+from molass.DataUtils.XrLoader import load_xr, load_xr_parallel
+
+
+def _write_frames(folder, num_frames=8, n_q=50):
+    qv = np.linspace(0.01, 0.3, n_q)
+    for j in range(num_frames):
+        data = np.array([qv, (j + 1)*np.exp(-qv*10), np.full(n_q, 0.01)]).T
+        np.savetxt(os.path.join(folder, "frame_%05d.dat" % j), data)
+
+
+@pytest.mark.parametrize("load_mode", ["threads", "processes"])
+def test_same_as_serial(tmp_path, load_mode):
+    _write_frames(str(tmp_path))
+    xr_array0, datafiles0 = load_xr(str(tmp_path))
+    xr_array1, datafiles1 = load_xr_parallel(str(tmp_path), load_mode=load_mode, n_jobs=2)
+    assert datafiles1 == datafiles0
+    assert np.array_equal(xr_array1, xr_array0)
+
+
+def test_broken_file_is_skipped(tmp_path):
+    _write_frames(str(tmp_path))
+    with open(os.path.join(str(tmp_path), "frame_00003.dat"), "w") as fh:
+        fh.write("not a number\n")
+    xr_array0, datafiles0 = load_xr(str(tmp_path))
+    xr_array1, datafiles1 = load_xr(str(tmp_path), load_mode='threads', n_jobs=2)
+    assert len(datafiles1) == 7
+    assert datafiles1 == datafiles0
+    assert np.array_equal(xr_array1, xr_array0)
+
+
+def test_unknown_mode_raises(tmp_path):
+    with pytest.raises(ValueError):
+        load_xr_parallel(str(tmp_path), load_mode='fibers')
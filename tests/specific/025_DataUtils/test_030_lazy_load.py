@@ -0,0 +1,81 @@
+"""Tests for the lazy loading mode of SecSaxsData."""
+import os
+import numpy as np
+import pytest
+from molass.DataObjects import SecSaxsData
+from molass.DataObjects.LazyData import LazyData
+from molass.DataUtils.XrLoader import scan_xr_header
+
+
+def _write_frames(folder, num_frames=20, n_q=50):
+    qv = np.linspace(0.01, 0.3, n_q)
+    for j in range(num_frames):
+        data = np.array([qv, (j + 1)*np.exp(-qv*10), np.full(n_q, 0.01)]).T
+        np.savetxt(os.path.join(folder, "frame_%05d.dat" % j), data)
+
+
+@pytest.fixture
+def data_folder(tmp_path):
+    _write_frames(str(tmp_path))
+    return str(tmp_path)
+
+
+def test_scan_xr_header(data_folder, tmp_path_factory):
+    header = scan_xr_header(data_folder)
+    assert header['num_frames'] == 20
+    assert header['num_points'] == 50
+    assert np.allclose(header['q_range'], (0.01, 0.3))
+    assert scan_xr_header(str(tmp_path_factory.mktemp("empty")))['num_frames'] == 0
+
+
+def test_lazy_xr_is_loaded_on_first_access(data_folder):
+    ssd = SecSaxsData(data_folder, xr_only=True, lazy=True, xr_pickat=0.05)
+    assert isinstance(ssd.xr, LazyData)
+    assert not ssd.is_loaded()
+    info = ssd.get_header_info()
+    assert info.n_xr_frames == 20 and info.n_xr_points == 50
+    assert not ssd.is_loaded()
+    assert "not loaded" in repr(ssd)
+
+    assert ssd.xr.pickat == 0.05        # kept until loaded
+    assert ssd.xr.M.shape == (50, 20)
+    assert ssd.is_loaded()
+    assert ssd.xr.pickat == 0.05
+    assert len(ssd.datafiles) == 20
+
+
+def test_lazy_matches_eager(data_folder):
+    eager = SecSaxsData(data_folder, xr_only=True)
+    lazy = SecSaxsData(data_folder, xr_only=True, lazy=True)
+    assert np.array_equal(lazy.xr.M, eager.xr.M)
+    assert np.array_equal(lazy.xr.qv, eager.xr.qv)
+    assert lazy.get_header_info() == eager.get_header_info()
+
+
+def test_lazy_data_without_data():
+    proxy = LazyData(lambda: None)
+    assert proxy.materialize() is None
+    assert proxy.is_materialized()
+
+
+def test_lazy_xr_only_folder(data_folder):
+    eager = SecSaxsData(data_folder)
+    ssd = SecSaxsData(data_folder, lazy=True)
+    assert eager.uv is None and ssd.uv is None
+    assert not ssd.has_uv()
+    assert "uv=" not in repr(ssd)
+    assert ssd.get_header_info() == eager.get_header_info()
+    copied = ssd.copy()
+    assert copied.uv is None
+    assert np.array_equal(copied.xr.M, eager.xr.M)
+    ssd.set_baseline_method('linear')
+
+
+def test_lazy_uv_without_data(data_folder):
+    xr_data = SecSaxsData(data_folder, xr_only=True).xr
+    proxy = LazyData(lambda: None)
+    ssd = SecSaxsData(object_list=[xr_data, proxy])
+    assert ssd.uv is proxy
+    proxy.materialize()
+    assert ssd.uv is None
+    assert ssd.copy().uv is None
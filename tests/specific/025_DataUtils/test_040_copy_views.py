@@ -0,0 +1,92 @@
+"""Tests for the copy-on-write view mode of SsMatrixData.copy and SecSaxsData.copy."""
+import numpy as np
+import pytest
+from molass.DataObjects import SecSaxsData
+from molass.DataObjects.XrData import XrData
+
+
+def _make_xr(n_q=30, n_frames=40):
+    rng = np.random.default_rng(0)
+    qv = np.linspace(0.01, 0.3, n_q)
+    M = rng.normal(1.0, 0.1, (n_q, n_frames))
+    E = np.full((n_q, n_frames), 0.01)
+    return XrData(M, qv, np.arange(n_frames), E)
+
+
+def test_view_copy_shares_memory():
+    xr = _make_xr()
+    slices = (slice(2, 25), slice(5, 35))
+    view = xr.copy(slices=slices, view=True)
+    copy = xr.copy(slices=slices)
+    assert np.shares_memory(view.M, xr.M) and np.shares_memory(view.E, xr.E)
+    assert not np.shares_memory(copy.M, xr.M)
+    assert np.array_equal(view.M, copy.M) and np.array_equal(view.E, copy.E)
+    assert view.view_slices == slices and copy.view_slices is None
+    assert view.is_view() and not copy.is_view()
+    assert view.pickat == xr.pickat
+    with pytest.raises(ValueError):
+        view.M[0, 0] = 0.0
+
+
+def test_view_is_copied_on_write():
+    xr = _make_xr()
+    original = xr.M.copy()
+    view = xr.copy(slices=(slice(None), slice(5, 35)), view=True)
+    baseline = np.full(view.M.shape, 0.5)
+    view.subtract_baseline(baseline)
+    assert not np.shares_memory(view.M, xr.M)
+    assert np.array_equal(xr.M, original)
+    assert np.allclose(view.M, original[:, 5:35] - 0.5)
+
+    view.ensure_writable()
+    assert not view.is_view()
+    view.E[0, 0] = 1.0
+    assert xr.E[0, 0] == 0.01
+
+
+def test_secsaxsdata_view_copy():
+    ssd = SecSaxsData(object_list=[_make_xr(), None])
+    trimmed = ssd.copy(xr_slices=(slice(2, 25), slice(5, 35)), view=True)
+    assert trimmed.xr.is_view()
+    assert np.shares_memory(trimmed.xr.M, ssd.xr.M)
+    assert trimmed.xr.M.shape == (23, 30)
+
+
+def test_corrected_copy_is_independent():
+    from molass.Global.Options import get_molass_options, set_molass_options
+    ssd = SecSaxsData(object_list=[_make_xr(), None])
+    assert not get_molass_options('copy_on_write')
+    corrected = ssd.corrected_copy()
+    assert not corrected.xr.is_view()
+    assert not np.shares_memory(corrected.xr.E, ssd.xr.E)
+    corrected.xr.E[0, 0] = 1.0
+    ssd.xr.E[1, 1] = 2.0
+    assert ssd.xr.E[0, 0] == 0.01 and corrected.xr.E[1, 1] == 0.01
+
+    set_molass_options(copy_on_write=True)
+    try:
+        shared = ssd.corrected_copy()
+    finally:
+        set_molass_options(copy_on_write=False)
+    assert shared.xr.is_view() and np.shares_memory(shared.xr.E, ssd.xr.E)
+    assert np.array_equal(shared.xr.M, corrected.xr.M)
+
+
+def test_parent_is_locked_by_view_copy():
+    ssd = SecSaxsData(object_list=[_make_xr(), None])
+    child = ssd.copy(xr_slices=(slice(2, 25), slice(5, 35)), view=True)
+    expected = child.xr.M.copy()
+    assert ssd.xr.is_view()
+    with pytest.raises(ValueError):
+        ssd.xr.M[3, 6] = 0.0
+    ssd.xr.subtract_baseline(np.full(ssd.xr.M.shape, 0.5))
+    ssd.xr.ensure_writable()
+    ssd.xr.M[3, 6] = 0.0
+    ssd.xr.E[3, 6] = 1.0
+    assert np.array_equal(child.xr.M, expected)
+    assert child.xr.E[1, 1] == 0.01
+
+    # transient views, e.g., of astype(), do not lock the parent
+    other = SecSaxsData(object_list=[_make_xr(), None])
+    other.astype(np.float32)
+    other.xr.M[0, 0] = 0.0
@@ -0,0 +1,78 @@
+"""Tests for the incremental ingestion of frames with XrStream."""
+import os
+import threading
+import numpy as np
+from molass.DataObjects import SecSaxsData
+from molass.DataUtils.XrStream import XrStream
+from molass.Guinier.BatchGuinier import fit_guinier_batch
+
+N_FRAMES = 160
+QV = np.linspace(0.005, 0.3, 120)
+
+
+def _frame(j, seed=0):
+    rng = np.random.default_rng(seed + j)
+    c = np.exp(-0.5*((j - 60)/12)**2) + 0.6*np.exp(-0.5*((j - 110)/10)**2) + 0.01
+    y = 10*c*np.exp(-(QV*30)**2/3)
+    e = 0.01*y + 1e-4
+    return np.array([QV, y + e*rng.normal(size=len(QV)), e]).T
+
+
+def _write_frame(folder, j):
+    # the simulated beamline writer
+    np.savetxt(os.path.join(folder, "frame_%05d.dat" % j), _frame(j))
+
+
+def _poll_all(stream):
+    # the last file is ingested by the poll after the one which first sees it
+    return stream.poll() + stream.poll()
+
+
+def test_incremental_matches_batch(tmp_path):
+    folder = str(tmp_path)
+    stream = XrStream(folder, capacity=16)
+    for start, stop in [(0, 5), (5, 40), (40, 41), (41, 100), (100, N_FRAMES)]:
+        for j in range(start, stop):
+            _write_frame(folder, j)
+        assert _poll_all(stream) == stop - start
+        xr = SecSaxsData(folder, xr_only=True).xr
+        assert np.array_equal(stream.M, xr.M)
+        assert np.allclose(stream.get_recognition_curve().y, xr.get_recognition_curve().y)
+        assert stream.detect_peaks() == xr.detect_peaks()
+    assert stream.num_frames == N_FRAMES
+    assert stream.detect_peaks() == [60, 110]
+    rg, score = stream.get_rg()
+    expected = fit_guinier_batch(xr.qv, xr.M, xr.E)
+    assert np.allclose(rg, expected.rg, equal_nan=True)
+    assert np.allclose(score, expected.score)
+    ssd = stream.get_secsaxsdata()
+    assert np.array_equal(ssd.xr.M, xr.M) and len(ssd.datafiles) == N_FRAMES
+
+
+def test_incomplete_frame_is_deferred(tmp_path):
+    folder = str(tmp_path)
+    for j in range(3):
+        _write_frame(folder, j)
+    with open(os.path.join(folder, "frame_%05d.dat" % 3), "w") as fh:
+        fh.write("0.005 1.0 0.01\n")     # being written
+    stream = XrStream(folder)
+    assert _poll_all(stream) == 3
+    assert stream.M.shape == (len(QV), 3)
+    _write_frame(folder, 3)
+    assert _poll_all(stream) == 1
+
+
+def test_watch_with_writer_thread(tmp_path):
+    folder = str(tmp_path)
+
+    def writer():
+        for j in range(50):
+            _write_frame(folder, j)
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    stream = XrStream(folder, guinier=False)
+    num_frames = stream.watch(interval=0.05, idle_timeout=2.0)
+    thread.join()
+    assert num_frames == 50
+    assert np.array_equal(stream.M, SecSaxsData(folder, xr_only=True).xr.M)
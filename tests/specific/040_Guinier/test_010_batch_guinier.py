@@ -0,0 +1,72 @@
+"""Tests for Guinier.BatchGuinier and the parallel SimpleGuinier path."""
+import numpy as np
+import pytest
+from molass.Guinier.BatchGuinier import fit_guinier_batch
+from molass.Guinier.RgCurveUtils import compute_simple_guinier_list, compute_rg_curve_batch
+
+
+def _make_data(rgs, n_q=400, noise=0.01, seed=0):
+    """Build (qv, D, E) with one Guinier-like scattering curve per frame."""
+    rng = np.random.default_rng(seed)
+    qv = np.linspace(0.005, 0.3, n_q)
+    n = len(rgs)
+    D = np.empty((n_q, n))
+    E = np.empty((n_q, n))
+    for j, rg in enumerate(rgs):
+        c = 1.0 + j*0.1
+        y = c*np.exp(-(qv*rg)**2/3)
+        E[:,j] = noise*y + 1e-5
+        D[:,j] = y + E[:,j]*rng.normal(size=n_q)
+    return qv, D, E
+
+
+class TestFitGuinierBatch:
+    def test_recovers_rg(self):
+        rgs = [20.0, 30.0, 45.0, 60.0]
+        qv, D, E = _make_data(rgs)
+        result = fit_guinier_batch(qv, D, E)
+        assert np.allclose(result.rg, rgs, rtol=0.02)
+        assert np.all(result.score > 0.9)
+        assert np.all(result.qrg_max <= 1.3 + 1e-6)
+
+    def test_failed_frame_is_nan(self):
+        qv, D, E = _make_data([30.0, 30.0])
+        D[:,1] = -1.0     # no positive intensities
+        result = fit_guinier_batch(qv, D, E)
+        assert np.isfinite(result.rg[0])
+        assert np.isnan(result.rg[1])
+        assert result.score[1] == 0
+
+    def test_rgcurve_and_progress_cb(self):
+        qv, D, E = _make_data([25.0, 35.0, 45.0])
+        jv = np.array([100, 101, 102])
+        calls = []
+        rgcurve = compute_rg_curve_batch(D, qv, E, jv, progress_cb=lambda buf, j: calls.append(j))
+        assert list(rgcurve.frames) == [100, 101, 102]
+        assert calls == [0, 1, 2]
+        assert np.allclose(rgcurve.rgvalues, [25.0, 35.0, 45.0], rtol=0.02)
+
+
+def test_parallel_simple_guinier_matches_serial():
+    qv, D, E = _make_data([25.0, 30.0, 35.0, 40.0])
+    jv = np.arange(4)
+    serial = compute_simple_guinier_list(qv, D, E, jv)
+    calls = []
+    parallel = compute_simple_guinier_list(qv, D, E, jv, n_jobs=2,
+                                           progress_cb=lambda buf, j: calls.append(j))
+    assert calls == [0, 1, 2, 3]
+    assert [i for i, _ in parallel] == [i for i, _ in serial]
+    for (_, sg1), (_, sg2) in zip(serial, parallel):
+        assert sg1.Rg == pytest.approx(sg2.Rg)
+        assert sg1.score == pytest.approx(sg2.score)
+
+
+def test_unknown_engine_is_rejected():
+    from molass.DataObjects.XrData import XrData
+    from molass.Guinier.RgCurveUtils import compute_rg_curve_from_arrays
+    qv, D, E = _make_data([30.0, 40.0])
+    with pytest.raises(ValueError, match="bacth"):
+        compute_rg_curve_from_arrays(D, qv, E, engine='bacth')
+    xr = XrData(D, qv, np.arange(2), E=E)
+    with pytest.raises(ValueError, match="bacth"):
+        xr.compute_rgcurve(engine='bacth')
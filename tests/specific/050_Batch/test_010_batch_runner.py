@@ -0,0 +1,44 @@
+"""Tests for Batch.BatchRunner — failures must not stop the batch."""
+import os
+import pytest
+from molass.Batch.BatchRunner import run_batch, load_batch_results, get_dataset_name
+
+
+def _make_broken_dataset(folder):
+    os.makedirs(folder)
+    for j in range(12):
+        with open(os.path.join(folder, "frame_%05d.dat" % j), "w") as fh:
+            fh.write("not a number\n")
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_failures_are_recorded(tmp_path, n_jobs):
+    root = tmp_path / "root"
+    _make_broken_dataset(str(root / "run1"))
+    _make_broken_dataset(str(root / "sub" / "run2"))
+    out_folder = str(tmp_path / "out")
+    records = run_batch(str(root), out_folder, n_jobs=n_jobs)
+    assert [r['dataset'] for r in records] == ['run1', 'sub__run2']
+    assert all(r['status'] == 'error' for r in records)
+    assert all(r['error'].startswith('failed at load') for r in records)
+    rows = load_batch_results(out_folder)
+    assert sorted(row['dataset'] for row in rows) == ['run1', 'sub__run2']
+    assert os.path.exists(os.path.join(out_folder, 'sub__run2', 'result.json'))
+
+
+def test_dataset_name(tmp_path):
+    root = str(tmp_path)
+    assert get_dataset_name(root, os.path.join(root, 'a', 'b')) == 'a__b'
+
+
+def test_quiet_option_is_restored(tmp_path):
+    from molass.Global.Options import get_molass_options, set_molass_options
+    root = tmp_path / "root"
+    _make_broken_dataset(str(root / "run1"))
+    previous = get_molass_options('quiet')
+    set_molass_options(quiet=False)
+    try:
+        run_batch(str(root), str(tmp_path / "out"), n_jobs=1, quiet=True)
+        assert get_molass_options('quiet') is False
+    finally:
+        set_molass_options(quiet=previous)
@@ -0,0 +1,56 @@
+"""Tests for the whole-matrix buffit baseline."""
+import warnings
+import numpy as np
+from molass.Baseline.Baseline2D import Baseline2D, individual_axes_impl
+from molass.Baseline.BuffitBaseline import compute_buffit_baseline, compute_buffit_baseline_matrix
+
+
+def _make_data(n_q=200, n_frames=150):
+    rng = np.random.default_rng(0)
+    jv = np.arange(n_frames) + 100.0
+    iv = np.linspace(0.01, 0.5, n_q)
+    peak = np.exp(-0.5*((jv - 175)/10)**2)
+    M = np.outer(1/iv, peak) + np.outer(iv, 0.01*jv) + rng.normal(0, 0.1, (n_q, n_frames))
+    mask = peak < 0.1
+    return jv, iv, M, mask
+
+
+def _row_wise(jv, M, mask):
+    return np.array([compute_buffit_baseline(jv, y, buffer_mask=mask) for y in M])
+
+
+def test_matrix_matches_row_wise():
+    jv, iv, M, mask = _make_data()
+    B, params = compute_buffit_baseline_matrix(jv, M, buffer_mask=mask, return_also_params=True)
+    assert B.shape == M.shape
+    assert np.allclose(B, _row_wise(jv, M, mask), rtol=1e-10, atol=1e-10)
+    assert params['n_buffer'] == mask.sum()
+
+
+def test_matrix_fallback_to_all_frames():
+    jv, iv, M, mask = _make_data()
+    for buffer_mask in [None, np.zeros(len(jv), dtype=bool)]:
+        B = compute_buffit_baseline_matrix(jv, M, buffer_mask=buffer_mask)
+        assert np.allclose(B, _row_wise(jv, M, buffer_mask), rtol=1e-10, atol=1e-10)
+
+
+def test_baseline2d_routes_to_matrix():
+    jv, iv, M, mask = _make_data()
+    fitter = Baseline2D(jv, iv)
+    kwargs = dict(jv=jv, buffer_mask=mask)
+    baseline, params = fitter.individual_axes(M.T, axes=0, method='buffit', method_kwargs=kwargs)
+    expected, _ = individual_axes_impl(
+        fitter, M.T, 0, 'buffit', kwargs,
+        lambda data, **kw: compute_buffit_baseline(kw['jv'], data, return_also_params=True, **kw))
+    assert baseline.shape == M.T.shape
+    assert np.allclose(baseline, expected, rtol=1e-10, atol=1e-10)
+    assert len(params['params_rows']['slope']) == len(iv)
+
+
+def test_baseline2d_threshold_without_mask_warns():
+    jv, iv, M, mask = _make_data()
+    fitter = Baseline2D(jv, iv)
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter('always')
+        fitter.individual_axes(M.T, axes=0, method='buffit', method_kwargs=dict(jv=jv, threshold=0.1))
+    assert any(issubclass(x.category, UserWarning) for x in w)
@@ -0,0 +1,77 @@
+"""Tests and benchmark for the batched LPM ('linear') baseline."""
+import os
+from time import perf_counter
+import numpy as np
+import pytest
+from molass.Baseline.Baseline2D import Baseline2D
+from molass.Baseline.LpmBaseline import compute_lpm_baseline, compute_lpm_baseline_matrix, LPM_MATRIX_RTOL
+
+
+def _make_data(n_q=200, n_frames=300, seed=1):
+    rng = np.random.default_rng(seed)
+    jv = np.arange(n_frames) + 50.0
+    iv = np.linspace(0.01, 0.5, n_q)
+    peak = np.exp(-0.5*((jv - 200)/15)**2) + 0.3*np.exp(-0.5*((jv - 240)/10)**2)
+    noise = rng.normal(0, 1, (n_q, n_frames)) * np.linspace(0.01, 2, n_q)[:, np.newaxis]
+    M = 0.1*np.outer(1/iv, peak) + 0.002*jv + noise
+    return jv, iv, M
+
+
+def _assert_equivalent(B, R, M):
+    err = np.abs(B - R).max(axis=1) / np.abs(M).max(axis=1)
+    assert err.max() < LPM_MATRIX_RTOL
+
+
+@pytest.mark.parametrize('kwargs', [
+    dict(),
+    dict(size_sigma=7.0),
+    dict(mask='first_part'),
+    dict(endpoint_fraction=0.1),
+])
+def test_matrix_matches_row_wise(kwargs):
+    jv, iv, M = _make_data()
+    if kwargs.get('mask') == 'first_part':
+        kwargs = dict(mask=jv < 300)
+    R = np.array([compute_lpm_baseline(jv, y, **kwargs) for y in M])
+    B = compute_lpm_baseline_matrix(jv, M, **kwargs)
+    _assert_equivalent(B, R, M)
+
+
+def test_matrix_matches_row_wise_on_noise_rows():
+    # pure-noise and tied-value rows take the less common branches of the iteration
+    rng = np.random.default_rng(5)
+    jv = np.arange(60.0)
+    M = np.vstack([rng.normal(size=(100, 60)), np.abs(rng.standard_cauchy((100, 60))),
+                   rng.integers(0, 3, (100, 60)).astype(float)])
+    R = np.array([compute_lpm_baseline(jv, y) for y in M])
+    _assert_equivalent(compute_lpm_baseline_matrix(jv, M), R, M)
+
+
+def test_baseline2d_routes_to_matrix():
+    jv, iv, M = _make_data(n_q=50)
+    fitter = Baseline2D(jv, iv)
+    baseline, params = fitter.individual_axes(M.T, axes=0, method='linear',
+                                              method_kwargs=dict(jv=jv, size_sigma=7.0))
+    R = np.array([compute_lpm_baseline(jv, y, size_sigma=7.0) for y in M])
+    _assert_equivalent(baseline.T, R, M)
+    assert len(params['params_rows']['p_final']) == len(iv)
+
+
+def test_large_matrix_matches_row_wise():
+    jv, iv, M = _make_data(n_q=400)
+    R = np.array([compute_lpm_baseline(jv, y, size_sigma=7.0) for y in M])
+    B = compute_lpm_baseline_matrix(jv, M, size_sigma=7.0)
+    _assert_equivalent(B, R, M)
+
+
+@pytest.mark.skipif(not os.environ.get('MOLASS_BENCHMARK'), reason="set MOLASS_BENCHMARK=1 to run benchmarks")
+def test_benchmark_against_row_wise():
+    # reports the timings only, which depend on the machine; run with -s to see them
+    jv, iv, M = _make_data(n_q=400)
+    t0 = perf_counter()
+    R = np.array([compute_lpm_baseline(jv, y, size_sigma=7.0) for y in M])
+    t1 = perf_counter()
+    B = compute_lpm_baseline_matrix(jv, M, size_sigma=7.0)
+    t2 = perf_counter()
+    print("row-wise: %.3g s, matrix: %.3g s, speedup: %.1fx" % (t1 - t0, t2 - t1, (t1 - t0)/(t2 - t1)))
+    _assert_equivalent(B, R, M)
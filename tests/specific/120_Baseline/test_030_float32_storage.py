@@ -0,0 +1,78 @@
+"""Tests and benchmark for the float32 storage and the in-place baseline correction."""
+import numpy as np
+from molass.DataObjects import SecSaxsData
+from molass.DataObjects.XrData import XrData
+from molass.LowRank.LowRankInfo import get_denoised_data
+from molass.Guinier.BatchGuinier import fit_guinier_batch
+
+
+def _make_ssd(n_q=300, n_frames=400, dtype=None, seed=0):
+    rng = np.random.default_rng(seed)
+    qv = np.linspace(0.005, 0.3, n_q)
+    jv = np.arange(n_frames)
+    C = np.array([np.exp(-0.5*((jv - 180)/20)**2), 0.5*np.exp(-0.5*((jv - 240)/25)**2)])
+    P = np.array([np.exp(-(qv*rg)**2/3) for rg in (40.0, 25.0)]).T
+    M = 100*P @ C + 0.5 + 0.001*jv + rng.normal(0, 0.01, (n_q, n_frames))
+    E = np.full(M.shape, 0.01)
+    return SecSaxsData(object_list=[XrData(M, qv, jv, E, dtype=dtype), None])
+
+
+def test_float32_storage():
+    ssd = _make_ssd(dtype=np.float32)
+    assert ssd.xr.M.dtype == np.float32 and ssd.xr.E.dtype == np.float32
+    assert ssd.xr.get_baseline2d().dtype == np.float32
+    corrected = ssd.corrected_copy()
+    assert corrected.xr.M.dtype == np.float32
+    ssd32 = _make_ssd().astype(np.float32)
+    assert np.array_equal(ssd32.xr.M, ssd.xr.M)
+
+
+def test_subtract_baseline_reuses_buffer():
+    xr = _make_ssd().xr
+    view = xr.copy(view=True)
+    baseline = np.full(xr.M.shape, 0.5)
+    view.subtract_baseline(baseline, reuse=True)
+    assert view.M is baseline
+    assert np.allclose(view.M, xr.M - 0.5)
+
+
+def test_inplace_matches_copy():
+    ssd = _make_ssd()
+    corrected = ssd.corrected_copy()
+    trimmed = ssd.copy(xr_slices=(slice(None), slice(None)), view=True)
+    result = trimmed.corrected_copy(inplace=True)
+    assert result is trimmed and result.corrected
+    assert np.array_equal(result.xr.M, corrected.xr.M)
+    assert not np.shares_memory(result.xr.M, ssd.xr.M)
+    assert np.array_equal(ssd.xr.M, _make_ssd().xr.M)
+
+    ssd.corrected_copy(inplace=True)
+    assert np.array_equal(ssd.xr.M, corrected.xr.M)
+
+
+def test_inplace_leaves_view_children_intact():
+    ssd = _make_ssd()
+    original = ssd.xr.M.copy()
+    child = ssd.copy(xr_slices=(slice(10, 200), slice(50, 350)), view=True)
+    shared = ssd.xr.M         # e.g., held by a legacy proxy
+    ssd.corrected_copy(inplace=True)
+    assert np.array_equal(child.xr.M, original[10:200, 50:350])
+    assert np.array_equal(shared, original)
+    assert not np.shares_memory(ssd.xr.M, shared) and ssd.xr.M.flags.writeable
+
+
+def test_benchmark_float32_accuracy():
+    results = {}
+    for dtype in (np.float64, np.float32):
+        ssd = _make_ssd(dtype=dtype)
+        corrected = ssd.corrected_copy()
+        D = get_denoised_data(corrected.xr.M, rank=2)
+        fit = fit_guinier_batch(corrected.xr.qv, D[:, [180, 240]], corrected.xr.E[:, [180, 240]])
+        results[dtype] = corrected.xr.M.nbytes, D, fit.rg
+    (nbytes64, D64, rg64), (nbytes32, D32, rg32) = results[np.float64], results[np.float32]
+    denoise_error = np.abs(D32 - D64).max() / np.abs(D64).max()
+    rg_error = np.abs(rg32 - rg64) / rg64
+    print("memory: %d -> %d bytes, denoised rel. error: %.2g, Rg rel. error: %s" % (nbytes64, nbytes32, denoise_error, rg_error))
+    assert nbytes32 * 2 == nbytes64
+    assert denoise_error < 1e-5
+    assert rg_error.max() < 1e-4
@@ -0,0 +1,73 @@
+"""
+Test the population-parallel evaluation of SolverCMA.
+
+The candidates of each generation are evaluated by replicas of the optimizer
+in worker processes.  The result must be the same as with the serial
+evaluation, and the cooperative stop and minima_callback must keep working.
+"""
+import io
+import threading
+import numpy as np
+import pytest
+
+pytest.importorskip("cma")
+
+
+class DummyOptimizer:
+    """Minimal stand-in for BasicOptimizer with its unpicklable members."""
+
+    def __init__(self, stop_after=None):
+        self._objective_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self.cb_fh = io.StringIO()
+        self.target = np.linspace(1, 9, 6)
+        self.eval_counter = 0
+        self.minima = []
+        self.stop_after = stop_after
+
+    def objective_func_wrapper(self, norm_params):
+        with self._objective_lock:
+            self.eval_counter += 1
+            return float(np.sum((norm_params - self.target)**2))
+
+    def minima_callback(self, x, f, accept):
+        self.minima.append((x.copy(), f, accept))
+        if self.stop_after is not None and len(self.minima) >= self.stop_after:
+            self._stop_event.set()
+        return False
+
+
+def _solve(n_jobs, niter=2, stop_after=None):
+    from molass.Solvers.CMA.SolverCMA import SolverCMA
+    optimizer = DummyOptimizer(stop_after=stop_after)
+    solver = SolverCMA(optimizer, n_jobs=n_jobs)
+    result = solver.minimize(optimizer.objective_func_wrapper, np.full(6, 5.0), niter=niter, seed=1234)
+    return optimizer, result
+
+
+def test_parallel_matches_serial():
+    opt_s, res_s = _solve(n_jobs=1)
+    opt_p, res_p = _solve(n_jobs=2)
+    assert res_p.nfev == res_s.nfev <= 2*200 + 20
+    assert res_p.fun == res_s.fun
+    assert np.array_equal(res_p.x, res_s.x)
+    # the replicas count their own evaluations; the solver accounts for them
+    assert opt_p.eval_counter == opt_s.eval_counter == res_s.nfev
+    assert [f for _, f, _ in opt_p.minima] == [f for _, f, _ in opt_s.minima]
+
+
+def test_parallel_cooperative_stop():
+    optimizer, result = _solve(n_jobs=2, niter=10, stop_after=1)
+    assert len(optimizer.minima) == 1
+    assert result.nit == 1
+
+
+def test_global_option():
+    from molass.Global.Options import set_molass_options
+    from molass.Solvers.CMA.SolverCMA import SolverCMA
+    set_molass_options(solver_n_jobs=3)
+    try:
+        assert SolverCMA(DummyOptimizer()).n_jobs == 3
+        assert SolverCMA(DummyOptimizer(), n_jobs=1).n_jobs == 1
+    finally:
+        set_molass_options(solver_n_jobs=None)
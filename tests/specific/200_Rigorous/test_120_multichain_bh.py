@@ -0,0 +1,84 @@
+"""
+Tests for the multi-chain mode of optimize_rigorously (MultiChainRunInfo).
+
+The chains are stood in for by sleeping subprocesses with fake callback.txt
+files in their job folders.
+"""
+import os
+import sys
+import json
+import subprocess
+import numpy as np
+import pytest
+
+from molass.Rigorous.RunInfo import RunInfo
+from molass.Rigorous.MultiChain import MultiChainRunInfo
+
+
+def _write_callback(folder, fvals):
+    os.makedirs(folder, exist_ok=True)
+    lines = []
+    for i, fv in enumerate(fvals):
+        lines.append(f"t=0\nx=\n[0.0]\nf={fv}\na=True\nc={i+1}\n")
+    with open(os.path.join(folder, "callback.txt"), "w", encoding="utf-8") as f:
+        f.write("".join(lines))
+
+
+@pytest.fixture
+def multichain(tmp_path):
+    analysis_folder = str(tmp_path)
+    fvals = [
+        [-1.0, -2.5],       # chain 0: best
+        [-1.0, -2.4],       # chain 1: close to the best
+        [-0.5, -0.6],       # chain 2: dominated
+    ]
+    chains = []
+    for k, fv in enumerate(fvals):
+        work_folder = os.path.join(analysis_folder, "optimized", "jobs", "%03d" % k)
+        _write_callback(work_folder, fv)
+        chain = RunInfo(ssd=None, optimizer=None, dsets=None, init_params=None,
+                        analysis_folder=analysis_folder)
+        chain.work_folder = work_folder
+        chain._subprocess_process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+        chains.append(chain)
+    run_info = MultiChainRunInfo(chains, [1234, 1235, 1236], ssd=None, optimizer=None, dsets=None,
+                                 init_params=None, analysis_folder=analysis_folder)
+    yield run_info
+    run_info.request_stop()
+    for chain in chains:
+        chain._subprocess_process.wait()
+
+
+def test_chain_status(multichain):
+    from molass.Rigorous.CurrentStateUtils import fv_to_sv
+    status = multichain.chain_status()
+    assert [s["seed"] for s in status] == [1234, 1235, 1236]
+    assert [s["best_fv"] for s in status] == [-2.5, -2.4, -0.6]
+    assert status[0]["best_sv"] == pytest.approx(fv_to_sv(-2.5))
+    assert all(s["alive"] and not s["killed"] for s in status)
+    assert multichain.is_alive
+
+
+def test_kill_dominated_after_patience(multichain):
+    assert multichain.kill_dominated(margin=5.0, patience=2) == []
+    assert multichain.kill_dominated(margin=5.0, patience=2) == [2]
+    multichain.chains[2]._subprocess_process.wait(timeout=10)
+    status = multichain.chain_status()
+    assert [s["alive"] for s in status] == [True, True, False]
+    assert status[2]["killed"] and multichain.killed == {2}
+    with open(os.path.join(status[2]["work_folder"], "RUN_MANIFEST.json")) as fh:
+        assert json.load(fh)["status"] == "killed_dominated"
+    # the rest stay within the margin
+    assert multichain.kill_dominated(margin=5.0, patience=2) == []
+
+
+def test_request_stop_and_wait(multichain):
+    multichain.request_stop()
+    assert multichain.wait(timeout=10, poll_interval=0.1)
+    assert not multichain.is_alive
+
+
+def test_invalid_num_chains():
+    from molass.Rigorous.RigorousImplement import make_rigorous_decomposition_impl
+    with pytest.raises(ValueError, match="num_chains"):
+        make_rigorous_decomposition_impl(None, None, num_chains=0)
@@ -0,0 +1,137 @@
+"""
+Tests for the incremental progress log of callback.txt (ProgressLog).
+"""
+import os
+import numpy as np
+import pytest
+
+from molass.Rigorous.ProgressLog import ProgressLog, get_progress_log, RECORD_DTYPE
+
+
+def _record(i, fv, accepted=True):
+    return (f"t=2026-01-01 12:00:{i:02d}\n"
+            "x=\n[ 1.0\n  2.0]\n"
+            f"f={fv}\n"
+            f"a={accepted}\n"
+            f"c={i * 100}\n")
+
+
+def _append(path, text):
+    with open(path, "a", encoding="utf-8") as fh:
+        fh.write(text)
+
+
+def test_tail_reads_only_new_records(tmp_path):
+    cb = str(tmp_path / "callback.txt")
+    _append(cb, _record(0, -1.0, False) + _record(1, -1.5))
+    log = ProgressLog(str(tmp_path))
+    assert log.update() == 2
+    assert list(log.records["fv"]) == [-1.0, -1.5]
+    assert list(log.records["accept"]) == [False, True]
+    assert log.update() == 0
+
+    # an incomplete trailing record is left until its c= line is written
+    text = _record(2, -2.0)
+    _append(cb, text[:-8])
+    assert log.update() == 0
+    offset = log.offset
+    _append(cb, text[-8:])
+    assert log.update() == 1
+    assert log.offset == os.path.getsize(cb) > offset
+    assert list(log.read(2)["counter"]) == [200]
+
+
+def test_sidecar_resumes_from_offset(tmp_path):
+    cb = str(tmp_path / "callback.txt")
+    _append(cb, _record(0, -1.0) + _record(1, -1.5))
+    ProgressLog(str(tmp_path)).update()
+    assert os.path.getsize(tmp_path / "progress.bin") == 2 * RECORD_DTYPE.itemsize
+
+    # a new reader starts from the saved records and offset
+    _append(cb, _record(2, -2.0))
+    log = ProgressLog(str(tmp_path))
+    assert len(log) == 2
+    assert log.update() == 1
+    assert list(log.records["fv"]) == [-1.0, -1.5, -2.0]
+
+
+def test_rewritten_callback_is_rebuilt(tmp_path):
+    cb = str(tmp_path / "callback.txt")
+    _append(cb, _record(0, -1.0) + _record(1, -1.5) + _record(2, -1.7))
+    log = get_progress_log(str(tmp_path))
+    assert len(log) == 3
+    with open(cb, "w", encoding="utf-8") as fh:
+        fh.write(_record(5, -3.0))
+    log = get_progress_log(str(tmp_path))
+    assert list(log.records["fv"]) == [-3.0]
+
+
+def test_matches_legacy_reader(tmp_path):
+    pytest.importorskip("molass_legacy")
+    from molass_legacy.Optimizer.StateSequence import read_callback_txt_impl
+    from molass.Rigorous.ProgressLog import record_time
+    cb = str(tmp_path / "callback.txt")
+    _append(cb, "".join(_record(i, -1.0 - 0.1*i, i % 2 == 1) for i in range(5)))
+    fv_list, _ = read_callback_txt_impl(cb)
+    records = get_progress_log(str(tmp_path)).records
+    assert [row[0] for row in fv_list] == list(records["counter"])
+    assert np.allclose([row[1] for row in fv_list], records["fv"])
+    assert [row[2] for row in fv_list] == list(records["accept"])
+    assert [row[3] for row in fv_list] == [record_time(t) for t in records["time"]]
+
+
+def test_sv_history_follows_appends(tmp_path):
+    from molass.Rigorous.CurrentStateUtils import parse_sv_history, fv_to_sv
+    job = tmp_path / "optimized" / "jobs" / "000"
+    job.mkdir(parents=True)
+    cb = str(job / "callback.txt")
+    _append(cb, _record(0, -1.0) + _record(1, -0.5))
+    assert parse_sv_history(str(tmp_path)) == pytest.approx([fv_to_sv(-1.0)] * 2)
+    _append(cb, _record(2, -2.0))
+    svs = parse_sv_history(str(tmp_path))
+    assert len(svs) == 3 and svs[-1] == pytest.approx(fv_to_sv(-2.0))
+
+
+def test_concurrent_updates(tmp_path):
+    import sys
+    import threading
+    n_records = 3000
+
+    def run_trial(folder):
+        os.makedirs(folder)
+        cb = os.path.join(folder, "callback.txt")
+        _append(cb, "")
+        done = threading.Event()
+        errors = []
+
+        def write():
+            for k in range(0, n_records, 5):
+                _append(cb, "".join(_record(i % 60, -float(i)) for i in range(k, k + 5)))
+            done.set()
+
+        def poll():
+            try:
+                while not done.is_set():
+                    get_progress_log(folder).records
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=poll) for _ in range(4)] + [threading.Thread(target=write)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return errors
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)     # interleave the threads as on several cores
+    try:
+        for trial in range(5):
+            folder = str(tmp_path / str(trial))
+            assert run_trial(folder) == []
+            log = get_progress_log(folder)
+            assert len(log) == n_records
+            assert np.array_equal(log.records["fv"], -np.arange(n_records, dtype=float))
+            assert len(ProgressLog(folder).records) == n_records
+    finally:
+        sys.setswitchinterval(interval)
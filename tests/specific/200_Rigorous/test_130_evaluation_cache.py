@@ -0,0 +1,138 @@
+"""
+Tests for the evaluation cache of the rigorous objective (EvaluationCache).
+"""
+import pickle
+import threading
+import numpy as np
+import pytest
+
+from molass.Rigorous.EvaluationCache import (
+    EvaluationCache, install_evaluation_cache, evaluate_breakdown, get_evaluation_cache,
+    make_objective_fingerprint,
+)
+
+
+class DummyOptimizer:
+    """Minimal stand-in for a legacy optimizer counting its evaluations."""
+
+    def __init__(self, xrD=None):
+        self._objective_lock = threading.Lock()
+        self.eval_counter = 0
+        self.n_calls = 0
+        self.xrD = np.ones((3, 4)) if xrD is None else xrD
+
+    def objective_func(self, p, plot=False, return_full=False):
+        self.eval_counter += 1
+        self.n_calls += 1
+        scores = np.array([np.sum(p), np.prod(p)])
+        fv = float(np.sum(p**2)*self.xrD.sum())/12
+        return (fv, scores, np.eye(2)) if return_full else fv
+
+    def objective_func_wrapper(self, norm_params):
+        with self._objective_lock:
+            self.eval_counter += 1
+            return self.objective_func(norm_params)
+
+
+def test_memoized_objective():
+    optimizer = DummyOptimizer()
+    cache = install_evaluation_cache(optimizer)
+    p = np.array([1.0, 2.0, 3.0])
+    assert optimizer.objective_func_wrapper(p) == 14.0
+    assert optimizer.objective_func_wrapper(p * (1 + 1e-15)) == 14.0   # within quantization
+    assert optimizer.n_calls == 1
+    # the hit advances eval_counter as the evaluation would have
+    assert optimizer.eval_counter == 4
+    assert cache.stats() == dict(hits=1, misses=1, hit_rate=0.5, size=1, maxsize=cache.maxsize)
+
+    # full results are always evaluated, and plotting bypasses the cache
+    fv, scores, M = optimizer.objective_func(p, return_full=True)
+    optimizer.objective_func(p, plot=True)
+    assert optimizer.n_calls == 3
+    assert install_evaluation_cache(optimizer) is cache
+
+
+def test_breakdown_from_cache():
+    optimizer = DummyOptimizer()
+    p = np.array([1.0, 2.0])
+    fv, scores = evaluate_breakdown(optimizer, p)
+    assert fv == 5.0 and list(scores) == [3.0, 2.0]
+    assert evaluate_breakdown(optimizer, p.copy())[0] == 5.0
+    assert optimizer.n_calls == 1
+    assert get_evaluation_cache(optimizer).hits == 2    # incl. the lookup after storing
+
+
+def test_lru_eviction():
+    cache = EvaluationCache(maxsize=2)
+    for k in range(3):
+        cache.put(np.array([k, 1.0]), k)
+    assert len(cache) == 2
+    assert cache.get(np.array([0, 1.0])) is None
+    assert cache.get(np.array([2, 1.0]))[0] == 2.0
+
+
+def test_save_and_load(tmp_path):
+    cache = EvaluationCache()
+    cache.put(np.array([0.0, 1.0]), 1.0, [0.5, 0.25])
+    cache.put(np.array([1.0, 1.0]), 2.0)
+    assert cache.save(str(tmp_path)) is not None
+    other = EvaluationCache()
+    assert other.load(str(tmp_path)) == 2
+    assert other.load(str(tmp_path)) == 0       # once per folder
+    fv, scores = other.get(np.array([0.0, 1.0]), need_scores=True)
+    assert fv == 1.0 and list(scores) == [0.5, 0.25]
+    assert other.get(np.array([1.0, 1.0]), need_scores=True) is None
+    assert other.get(np.array([1.0, 1.0]))[0] == 2.0
+
+
+def test_replica_of_cached_optimizer():
+    from molass.Solvers.PopulationPool import OptimizerReplica
+    optimizer = DummyOptimizer()
+    install_evaluation_cache(optimizer)
+    replica = pickle.loads(pickle.dumps(OptimizerReplica(optimizer, 'objective_func_wrapper')))
+    assert replica(np.array([1.0, 2.0])) == 5.0
+
+
+def test_saved_entries_of_another_objective_are_skipped(tmp_path):
+    p = np.array([1.0, 2.0])
+    optimizer = DummyOptimizer()
+    assert evaluate_breakdown(optimizer, p)[0] == 5.0
+    get_evaluation_cache(optimizer).save(str(tmp_path))
+
+    # e.g., a resumed session with differently trimmed data
+    other = DummyOptimizer(xrD=np.full((3, 4), 2.0))
+    assert make_objective_fingerprint(other) != make_objective_fingerprint(optimizer)
+    assert evaluate_breakdown(other, p, folder=str(tmp_path))[0] == 10.0
+    assert other.n_calls == 1
+
+    same = DummyOptimizer()
+    assert evaluate_breakdown(same, p, folder=str(tmp_path))[0] == 5.0
+    assert same.n_calls == 0
+
+
+def test_cache_cleared_when_objective_changes():
+    p = np.array([1.0, 2.0])
+    optimizer = DummyOptimizer()
+    cache = install_evaluation_cache(optimizer)
+    assert optimizer.objective_func(p) == 5.0
+    optimizer.xr_params_indeces = np.array([1])     # e.g., frozen_param_groups set later
+    assert install_evaluation_cache(optimizer) is cache
+    assert len(cache) == 0
+    optimizer.xrD = optimizer.xrD*2
+    assert evaluate_breakdown(optimizer, p)[0] == 10.0
+    assert optimizer.n_calls == 2
+
+
+def test_data_hashed_once_per_array(monkeypatch):
+    import molass.Rigorous.EvaluationCache as ec
+    hashed = []
+    hash_data = ec._hash_data
+    monkeypatch.setattr(ec, "_hash_data", lambda arrays: hashed.append(1) or hash_data(arrays))
+    optimizer = DummyOptimizer()
+    p = np.array([1.0, 2.0])
+    for _ in range(3):
+        evaluate_breakdown(optimizer, p)
+    assert len(hashed) == 1
+    optimizer.xrD = optimizer.xrD.reshape(4, 3)
+    evaluate_breakdown(optimizer, p)
+    assert len(hashed) == 2
@@ -0,0 +1,75 @@
+"""Tests for the pluggable SVD backend of the low rank denoising."""
+import numpy as np
+import pytest
+from molass.LowRank.LowRankInfo import get_denoised_data
+from molass.LowRank.SvdBackend import (
+    SVD_METHODS, choose_svd_method, compute_svd, get_svd, svd_cache_info, clear_svd_cache)
+
+
+def _make_matrix(shape=(400, 120), rank=4, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.random((shape[0], rank)) @ rng.random((rank, shape[1])) + 0.01*rng.normal(size=shape)
+
+
+def _reference_denoised(D, rank):
+    U, s, VT = np.linalg.svd(D)
+    return (U[:, :rank] * s[:rank]) @ VT[:rank]
+
+
+@pytest.mark.parametrize('method', SVD_METHODS)
+def test_denoised_data_matches_full_svd(method):
+    D = _make_matrix()
+    clear_svd_cache()
+    D_ = get_denoised_data(D, rank=3, svd_method=method)
+    ref = _reference_denoised(D, 3)
+    assert np.allclose(D_, ref, rtol=0, atol=1e-10 * np.abs(ref).max())
+
+
+def test_truncated_backends_return_rank_triplets():
+    D = _make_matrix()
+    for method in ['randomized', 'arpack']:
+        U, s, VT = compute_svd(D, rank=3, method=method)
+        assert U.shape == (400, 3) and s.shape == (3,) and VT.shape == (3, 120)
+        assert np.all(np.diff(s) <= 0)
+    with pytest.raises(ValueError):
+        compute_svd(D, method='randomized')
+    with pytest.raises(ValueError):
+        compute_svd(D, rank=3, method='qr')
+
+
+def test_choose_svd_method():
+    assert choose_svd_method((1000, 300), 3) == 'economy'
+    assert choose_svd_method((2000, 800), 3) == 'arpack'
+    assert choose_svd_method((2000, 800), None) == 'economy'
+
+
+def test_svd_cache_is_shared_per_matrix():
+    D = _make_matrix()
+    clear_svd_cache()
+    get_denoised_data(D, rank=3)
+    get_denoised_data(D, rank=2)
+    assert svd_cache_info().hits == 1
+    # a copy is a different matrix
+    get_denoised_data(D.copy(), rank=3)
+    assert svd_cache_info().misses == 2
+    # an in-place modification invalidates the entry
+    D *= 2
+    get_svd(D, rank=3)
+    assert svd_cache_info().misses == 3
+
+
+def test_svd_cache_detects_single_element_edit():
+    D = _make_matrix()
+    clear_svd_cache()
+    before = get_denoised_data(D, rank=2)
+    D[1, 1] += 1000
+    after = get_denoised_data(D, rank=2)
+    assert svd_cache_info().hits == 0
+    assert not np.allclose(after, before)
+    assert np.allclose(after, get_denoised_data(D.copy(), rank=2))
+
+
+def test_full_rank_is_a_copy():
+    D = _make_matrix(shape=(50, 3), rank=2)
+    D_ = get_denoised_data(D, rank=3)
+    assert D_ is not D and np.array_equal(D_, D)
@@ -0,0 +1,42 @@
+"""Tests for the factorization-based error propagation."""
+import numpy as np
+from molass.LowRank.ErrorPropagate import compute_pinv_product, compute_propagated_error
+from molass.LowRank.LowRankInfo import compute_lowrank_matrices, get_denoised_data
+from molass.LowRank.SvdBackend import svd_cache_info, clear_svd_cache
+
+
+class _Curve:
+    def __init__(self, x, y):
+        self.x, self.y = x, y
+
+    def get_xy(self):
+        return self.x, self.y
+
+
+def _make_data(shape=(300, 120), seed=0):
+    rng = np.random.default_rng(seed)
+    x = np.arange(shape[1])
+    C = np.array([np.exp(-0.5*((x - m)/10)**2) for m in [40, 60, 80]])
+    P = rng.random((shape[0], 3))
+    D = P @ C + 0.01*rng.normal(size=shape)
+    E = 0.01*(1 + np.abs(rng.normal(size=shape)))
+    return x, C, D, E
+
+
+def test_propagated_error_matches_pinv():
+    x, C, D, E = _make_data()
+    ccurves = [_Curve(x, cy) for cy in C]
+    M_, C_, P_, Pe = compute_lowrank_matrices(D, ccurves, E, None)
+    expected = np.sqrt((E**2) @ ((np.linalg.pinv(M_) @ P_)**2))
+    assert np.allclose(Pe, expected, rtol=1e-10)
+    assert np.allclose(compute_propagated_error(M_, P_, E), expected, rtol=1e-10)
+
+
+def test_pinv_product_of_full_rank_matrix_is_cached():
+    x, C, D, E = _make_data()
+    P = get_denoised_data(D, 3) @ np.linalg.pinv(C)
+    clear_svd_cache()
+    W = compute_pinv_product(D, P)
+    assert np.allclose(W, np.linalg.pinv(D) @ P, rtol=1e-8, atol=1e-10*np.abs(W).max())
+    compute_pinv_product(D, 2*P)
+    assert svd_cache_info().hits == 1
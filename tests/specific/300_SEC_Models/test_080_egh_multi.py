@@ -0,0 +1,30 @@
+"""Tests for the batched EGH evaluators in SEC.Models.Simple."""
+import numpy as np
+import pytest
+from molass.SEC.Models.Simple import egh, egh_multi, egh_multi_numba
+
+X = np.arange(0, 600, dtype=float)
+PARAMS = np.array([
+    [1.0, 200, 20, 30],
+    [0.5, 300, 25, -40],
+    [0.3, 400, 15, 0],
+    [0.2, 100, 1, 500],     # a large tau makes the left part exactly zero
+])
+
+
+def test_rows_equal_egh():
+    M = egh_multi(X, PARAMS)
+    assert M.shape == (len(PARAMS), len(X))
+    for k, params in enumerate(PARAMS):
+        assert np.array_equal(M[k], egh(X, *params))
+
+
+def test_preallocated_out_is_reused():
+    out = np.empty((len(PARAMS), len(X)))
+    M = egh_multi(X, PARAMS, out=out)
+    assert M is out
+    assert np.array_equal(out, egh_multi(X, PARAMS))
+
+
+def test_numba_variant():
+    assert np.allclose(egh_multi_numba(X, PARAMS), egh_multi(X, PARAMS), rtol=1e-12, atol=1e-15)
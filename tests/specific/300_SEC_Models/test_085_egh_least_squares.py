@@ -0,0 +1,75 @@
+"""Tests for the analytic-gradient (least-squares) EGH fitting path."""
+import numpy as np
+import pytest
+from scipy.optimize import approx_fprime
+from molass.SEC.Models.Simple import egh_multi, egh_multi_jacobian
+from molass.LowRank.LeastSquaresDecomposer import fit_egh_least_squares
+
+X = np.arange(0, 300, dtype=float)
+TRUE_PARAMS = np.array([
+    [1.0, 120, 12, 4],
+    [0.6, 160, 14, 6],
+    [0.3, 200, 15, 3],
+])
+
+
+def test_jacobian_matches_finite_differences():
+    values, J = egh_multi_jacobian(X, TRUE_PARAMS)
+    assert np.array_equal(values, egh_multi(X, TRUE_PARAMS))
+    for k, params in enumerate(TRUE_PARAMS):
+        for i in [80, 118, 125, 170]:
+            numeric = approx_fprime(params, lambda p: egh_multi(X[i:i+1], p)[0, 0], 1e-6)
+            assert np.allclose(J[k, :, i], numeric, rtol=1e-4, atol=1e-7)
+
+
+def make_bounds(m):
+    return [(0.01, None), (50, 250), (2, 40), (-40, 40)] * m
+
+
+def test_fit_recovers_synthetic_peaks():
+    y = np.sum(egh_multi(X, TRUE_PARAMS), axis=0)
+    areas = np.sum(egh_multi(X, TRUE_PARAMS), axis=1)
+    init_params = TRUE_PARAMS * np.array([0.9, 1.0, 1.2, 0.5]) + np.array([0, 3, 0, 0])
+    res = fit_egh_least_squares(X, y, init_params, make_bounds(3), areas/np.sum(areas), tau_limit=0.5)
+    assert res.success
+    assert np.allclose(res.x.reshape(TRUE_PARAMS.shape), TRUE_PARAMS, rtol=1e-3, atol=1e-3)
+
+
+def make_noisy_icurve():
+    from molass.DataObjects.Curve import Curve
+    rng = np.random.default_rng(0)
+    y = np.sum(egh_multi(X, TRUE_PARAMS), axis=0) + rng.normal(0, 0.005, len(X))
+    return Curve(X, y, type='i')
+
+
+def test_benchmark_against_nelder_mead(monkeypatch):
+    import molass.LowRank.CurveDecomposer as cd
+    import molass.LowRank.LeastSquaresDecomposer as lsd
+    icurve = make_noisy_icurve()
+    x, y = icurve.get_xy()
+    counts = dict(nm=0, ls=0)
+
+    def counted(name, func):
+        def wrapper(*args, **kwargs):
+            counts[name] += 1
+            return func(*args, **kwargs)
+        return wrapper
+
+    def ssr(ccurves):
+        ty = np.sum([c.get_xy()[1] for c in ccurves], axis=0)
+        return np.sum((ty - y)**2)
+
+    monkeypatch.setattr(cd, 'egh_multi', counted('nm', cd.egh_multi))
+    nm_curves = cd.decompose_icurve_impl(icurve, 3)
+    monkeypatch.setattr(lsd, 'egh_multi_jacobian', counted('ls', lsd.egh_multi_jacobian))
+    ls_curves = cd.decompose_icurve_impl(icurve, 3, solver='least_squares')
+
+    assert len(ls_curves) == 3
+    assert ssr(ls_curves) <= ssr(nm_curves) * 1.05
+    assert counts['ls'] * 10 < counts['nm']
+
+
+def test_unknown_solver():
+    from molass.LowRank.CurveDecomposer import decompose_icurve_impl
+    with pytest.raises(ValueError):
+        decompose_icurve_impl(make_noisy_icurve(), 3, solver='bfgs')
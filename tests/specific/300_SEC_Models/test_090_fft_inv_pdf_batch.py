@@ -0,0 +1,127 @@
+"""Tests for the batched characteristic-function inversion FftInvPdf.batch."""
+import numpy as np
+from molass.MathUtils.FftUtils import FftInvPdf
+from molass.SEC.Models.SdmMonoPore import sdm_monopore_gamma_pdf, sdm_monopore_gamma_pdf_batch
+from molass.SEC.Models.EdmLinear import edm_pdf, edm_pdf_batch
+
+
+def _shifted_gaussian_cf(w, mu, sigma):
+    return np.exp(1j * w * mu - 0.5 * sigma**2 * w**2)
+
+
+fft_shifted_gauss = FftInvPdf(_shifted_gaussian_cf)
+MUS = np.array([100.0, 200.0, 300.0])
+SIGMAS = np.array([10.0, 20.0, 15.0])
+
+
+def test_batch_matches_single_calls():
+    t = np.linspace(0, 600, 301)
+    B = fft_shifted_gauss.batch(t, MUS, SIGMAS)
+    assert B.shape == (3, len(t))
+    for k, (mu, sigma) in enumerate(zip(MUS, SIGMAS)):
+        assert np.allclose(B[k], fft_shifted_gauss(t, mu, sigma), rtol=1e-10, atol=1e-14)
+
+
+def test_batch_shared_and_per_row_params():
+    t = np.linspace(0, 600, 301)
+    B = fft_shifted_gauss.batch(t, MUS, 15.0)
+    assert np.allclose(B[1], fft_shifted_gauss(t, 200.0, 15.0), rtol=1e-10, atol=1e-14)
+    T = np.array([t, t * 1.1, t * 0.9])
+    B = fft_shifted_gauss.batch(T, MUS, SIGMAS)
+    for k in range(3):
+        assert np.allclose(B[k], fft_shifted_gauss(T[k], MUS[k], SIGMAS[k]), rtol=1e-10, atol=1e-14)
+
+
+def test_batch_auto_resize():
+    t = np.linspace(455, 1393, 200)
+    B = fft_shifted_gauss.batch(t, [800.0, 1000.0], 30.0)
+    for k, mu in enumerate([800.0, 1000.0]):
+        assert np.allclose(B[k], fft_shifted_gauss(t, mu, 30.0), rtol=1e-10, atol=1e-14)
+
+
+def test_model_wrappers():
+    x = np.linspace(0, 400, 400)
+    npi = np.array([20.0, 30.0])
+    theta = np.array([1.0, 0.8])
+    B = sdm_monopore_gamma_pdf_batch(x, npi, 2.0, theta, 14400.0, 150.0)
+    for k in range(2):
+        assert np.allclose(B[k], sdm_monopore_gamma_pdf(x, npi[k], 2.0, theta[k], 14400.0, 150.0), atol=1e-14)
+
+    t = np.linspace(0.1, 30.0, 500)
+    R = np.array([2.0, 3.0])
+    B = edm_pdf_batch(t, 400, 5.0, R)
+    for k in range(2):
+        assert np.allclose(B[k], edm_pdf(t, 400, 5.0, R[k]), atol=1e-12)
+
+
+def test_sdm_curves_batch():
+    from molass.SEC.Models.SdmComponentCurve import SdmColumn, SdmComponentCurve, compute_sdm_curves_batch
+    x = np.arange(300, dtype=float)
+    column = SdmColumn([50, 2.0, 1.5, 2.0, 100, 10, 14400, 80, 0.25, 2.0])
+    rgs = [40.0, 30.0, 20.0]
+    scales = [1.0, 0.5, 2.0]
+    Y = compute_sdm_curves_batch(x, column, rgs, scales)
+    for k, (rg, scale) in enumerate(zip(rgs, scales)):
+        assert np.allclose(Y[k], SdmComponentCurve(x, column, rg, scale).get_y(), atol=1e-14)
+
+
+def test_interp_matrix_matches_spline():
+    from scipy.interpolate import UnivariateSpline
+    from molass.MathUtils.FftUtils import compute_interp_matrix
+    N = 1024
+    y = np.abs(np.random.default_rng(0).normal(size=N))
+    t = np.linspace(-2, 1030, 500)
+    W = compute_interp_matrix(N, t)
+    assert W.shape == (len(t), N)
+    ref = UnivariateSpline(np.arange(N), y, s=0)(t)
+    assert np.allclose(W @ y, ref, rtol=1e-13, atol=1e-13)
+
+
+def test_interp_cache_counters():
+    pdf = FftInvPdf(_shifted_gaussian_cf, cache_size=2)
+    t1 = np.linspace(0, 600, 301)
+    t2 = np.linspace(0, 500, 301)
+    t3 = np.linspace(0, 400, 301)
+    y1 = pdf(t1, 200.0, 20.0)           # first seen: spline
+    assert pdf.cache_info() == (0, 1, 2, 0)
+    assert np.allclose(pdf(t1, 250.0, 20.0), fft_shifted_gauss(t1, 250.0, 20.0))    # seen again: built
+    pdf.batch(t1, MUS, SIGMAS)
+    assert pdf.cache_info() == (1, 2, 2, 1)
+    for t in [t2, t2, t3, t3]:          # evicts t1
+        pdf(t, 200.0, 20.0)
+    assert np.allclose(pdf(t1, 200.0, 20.0), y1)
+    assert pdf.cache_info() == (1, 7, 2, 2)
+    pdf.cache_clear()
+    assert pdf.cache_info() == (0, 0, 2, 0)
+
+
+def test_benchmark_varying_grids(monkeypatch):
+    """Query grids such as ts*(x - tI) change with tI on every evaluation.
+
+    No interpolation matrix may be built for them, each costing more than a
+    spline fit, while a repeated grid is served by one built matrix.
+    """
+    import molass.MathUtils.FftUtils as fu
+    from molass.SEC.Models.SdmMonoPore import sdm_monopore_cf
+    builds = []
+
+    def counted(N, t, *args):
+        builds.append(N)
+        return compute_interp_matrix(N, t, *args)
+
+    compute_interp_matrix = fu.compute_interp_matrix
+    monkeypatch.setattr(fu, 'compute_interp_matrix', counted)
+    pdf = FftInvPdf(sdm_monopore_cf)
+    x = np.arange(400, dtype=float)
+    ts = 0.25
+    for tI in np.linspace(-60, -40, 50):
+        pdf(ts*(x - tI), 20.0, ts*2.0, 14400.0, ts*150.0)
+        pdf.batch(ts*(x - tI - 0.1), [20.0, 30.0, 10.0], ts*2.0, 14400.0, ts*np.array([150.0, 120.0, 180.0]))
+    assert builds == []
+    assert pdf.cache_info().hits == 0
+
+    t = ts*(x + 50)
+    for k in range(50):
+        pdf(t, 20.0, ts*2.0, 14400.0, ts*150.0)
+    assert builds == [1024]
+    assert pdf.cache_info().hits == 48
@@ -0,0 +1,73 @@
+"""Tests for the multi-start optimization used by the SDM/EDM optimizers."""
+import numpy as np
+from scipy.optimize import rosen
+from molass.ScipyUtils.MultiStart import make_random_starts, minimize_multistart, select_best
+
+
+def test_random_starts_within_bounds():
+    x0 = np.array([1.0, 0.0, -5.0])
+    bounds = [(0.95, 1.05), (None, None), (-6.0, None)]
+    starts = make_random_starts(x0, bounds, 20, scale=0.5, seed=0)
+    assert len(starts) == 20
+    for start in starts:
+        assert 0.95 <= start[0] <= 1.05
+        assert start[2] >= -6.0
+    again = make_random_starts(x0, bounds, 20, scale=0.5, seed=0)
+    assert all(np.array_equal(a, b) for a, b in zip(starts, again))
+
+
+def test_parallel_equals_serial():
+    starts = [np.array([-1.2, 1.0]), np.array([2.0, 2.0]), np.array([0.0, -1.0])]
+    serial = minimize_multistart(rosen, starts, method='Nelder-Mead')
+    parallel = minimize_multistart(rosen, starts, n_jobs=2, method='Nelder-Mead')
+    for r1, r2 in zip(serial, parallel):
+        assert np.array_equal(r1.x, r2.x)
+    best = select_best(parallel)
+    assert best.fun == min(r.fun for r in serial)
+
+
+def test_cedm_multistart():
+    from molass_legacy.Models.RateTheory.EDM import edm_impl
+    from molass.SEC.Models.EdmOptimizer import optimize_edm_xr_decomposition
+
+    class FakeCurve:
+        def __init__(self, x, y):
+            self.x = x
+            self.y = y
+
+        def get_xy(self):
+            return self.x, self.y
+
+    class FakeDecomposition:
+        def __init__(self, x, ys):
+            self.xr_icurve = FakeCurve(x, np.sum(ys, axis=0))
+            self.xr_ccurves = [FakeCurve(x, y) for y in ys]
+            self.num_components = len(ys)
+
+    x = np.linspace(50, 200, 300)
+    init = np.array([[80.0, 1.0, 1.0, 0.0, 0.5, 0.01, 1.0],
+                     [80.0, 1.0, 1.5, 0.0, 0.5, 0.01, 0.5]])
+    decomp = FakeDecomposition(x, [edm_impl(x, *p) for p in init])
+
+    def fitted(ccurves):
+        return np.array([c.params for c in ccurves])
+
+    single = fitted(optimize_edm_xr_decomposition(decomp, init))
+    parallel = fitted(optimize_edm_xr_decomposition(decomp, init, n_jobs=2))
+    assert np.array_equal(single, parallel)
+    multi = optimize_edm_xr_decomposition(decomp, init, n_starts=2, n_jobs=2, seed=0)
+    assert len(multi) == 2
+
+
+def test_sdm_objective_is_picklable():
+    import pickle
+    from molass.SEC.Models.SdmOptimizer import SdmXrObjective
+    x = np.arange(300, dtype=float)
+    y = np.exp(-0.5*((x - 150)/15)**2)
+    objective = SdmXrObjective(x, y, 2, 1.5, 2.0, 'gamma', 0.25,
+                               np.array([40.0, 30.0]), np.ones(2), 1.0,
+                               np.array([140.0, 170.0]), 1e-5)
+    params = np.array([500, 0.2, 50, 10, 14400, 1.0, 40.0, 30.0, 1.0, 0.5, 100.0])
+    value = objective(params)
+    assert np.isfinite(value)
+    assert pickle.loads(pickle.dumps(objective))(params) == value
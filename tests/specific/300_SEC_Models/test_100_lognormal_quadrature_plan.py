@@ -0,0 +1,55 @@
+"""Tests for the cached quadrature plan and the batched lognormal SDM CF."""
+import numpy as np
+from scipy.stats import lognorm
+from molass.SEC.Models.LognormalPore import (
+    get_quadrature_plan,
+    sdm_lognormal_pore_gamma_cf_fast,
+    sdm_lognormal_pore_gamma_pdf_fast,
+    sdm_lognormal_pore_gamma_pdf_fast_batch,
+    compute_mode,
+    compute_stdev,
+    PORESIZE_INTEG_LIMIT,
+)
+
+PARAMS = dict(N=500, T=0.5, k=1.5, me=1.5, mp=1.5, mu=4.6, sigma=0.3, N0=14400, t0=50)
+
+
+def _reference_cf(w, N, T, k, me, mp, mu, sigma, Rg, N0, t0, n_quad=64):
+    # the per-call leggauss/lognorm.pdf formulation
+    max_rg = min(PORESIZE_INTEG_LIMIT, compute_mode(mu, sigma) + 5*compute_stdev(mu, sigma))
+    Z = 1j * w * t0
+    if max_rg > Rg:
+        nodes, weights = np.polynomial.legendre.leggauss(n_quad)
+        r = 0.5 * (max_rg - Rg) * nodes + 0.5 * (max_rg + Rg)
+        wt = 0.5 * (max_rg - Rg) * weights
+        g = lognorm.pdf(r, sigma, scale=np.exp(mu))
+        ratio = np.minimum(1.0, Rg / r)
+        gamma_term = (1 - 1j * w[:, None] * T * (1 - ratio)**mp)**(-k) - 1
+        Z = Z + gamma_term @ (g * N * (1 - ratio)**me * wt)
+    return np.exp(Z + Z**2 / (2 * N0))
+
+
+def test_quadrature_plan_is_shared():
+    assert get_quadrature_plan(64) is get_quadrature_plan(64)
+    plan = get_quadrature_plan(32)
+    r, wt = plan.get_nodes(np.array([10.0, 20.0]), np.array([100.0, 100.0]))
+    assert r.shape == wt.shape == (2, 32)
+    assert np.allclose(wt.sum(axis=1), [90.0, 80.0])
+
+
+def test_cf_matches_reference():
+    w = np.linspace(-0.5, 0.5, 101)
+    for Rg in [20.0, 35.0, 1000.0]:
+        cf = sdm_lognormal_pore_gamma_cf_fast(w, Rg=Rg, **PARAMS)
+        assert np.allclose(cf, _reference_cf(w, Rg=Rg, **PARAMS), rtol=1e-10, atol=1e-14)
+
+
+def test_pdf_batch_matches_single_calls():
+    x = np.arange(400.0)
+    rgs = np.array([40.0, 30.0, 25.0, 1000.0])
+    scales = np.array([1.0, 2.0, 0.5, 1.0])
+    Y = sdm_lognormal_pore_gamma_pdf_fast_batch(x, scales, Rgs=rgs, **PARAMS)
+    assert Y.shape == (len(rgs), len(x))
+    for k, (rg, scale) in enumerate(zip(rgs, scales)):
+        y = sdm_lognormal_pore_gamma_pdf_fast(x, scale, Rg=rg, **PARAMS)
+        assert np.allclose(Y[k], y, rtol=1e-10, atol=1e-12)
@@ -0,0 +1,93 @@
+"""Tests for the headless column simulation engine."""
+import numpy as np
+import pytest
+from molass.SEC.ColumnEngine import ColumnEngine, simulate_column
+from molass.SEC.ColumnElements import Particle
+from molass.SEC.StationaryMove import get_next_position_impl
+
+
+def _reference_step(engine, pxv, pyv, inmobile_states, grain_references, dxv, dyv):
+    # the moves of touchable_indeces and compute_next_positions in ColumnSimulation.get_animation
+    grains = engine.grains
+    radiusv = engine.radii[engine.ptype]
+    rv = engine.rvs[engine.ptype]
+    xmin, xmax = engine.xmin, engine.xmax
+    last_pxv = pxv.copy()
+    last_pyv = pyv.copy()
+    pxv += dxv
+    exceed_left = pxv < xmin
+    pxv[exceed_left] = 2*xmin - pxv[exceed_left]
+    exceed_right = pxv > xmax
+    pxv[exceed_right] = 2*xmax - pxv[exceed_right]
+    pyv += dyv
+    pyv[inmobile_states] -= engine.du
+
+    indeces = []
+    bounce_scales = []
+    for k, (mobile, x, y) in enumerate(zip(inmobile_states, pxv, pyv)):
+        distv = rv[k] - np.sqrt((engine.gx - x)**2 + (engine.gy - y)**2)
+        w = np.where(distv > 0)[0]
+        if len(w) == 0:
+            inmobile_states[k] = True
+            grain_references[k] = -1
+        else:
+            j = w[0]
+            last_particle = Particle((last_pxv[k], last_pyv[k]), radiusv[k])
+            ret = Particle((x, y), radiusv[k]).enters_stationary(grains[j], last_particle=last_particle)
+            if mobile:
+                if ret is None:
+                    indeces.append((k, j))
+                    bounce_scales.append(distv[j])
+                    grain_references[k] = -1
+                else:
+                    inmobile_states[k] = False
+                    grain_references[k] = j
+    if len(indeces) > 0:
+        touchables, porous_indeces = np.array(indeces, dtype=int).T
+        dx = pxv[touchables] - engine.gx[porous_indeces]
+        dy = pyv[touchables] - engine.gy[porous_indeces]
+        scale = np.array(bounce_scales)/np.sqrt(dx**2 + dy**2)*2
+        pxv[touchables] += dx*scale
+        pyv[touchables] += dy*scale
+
+    for i in np.where(np.logical_not(inmobile_states))[0]:
+        particle = Particle((pxv[i], pyv[i]), radiusv[i])
+        grain = grains[grain_references[i]]
+        pxv[i], pyv[i], inmobile_states[i] = get_next_position_impl(particle, grain, last_pxv[i], last_pyv[i], pxv[i], pyv[i])
+
+    exceed = np.logical_or(pxv < xmin, pxv > xmax)
+    pxv[exceed] += -2*dxv[exceed]
+
+
+def test_step_matches_reference():
+    engine = ColumnEngine(num_species_particles=40, seed=1)
+    pxv, pyv = engine.x.copy(), engine.y.copy()
+    inmobile_states = engine.mobile.copy()
+    grain_references = engine.grain_ref.copy()
+    rng = np.random.default_rng(2)
+    num_entered = 0
+    for _ in range(80):
+        dxv, dyv = rng.normal(0, engine.delta, (2, engine.num_particles))
+        _reference_step(engine, pxv, pyv, inmobile_states, grain_references, dxv, dyv)
+        engine.step(dxv, dyv)
+        assert np.allclose(engine.x, pxv, atol=1e-12)
+        assert np.allclose(engine.y, pyv, atol=1e-12)
+        assert np.array_equal(engine.mobile, inmobile_states)
+        assert np.array_equal(engine.grain_ref, grain_references)
+        num_entered += np.count_nonzero(~engine.mobile)
+    assert num_entered > 0
+
+
+def test_statistics():
+    stats = simulate_column(num_species_particles=300, num_frames=400, seed=0)
+    ptype = stats['ptype_indeces']
+    assert len(ptype) == 900
+    assert len(stats['adsorption_durations']) == len(stats['adsorption_particle_ids'])
+    assert np.all(stats['adsorption_durations'] > 0)
+    assert np.allclose(np.bincount(stats['adsorption_particle_ids'], weights=stats['adsorption_durations'],
+                                   minlength=len(ptype)), stats['total_adsorbed_time'])
+    # large particles do not enter the pores, and elute first
+    assert stats['adsorption_counts'][ptype == 0].sum() == 0
+    exit_frames = stats['exit_frames']
+    medians = [np.median(exit_frames[(ptype == t) & (exit_frames >= 0)]) for t in range(3)]
+    assert medians[0] < medians[1] < medians[2]
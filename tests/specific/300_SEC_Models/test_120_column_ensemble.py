@@ -0,0 +1,50 @@
+"""Tests for the ensembles of column simulations."""
+import numpy as np
+from molass.SEC.ColumnEnsemble import run_column_ensemble, aggregate_column_stats, compute_sdm_exit_pdf
+
+CONFIGS = [dict(num_species_particles=150, num_pores=8),
+           dict(num_species_particles=150, num_pores=16, psizes=[5, 3, 1.5])]
+
+
+def test_parallel_matches_serial():
+    serial = run_column_ensemble(CONFIGS, num_runs=2, seed=1, n_jobs=1)
+    parallel = run_column_ensemble(CONFIGS, num_runs=2, seed=1, n_jobs=2)
+    assert serial[0][0]['num_pores'] == 8 and serial[1][0]['num_pores'] == 16
+    assert serial[0][0]['seed'] != serial[0][1]['seed']
+    for runs_s, runs_p in zip(serial, parallel):
+        for s, p in zip(runs_s, runs_p):
+            assert s['seed'] == p['seed']
+            assert np.array_equal(s['exit_frames'], p['exit_frames'])
+            assert np.array_equal(s['adsorption_durations'], p['adsorption_durations'])
+
+
+def test_aggregate_and_sdm():
+    import matplotlib.pyplot as plt
+    num_figs = len(plt.get_fignums())
+    done = []
+    results = run_column_ensemble([dict(num_species_particles=150)], num_runs=2, seed=0,
+                                  callback_done=lambda c, r, stats: done.append((c, r)))
+    assert sorted(done) == [(0, 0), (0, 1)]
+    assert len(plt.get_fignums()) == num_figs
+
+    species = aggregate_column_stats(results[0])
+    assert len(species) == 3
+    large, middle = species[0], species[1]
+    # with the default 16 pores, large particles do not enter them
+    assert large['npi'] == 0 and np.isnan(large['k'])
+    assert len(middle['entry_counts']) == 300
+    assert np.isclose(middle['npi'], np.mean(middle['entry_counts']))
+    counts, _ = middle['entry_count_hist']
+    assert counts.sum() == 300
+    values, edges = middle['residence_hist']
+    assert np.isclose(np.sum(values*np.diff(edges)), 1)
+    assert middle['k'] > 0 and middle['theta'] > 0
+
+    for s in species[:2]:
+        values, edges = s['exit_time_hist']
+        x = (edges[:-1] + edges[1:])/2
+        pdf = compute_sdm_exit_pdf(s, x)
+        assert np.all(np.isfinite(pdf))
+        # the SDM with the moment estimates reproduces the mean elution time
+        pdf_mean = np.sum(pdf*x)/np.sum(pdf)
+        assert abs(pdf_mean - np.mean(s['exit_times'])) < 0.05*np.mean(s['exit_times'])